@@ -12,6 +12,8 @@
 
 """Add control to operation if supported."""
 
+import numbers
+from functools import lru_cache
 from typing import Union, Optional
 
 from qiskit.circuit.exceptions import CircuitError
@@ -73,6 +75,12 @@ def control(
     If a method is not directly known, it calls the unroller to convert to `u1`, `u3`,
     and `cx` gates.
 
+    Unless it was assigned a custom definition, the definition of a controlled standard gate
+    only depends on the type and parameters of the gate. Definitions for numeric parameters are
+    cached and shared between all gates with the same type, parameters and number of controls,
+    and every gate only gets its own copy when its definition is first used. With unbound
+    parameters the definition is built on first use.
+
     Args:
         operation: The gate used to create the ControlledGate.
         num_ctrl_qubits: The number of controls to add to gate (default=1).
@@ -88,6 +96,54 @@ def control(
     Raises:
         CircuitError: gate contains non-gate in definition
     """
+    # pylint: disable=cyclic-import
+    from qiskit.circuit import controlledgate
+
+    if isinstance(operation, controlledgate.ControlledGate):
+        new_num_ctrl_qubits = num_ctrl_qubits + operation.num_ctrl_qubits
+        new_ctrl_state = operation.ctrl_state << num_ctrl_qubits | ctrl_state
+        base_name = operation.base_gate.name
+        base_gate = operation.base_gate
+    else:
+        new_num_ctrl_qubits = num_ctrl_qubits
+        new_ctrl_state = ctrl_state
+        base_name = operation.name
+        base_gate = operation
+    # In order to maintain some backward compatibility with gate names this
+    # uses a naming convention where if the number of controls is <=2 the gate
+    # is named like "cc<base_gate.name>", else it is named like
+    # "c<num_ctrl_qubits><base_name>".
+    if new_num_ctrl_qubits > 2:
+        ctrl_substr = f"c{new_num_ctrl_qubits:d}"
+    else:
+        ctrl_substr = ("{0}" * new_num_ctrl_qubits).format("c")
+    new_name = f"{ctrl_substr}{base_name}"
+    cgate = controlledgate.ControlledGate(
+        new_name,
+        num_ctrl_qubits + operation.num_qubits,
+        operation.params,
+        label=label,
+        num_ctrl_qubits=new_num_ctrl_qubits,
+        ctrl_state=new_ctrl_state,
+        base_gate=base_gate,
+    )
+    if type(operation) in _standard_gate_types() and _has_default_definition(operation):
+        cgate._control_source = (
+            type(operation),
+            getattr(operation, "ctrl_state", None),
+            num_ctrl_qubits,
+        )
+        if _is_cacheable(operation.params):
+            # build (or look up) the shared definition now, so that errors are raised here, but
+            # only copy it into the gate when it is first used, in ControlledGate._define
+            _cached_controlled_definition(*cgate._control_source, _params_key(operation.params))
+    else:
+        cgate.definition = _controlled_definition(operation, num_ctrl_qubits)
+    return cgate
+
+
+def _controlled_definition(operation, num_ctrl_qubits):
+    """Return the definition of ``operation`` with ``num_ctrl_qubits`` closed controls added."""
     from math import pi
 
     # pylint: disable=cyclic-import
@@ -217,35 +273,111 @@ def control(
             controlled_circ.mcp(global_phase, q_control[:-1], q_control[-1])
     if isinstance(operation, controlledgate.ControlledGate):
         operation.ctrl_state = original_ctrl_state
-        new_num_ctrl_qubits = num_ctrl_qubits + operation.num_ctrl_qubits
-        new_ctrl_state = operation.ctrl_state << num_ctrl_qubits | ctrl_state
-        base_name = operation.base_gate.name
-        base_gate = operation.base_gate
-    else:
-        new_num_ctrl_qubits = num_ctrl_qubits
-        new_ctrl_state = ctrl_state
-        base_name = operation.name
-        base_gate = operation
-    # In order to maintain some backward compatibility with gate names this
-    # uses a naming convention where if the number of controls is <=2 the gate
-    # is named like "cc<base_gate.name>", else it is named like
-    # "c<num_ctrl_qubits><base_name>".
-    if new_num_ctrl_qubits > 2:
-        ctrl_substr = f"c{new_num_ctrl_qubits:d}"
+    return controlled_circ
+
+
+def _standard_controlled_definition(operation_class, operation_ctrl_state, num_ctrl_qubits, params):
+    """Return the definition of the standard gate ``operation_class(*params)``, with control
+    state ``operation_ctrl_state`` if it is a controlled gate, with ``num_ctrl_qubits`` closed
+    controls added."""
+    if _is_cacheable(params):
+        return _cached_controlled_definition(
+            operation_class, operation_ctrl_state, num_ctrl_qubits, _params_key(params)
+        ).copy()
+    operation = _standard_gate(operation_class, operation_ctrl_state, params)
+    return _controlled_definition(operation, num_ctrl_qubits)
+
+
+@lru_cache(maxsize=1024)
+def _cached_controlled_definition(operation_class, operation_ctrl_state, num_ctrl_qubits, params):
+    operation = _standard_gate(
+        operation_class, operation_ctrl_state, [param for _, param in params]
+    )
+    return _controlled_definition(operation, num_ctrl_qubits)
+
+
+def _is_cacheable(params):
+    return all(isinstance(param, numbers.Number) for param in params)
+
+
+def _params_key(params):
+    """The key of numeric parameters in the definition caches, which tells apart equal parameters
+    of different types, like ``1``, ``1.0`` and ``True``."""
+    return tuple((type(param), param) for param in params)
+
+
+def _has_default_definition(operation):
+    """Whether the definition of the standard gate ``operation`` is the one of its type, rather
+    than one assigned by the user."""
+    definition = operation._definition
+    if definition is None:
+        return True
+    ctrl_state = getattr(operation, "ctrl_state", None)
+    if _is_cacheable(operation.params):
+        default = _cached_default_definition(
+            type(operation), ctrl_state, _params_key(operation.params)
+        )
     else:
-        ctrl_substr = ("{0}" * new_num_ctrl_qubits).format("c")
-    new_name = f"{ctrl_substr}{base_name}"
-    cgate = controlledgate.ControlledGate(
-        new_name,
-        controlled_circ.num_qubits,
-        operation.params,
-        label=label,
-        num_ctrl_qubits=new_num_ctrl_qubits,
-        definition=controlled_circ,
-        ctrl_state=new_ctrl_state,
-        base_gate=base_gate,
+        default = _standard_gate(type(operation), ctrl_state, operation.params).definition
+    # Comparing the circuits also compares the definitions of all the gates in them, which is
+    # slow, so first check if the definition is made of the same standard gates as the default.
+    return _same_standard_instructions(definition, default) or definition == default
+
+
+@lru_cache(maxsize=1024)
+def _cached_default_definition(operation_class, operation_ctrl_state, params):
+    return _standard_gate(
+        operation_class, operation_ctrl_state, [param for _, param in params]
+    ).definition
+
+
+def _same_standard_instructions(circuit, other):
+    """Whether ``circuit`` and ``other`` apply the same standard gates, with their default
+    definitions, on the same bits in the same order."""
+    if (
+        circuit.num_qubits != other.num_qubits
+        or circuit.num_clbits != other.num_clbits
+        or circuit.global_phase != other.global_phase
+        or len(circuit.data) != len(other.data)
+    ):
+        return False
+    standard_gate_types = _standard_gate_types()
+    indices = {bit: index for index, bit in enumerate(circuit.qubits + circuit.clbits)}
+    other_indices = {bit: index for index, bit in enumerate(other.qubits + other.clbits)}
+    for instruction, other_instruction in zip(circuit.data, other.data):
+        operation, other_operation = instruction.operation, other_instruction.operation
+        if (
+            type(operation) is not type(other_operation)
+            or type(operation) not in standard_gate_types
+            or operation.params != other_operation.params
+            or getattr(operation, "ctrl_state", None)
+            != getattr(other_operation, "ctrl_state", None)
+            or operation.condition is not None
+            or other_operation.condition is not None
+            or [indices[bit] for bit in instruction.qubits + instruction.clbits]
+            != [other_indices[bit] for bit in other_instruction.qubits + other_instruction.clbits]
+            or not _has_default_definition(operation)
+            or not _has_default_definition(other_operation)
+        ):
+            return False
+    return True
+
+
+def _standard_gate(operation_class, operation_ctrl_state, params):
+    if operation_ctrl_state is None:
+        return operation_class(*params)
+    return operation_class(*params, ctrl_state=operation_ctrl_state)
+
+
+@lru_cache(maxsize=None)
+def _standard_gate_types():
+    """The types of the gates whose definition is fully determined by their parameters."""
+    # pylint: disable=cyclic-import
+    from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
+
+    return frozenset(
+        type(gate) for gate in get_standard_gate_name_mapping().values() if isinstance(gate, Gate)
     )
-    return cgate
 
 
 def _gate_to_dag(operation):
@@ -27,6 +27,11 @@ from ._utils import _ctrl_state_to_int
 class ControlledGate(Gate):
     """Controlled unitary gate."""
 
+    # (gate class, control state, number of added controls) of the standard gate this gate was
+    # made from by ``Gate.control``, whose definition is only built when it is used.  This is a
+    # class attribute so that gates pickled before it was added still have it.
+    _control_source = None
+
     def __init__(
         self,
         name: str,
@@ -108,6 +113,9 @@ class ControlledGate(Gate):
         `_definition`.
         """
         if self._open_ctrl:
+            if self._definition is None and self._control_source is not None:
+                # build the closed definition once, rather than for every closed copy
+                self._define()
             closed_gate = self.copy()
             closed_gate.ctrl_state = None
             bit_ctrl_state = bin(self.ctrl_state)[2:].zfill(self.num_ctrl_qubits)
@@ -132,6 +140,13 @@ class ControlledGate(Gate):
             excited_def: The circuit with all closed controls."""
         self._definition = excited_def
 
+    def _define(self):
+        if self._control_source is not None:
+            # pylint: disable=cyclic-import
+            from .add_control import _standard_controlled_definition
+
+            self.definition = _standard_controlled_definition(*self._control_source, self.params)
+
     @property
     def name(self) -> str:
         """Get name of gate. If the gate has open controls the gate name
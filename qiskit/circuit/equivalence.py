@@ -12,7 +12,8 @@
 
 """Gate equivalence library."""
 
-from collections import namedtuple
+import json
+from collections import Counter, namedtuple
 
 from retworkx.visualization import graphviz_draw  # pylint: disable=no-name-in-module,import-error
 import retworkx as rx
@@ -215,6 +216,148 @@ class EquivalenceLibrary:
             return equivalences + self._base._get_equivalences(key)
         return equivalences
 
+    def _get_signatures(self, key):
+        """Get the gates used by each equivalence of ``key``, in the same order as
+        :meth:`_get_equivalences`, as ``{Key: count}`` dictionaries."""
+        search_base, equivalences = self._map.get(key, (True, []))
+        signatures = [_equivalence_signature(equiv.circuit) for equiv in equivalences]
+
+        if search_base and self._base is not None:
+            return signatures + self._base._get_signatures(key)
+        return signatures
+
+
+class LazyEquivalenceLibrary(EquivalenceLibrary):
+    """An :class:`.EquivalenceLibrary` whose entries are only built when first needed.
+
+    Entries are registered as loader functions with :meth:`lazy_entry`.  The loaders for a gate
+    are called, in registration order, the first time the library is queried for that gate.
+
+    A basis search only needs to know which gates each equivalence uses to build its graph, and
+    only needs the circuits of the equivalences it ends up choosing.  If a snapshot of these
+    signatures is given, it is used in place of the real circuits for entries that have not been
+    loaded yet, so a search never builds circuits it does not use.
+    """
+
+    def __init__(self, *, base=None, signatures_path=None):
+        """Create a new lazily-built equivalence library.
+
+        Args:
+            base (Optional[EquivalenceLibrary]):  Base equivalence library to
+                will be referenced if an entry is not found in this library.
+            signatures_path (Optional[str]): Path to a JSON snapshot of the signatures of the
+                registered equivalences, as written by :meth:`dump_signatures`.  It is only
+                read the first time a signature is requested.
+        """
+        super().__init__(base=base)
+        self._loaders = {}
+        self._signatures_path = signatures_path
+        self._signatures = None
+
+    def lazy_entry(self, name, num_qubits):
+        """Return a decorator registering a loader for the gate ``name`` on ``num_qubits``.
+
+        The decorated function is called with this library as its only argument, and should
+        add its equivalences with :meth:`add_equivalence`.
+
+        Args:
+            name (str): The name of the gate the loader adds equivalences for.
+            num_qubits (int): The number of qubits of that gate.
+
+        Returns:
+            Callable: A decorator which registers and returns its argument.
+        """
+        key = Key(name=name, num_qubits=num_qubits)
+
+        def register(loader):
+            self._loaders.setdefault(key, []).append(loader)
+            return loader
+
+        return register
+
+    def dump_signatures(self, path):
+        """Build every entry of this library (not of its base) and write the signatures of its
+        equivalences to a JSON file, in the format read by ``signatures_path``.
+
+        Args:
+            path (str): The file to write the snapshot to.
+        """
+        for key in list(self._loaders):
+            self._load(key)
+        snapshot = {
+            f"{key.name}/{key.num_qubits}": [
+                [
+                    [gate.name, gate.num_qubits, count]
+                    for gate, count in _equivalence_signature(equiv.circuit).items()
+                ]
+                for equiv in entry.equivalences
+            ]
+            for key, entry in sorted(self._map.items())
+        }
+        # One entry per line, so that changes to the library give readable diffs.
+        with open(path, "w") as fd:
+            fd.write("{\n")
+            fd.write(
+                ",\n".join(
+                    f"{json.dumps(label)}: {json.dumps(sigs)}" for label, sigs in snapshot.items()
+                )
+            )
+            fd.write("\n}\n")
+
+    def add_equivalence(self, gate, equivalent_circuit):
+        self._load(Key(name=gate.name, num_qubits=gate.num_qubits))
+        super().add_equivalence(gate, equivalent_circuit)
+
+    def has_entry(self, gate):
+        key = Key(name=gate.name, num_qubits=gate.num_qubits)
+        return key in self._loaders or super().has_entry(gate)
+
+    def set_entry(self, gate, entry):
+        self._loaders.pop(Key(name=gate.name, num_qubits=gate.num_qubits), None)
+        super().set_entry(gate, entry)
+
+    def _load(self, key):
+        # The loaders are removed before they run, so their own calls to ``add_equivalence``
+        # don't try to load the same entry again.
+        for loader in self._loaders.pop(key, ()):
+            loader(self)
+
+    def _load_signatures(self):
+        if self._signatures is None:
+            self._signatures = {}
+            if self._signatures_path is not None:
+                with open(self._signatures_path) as fd:
+                    snapshot = json.load(fd)
+                for label, signatures in snapshot.items():
+                    name, num_qubits = label.rsplit("/", 1)
+                    self._signatures[Key(name=name, num_qubits=int(num_qubits))] = [
+                        {
+                            Key(name=gate_name, num_qubits=gate_num_qubits): count
+                            for gate_name, gate_num_qubits, count in signature
+                        }
+                        for signature in signatures
+                    ]
+        return self._signatures
+
+    def _get_all_keys(self):
+        return super()._get_all_keys() | set(self._loaders)
+
+    def _get_equivalences(self, key):
+        self._load(key)
+        return super()._get_equivalences(key)
+
+    def _get_signatures(self, key):
+        if key in self._loaders:
+            signatures = self._load_signatures().get(key)
+            if signatures is not None:
+                # An entry with pending loaders has nothing in ``self._map`` yet, since
+                # ``add_equivalence`` loads first and ``set_entry`` drops the loaders.
+                if self._base is not None:
+                    return signatures + self._base._get_signatures(key)
+                return list(signatures)
+            self._load(key)
+        return super()._get_signatures(key)
+
 
 def _raise_if_param_mismatch(gate_params, circuit_parameters):
     gate_parameters = [p for p in gate_params if isinstance(p, ParameterExpression)]
@@ -238,6 +381,15 @@ def _raise_if_shape_mismatch(gate, circuit):
         )
 
 
+def _equivalence_signature(circuit):
+    return dict(
+        Counter(
+            Key(name=instruction.operation.name, num_qubits=len(instruction.qubits))
+            for instruction in circuit.data
+        )
+    )
+
+
 def _rebind_equiv(equiv, query_params):
     equiv_params, equiv_circuit = equiv
     param_map = dict(zip(equiv_params, query_params))
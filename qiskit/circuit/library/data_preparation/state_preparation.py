@@ -17,7 +17,7 @@ import math
 import numpy as np
 
 from qiskit.exceptions import QiskitError
-from qiskit.circuit import QuantumCircuit, QuantumRegister, Qubit
+from qiskit.circuit import QuantumCircuit, QuantumRegister, Qubit, CircuitInstruction
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.library.standard_gates.x import CXGate, XGate
 from qiskit.circuit.library.standard_gates.h import HGate
@@ -257,7 +257,7 @@ class StatePreparation(Gate):
         circuit = QuantumCircuit(q, name="disentangler")
 
         # kick start the peeling loop, and disentangle one-by-one from LSB to MSB
-        remaining_param = self.params
+        remaining_param = np.asarray(self.params, dtype=complex)
 
         for i in range(self.num_qubits):
             # work out which rotations must be done to disentangle the LSB
@@ -275,11 +275,13 @@ class StatePreparation(Gate):
 
             if np.linalg.norm(phis) != 0:
                 rz_mult = self._multiplex(RZGate, phis, last_cnot=add_last_cnot)
-                circuit.append(rz_mult.to_instruction(), q[i : self.num_qubits])
+                circuit._append(CircuitInstruction(rz_mult, tuple(q[i : self.num_qubits]), ()))
 
             if np.linalg.norm(thetas) != 0:
                 ry_mult = self._multiplex(RYGate, thetas, last_cnot=add_last_cnot)
-                circuit.append(ry_mult.to_instruction().reverse_ops(), q[i : self.num_qubits])
+                circuit._append(
+                    CircuitInstruction(ry_mult.reverse_ops(), tuple(q[i : self.num_qubits]), ())
+                )
         circuit.global_phase -= np.angle(sum(remaining_param))
         return circuit
 
@@ -296,30 +298,31 @@ class StatePreparation(Gate):
                                     .
                                         .
         0         0           Ry(theta_2^n).Rz(phi_2^n)]]
-        """
-        remaining_vector = []
-        thetas = []
-        phis = []
-
-        param_len = len(local_param)
-
-        for i in range(param_len // 2):
-            # Ry and Rz rotations to move bloch vector from 0 to "imaginary"
-            # qubit
-            # (imagine a qubit state signified by the amplitudes at index 2*i
-            # and 2*(i+1), corresponding to the select qubits of the
-            # multiplexor being in state |i>)
-            (remains, add_theta, add_phi) = StatePreparation._bloch_angles(
-                local_param[2 * i : 2 * (i + 1)]
-            )
-
-            remaining_vector.append(remains)
-
-            # rotations for all imaginary qubits of the full vector
-            # to move from where it is to zero, hence the negative sign
-            thetas.append(-add_theta)
-            phis.append(-add_phi)
 
+        The angles of all the "imaginary" qubits (the pairs of amplitudes at indices 2*i and
+        2*i+1, corresponding to the select qubits of the multiplexor being in state |i>) are
+        computed at once, as in :meth:`_bloch_angles`.
+        """
+        local_param = np.asarray(local_param, dtype=complex)
+        a_complex = local_param[0::2]
+        b_complex = local_param[1::2]
+        mag_a = np.absolute(a_complex)
+        final_r = np.sqrt(mag_a**2 + np.absolute(b_complex) ** 2)
+        nonzero = final_r >= _EPS
+
+        # rotations for all imaginary qubits of the full vector
+        # to move from where it is to zero, hence the negative sign
+        thetas = np.zeros(len(a_complex))
+        phis = np.zeros(len(a_complex))
+        final_t = np.zeros(len(a_complex))
+        thetas[nonzero] = -2 * np.arccos(mag_a[nonzero] / final_r[nonzero])
+        a_arg = np.angle(a_complex[nonzero])
+        b_arg = np.angle(b_complex[nonzero])
+        final_t[nonzero] = a_arg + b_arg
+        phis[nonzero] = -(b_arg - a_arg)
+        final_r[~nonzero] = 0
+
+        remaining_vector = final_r * np.exp(1.0j * final_t / 2)
         return remaining_vector, thetas, phis
 
     @staticmethod
@@ -350,9 +353,8 @@ class StatePreparation(Gate):
 
     def _multiplex(self, target_gate, list_of_angles, last_cnot=True):
         """
-        Return a recursive implementation of a multiplexor circuit,
-        where each instruction itself has a decomposition based on
-        smaller multiplexors.
+        Return a multiplexor gate, whose definition is the (flattened) recursive
+        implementation of a multiplexor circuit.
 
         The LSB is the multiplexor "data" and the other bits are multiplexor "select".
 
@@ -363,50 +365,96 @@ class StatePreparation(Gate):
             last_cnot (bool): add the last cnot if last_cnot = True
 
         Returns:
-            DAGCircuit: the circuit implementing the multiplexor's action
+            Gate: the gate implementing the multiplexor's action
         """
-        list_len = len(list_of_angles)
-        local_num_qubits = int(math.log2(list_len)) + 1
-
-        q = QuantumRegister(local_num_qubits)
-        circuit = QuantumCircuit(q, name="multiplex" + str(local_num_qubits))
-
-        lsb = q[0]
-        msb = q[local_num_qubits - 1]
-
-        # case of no multiplexing: base case for recursion
-        if local_num_qubits == 1:
-            circuit.append(target_gate(list_of_angles[0]), [q[0]])
-            return circuit
+        return _Multiplexor(target_gate, list_of_angles, last_cnot)
 
-        # calc angle weights, assuming recursion (that is the lower-level
-        # requested angles have been correctly implemented by recursion
-        angle_weight = np.kron([[0.5, 0.5], [0.5, -0.5]], np.identity(2 ** (local_num_qubits - 2)))
 
-        # calc the combo angles
-        list_of_angles = angle_weight.dot(np.array(list_of_angles)).tolist()
+class _Multiplexor(Gate):
+    """A multiplexed Ry or Rz rotation, as used by :class:`.StatePreparation`.
 
-        # recursive step on half the angles fulfilling the above assumption
-        multiplex_1 = self._multiplex(target_gate, list_of_angles[0 : (list_len // 2)], False)
-        circuit.append(multiplex_1.to_instruction(), q[0:-1])
+    The definition is the circuit given by the recursive construction of Shende, Bullock and
+    Markov, in which the second half of each level is reversed so that adjacent CNOTs cancel,
+    but it is computed directly in its flattened form: the rotation angles of the whole
+    recursion tree are worked out with one vectorized step per level.  Reversing and inverting
+    the gate do not build its definition either."""
 
-        # attach CNOT as follows, thereby flipping the LSB qubit
-        circuit.append(CXGate(), [msb, lsb])
+    def __init__(self, target_gate, angles, last_cnot=True, reverse=False, name=None):
+        num_qubits = int(math.log2(len(angles))) + 1
+        self._target_gate = target_gate
+        self._last_cnot = last_cnot
+        self._reverse = reverse
+        if name is None:
+            name = "multiplex" + str(num_qubits)
+        super().__init__(name, num_qubits, list(angles))
 
-        # implement extra efficiency from the paper of cancelling adjacent
-        # CNOTs (by leaving out last CNOT and reversing (NOT inverting) the
-        # second lower-level multiplex)
-        multiplex_2 = self._multiplex(target_gate, list_of_angles[(list_len // 2) :], False)
-        if list_len > 1:
-            circuit.append(multiplex_2.to_instruction().reverse_ops(), q[0:-1])
-        else:
-            circuit.append(multiplex_2.to_instruction(), q[0:-1])
+    def validate_parameter(self, parameter):
+        """The rotation angles are floats."""
+        return float(parameter)
+
+    def reverse_ops(self):
+        return _Multiplexor(
+            self._target_gate,
+            self.params,
+            self._last_cnot,
+            not self._reverse,
+            name=self.name + "_reverse",
+        )
 
-        # attach a final CNOT
-        if last_cnot:
-            circuit.append(CXGate(), [msb, lsb])
+    def inverse(self):
+        return _Multiplexor(
+            self._target_gate,
+            [-angle for angle in self.params],
+            self._last_cnot,
+            not self._reverse,
+            name=self.name + "_dg",
+        )
 
-        return circuit
+    def _define(self):
+        q = QuantumRegister(self.num_qubits, "q")
+        circuit = QuantumCircuit(q, name=self.name)
+        lsb = q[0]
+        angles = _multiplexor_angles(np.array(self.params, dtype=float))
+        num_angles = len(angles)
+
+        instructions = []
+        for i, angle in enumerate(angles.tolist()):
+            instructions.append(CircuitInstruction(self._target_gate(angle), (lsb,), ()))
+            if i < num_angles - 1:
+                # the select qubit of the CNOT is given by the number of trailing zeros of i + 1
+                msb = q[((i + 1) & -(i + 1)).bit_length()]
+                instructions.append(CircuitInstruction(CXGate(), (msb, lsb), ()))
+            elif self._last_cnot and self.num_qubits > 1:
+                instructions.append(CircuitInstruction(CXGate(), (q[-1], lsb), ()))
+        if self._reverse:
+            instructions.reverse()
+        for instruction in instructions:
+            circuit._append(instruction)
+        self.definition = circuit
+
+
+def _multiplexor_angles(angles):
+    """Return the angles of the rotations of a multiplexor, in circuit order.
+
+    The recursive construction applies, at each level, the weights
+    ``kron([[0.5, 0.5], [0.5, -0.5]], I)`` to the angles of every block, implements the first half
+    of the result recursively and then the second half recursively and reversed.  A reversed
+    block places the second half of its weighted angles first, and both halves of any block
+    again consist of a forward block followed by a reversed one, so all blocks of a level can be
+    handled with a single vectorized step."""
+    blocks = angles.reshape(1, -1)
+    reversed_blocks = np.zeros(1, dtype=bool)
+    while blocks.shape[1] > 1:
+        half = blocks.shape[1] // 2
+        first = (blocks[:, :half] + blocks[:, half:]) / 2
+        second = (blocks[:, :half] - blocks[:, half:]) / 2
+        first[reversed_blocks], second[reversed_blocks] = (
+            second[reversed_blocks],
+            first[reversed_blocks],
+        )
+        blocks = np.stack([first, second], axis=1).reshape(-1, half)
+        reversed_blocks = np.tile([False, True], len(reversed_blocks))
+    return blocks.reshape(-1)
 
 
 def prepare_state(self, state, qubits=None, label=None):
@@ -110,8 +110,9 @@ class LinearFunction(Gate):
 
             # Optionally, check that the matrix is invertible
             if validate_input:
-                det = np.linalg.det(linear) % 2
-                if not np.allclose(det, 1):
+                from qiskit.synthesis.linear import check_invertible_binary_matrix
+
+                if not check_invertible_binary_matrix(linear):
                     raise CircuitError(
                         "A linear function must be represented by an invertible matrix."
                     )
@@ -120,6 +121,20 @@ class LinearFunction(Gate):
             name="linear_function", num_qubits=len(linear), params=[linear, original_circuit]
         )
 
+    def __eq__(self, other):
+        """Two linear functions are the same if they have the same matrix.
+
+        Unlike the generic :meth:`.Instruction.__eq__`, this compares the matrices directly
+        (bit-packed) and never synthesizes the definitions of the two functions.
+        """
+        if not isinstance(other, LinearFunction):
+            return False
+        if self.num_qubits != other.num_qubits:
+            return False
+        from qiskit.synthesis.linear import PackedBinaryMatrix
+
+        return PackedBinaryMatrix(self.linear) == PackedBinaryMatrix(other.linear)
+
     def validate_parameter(self, parameter):
         """Parameter validation"""
         return parameter
@@ -174,19 +189,23 @@ class LinearFunction(Gate):
 
 def _linear_quantum_circuit_to_mat(qc: QuantumCircuit):
     """This creates a n x n matrix corresponding to the given linear quantum circuit."""
+    from qiskit.synthesis.linear import PackedBinaryMatrix
+
     nq = qc.num_qubits
-    mat = np.eye(nq, nq, dtype=bool)
+    # Compose the gates on bit-packed rows, with bit j of a row holding column j.
+    mat = PackedBinaryMatrix.identity(nq).to_row_integers()
+    indices = {bit: index for index, bit in enumerate(qc.qubits)}
 
     for instruction in qc.data:
         if instruction.operation.name == "cx":
-            cb = qc.find_bit(instruction.qubits[0]).index
-            tb = qc.find_bit(instruction.qubits[1]).index
-            mat[tb, :] = (mat[tb, :]) ^ (mat[cb, :])
+            cb = indices[instruction.qubits[0]]
+            tb = indices[instruction.qubits[1]]
+            mat[tb] ^= mat[cb]
         elif instruction.operation.name == "swap":
-            cb = qc.find_bit(instruction.qubits[0]).index
-            tb = qc.find_bit(instruction.qubits[1]).index
-            mat[[cb, tb]] = mat[[tb, cb]]
+            cb = indices[instruction.qubits[0]]
+            tb = indices[instruction.qubits[1]]
+            mat[cb], mat[tb] = mat[tb], mat[cb]
         else:
             raise CircuitError("A linear quantum circuit can include only CX and SWAP gates.")
 
-    return mat
+    return PackedBinaryMatrix.from_row_integers(mat, nq).to_matrix()
@@ -12,9 +12,11 @@
 
 """Standard gates."""
 
+import os
 
 from qiskit.qasm import pi
-from qiskit.circuit import EquivalenceLibrary, Parameter, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter, QuantumCircuit, QuantumRegister
+from qiskit.circuit.equivalence import LazyEquivalenceLibrary
 
 from qiskit.quantum_info.synthesis.ion_decompose import cnot_rxx_decompose
 
@@ -67,20 +69,28 @@ from . import (
 )
 
 
-_sel = StandardEquivalenceLibrary = EquivalenceLibrary()
+# Each function below builds the equivalences of one section of the library, and is only called
+# the first time the library is asked about the gate it defines.  The gates used by every
+# equivalence are recorded in the signatures snapshot next to this file, which lets the basis
+# search build its graph without constructing any circuits.  Run
+# ``tools/update_equivalence_signatures.py`` after changing any equivalence here.
+_SIGNATURES_PATH = os.path.join(os.path.dirname(__file__), "equivalence_signatures.json")
 
+_sel = StandardEquivalenceLibrary = LazyEquivalenceLibrary(signatures_path=_SIGNATURES_PATH)
 
-# Import existing gate definitions
 
 # HGate
 #
 #    ┌───┐        ┌─────────┐
 # q: ┤ H ├  ≡  q: ┤ U2(0,π) ├
 #    └───┘        └─────────┘
-q = QuantumRegister(1, "q")
-def_h = QuantumCircuit(q)
-def_h.append(U2Gate(0, pi), [q[0]], [])
-_sel.add_equivalence(HGate(), def_h)
+@_sel.lazy_entry("h", 1)
+def _def_h(lib):
+    q = QuantumRegister(1, "q")
+    def_h = QuantumCircuit(q)
+    def_h.append(U2Gate(0, pi), [q[0]], [])
+    lib.add_equivalence(HGate(), def_h)
+
 
 # CHGate
 #
@@ -88,36 +98,45 @@ _sel.add_equivalence(HGate(), def_h)
 #      ┌─┴─┐  ≡       ┌───┐┌───┐┌───┐┌─┴─┐┌─────┐┌───┐┌─────┐
 # q_1: ┤ H ├     q_1: ┤ S ├┤ H ├┤ T ├┤ X ├┤ Tdg ├┤ H ├┤ Sdg ├
 #      └───┘          └───┘└───┘└───┘└───┘└─────┘└───┘└─────┘
-q = QuantumRegister(2, "q")
-def_ch = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (SGate(), [q[1]], []),
-    (HGate(), [q[1]], []),
-    (TGate(), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (TdgGate(), [q[1]], []),
-    (HGate(), [q[1]], []),
-    (SdgGate(), [q[1]], []),
-]:
-    def_ch.append(inst, qargs, cargs)
-_sel.add_equivalence(CHGate(), def_ch)
+@_sel.lazy_entry("ch", 2)
+def _def_ch(lib):
+    q = QuantumRegister(2, "q")
+    def_ch = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (SGate(), [q[1]], []),
+        (HGate(), [q[1]], []),
+        (TGate(), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (TdgGate(), [q[1]], []),
+        (HGate(), [q[1]], []),
+        (SdgGate(), [q[1]], []),
+    ]:
+        def_ch.append(inst, qargs, cargs)
+    lib.add_equivalence(CHGate(), def_ch)
+
 
 # PhaseGate
 #
 #    ┌──────┐        ┌───────┐
 # q: ┤ P(ϴ) ├  ≡  q: ┤ U1(ϴ) ├
 #    └──────┘        └───────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-phase_to_u1 = QuantumCircuit(q)
-phase_to_u1.append(U1Gate(theta), [0])
-_sel.add_equivalence(PhaseGate(theta), phase_to_u1)
-
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-phase_to_u = QuantumCircuit(q)
-phase_to_u.u(0, 0, theta, 0)
-_sel.add_equivalence(PhaseGate(theta), phase_to_u)
+@_sel.lazy_entry("p", 1)
+def _phase_to_u1(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    phase_to_u1 = QuantumCircuit(q)
+    phase_to_u1.append(U1Gate(theta), [0])
+    lib.add_equivalence(PhaseGate(theta), phase_to_u1)
+
+
+@_sel.lazy_entry("p", 1)
+def _phase_to_u(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    phase_to_u = QuantumCircuit(q)
+    phase_to_u.u(0, 0, theta, 0)
+    lib.add_equivalence(PhaseGate(theta), phase_to_u)
+
 
 # CPhaseGate
 #                      ┌────────┐
@@ -125,38 +144,47 @@ _sel.add_equivalence(PhaseGate(theta), phase_to_u)
 #       │P(ϴ)  ≡       └────────┘┌─┴─┐┌─────────┐┌─┴─┐┌────────┐
 # q_1: ─■────     q_1: ──────────┤ X ├┤ P(-ϴ/2) ├┤ X ├┤ P(ϴ/2) ├
 #                                └───┘└─────────┘└───┘└────────┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_cphase = QuantumCircuit(q)
-def_cphase.p(theta / 2, 0)
-def_cphase.cx(0, 1)
-def_cphase.p(-theta / 2, 1)
-def_cphase.cx(0, 1)
-def_cphase.p(theta / 2, 1)
-_sel.add_equivalence(CPhaseGate(theta), def_cphase)
+@_sel.lazy_entry("cp", 2)
+def _def_cphase(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_cphase = QuantumCircuit(q)
+    def_cphase.p(theta / 2, 0)
+    def_cphase.cx(0, 1)
+    def_cphase.p(-theta / 2, 1)
+    def_cphase.cx(0, 1)
+    def_cphase.p(theta / 2, 1)
+    lib.add_equivalence(CPhaseGate(theta), def_cphase)
+
 
 # CPhaseGate
 #
 # q_0: ─■────     q_0: ─■────
 #       │P(ϴ)  ≡        │U1(ϴ)
 # q_1: ─■────     q_1: ─■────
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-cphase_to_cu1 = QuantumCircuit(q)
-cphase_to_cu1.append(CU1Gate(theta), [0, 1])
-_sel.add_equivalence(CPhaseGate(theta), cphase_to_cu1)
+@_sel.lazy_entry("cp", 2)
+def _cphase_to_cu1(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    cphase_to_cu1 = QuantumCircuit(q)
+    cphase_to_cu1.append(CU1Gate(theta), [0, 1])
+    lib.add_equivalence(CPhaseGate(theta), cphase_to_cu1)
+
 
 # RGate
 #
 #    ┌────────┐        ┌───────────────────────┐
 # q: ┤ R(ϴ,φ) ├  ≡  q: ┤ U3(ϴ,φ - π/2,π/2 - φ) ├
 #    └────────┘        └───────────────────────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-phi = Parameter("phi")
-def_r = QuantumCircuit(q)
-def_r.append(U3Gate(theta, phi - pi / 2, -phi + pi / 2), [q[0]])
-_sel.add_equivalence(RGate(theta, phi), def_r)
+@_sel.lazy_entry("r", 1)
+def _def_r(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    phi = Parameter("phi")
+    def_r = QuantumCircuit(q)
+    def_r.append(U3Gate(theta, phi - pi / 2, -phi + pi / 2), [q[0]])
+    lib.add_equivalence(RGate(theta, phi), def_r)
+
 
 # RCCXGate
 #
@@ -167,32 +195,38 @@ _sel.add_equivalence(RGate(theta, phi), def_r)
 #      │       │          ┌───┐┌───┐┌─┴─┐┌─────┐┌─┴─┐┌───┐┌─┴─┐┌─────┐┌───┐
 # q_2: ┤2      ├     q_2: ┤ H ├┤ T ├┤ X ├┤ Tdg ├┤ X ├┤ T ├┤ X ├┤ Tdg ├┤ H ├
 #      └───────┘          └───┘└───┘└───┘└─────┘└───┘└───┘└───┘└─────┘└───┘
-q = QuantumRegister(3, "q")
-def_rccx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[2]], []),
-    (TGate(), [q[2]], []),
-    (CXGate(), [q[1], q[2]], []),
-    (TdgGate(), [q[2]], []),
-    (CXGate(), [q[0], q[2]], []),
-    (TGate(), [q[2]], []),
-    (CXGate(), [q[1], q[2]], []),
-    (TdgGate(), [q[2]], []),
-    (HGate(), [q[2]], []),
-]:
-    def_rccx.append(inst, qargs, cargs)
-_sel.add_equivalence(RCCXGate(), def_rccx)
+@_sel.lazy_entry("rccx", 3)
+def _def_rccx(lib):
+    q = QuantumRegister(3, "q")
+    def_rccx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[2]], []),
+        (TGate(), [q[2]], []),
+        (CXGate(), [q[1], q[2]], []),
+        (TdgGate(), [q[2]], []),
+        (CXGate(), [q[0], q[2]], []),
+        (TGate(), [q[2]], []),
+        (CXGate(), [q[1], q[2]], []),
+        (TdgGate(), [q[2]], []),
+        (HGate(), [q[2]], []),
+    ]:
+        def_rccx.append(inst, qargs, cargs)
+    lib.add_equivalence(RCCXGate(), def_rccx)
+
 
 # RXGate
 #
 #    ┌───────┐        ┌────────┐
 # q: ┤ Rx(ϴ) ├  ≡  q: ┤ R(ϴ,0) ├
 #    └───────┘        └────────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-def_rx = QuantumCircuit(q)
-def_rx.append(RGate(theta, 0), [q[0]], [])
-_sel.add_equivalence(RXGate(theta), def_rx)
+@_sel.lazy_entry("rx", 1)
+def _def_rx(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    def_rx = QuantumCircuit(q)
+    def_rx.append(RGate(theta, 0), [q[0]], [])
+    lib.add_equivalence(RXGate(theta), def_rx)
+
 
 # CRXGate
 #
@@ -200,18 +234,21 @@ _sel.add_equivalence(RXGate(theta), def_rx)
 #      ┌───┴───┐  ≡       ┌─────────┐┌─┴─┐┌──────────────┐┌─┴─┐┌────────────────┐
 # q_1: ┤ Rx(ϴ) ├     q_1: ┤ U1(π/2) ├┤ X ├┤ U3(-ϴ/2,0,0) ├┤ X ├┤ U3(ϴ/2,-π/2,0) ├
 #      └───────┘          └─────────┘└───┘└──────────────┘└───┘└────────────────┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_crx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (U1Gate(pi / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (U3Gate(-theta / 2, 0, 0), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (U3Gate(theta / 2, -pi / 2, 0), [q[1]], []),
-]:
-    def_crx.append(inst, qargs, cargs)
-_sel.add_equivalence(CRXGate(theta), def_crx)
+@_sel.lazy_entry("crx", 2)
+def _def_crx(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_crx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (U1Gate(pi / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (U3Gate(-theta / 2, 0, 0), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (U3Gate(theta / 2, -pi / 2, 0), [q[1]], []),
+    ]:
+        def_crx.append(inst, qargs, cargs)
+    lib.add_equivalence(CRXGate(theta), def_crx)
+
 
 # CRXGate
 #
@@ -219,19 +256,22 @@ _sel.add_equivalence(CRXGate(theta), def_crx)
 #      ┌───┴───┐  ≡       ┌───┐┌─┴─┐┌──────────┐┌─┴─┐┌─────────┐┌─────┐
 # q_1: ┤ Rx(ϴ) ├     q_1: ┤ S ├┤ X ├┤ Ry(-ϴ/2) ├┤ X ├┤ Ry(ϴ/2) ├┤ Sdg ├
 #      └───────┘          └───┘└───┘└──────────┘└───┘└─────────┘└─────┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-crx_to_srycx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (SGate(), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RYGate(-theta / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RYGate(theta / 2), [q[1]], []),
-    (SdgGate(), [q[1]], []),
-]:
-    crx_to_srycx.append(inst, qargs, cargs)
-_sel.add_equivalence(CRXGate(theta), crx_to_srycx)
+@_sel.lazy_entry("crx", 2)
+def _crx_to_srycx(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    crx_to_srycx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (SGate(), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RYGate(-theta / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RYGate(theta / 2), [q[1]], []),
+        (SdgGate(), [q[1]], []),
+    ]:
+        crx_to_srycx.append(inst, qargs, cargs)
+    lib.add_equivalence(CRXGate(theta), crx_to_srycx)
+
 
 # RXXGate
 #
@@ -240,34 +280,40 @@ _sel.add_equivalence(CRXGate(theta), crx_to_srycx)
 #      │  Rxx(ϴ) │  ≡       ├───┤┌─┴─┐┌───────┐┌─┴─┐├───┤
 # q_1: ┤1        ├     q_1: ┤ H ├┤ X ├┤ Rz(ϴ) ├┤ X ├┤ H ├
 #      └─────────┘          └───┘└───┘└───────┘└───┘└───┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_rxx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[0]], []),
-    (HGate(), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RZGate(theta), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (HGate(), [q[1]], []),
-    (HGate(), [q[0]], []),
-]:
-    def_rxx.append(inst, qargs, cargs)
-_sel.add_equivalence(RXXGate(theta), def_rxx)
+@_sel.lazy_entry("rxx", 2)
+def _def_rxx(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_rxx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[0]], []),
+        (HGate(), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RZGate(theta), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (HGate(), [q[1]], []),
+        (HGate(), [q[0]], []),
+    ]:
+        def_rxx.append(inst, qargs, cargs)
+    lib.add_equivalence(RXXGate(theta), def_rxx)
+
 
 # RXX to RZZ
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-rxx_to_rzz = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[0]], []),
-    (HGate(), [q[1]], []),
-    (RZZGate(theta), [q[0], q[1]], []),
-    (HGate(), [q[0]], []),
-    (HGate(), [q[1]], []),
-]:
-    rxx_to_rzz.append(inst, qargs, cargs)
-_sel.add_equivalence(RXXGate(theta), rxx_to_rzz)
+@_sel.lazy_entry("rxx", 2)
+def _rxx_to_rzz(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    rxx_to_rzz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[0]], []),
+        (HGate(), [q[1]], []),
+        (RZZGate(theta), [q[0], q[1]], []),
+        (HGate(), [q[0]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        rxx_to_rzz.append(inst, qargs, cargs)
+    lib.add_equivalence(RXXGate(theta), rxx_to_rzz)
+
 
 # RZXGate
 #
@@ -276,18 +322,20 @@ _sel.add_equivalence(RXXGate(theta), rxx_to_rzz)
 #      │  Rzx(ϴ) │  ≡       ┌───┐┌─┴─┐┌───────┐┌─┴─┐┌───┐
 # q_1: ┤1        ├     q_1: ┤ H ├┤ X ├┤ Rz(ϴ) ├┤ X ├┤ H ├
 #      └─────────┘          └───┘└───┘└───────┘└───┘└───┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_rzx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RZGate(theta), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (HGate(), [q[1]], []),
-]:
-    def_rzx.append(inst, qargs, cargs)
-_sel.add_equivalence(RZXGate(theta), def_rzx)
+@_sel.lazy_entry("rzx", 2)
+def _def_rzx(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_rzx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RZGate(theta), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        def_rzx.append(inst, qargs, cargs)
+    lib.add_equivalence(RZXGate(theta), def_rzx)
 
 
 # RYGate
@@ -295,11 +343,14 @@ _sel.add_equivalence(RZXGate(theta), def_rzx)
 #    ┌───────┐        ┌──────────┐
 # q: ┤ Ry(ϴ) ├  ≡  q: ┤ R(ϴ,π/2) ├
 #    └───────┘        └──────────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-def_ry = QuantumCircuit(q)
-def_ry.append(RGate(theta, pi / 2), [q[0]], [])
-_sel.add_equivalence(RYGate(theta), def_ry)
+@_sel.lazy_entry("ry", 1)
+def _def_ry(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    def_ry = QuantumCircuit(q)
+    def_ry.append(RGate(theta, pi / 2), [q[0]], [])
+    lib.add_equivalence(RYGate(theta), def_ry)
+
 
 # CRYGate
 #
@@ -307,17 +358,20 @@ _sel.add_equivalence(RYGate(theta), def_ry)
 #      ┌───┴───┐   ≡       ┌─────────┐┌─┴─┐┌──────────┐┌─┴─┐
 # q_1: ┤ Ry(ϴ) ├      q_1: ┤ Ry(ϴ/2) ├┤ X ├┤ Ry(-ϴ/2) ├┤ X ├
 #      └───────┘           └─────────┘└───┘└──────────┘└───┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_cry = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (RYGate(theta / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RYGate(-theta / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-]:
-    def_cry.append(inst, qargs, cargs)
-_sel.add_equivalence(CRYGate(theta), def_cry)
+@_sel.lazy_entry("cry", 2)
+def _def_cry(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_cry = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (RYGate(theta / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RYGate(-theta / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+    ]:
+        def_cry.append(inst, qargs, cargs)
+    lib.add_equivalence(CRYGate(theta), def_cry)
+
 
 # RYYGate
 #
@@ -326,57 +380,70 @@ _sel.add_equivalence(CRYGate(theta), def_cry)
 #      │  Ryy(ϴ) │  ≡       ├─────────┤┌─┴─┐┌───────┐┌─┴─┐├──────────┤
 # q_1: ┤1        ├     q_1: ┤ Rx(π/2) ├┤ X ├┤ Rz(ϴ) ├┤ X ├┤ Rx(-π/2) ├
 #      └─────────┘          └─────────┘└───┘└───────┘└───┘└──────────┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_ryy = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (RXGate(pi / 2), [q[0]], []),
-    (RXGate(pi / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RZGate(theta), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RXGate(-pi / 2), [q[0]], []),
-    (RXGate(-pi / 2), [q[1]], []),
-]:
-    def_ryy.append(inst, qargs, cargs)
-_sel.add_equivalence(RYYGate(theta), def_ryy)
+@_sel.lazy_entry("ryy", 2)
+def _def_ryy(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_ryy = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (RXGate(pi / 2), [q[0]], []),
+        (RXGate(pi / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RZGate(theta), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RXGate(-pi / 2), [q[0]], []),
+        (RXGate(-pi / 2), [q[1]], []),
+    ]:
+        def_ryy.append(inst, qargs, cargs)
+    lib.add_equivalence(RYYGate(theta), def_ryy)
+
 
 # RYY to RZZ
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-ryy_to_rzz = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (RXGate(pi / 2), [q[0]], []),
-    (RXGate(pi / 2), [q[1]], []),
-    (RZZGate(theta), [q[0], q[1]], []),
-    (RXGate(-pi / 2), [q[0]], []),
-    (RXGate(-pi / 2), [q[1]], []),
-]:
-    ryy_to_rzz.append(inst, qargs, cargs)
-_sel.add_equivalence(RYYGate(theta), ryy_to_rzz)
+@_sel.lazy_entry("ryy", 2)
+def _ryy_to_rzz(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    ryy_to_rzz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (RXGate(pi / 2), [q[0]], []),
+        (RXGate(pi / 2), [q[1]], []),
+        (RZZGate(theta), [q[0], q[1]], []),
+        (RXGate(-pi / 2), [q[0]], []),
+        (RXGate(-pi / 2), [q[1]], []),
+    ]:
+        ryy_to_rzz.append(inst, qargs, cargs)
+    lib.add_equivalence(RYYGate(theta), ryy_to_rzz)
+
 
 # RZGate
 #                  global phase: -ϴ/2
 #    ┌───────┐        ┌───────┐
 # q: ┤ Rz(ϴ) ├  ≡  q: ┤ U1(ϴ) ├
 #    └───────┘        └───────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-def_rz = QuantumCircuit(q, global_phase=-theta / 2)
-def_rz.append(U1Gate(theta), [q[0]], [])
-_sel.add_equivalence(RZGate(theta), def_rz)
+@_sel.lazy_entry("rz", 1)
+def _def_rz(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    def_rz = QuantumCircuit(q, global_phase=-theta / 2)
+    def_rz.append(U1Gate(theta), [q[0]], [])
+    lib.add_equivalence(RZGate(theta), def_rz)
+
 
 # RZGate
 #
 #    ┌───────┐        ┌────┐┌────────┐┌──────┐
 # q: ┤ Rz(ϴ) ├  ≡  q: ┤ √X ├┤ Ry(-ϴ) ├┤ √Xdg ├
 #    └───────┘        └────┘└────────┘└──────┘
-q = QuantumRegister(1, "q")
-rz_to_sxry = QuantumCircuit(q)
-rz_to_sxry.sx(0)
-rz_to_sxry.ry(-theta, 0)
-rz_to_sxry.sxdg(0)
-_sel.add_equivalence(RZGate(theta), rz_to_sxry)
+@_sel.lazy_entry("rz", 1)
+def _rz_to_sxry(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    rz_to_sxry = QuantumCircuit(q)
+    rz_to_sxry.sx(0)
+    rz_to_sxry.ry(-theta, 0)
+    rz_to_sxry.sxdg(0)
+    lib.add_equivalence(RZGate(theta), rz_to_sxry)
+
 
 # CRZGate
 #
@@ -384,17 +451,20 @@ _sel.add_equivalence(RZGate(theta), rz_to_sxry)
 #      ┌───┴───┐  ≡       ┌─────────┐┌─┴─┐┌──────────┐┌─┴─┐
 # q_1: ┤ Rz(ϴ) ├     q_1: ┤ Rz(ϴ/2) ├┤ X ├┤ Rz(-ϴ/2) ├┤ X ├
 #      └───────┘          └─────────┘└───┘└──────────┘└───┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_crz = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (RZGate(theta / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RZGate(-theta / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-]:
-    def_crz.append(inst, qargs, cargs)
-_sel.add_equivalence(CRZGate(theta), def_crz)
+@_sel.lazy_entry("crz", 2)
+def _def_crz(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_crz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (RZGate(theta / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RZGate(-theta / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+    ]:
+        def_crz.append(inst, qargs, cargs)
+    lib.add_equivalence(CRZGate(theta), def_crz)
+
 
 # RZZGate
 #
@@ -402,44 +472,52 @@ _sel.add_equivalence(CRZGate(theta), def_crz)
 #       │ZZ(ϴ)  ≡       ┌─┴─┐┌───────┐┌─┴─┐
 # q_1: ─■─────     q_1: ┤ X ├┤ Rz(ϴ) ├┤ X ├
 #                       └───┘└───────┘└───┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_rzz = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (CXGate(), [q[0], q[1]], []),
-    (RZGate(theta), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-]:
-    def_rzz.append(inst, qargs, cargs)
-_sel.add_equivalence(RZZGate(theta), def_rzz)
+@_sel.lazy_entry("rzz", 2)
+def _def_rzz(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_rzz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (CXGate(), [q[0], q[1]], []),
+        (RZGate(theta), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+    ]:
+        def_rzz.append(inst, qargs, cargs)
+    lib.add_equivalence(RZZGate(theta), def_rzz)
+
 
 # RZZ to RXX
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-rzz_to_rxx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[0]], []),
-    (HGate(), [q[1]], []),
-    (RXXGate(theta), [q[0], q[1]], []),
-    (HGate(), [q[0]], []),
-    (HGate(), [q[1]], []),
-]:
-    rzz_to_rxx.append(inst, qargs, cargs)
-_sel.add_equivalence(RZZGate(theta), rzz_to_rxx)
+@_sel.lazy_entry("rzz", 2)
+def _rzz_to_rxx(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    rzz_to_rxx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[0]], []),
+        (HGate(), [q[1]], []),
+        (RXXGate(theta), [q[0], q[1]], []),
+        (HGate(), [q[0]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        rzz_to_rxx.append(inst, qargs, cargs)
+    lib.add_equivalence(RZZGate(theta), rzz_to_rxx)
+
 
 # RZZ to RYY
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-rzz_to_ryy = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (RXGate(-pi / 2), [q[0]], []),
-    (RXGate(-pi / 2), [q[1]], []),
-    (RYYGate(theta), [q[0], q[1]], []),
-    (RXGate(pi / 2), [q[0]], []),
-    (RXGate(pi / 2), [q[1]], []),
-]:
-    rzz_to_ryy.append(inst, qargs, cargs)
-_sel.add_equivalence(RZZGate(theta), rzz_to_ryy)
+@_sel.lazy_entry("rzz", 2)
+def _rzz_to_ryy(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    rzz_to_ryy = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (RXGate(-pi / 2), [q[0]], []),
+        (RXGate(-pi / 2), [q[1]], []),
+        (RYYGate(theta), [q[0], q[1]], []),
+        (RXGate(pi / 2), [q[0]], []),
+        (RXGate(pi / 2), [q[1]], []),
+    ]:
+        rzz_to_ryy.append(inst, qargs, cargs)
+    lib.add_equivalence(RZZGate(theta), rzz_to_ryy)
 
 
 # RZXGate
@@ -449,18 +527,21 @@ _sel.add_equivalence(RZZGate(theta), rzz_to_ryy)
 #      │  Rzx(ϴ) │  ≡       ┌───┐┌─┴─┐┌───────┐┌─┴─┐┌───┐
 # q_1: ┤1        ├     q_1: ┤ H ├┤ X ├┤ Rz(ϴ) ├┤ X ├┤ H ├
 #      └─────────┘          └───┘└───┘└───────┘└───┘└───┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_rzx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (RZGate(theta), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (HGate(), [q[1]], []),
-]:
-    def_rzx.append(inst, qargs, cargs)
-_sel.add_equivalence(RZXGate(theta), def_rzx)
+@_sel.lazy_entry("rzx", 2)
+def _rzx_to_cxrz(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    rzx_to_cxrz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (RZGate(theta), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        rzx_to_cxrz.append(inst, qargs, cargs)
+    lib.add_equivalence(RZXGate(theta), rzx_to_cxrz)
+
 
 # ECRGate
 #
@@ -469,35 +550,44 @@ _sel.add_equivalence(RZXGate(theta), def_rzx)
 #      │  Ecr │  ≡       │  Rzx(π/4) │└───┘│  Rzx(-π/4) │
 # q_1: ┤1     ├     q_1: ┤1          ├─────┤1           ├
 #      └──────┘          └───────────┘     └────────────┘
-q = QuantumRegister(2, "q")
-def_ecr = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (RZXGate(pi / 4), [q[0], q[1]], []),
-    (XGate(), [q[0]], []),
-    (RZXGate(-pi / 4), [q[0], q[1]], []),
-]:
-    def_ecr.append(inst, qargs, cargs)
-_sel.add_equivalence(ECRGate(), def_ecr)
+@_sel.lazy_entry("ecr", 2)
+def _def_ecr(lib):
+    q = QuantumRegister(2, "q")
+    def_ecr = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (RZXGate(pi / 4), [q[0], q[1]], []),
+        (XGate(), [q[0]], []),
+        (RZXGate(-pi / 4), [q[0], q[1]], []),
+    ]:
+        def_ecr.append(inst, qargs, cargs)
+    lib.add_equivalence(ECRGate(), def_ecr)
+
 
 # SGate
 #
 #    ┌───┐        ┌─────────┐
 # q: ┤ S ├  ≡  q: ┤ U1(π/2) ├
 #    └───┘        └─────────┘
-q = QuantumRegister(1, "q")
-def_s = QuantumCircuit(q)
-def_s.append(U1Gate(pi / 2), [q[0]], [])
-_sel.add_equivalence(SGate(), def_s)
+@_sel.lazy_entry("s", 1)
+def _def_s(lib):
+    q = QuantumRegister(1, "q")
+    def_s = QuantumCircuit(q)
+    def_s.append(U1Gate(pi / 2), [q[0]], [])
+    lib.add_equivalence(SGate(), def_s)
+
 
 # SdgGate
 #
 #    ┌─────┐        ┌──────────┐
 # q: ┤ Sdg ├  ≡  q: ┤ U1(-π/2) ├
 #    └─────┘        └──────────┘
-q = QuantumRegister(1, "q")
-def_sdg = QuantumCircuit(q)
-def_sdg.append(U1Gate(-pi / 2), [q[0]], [])
-_sel.add_equivalence(SdgGate(), def_sdg)
+@_sel.lazy_entry("sdg", 1)
+def _def_sdg(lib):
+    q = QuantumRegister(1, "q")
+    def_sdg = QuantumCircuit(q)
+    def_sdg.append(U1Gate(-pi / 2), [q[0]], [])
+    lib.add_equivalence(SdgGate(), def_sdg)
+
 
 # CSGate
 #
@@ -505,12 +595,15 @@ _sel.add_equivalence(SdgGate(), def_sdg)
 #      ┌─┴─┐        ┌───┐┌─┴──┐┌───┐
 # q_1: ┤ S ├ = q_1: ┤ H ├┤ Sx ├┤ H ├
 #      └───┘        └───┘└────┘└───┘
-q = QuantumRegister(2, "q")
-def_cs = QuantumCircuit(q)
-def_cs.append(HGate(), [q[1]], [])
-def_cs.append(CSXGate(), [q[0], q[1]], [])
-def_cs.append(HGate(), [q[1]], [])
-_sel.add_equivalence(CSGate(), def_cs)
+@_sel.lazy_entry("cs", 2)
+def _def_cs(lib):
+    q = QuantumRegister(2, "q")
+    def_cs = QuantumCircuit(q)
+    def_cs.append(HGate(), [q[1]], [])
+    def_cs.append(CSXGate(), [q[0], q[1]], [])
+    def_cs.append(HGate(), [q[1]], [])
+    lib.add_equivalence(CSGate(), def_cs)
+
 
 # CSdgGate
 #
@@ -518,56 +611,68 @@ _sel.add_equivalence(CSGate(), def_cs)
 #      ┌──┴──┐        ┌───┐┌─┴─┐┌─┴──┐┌───┐
 # q_1: ┤ Sdg ├ = q_1: ┤ H ├┤ X ├┤ Sx ├┤ H ├
 #      └─────┘        └───┘└───┘└────┘└───┘
-q = QuantumRegister(2, "q")
-def_csdg = QuantumCircuit(q)
-def_csdg.append(HGate(), [q[1]], [])
-def_csdg.append(CXGate(), [q[0], q[1]], [])
-def_csdg.append(CSXGate(), [q[0], q[1]], [])
-def_csdg.append(HGate(), [q[1]], [])
-_sel.add_equivalence(CSdgGate(), def_csdg)
+@_sel.lazy_entry("csdg", 2)
+def _def_csdg(lib):
+    q = QuantumRegister(2, "q")
+    def_csdg = QuantumCircuit(q)
+    def_csdg.append(HGate(), [q[1]], [])
+    def_csdg.append(CXGate(), [q[0], q[1]], [])
+    def_csdg.append(CSXGate(), [q[0], q[1]], [])
+    def_csdg.append(HGate(), [q[1]], [])
+    lib.add_equivalence(CSdgGate(), def_csdg)
+
 
 # SdgGate
 #
 #    ┌─────┐        ┌───┐┌───┐
 # q: ┤ Sdg ├  ≡  q: ┤ S ├┤ Z ├
 #    └─────┘        └───┘└───┘
-q = QuantumRegister(1, "q")
-def_sdg = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (SGate(), [q[0]], []),
-    (ZGate(), [q[0]], []),
-]:
-    def_sdg.append(inst, qargs, cargs)
-_sel.add_equivalence(SdgGate(), def_sdg)
+@_sel.lazy_entry("sdg", 1)
+def _sdg_to_sz(lib):
+    q = QuantumRegister(1, "q")
+    sdg_to_sz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (SGate(), [q[0]], []),
+        (ZGate(), [q[0]], []),
+    ]:
+        sdg_to_sz.append(inst, qargs, cargs)
+    lib.add_equivalence(SdgGate(), sdg_to_sz)
+
 
 # SdgGate
 #
 #    ┌─────┐        ┌───┐┌───┐
 # q: ┤ Sdg ├  ≡  q: ┤ Z ├┤ S ├
 #    └─────┘        └───┘└───┘
-q = QuantumRegister(1, "q")
-def_sdg = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (ZGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-]:
-    def_sdg.append(inst, qargs, cargs)
-_sel.add_equivalence(SdgGate(), def_sdg)
+@_sel.lazy_entry("sdg", 1)
+def _sdg_to_zs(lib):
+    q = QuantumRegister(1, "q")
+    sdg_to_zs = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (ZGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+    ]:
+        sdg_to_zs.append(inst, qargs, cargs)
+    lib.add_equivalence(SdgGate(), sdg_to_zs)
+
 
 # SdgGate
 #
 #    ┌─────┐        ┌───┐┌───┐┌───┐
 # q: ┤ Sdg ├  ≡  q: ┤ S ├┤ S ├┤ S ├
 #    └─────┘        └───┘└───┘└───┘
-q = QuantumRegister(1, "q")
-def_sdg = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (SGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-]:
-    def_sdg.append(inst, qargs, cargs)
-_sel.add_equivalence(SdgGate(), def_sdg)
+@_sel.lazy_entry("sdg", 1)
+def _sdg_to_sss(lib):
+    q = QuantumRegister(1, "q")
+    sdg_to_sss = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (SGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+    ]:
+        sdg_to_sss.append(inst, qargs, cargs)
+    lib.add_equivalence(SdgGate(), sdg_to_sss)
+
 
 # SwapGate
 #                        ┌───┐
@@ -575,15 +680,18 @@ _sel.add_equivalence(SdgGate(), def_sdg)
 #       │   ≡       ┌─┴─┐└─┬─┘┌─┴─┐
 # q_1: ─X─     q_1: ┤ X ├──■──┤ X ├
 #                   └───┘     └───┘
-q = QuantumRegister(2, "q")
-def_swap = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (CXGate(), [q[0], q[1]], []),
-    (CXGate(), [q[1], q[0]], []),
-    (CXGate(), [q[0], q[1]], []),
-]:
-    def_swap.append(inst, qargs, cargs)
-_sel.add_equivalence(SwapGate(), def_swap)
+@_sel.lazy_entry("swap", 2)
+def _def_swap(lib):
+    q = QuantumRegister(2, "q")
+    def_swap = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (CXGate(), [q[0], q[1]], []),
+        (CXGate(), [q[1], q[0]], []),
+        (CXGate(), [q[0], q[1]], []),
+    ]:
+        def_swap.append(inst, qargs, cargs)
+    lib.add_equivalence(SwapGate(), def_swap)
+
 
 # iSwapGate
 #
@@ -592,60 +700,79 @@ _sel.add_equivalence(SwapGate(), def_swap)
 #      │  Iswap │  ≡       ├───┤└───┘┌─┴─┐└─┬─┘┌───┐
 # q_1: ┤1       ├     q_1: ┤ S ├─────┤ X ├──■──┤ H ├
 #      └────────┘          └───┘     └───┘     └───┘
-q = QuantumRegister(2, "q")
-def_iswap = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (SGate(), [q[0]], []),
-    (SGate(), [q[1]], []),
-    (HGate(), [q[0]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (CXGate(), [q[1], q[0]], []),
-    (HGate(), [q[1]], []),
-]:
-    def_iswap.append(inst, qargs, cargs)
-_sel.add_equivalence(iSwapGate(), def_iswap)
+@_sel.lazy_entry("iswap", 2)
+def _def_iswap(lib):
+    q = QuantumRegister(2, "q")
+    def_iswap = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (SGate(), [q[0]], []),
+        (SGate(), [q[1]], []),
+        (HGate(), [q[0]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (CXGate(), [q[1], q[0]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        def_iswap.append(inst, qargs, cargs)
+    lib.add_equivalence(iSwapGate(), def_iswap)
+
 
 # SXGate
 #               global phase: π/4
 #    ┌────┐        ┌─────┐┌───┐┌─────┐
 # q: ┤ √X ├  ≡  q: ┤ Sdg ├┤ H ├┤ Sdg ├
 #    └────┘        └─────┘└───┘└─────┘
-q = QuantumRegister(1, "q")
-def_sx = QuantumCircuit(q, global_phase=pi / 4)
-for inst, qargs, cargs in [(SdgGate(), [q[0]], []), (HGate(), [q[0]], []), (SdgGate(), [q[0]], [])]:
-    def_sx.append(inst, qargs, cargs)
-_sel.add_equivalence(SXGate(), def_sx)
+@_sel.lazy_entry("sx", 1)
+def _def_sx(lib):
+    q = QuantumRegister(1, "q")
+    def_sx = QuantumCircuit(q, global_phase=pi / 4)
+    for inst, qargs, cargs in [
+        (SdgGate(), [q[0]], []),
+        (HGate(), [q[0]], []),
+        (SdgGate(), [q[0]], []),
+    ]:
+        def_sx.append(inst, qargs, cargs)
+    lib.add_equivalence(SXGate(), def_sx)
+
 
 # SXGate
 #               global phase: π/4
 #    ┌────┐        ┌─────────┐
 # q: ┤ √X ├  ≡  q: ┤ Rx(π/2) ├
 #    └────┘        └─────────┘
-q = QuantumRegister(1, "q")
-sx_to_rx = QuantumCircuit(q, global_phase=pi / 4)
-sx_to_rx.rx(pi / 2, 0)
-_sel.add_equivalence(SXGate(), sx_to_rx)
+@_sel.lazy_entry("sx", 1)
+def _sx_to_rx(lib):
+    q = QuantumRegister(1, "q")
+    sx_to_rx = QuantumCircuit(q, global_phase=pi / 4)
+    sx_to_rx.rx(pi / 2, 0)
+    lib.add_equivalence(SXGate(), sx_to_rx)
+
 
 # SXdgGate
 #                 global phase: 7π/4
 #    ┌──────┐        ┌───┐┌───┐┌───┐
 # q: ┤ √Xdg ├  ≡  q: ┤ S ├┤ H ├┤ S ├
 #    └──────┘        └───┘└───┘└───┘
-q = QuantumRegister(1, "q")
-def_sxdg = QuantumCircuit(q, global_phase=-pi / 4)
-for inst, qargs, cargs in [(SGate(), [q[0]], []), (HGate(), [q[0]], []), (SGate(), [q[0]], [])]:
-    def_sxdg.append(inst, qargs, cargs)
-_sel.add_equivalence(SXdgGate(), def_sxdg)
+@_sel.lazy_entry("sxdg", 1)
+def _def_sxdg(lib):
+    q = QuantumRegister(1, "q")
+    def_sxdg = QuantumCircuit(q, global_phase=-pi / 4)
+    for inst, qargs, cargs in [(SGate(), [q[0]], []), (HGate(), [q[0]], []), (SGate(), [q[0]], [])]:
+        def_sxdg.append(inst, qargs, cargs)
+    lib.add_equivalence(SXdgGate(), def_sxdg)
+
 
 # SXdgGate
 #                 global phase: 7π/4
 #    ┌──────┐        ┌──────────┐
 # q: ┤ √Xdg ├  ≡  q: ┤ Rx(-π/2) ├
 #    └──────┘        └──────────┘
-q = QuantumRegister(1, "q")
-sxdg_to_rx = QuantumCircuit(q, global_phase=-pi / 4)
-sxdg_to_rx.rx(-pi / 2, 0)
-_sel.add_equivalence(SXdgGate(), sxdg_to_rx)
+@_sel.lazy_entry("sxdg", 1)
+def _sxdg_to_rx(lib):
+    q = QuantumRegister(1, "q")
+    sxdg_to_rx = QuantumCircuit(q, global_phase=-pi / 4)
+    sxdg_to_rx.rx(-pi / 2, 0)
+    lib.add_equivalence(SXdgGate(), sxdg_to_rx)
+
 
 # CSXGate
 #
@@ -653,15 +780,18 @@ _sel.add_equivalence(SXdgGate(), sxdg_to_rx)
 #      ┌─┴──┐  ≡       ┌───┐ │U1(π/2) ┌───┐
 # q_1: ┤ Sx ├     q_1: ┤ H ├─■────────┤ H ├
 #      └────┘          └───┘          └───┘
-q = QuantumRegister(2, "q")
-def_csx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[1]], []),
-    (CU1Gate(pi / 2), [q[0], q[1]], []),
-    (HGate(), [q[1]], []),
-]:
-    def_csx.append(inst, qargs, cargs)
-_sel.add_equivalence(CSXGate(), def_csx)
+@_sel.lazy_entry("csx", 2)
+def _def_csx(lib):
+    q = QuantumRegister(2, "q")
+    def_csx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[1]], []),
+        (CU1Gate(pi / 2), [q[0], q[1]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        def_csx.append(inst, qargs, cargs)
+    lib.add_equivalence(CSXGate(), def_csx)
+
 
 # CSXGate
 #                 global phase: π/8
@@ -670,17 +800,19 @@ _sel.add_equivalence(CSXGate(), def_csx)
 #      ┌─┴──┐  ≡       └───┘│  Rzx(π/4) │┌┴─────┴─┐└───┘
 # q_1: ┤ Sx ├     q_1: ─────┤1          ├┤ sx^0.5 ├─────
 #      └────┘               └───────────┘└────────┘
-q = QuantumRegister(2, "q")
-csx_to_zx45 = QuantumCircuit(q, global_phase=pi / 4)
-for inst, qargs, cargs in [
-    (XGate(), [q[0]], []),
-    (RZXGate(pi / 4), [q[0], q[1]], []),
-    (TdgGate(), [q[0]], []),
-    (XGate(), [q[0]], []),
-    (RXGate(pi / 4), [q[1]], []),
-]:
-    csx_to_zx45.append(inst, qargs, cargs)
-_sel.add_equivalence(CSXGate(), csx_to_zx45)
+@_sel.lazy_entry("csx", 2)
+def _csx_to_zx45(lib):
+    q = QuantumRegister(2, "q")
+    csx_to_zx45 = QuantumCircuit(q, global_phase=pi / 4)
+    for inst, qargs, cargs in [
+        (XGate(), [q[0]], []),
+        (RZXGate(pi / 4), [q[0], q[1]], []),
+        (TdgGate(), [q[0]], []),
+        (XGate(), [q[0]], []),
+        (RXGate(pi / 4), [q[1]], []),
+    ]:
+        csx_to_zx45.append(inst, qargs, cargs)
+    lib.add_equivalence(CSXGate(), csx_to_zx45)
 
 
 # DCXGate
@@ -690,11 +822,14 @@ _sel.add_equivalence(CSXGate(), csx_to_zx45)
 #      │  Dcx │  ≡       ┌─┴─┐└─┬─┘
 # q_1: ┤1     ├     q_1: ┤ X ├──■──
 #      └──────┘          └───┘
-q = QuantumRegister(2, "q")
-def_dcx = QuantumCircuit(q)
-for inst, qargs, cargs in [(CXGate(), [q[0], q[1]], []), (CXGate(), [q[1], q[0]], [])]:
-    def_dcx.append(inst, qargs, cargs)
-_sel.add_equivalence(DCXGate(), def_dcx)
+@_sel.lazy_entry("dcx", 2)
+def _def_dcx(lib):
+    q = QuantumRegister(2, "q")
+    def_dcx = QuantumCircuit(q)
+    for inst, qargs, cargs in [(CXGate(), [q[0], q[1]], []), (CXGate(), [q[1], q[0]], [])]:
+        def_dcx.append(inst, qargs, cargs)
+    lib.add_equivalence(DCXGate(), def_dcx)
+
 
 # DCXGate
 #
@@ -703,17 +838,20 @@ _sel.add_equivalence(DCXGate(), def_dcx)
 #      │  Dcx │  ≡       ┌┴───┴┐└─────┘│  Iswap │┌───┐
 # q_1: ┤1     ├     q_1: ┤ Sdg ├───────┤1       ├┤ H ├
 #      └──────┘          └─────┘       └────────┘└───┘
-q = QuantumRegister(2, "q")
-dcx_to_iswap = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[0]], []),
-    (SdgGate(), [q[0]], []),
-    (SdgGate(), [q[1]], []),
-    (iSwapGate(), [q[0], q[1]], []),
-    (HGate(), [q[1]], []),
-]:
-    dcx_to_iswap.append(inst, qargs, cargs)
-_sel.add_equivalence(DCXGate(), dcx_to_iswap)
+@_sel.lazy_entry("dcx", 2)
+def _dcx_to_iswap(lib):
+    q = QuantumRegister(2, "q")
+    dcx_to_iswap = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[0]], []),
+        (SdgGate(), [q[0]], []),
+        (SdgGate(), [q[1]], []),
+        (iSwapGate(), [q[0], q[1]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        dcx_to_iswap.append(inst, qargs, cargs)
+    lib.add_equivalence(DCXGate(), dcx_to_iswap)
+
 
 # CSwapGate
 #
@@ -723,48 +861,60 @@ _sel.add_equivalence(DCXGate(), dcx_to_iswap)
 #       │           └─┬─┘┌─┴─┐└─┬─┘
 # q_2: ─X─     q_2: ──■──┤ X ├──■──
 #                        └───┘
-q = QuantumRegister(3, "q")
-def_cswap = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (CXGate(), [q[2], q[1]], []),
-    (CCXGate(), [q[0], q[1], q[2]], []),
-    (CXGate(), [q[2], q[1]], []),
-]:
-    def_cswap.append(inst, qargs, cargs)
-_sel.add_equivalence(CSwapGate(), def_cswap)
+@_sel.lazy_entry("cswap", 3)
+def _def_cswap(lib):
+    q = QuantumRegister(3, "q")
+    def_cswap = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (CXGate(), [q[2], q[1]], []),
+        (CCXGate(), [q[0], q[1], q[2]], []),
+        (CXGate(), [q[2], q[1]], []),
+    ]:
+        def_cswap.append(inst, qargs, cargs)
+    lib.add_equivalence(CSwapGate(), def_cswap)
+
 
 # TGate
 #
 #    ┌───┐        ┌─────────┐
 # q: ┤ T ├  ≡  q: ┤ U1(π/4) ├
 #    └───┘        └─────────┘
-q = QuantumRegister(1, "q")
-def_t = QuantumCircuit(q)
-def_t.append(U1Gate(pi / 4), [q[0]], [])
-_sel.add_equivalence(TGate(), def_t)
+@_sel.lazy_entry("t", 1)
+def _def_t(lib):
+    q = QuantumRegister(1, "q")
+    def_t = QuantumCircuit(q)
+    def_t.append(U1Gate(pi / 4), [q[0]], [])
+    lib.add_equivalence(TGate(), def_t)
+
 
 # TdgGate
 #
 #    ┌─────┐        ┌──────────┐
 # q: ┤ Tdg ├  ≡  q: ┤ U1(-π/4) ├
 #    └─────┘        └──────────┘
-q = QuantumRegister(1, "q")
-def_tdg = QuantumCircuit(q)
-def_tdg.append(U1Gate(-pi / 4), [q[0]], [])
-_sel.add_equivalence(TdgGate(), def_tdg)
+@_sel.lazy_entry("tdg", 1)
+def _def_tdg(lib):
+    q = QuantumRegister(1, "q")
+    def_tdg = QuantumCircuit(q)
+    def_tdg.append(U1Gate(-pi / 4), [q[0]], [])
+    lib.add_equivalence(TdgGate(), def_tdg)
+
 
 # UGate
 #
 #    ┌──────────┐        ┌───────────┐
 # q: ┤ U(θ,ϕ,λ) ├  ≡  q: ┤ U3(θ,ϕ,λ) ├
 #    └──────────┘        └───────────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-phi = Parameter("phi")
-lam = Parameter("lam")
-u_to_u3 = QuantumCircuit(q)
-u_to_u3.append(U3Gate(theta, phi, lam), [0])
-_sel.add_equivalence(UGate(theta, phi, lam), u_to_u3)
+@_sel.lazy_entry("u", 1)
+def _u_to_u3(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    phi = Parameter("phi")
+    lam = Parameter("lam")
+    u_to_u3 = QuantumCircuit(q)
+    u_to_u3.append(U3Gate(theta, phi, lam), [0])
+    lib.add_equivalence(UGate(theta, phi, lam), u_to_u3)
+
 
 # CUGate
 #                                  ┌──────┐    ┌──────────────┐     »
@@ -777,20 +927,23 @@ _sel.add_equivalence(UGate(theta, phi, lam), u_to_u3)
 # «     ┌──────────────────────┐┌─┴─┐┌────────────┐
 # «q_1: ┤ U(-θ/2,ϕ,-λ/2 - ϕ/2) ├┤ X ├┤ U(θ/2,ϕ,0) ├
 # «     └──────────────────────┘└───┘└────────────┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-phi = Parameter("phi")
-lam = Parameter("lam")
-gamma = Parameter("gamma")
-def_cu = QuantumCircuit(q)
-def_cu.p(gamma, 0)
-def_cu.p((lam + phi) / 2, 0)
-def_cu.p((lam - phi) / 2, 1)
-def_cu.cx(0, 1)
-def_cu.u(-theta / 2, 0, -(phi + lam) / 2, 1)
-def_cu.cx(0, 1)
-def_cu.u(theta / 2, phi, 0, 1)
-_sel.add_equivalence(CUGate(theta, phi, lam, gamma), def_cu)
+@_sel.lazy_entry("cu", 2)
+def _def_cu(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    phi = Parameter("phi")
+    lam = Parameter("lam")
+    gamma = Parameter("gamma")
+    def_cu = QuantumCircuit(q)
+    def_cu.p(gamma, 0)
+    def_cu.p((lam + phi) / 2, 0)
+    def_cu.p((lam - phi) / 2, 1)
+    def_cu.cx(0, 1)
+    def_cu.u(-theta / 2, 0, -(phi + lam) / 2, 1)
+    def_cu.cx(0, 1)
+    def_cu.u(theta / 2, phi, 0, 1)
+    lib.add_equivalence(CUGate(theta, phi, lam, gamma), def_cu)
+
 
 # CUGate
 #                              ┌──────┐
@@ -798,48 +951,60 @@ _sel.add_equivalence(CUGate(theta, phi, lam, gamma), def_cu)
 #      ┌─────┴──────┐  ≡       └──────┘┌─────┴─────┐
 # q_1: ┤ U(θ,ϕ,λ,γ) ├     q_1: ────────┤ U3(θ,ϕ,λ) ├
 #      └────────────┘                  └───────────┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-phi = Parameter("phi")
-lam = Parameter("lam")
-gamma = Parameter("gamma")
-cu_to_cu3 = QuantumCircuit(q)
-cu_to_cu3.p(gamma, 0)
-cu_to_cu3.append(CU3Gate(theta, phi, lam), [0, 1])
-_sel.add_equivalence(CUGate(theta, phi, lam, gamma), cu_to_cu3)
+@_sel.lazy_entry("cu", 2)
+def _cu_to_cu3(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    phi = Parameter("phi")
+    lam = Parameter("lam")
+    gamma = Parameter("gamma")
+    cu_to_cu3 = QuantumCircuit(q)
+    cu_to_cu3.p(gamma, 0)
+    cu_to_cu3.append(CU3Gate(theta, phi, lam), [0, 1])
+    lib.add_equivalence(CUGate(theta, phi, lam, gamma), cu_to_cu3)
+
 
 # U1Gate
 #
 #    ┌───────┐        ┌───────────┐
 # q: ┤ U1(θ) ├  ≡  q: ┤ U3(0,0,θ) ├
 #    └───────┘        └───────────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-def_u1 = QuantumCircuit(q)
-def_u1.append(U3Gate(0, 0, theta), [q[0]], [])
-_sel.add_equivalence(U1Gate(theta), def_u1)
+@_sel.lazy_entry("u1", 1)
+def _def_u1(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    def_u1 = QuantumCircuit(q)
+    def_u1.append(U3Gate(0, 0, theta), [q[0]], [])
+    lib.add_equivalence(U1Gate(theta), def_u1)
+
 
 # U1Gate
 #
 #    ┌───────┐        ┌──────┐
 # q: ┤ U1(θ) ├  ≡  q: ┤ P(0) ├
 #    └───────┘        └──────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-u1_to_phase = QuantumCircuit(q)
-u1_to_phase.p(theta, 0)
-_sel.add_equivalence(U1Gate(theta), u1_to_phase)
+@_sel.lazy_entry("u1", 1)
+def _u1_to_phase(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    u1_to_phase = QuantumCircuit(q)
+    u1_to_phase.p(theta, 0)
+    lib.add_equivalence(U1Gate(theta), u1_to_phase)
+
 
 # U1Gate
 #                  global phase: θ/2
 #    ┌───────┐        ┌───────┐
 # q: ┤ U1(θ) ├  ≡  q: ┤ Rz(θ) ├
 #    └───────┘        └───────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-u1_to_rz = QuantumCircuit(q, global_phase=theta / 2)
-u1_to_rz.append(RZGate(theta), [q[0]], [])
-_sel.add_equivalence(U1Gate(theta), u1_to_rz)
+@_sel.lazy_entry("u1", 1)
+def _u1_to_rz(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    u1_to_rz = QuantumCircuit(q, global_phase=theta / 2)
+    u1_to_rz.append(RZGate(theta), [q[0]], [])
+    lib.add_equivalence(U1Gate(theta), u1_to_rz)
+
 
 # CU1Gate
 #                       ┌─────────┐
@@ -847,74 +1012,89 @@ _sel.add_equivalence(U1Gate(theta), u1_to_rz)
 #       │U1(θ)  ≡       └─────────┘┌─┴─┐┌──────────┐┌─┴─┐┌─────────┐
 # q_1: ─■─────     q_1: ───────────┤ X ├┤ U1(-θ/2) ├┤ X ├┤ U1(θ/2) ├
 #                                  └───┘└──────────┘└───┘└─────────┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-def_cu1 = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (U1Gate(theta / 2), [q[0]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (U1Gate(-theta / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (U1Gate(theta / 2), [q[1]], []),
-]:
-    def_cu1.append(inst, qargs, cargs)
-_sel.add_equivalence(CU1Gate(theta), def_cu1)
+@_sel.lazy_entry("cu1", 2)
+def _def_cu1(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    def_cu1 = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (U1Gate(theta / 2), [q[0]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (U1Gate(-theta / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (U1Gate(theta / 2), [q[1]], []),
+    ]:
+        def_cu1.append(inst, qargs, cargs)
+    lib.add_equivalence(CU1Gate(theta), def_cu1)
+
 
 # U2Gate
 #
 #    ┌─────────┐        ┌─────────────┐
 # q: ┤ U2(ϕ,λ) ├  ≡  q: ┤ U3(π/2,ϕ,λ) ├
 #    └─────────┘        └─────────────┘
-q = QuantumRegister(1, "q")
-phi = Parameter("phi")
-lam = Parameter("lam")
-def_u2 = QuantumCircuit(q)
-def_u2.append(U3Gate(pi / 2, phi, lam), [q[0]], [])
-_sel.add_equivalence(U2Gate(phi, lam), def_u2)
+@_sel.lazy_entry("u2", 1)
+def _def_u2(lib):
+    q = QuantumRegister(1, "q")
+    phi = Parameter("phi")
+    lam = Parameter("lam")
+    def_u2 = QuantumCircuit(q)
+    def_u2.append(U3Gate(pi / 2, phi, lam), [q[0]], [])
+    lib.add_equivalence(U2Gate(phi, lam), def_u2)
+
 
 # U2Gate
 #                    global phase: 7π/4
 #    ┌─────────┐        ┌─────────────┐┌────┐┌─────────────┐
 # q: ┤ U2(ϕ,λ) ├  ≡  q: ┤ U1(λ - π/2) ├┤ √X ├┤ U1(ϕ + π/2) ├
 #    └─────────┘        └─────────────┘└────┘└─────────────┘
-q = QuantumRegister(1, "q")
-phi = Parameter("phi")
-lam = Parameter("lam")
-u2_to_u1sx = QuantumCircuit(q, global_phase=-pi / 4)
-u2_to_u1sx.append(U1Gate(lam - pi / 2), [0])
-u2_to_u1sx.sx(0)
-u2_to_u1sx.append(U1Gate(phi + pi / 2), [0])
-_sel.add_equivalence(U2Gate(phi, lam), u2_to_u1sx)
+@_sel.lazy_entry("u2", 1)
+def _u2_to_u1sx(lib):
+    q = QuantumRegister(1, "q")
+    phi = Parameter("phi")
+    lam = Parameter("lam")
+    u2_to_u1sx = QuantumCircuit(q, global_phase=-pi / 4)
+    u2_to_u1sx.append(U1Gate(lam - pi / 2), [0])
+    u2_to_u1sx.sx(0)
+    u2_to_u1sx.append(U1Gate(phi + pi / 2), [0])
+    lib.add_equivalence(U2Gate(phi, lam), u2_to_u1sx)
+
 
 # U3Gate
 #                         global phase: λ/2 + ϕ/2 - π/2
 #    ┌───────────┐        ┌───────┐┌────┐┌───────────┐┌────┐┌────────────┐
 # q: ┤ U3(θ,ϕ,λ) ├  ≡  q: ┤ Rz(λ) ├┤ √X ├┤ Rz(θ + π) ├┤ √X ├┤ Rz(ϕ + 3π) ├
 #    └───────────┘        └───────┘└────┘└───────────┘└────┘└────────────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-phi = Parameter("phi")
-lam = Parameter("lam")
-u3_qasm_def = QuantumCircuit(q, global_phase=(lam + phi - pi) / 2)
-u3_qasm_def.rz(lam, 0)
-u3_qasm_def.sx(0)
-u3_qasm_def.rz(theta + pi, 0)
-u3_qasm_def.sx(0)
-u3_qasm_def.rz(phi + 3 * pi, 0)
-_sel.add_equivalence(U3Gate(theta, phi, lam), u3_qasm_def)
+@_sel.lazy_entry("u3", 1)
+def _u3_qasm_def(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    phi = Parameter("phi")
+    lam = Parameter("lam")
+    u3_qasm_def = QuantumCircuit(q, global_phase=(lam + phi - pi) / 2)
+    u3_qasm_def.rz(lam, 0)
+    u3_qasm_def.sx(0)
+    u3_qasm_def.rz(theta + pi, 0)
+    u3_qasm_def.sx(0)
+    u3_qasm_def.rz(phi + 3 * pi, 0)
+    lib.add_equivalence(U3Gate(theta, phi, lam), u3_qasm_def)
+
 
 # U3Gate
 #
 #    ┌───────────┐        ┌──────────┐
 # q: ┤ U3(θ,ϕ,λ) ├  ≡  q: ┤ U(θ,ϕ,λ) ├
 #    └───────────┘        └──────────┘
-q = QuantumRegister(1, "q")
-theta = Parameter("theta")
-phi = Parameter("phi")
-lam = Parameter("lam")
-u3_to_u = QuantumCircuit(q)
-u3_to_u.u(theta, phi, lam, 0)
-_sel.add_equivalence(U3Gate(theta, phi, lam), u3_to_u)
+@_sel.lazy_entry("u3", 1)
+def _u3_to_u(lib):
+    q = QuantumRegister(1, "q")
+    theta = Parameter("theta")
+    phi = Parameter("phi")
+    lam = Parameter("lam")
+    u3_to_u = QuantumCircuit(q)
+    u3_to_u.u(theta, phi, lam, 0)
+    lib.add_equivalence(U3Gate(theta, phi, lam), u3_to_u)
+
 
 # CU3Gate
 #                             ┌───────────────┐                                   »
@@ -927,62 +1107,65 @@ _sel.add_equivalence(U3Gate(theta, phi, lam), u3_to_u)
 # «     ┌─────────────┐
 # «q_1: ┤ U3(θ/2,ϕ,0) ├
 # «     └─────────────┘
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-phi = Parameter("phi")
-lam = Parameter("lam")
-def_cu3 = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (U1Gate((lam + phi) / 2), [q[0]], []),
-    (U1Gate((lam - phi) / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (U3Gate(-theta / 2, 0, -(phi + lam) / 2), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (U3Gate(theta / 2, phi, 0), [q[1]], []),
-]:
-    def_cu3.append(inst, qargs, cargs)
-_sel.add_equivalence(CU3Gate(theta, phi, lam), def_cu3)
-
-q = QuantumRegister(2, "q")
-theta = Parameter("theta")
-phi = Parameter("phi")
-lam = Parameter("lam")
-cu3_to_cu = QuantumCircuit(q)
-cu3_to_cu.cu(theta, phi, lam, 0, 0, 1)
+@_sel.lazy_entry("cu3", 2)
+def _def_cu3(lib):
+    q = QuantumRegister(2, "q")
+    theta = Parameter("theta")
+    phi = Parameter("phi")
+    lam = Parameter("lam")
+    def_cu3 = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (U1Gate((lam + phi) / 2), [q[0]], []),
+        (U1Gate((lam - phi) / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (U3Gate(-theta / 2, 0, -(phi + lam) / 2), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (U3Gate(theta / 2, phi, 0), [q[1]], []),
+    ]:
+        def_cu3.append(inst, qargs, cargs)
+    lib.add_equivalence(CU3Gate(theta, phi, lam), def_cu3)
+
 
 # XGate
 #
 #    ┌───┐        ┌───────────┐
 # q: ┤ X ├  ≡  q: ┤ U3(π,0,π) ├
 #    └───┘        └───────────┘
-q = QuantumRegister(1, "q")
-def_x = QuantumCircuit(q)
-def_x.append(U3Gate(pi, 0, pi), [q[0]], [])
-_sel.add_equivalence(XGate(), def_x)
+@_sel.lazy_entry("x", 1)
+def _def_x(lib):
+    q = QuantumRegister(1, "q")
+    def_x = QuantumCircuit(q)
+    def_x.append(U3Gate(pi, 0, pi), [q[0]], [])
+    lib.add_equivalence(XGate(), def_x)
+
 
 # XGate
 #
 #    ┌───┐        ┌───┐┌───┐┌───┐┌───┐
 # q: ┤ X ├  ≡  q: ┤ H ├┤ S ├┤ S ├┤ H ├
 #    └───┘        └───┘└───┘└───┘└───┘
-q = QuantumRegister(1, "q")
-def_x = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (HGate(), [q[0]], []),
-]:
-    def_x.append(inst, qargs, cargs)
-_sel.add_equivalence(XGate(), def_x)
+@_sel.lazy_entry("x", 1)
+def _x_to_hssh(lib):
+    q = QuantumRegister(1, "q")
+    x_to_hssh = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (HGate(), [q[0]], []),
+    ]:
+        x_to_hssh.append(inst, qargs, cargs)
+    lib.add_equivalence(XGate(), x_to_hssh)
 
 
 # CXGate
+@_sel.lazy_entry("cx", 2)
+def _cx_to_rxx(lib):
+    for plus_ry in [False, True]:
+        for plus_rxx in [False, True]:
+            cx_to_rxx = cnot_rxx_decompose(plus_ry, plus_rxx)
+            lib.add_equivalence(CXGate(), cx_to_rxx)
 
-for plus_ry in [False, True]:
-    for plus_rxx in [False, True]:
-        cx_to_rxx = cnot_rxx_decompose(plus_ry, plus_rxx)
-        _sel.add_equivalence(CXGate(), cx_to_rxx)
 
 # CXGate
 #
@@ -990,15 +1173,18 @@ for plus_ry in [False, True]:
 #      ┌─┴─┐  ≡       ┌───┐ │ ┌───┐
 # q_1: ┤ X ├     q_1: ┤ H ├─■─┤ H ├
 #      └───┘          └───┘   └───┘
-q = QuantumRegister(2, "q")
-cx_to_cz = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[1]], []),
-    (CZGate(), [q[0], q[1]], []),
-    (HGate(), [q[1]], []),
-]:
-    cx_to_cz.append(inst, qargs, cargs)
-_sel.add_equivalence(CXGate(), cx_to_cz)
+@_sel.lazy_entry("cx", 2)
+def _cx_to_cz(lib):
+    q = QuantumRegister(2, "q")
+    cx_to_cz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[1]], []),
+        (CZGate(), [q[0], q[1]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        cx_to_cz.append(inst, qargs, cargs)
+    lib.add_equivalence(CXGate(), cx_to_cz)
+
 
 # CXGate
 #                global phase: 3π/4
@@ -1007,25 +1193,28 @@ _sel.add_equivalence(CXGate(), cx_to_cz)
 #      ┌─┴─┐  ≡       ├───┤┌───┐│  Iswap │├───┤┌───┐│  Iswap │├───┤├───┤┌───┐
 # q_1: ┤ X ├     q_1: ┤ X ├┤ H ├┤1       ├┤ X ├┤ H ├┤1       ├┤ S ├┤ X ├┤ H ├
 #      └───┘          └───┘└───┘└────────┘└───┘└───┘└────────┘└───┘└───┘└───┘
-q = QuantumRegister(2, "q")
-cx_to_iswap = QuantumCircuit(q, global_phase=3 * pi / 4)
-for inst, qargs, cargs in [
-    (HGate(), [q[0]], []),
-    (XGate(), [q[1]], []),
-    (HGate(), [q[1]], []),
-    (iSwapGate(), [q[0], q[1]], []),
-    (XGate(), [q[0]], []),
-    (XGate(), [q[1]], []),
-    (HGate(), [q[1]], []),
-    (iSwapGate(), [q[0], q[1]], []),
-    (HGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (SGate(), [q[1]], []),
-    (XGate(), [q[1]], []),
-    (HGate(), [q[1]], []),
-]:
-    cx_to_iswap.append(inst, qargs, cargs)
-_sel.add_equivalence(CXGate(), cx_to_iswap)
+@_sel.lazy_entry("cx", 2)
+def _cx_to_iswap(lib):
+    q = QuantumRegister(2, "q")
+    cx_to_iswap = QuantumCircuit(q, global_phase=3 * pi / 4)
+    for inst, qargs, cargs in [
+        (HGate(), [q[0]], []),
+        (XGate(), [q[1]], []),
+        (HGate(), [q[1]], []),
+        (iSwapGate(), [q[0], q[1]], []),
+        (XGate(), [q[0]], []),
+        (XGate(), [q[1]], []),
+        (HGate(), [q[1]], []),
+        (iSwapGate(), [q[0], q[1]], []),
+        (HGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (SGate(), [q[1]], []),
+        (XGate(), [q[1]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        cx_to_iswap.append(inst, qargs, cargs)
+    lib.add_equivalence(CXGate(), cx_to_iswap)
+
 
 # CXGate
 #                global phase: 7π/4
@@ -1034,31 +1223,37 @@ _sel.add_equivalence(CXGate(), cx_to_iswap)
 #      ┌─┴─┐  ≡       ├─────────┬┘└───────┘│  Ecr │
 # q_1: ┤ X ├     q_1: ┤ Rx(π/2) ├──────────┤1     ├
 #      └───┘          └─────────┘          └──────┘
-q = QuantumRegister(2, "q")
-cx_to_ecr = QuantumCircuit(q, global_phase=-pi / 4)
-for inst, qargs, cargs in [
-    (RZGate(-pi / 2), [q[0]], []),
-    (RYGate(pi), [q[0]], []),
-    (RXGate(pi / 2), [q[1]], []),
-    (ECRGate(), [q[0], q[1]], []),
-]:
-    cx_to_ecr.append(inst, qargs, cargs)
-_sel.add_equivalence(CXGate(), cx_to_ecr)
+@_sel.lazy_entry("cx", 2)
+def _cx_to_ecr(lib):
+    q = QuantumRegister(2, "q")
+    cx_to_ecr = QuantumCircuit(q, global_phase=-pi / 4)
+    for inst, qargs, cargs in [
+        (RZGate(-pi / 2), [q[0]], []),
+        (RYGate(pi), [q[0]], []),
+        (RXGate(pi / 2), [q[1]], []),
+        (ECRGate(), [q[0], q[1]], []),
+    ]:
+        cx_to_ecr.append(inst, qargs, cargs)
+    lib.add_equivalence(CXGate(), cx_to_ecr)
+
 
 # CXGate
 # q_0: ──■──     q_0: ───────────────■───────────────────
 #      ┌─┴─┐  ≡       ┌────────────┐ │P(π) ┌────────────┐
 # q_1: ┤ X ├     q_1: ┤ U(π/2,0,π) ├─■─────┤ U(π/2,0,π) ├
 #      └───┘          └────────────┘       └────────────┘
-q = QuantumRegister(2, "q")
-cx_to_cp = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (UGate(pi / 2, 0, pi), [q[1]], []),
-    (CPhaseGate(pi), [q[0], q[1]], []),
-    (UGate(pi / 2, 0, pi), [q[1]], []),
-]:
-    cx_to_cp.append(inst, qargs, cargs)
-_sel.add_equivalence(CXGate(), cx_to_cp)
+@_sel.lazy_entry("cx", 2)
+def _cx_to_cp(lib):
+    q = QuantumRegister(2, "q")
+    cx_to_cp = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (UGate(pi / 2, 0, pi), [q[1]], []),
+        (CPhaseGate(pi), [q[0], q[1]], []),
+        (UGate(pi / 2, 0, pi), [q[1]], []),
+    ]:
+        cx_to_cp.append(inst, qargs, cargs)
+    lib.add_equivalence(CXGate(), cx_to_cp)
+
 
 # CXGate
 #                     ┌────────────┐
@@ -1066,16 +1261,19 @@ _sel.add_equivalence(CXGate(), cx_to_cp)
 #      ┌─┴─┐  ≡       ├────────────┤┌───┴───┐┌────────────┐
 # q_1: ┤ X ├     q_1: ┤ U(π/2,0,π) ├┤ Rz(π) ├┤ U(π/2,0,π) ├
 #      └───┘          └────────────┘└───────┘└────────────┘
-q = QuantumRegister(2, "q")
-cx_to_crz = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (UGate(pi / 2, 0, pi), [q[1]], []),
-    (UGate(0, 0, pi / 2), [q[0]], []),
-    (CRZGate(pi), [q[0], q[1]], []),
-    (UGate(pi / 2, 0, pi), [q[1]], []),
-]:
-    cx_to_crz.append(inst, qargs, cargs)
-_sel.add_equivalence(CXGate(), cx_to_crz)
+@_sel.lazy_entry("cx", 2)
+def _cx_to_crz(lib):
+    q = QuantumRegister(2, "q")
+    cx_to_crz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (UGate(pi / 2, 0, pi), [q[1]], []),
+        (UGate(0, 0, pi / 2), [q[0]], []),
+        (CRZGate(pi), [q[0], q[1]], []),
+        (UGate(pi / 2, 0, pi), [q[1]], []),
+    ]:
+        cx_to_crz.append(inst, qargs, cargs)
+    lib.add_equivalence(CXGate(), cx_to_crz)
+
 
 # CXGate
 #                global phase: π/4
@@ -1084,15 +1282,18 @@ _sel.add_equivalence(CXGate(), cx_to_crz)
 #      ┌─┴─┐  ≡       │  Rzx(π/2) │├─────┴┐
 # q_1: ┤ X ├     q_1: ┤1          ├┤ √Xdg ├
 #      └───┘          └───────────┘└──────┘
-q = QuantumRegister(2, "q")
-cx_to_zx90 = QuantumCircuit(q, global_phase=pi / 4)
-for inst, qargs, cargs in [
-    (RZXGate(pi / 2), [q[0], q[1]], []),
-    (SdgGate(), [q[0]], []),
-    (SXdgGate(), [q[1]], []),
-]:
-    cx_to_zx90.append(inst, qargs, cargs)
-_sel.add_equivalence(CXGate(), cx_to_zx90)
+@_sel.lazy_entry("cx", 2)
+def _cx_to_zx90(lib):
+    q = QuantumRegister(2, "q")
+    cx_to_zx90 = QuantumCircuit(q, global_phase=pi / 4)
+    for inst, qargs, cargs in [
+        (RZXGate(pi / 2), [q[0], q[1]], []),
+        (SdgGate(), [q[0]], []),
+        (SXdgGate(), [q[1]], []),
+    ]:
+        cx_to_zx90.append(inst, qargs, cargs)
+    lib.add_equivalence(CXGate(), cx_to_zx90)
+
 
 # CCXGate
 #                                                                       ┌───┐
@@ -1102,27 +1303,30 @@ _sel.add_equivalence(CXGate(), cx_to_zx90)
 #      ┌─┴─┐          ┌───┐┌─┴─┐┌─────┐┌─┴─┐┌───┐┌─┴─┐┌┴───┴┐┌─┴─┐├───┤└┬───┬┘└───┘
 # q_2: ┤ X ├     q_2: ┤ H ├┤ X ├┤ Tdg ├┤ X ├┤ T ├┤ X ├┤ Tdg ├┤ X ├┤ T ├─┤ H ├──────
 #      └───┘          └───┘└───┘└─────┘└───┘└───┘└───┘└─────┘└───┘└───┘ └───┘
-q = QuantumRegister(3, "q")
-def_ccx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[2]], []),
-    (CXGate(), [q[1], q[2]], []),
-    (TdgGate(), [q[2]], []),
-    (CXGate(), [q[0], q[2]], []),
-    (TGate(), [q[2]], []),
-    (CXGate(), [q[1], q[2]], []),
-    (TdgGate(), [q[2]], []),
-    (CXGate(), [q[0], q[2]], []),
-    (TGate(), [q[1]], []),
-    (TGate(), [q[2]], []),
-    (HGate(), [q[2]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (TGate(), [q[0]], []),
-    (TdgGate(), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-]:
-    def_ccx.append(inst, qargs, cargs)
-_sel.add_equivalence(CCXGate(), def_ccx)
+@_sel.lazy_entry("ccx", 3)
+def _def_ccx(lib):
+    q = QuantumRegister(3, "q")
+    def_ccx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[2]], []),
+        (CXGate(), [q[1], q[2]], []),
+        (TdgGate(), [q[2]], []),
+        (CXGate(), [q[0], q[2]], []),
+        (TGate(), [q[2]], []),
+        (CXGate(), [q[1], q[2]], []),
+        (TdgGate(), [q[2]], []),
+        (CXGate(), [q[0], q[2]], []),
+        (TGate(), [q[1]], []),
+        (TGate(), [q[2]], []),
+        (HGate(), [q[2]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (TGate(), [q[0]], []),
+        (TdgGate(), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+    ]:
+        def_ccx.append(inst, qargs, cargs)
+    lib.add_equivalence(CCXGate(), def_ccx)
+
 
 # CCXGate
 #
@@ -1132,68 +1336,80 @@ _sel.add_equivalence(CCXGate(), def_ccx)
 #      ┌─┴─┐          ┌─┴──┐├───┤└─────┘┌─┴──┐├───┤┌─┴──┐
 # q_2: ┤ X ├     q_2: ┤ Sx ├┤ Z ├───────┤ Sx ├┤ Z ├┤ Sx ├
 #      └───┘          └────┘└───┘       └────┘└───┘└────┘
-q = QuantumRegister(3, "q")
-ccx_to_cx_csx = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (CSXGate(), [q[1], q[2]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (ZGate(), [q[2]], []),
-    (SdgGate(), [q[1]], []),
-    (CSXGate(), [q[1], q[2]], []),
-    (ZGate(), [q[2]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (CSXGate(), [q[0], q[2]], []),
-]:
-    ccx_to_cx_csx.append(inst, qargs, cargs)
-_sel.add_equivalence(CCXGate(), ccx_to_cx_csx)
+@_sel.lazy_entry("ccx", 3)
+def _ccx_to_cx_csx(lib):
+    q = QuantumRegister(3, "q")
+    ccx_to_cx_csx = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (CSXGate(), [q[1], q[2]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (ZGate(), [q[2]], []),
+        (SdgGate(), [q[1]], []),
+        (CSXGate(), [q[1], q[2]], []),
+        (ZGate(), [q[2]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (CSXGate(), [q[0], q[2]], []),
+    ]:
+        ccx_to_cx_csx.append(inst, qargs, cargs)
+    lib.add_equivalence(CCXGate(), ccx_to_cx_csx)
+
 
 # YGate
 #
 #    ┌───┐        ┌───────────────┐
 # q: ┤ Y ├  ≡  q: ┤ U3(π,π/2,π/2) ├
 #    └───┘        └───────────────┘
-q = QuantumRegister(1, "q")
-def_y = QuantumCircuit(q)
-def_y.append(U3Gate(pi, pi / 2, pi / 2), [q[0]], [])
-_sel.add_equivalence(YGate(), def_y)
+@_sel.lazy_entry("y", 1)
+def _def_y(lib):
+    q = QuantumRegister(1, "q")
+    def_y = QuantumCircuit(q)
+    def_y.append(U3Gate(pi, pi / 2, pi / 2), [q[0]], [])
+    lib.add_equivalence(YGate(), def_y)
+
 
 # YGate
 #              global phase: 3π/2
 #    ┌───┐        ┌───┐┌───┐┌───┐┌───┐┌───┐┌───┐
 # q: ┤ Y ├  ≡  q: ┤ H ├┤ S ├┤ S ├┤ H ├┤ S ├┤ S ├
 #    └───┘        └───┘└───┘└───┘└───┘└───┘└───┘
-q = QuantumRegister(1, "q")
-def_y = QuantumCircuit(q)
-def_y.global_phase = 3 * pi / 2
-for inst, qargs, cargs in [
-    (HGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (HGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-]:
-    def_y.append(inst, qargs, cargs)
-_sel.add_equivalence(YGate(), def_y)
+@_sel.lazy_entry("y", 1)
+def _y_to_hsshss(lib):
+    q = QuantumRegister(1, "q")
+    y_to_hsshss = QuantumCircuit(q)
+    y_to_hsshss.global_phase = 3 * pi / 2
+    for inst, qargs, cargs in [
+        (HGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (HGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+    ]:
+        y_to_hsshss.append(inst, qargs, cargs)
+    lib.add_equivalence(YGate(), y_to_hsshss)
+
 
 # YGate
 #              global phase: π/2
 #    ┌───┐        ┌───┐┌───┐┌───┐┌───┐┌───┐┌───┐
 # q: ┤ Y ├  ≡  q: ┤ S ├┤ S ├┤ H ├┤ S ├┤ S ├┤ H ├
 #    └───┘        └───┘└───┘└───┘└───┘└───┘└───┘
-q = QuantumRegister(1, "q")
-def_y = QuantumCircuit(q)
-def_y.global_phase = pi / 2
-for inst, qargs, cargs in [
-    (SGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (HGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-    (HGate(), [q[0]], []),
-]:
-    def_y.append(inst, qargs, cargs)
-_sel.add_equivalence(YGate(), def_y)
+@_sel.lazy_entry("y", 1)
+def _y_to_sshssh(lib):
+    q = QuantumRegister(1, "q")
+    y_to_sshssh = QuantumCircuit(q)
+    y_to_sshssh.global_phase = pi / 2
+    for inst, qargs, cargs in [
+        (SGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (HGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+        (HGate(), [q[0]], []),
+    ]:
+        y_to_sshssh.append(inst, qargs, cargs)
+    lib.add_equivalence(YGate(), y_to_sshssh)
+
 
 # CYGate
 #
@@ -1201,40 +1417,48 @@ _sel.add_equivalence(YGate(), def_y)
 #      ┌─┴─┐  ≡       ┌─────┐┌─┴─┐┌───┐
 # q_1: ┤ Y ├     q_1: ┤ Sdg ├┤ X ├┤ S ├
 #      └───┘          └─────┘└───┘└───┘
-q = QuantumRegister(2, "q")
-def_cy = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (SdgGate(), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (SGate(), [q[1]], []),
-]:
-    def_cy.append(inst, qargs, cargs)
-_sel.add_equivalence(CYGate(), def_cy)
+@_sel.lazy_entry("cy", 2)
+def _def_cy(lib):
+    q = QuantumRegister(2, "q")
+    def_cy = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (SdgGate(), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (SGate(), [q[1]], []),
+    ]:
+        def_cy.append(inst, qargs, cargs)
+    lib.add_equivalence(CYGate(), def_cy)
+
 
 # ZGate
 #
 #    ┌───┐        ┌───────┐
 # q: ┤ Z ├  ≡  q: ┤ U1(π) ├
 #    └───┘        └───────┘
-q = QuantumRegister(1, "q")
-def_z = QuantumCircuit(q)
-def_z.append(U1Gate(pi), [q[0]], [])
-_sel.add_equivalence(ZGate(), def_z)
+@_sel.lazy_entry("z", 1)
+def _def_z(lib):
+    q = QuantumRegister(1, "q")
+    def_z = QuantumCircuit(q)
+    def_z.append(U1Gate(pi), [q[0]], [])
+    lib.add_equivalence(ZGate(), def_z)
+
 
-# """
 # ZGate
 #
 #    ┌───┐        ┌───┐┌───┐
 # q: ┤ Z ├  ≡  q: ┤ S ├┤ S ├
 #    └───┘        └───┘└───┘
-q = QuantumRegister(1, "q")
-def_z = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (SGate(), [q[0]], []),
-    (SGate(), [q[0]], []),
-]:
-    def_z.append(inst, qargs, cargs)
-_sel.add_equivalence(ZGate(), def_z)
+@_sel.lazy_entry("z", 1)
+def _z_to_ss(lib):
+    q = QuantumRegister(1, "q")
+    z_to_ss = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (SGate(), [q[0]], []),
+        (SGate(), [q[0]], []),
+    ]:
+        z_to_ss.append(inst, qargs, cargs)
+    lib.add_equivalence(ZGate(), z_to_ss)
+
 
 # CZGate
 #
@@ -1242,15 +1466,18 @@ _sel.add_equivalence(ZGate(), def_z)
 #       │   ≡       ┌───┐┌─┴─┐┌───┐
 # q_1: ─■─     q_1: ┤ H ├┤ X ├┤ H ├
 #                   └───┘└───┘└───┘
-q = QuantumRegister(2, "q")
-def_cz = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[1]], []),
-    (CXGate(), [q[0], q[1]], []),
-    (HGate(), [q[1]], []),
-]:
-    def_cz.append(inst, qargs, cargs)
-_sel.add_equivalence(CZGate(), def_cz)
+@_sel.lazy_entry("cz", 2)
+def _def_cz(lib):
+    q = QuantumRegister(2, "q")
+    def_cz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[1]], []),
+        (CXGate(), [q[0], q[1]], []),
+        (HGate(), [q[1]], []),
+    ]:
+        def_cz.append(inst, qargs, cargs)
+    lib.add_equivalence(CZGate(), def_cz)
+
 
 # CCZGate
 #
@@ -1260,58 +1487,72 @@ _sel.add_equivalence(CZGate(), def_cz)
 #       │         ┌───┐┌─┴─┐┌───┐
 # q_2: ─■─   q_2: ┤ H ├┤ X ├┤ H ├
 #                 └───┘└───┘└───┘
-q = QuantumRegister(3, "q")
-def_ccz = QuantumCircuit(q)
-for inst, qargs, cargs in [
-    (HGate(), [q[2]], []),
-    (CCXGate(), [q[0], q[1], q[2]], []),
-    (HGate(), [q[2]], []),
-]:
-    def_ccz.append(inst, qargs, cargs)
-_sel.add_equivalence(CCZGate(), def_ccz)
+@_sel.lazy_entry("ccz", 3)
+def _def_ccz(lib):
+    q = QuantumRegister(3, "q")
+    def_ccz = QuantumCircuit(q)
+    for inst, qargs, cargs in [
+        (HGate(), [q[2]], []),
+        (CCXGate(), [q[0], q[1], q[2]], []),
+        (HGate(), [q[2]], []),
+    ]:
+        def_ccz.append(inst, qargs, cargs)
+    lib.add_equivalence(CCZGate(), def_ccz)
+
 
 # XGate
 #              global phase: π/2
 #    ┌───┐        ┌───────┐
 # q: ┤ X ├  ≡  q: ┤ Rx(π) ├
 #    └───┘        └───────┘
-q = QuantumRegister(1, "q")
-x_to_rx = QuantumCircuit(q)
-x_to_rx.append(RXGate(theta=pi), [q[0]])
-x_to_rx.global_phase = pi / 2
-_sel.add_equivalence(XGate(), x_to_rx)
+@_sel.lazy_entry("x", 1)
+def _x_to_rx(lib):
+    q = QuantumRegister(1, "q")
+    x_to_rx = QuantumCircuit(q)
+    x_to_rx.append(RXGate(theta=pi), [q[0]])
+    x_to_rx.global_phase = pi / 2
+    lib.add_equivalence(XGate(), x_to_rx)
+
 
 # YGate
 #              global phase: π/2
 #    ┌───┐        ┌───────┐
 # q: ┤ Y ├  ≡  q: ┤ Ry(π) ├
 #    └───┘        └───────┘
-q = QuantumRegister(1, "q")
-y_to_ry = QuantumCircuit(q)
-y_to_ry.append(RYGate(theta=pi), [q[0]])
-y_to_ry.global_phase = pi / 2
-_sel.add_equivalence(YGate(), y_to_ry)
+@_sel.lazy_entry("y", 1)
+def _y_to_ry(lib):
+    q = QuantumRegister(1, "q")
+    y_to_ry = QuantumCircuit(q)
+    y_to_ry.append(RYGate(theta=pi), [q[0]])
+    y_to_ry.global_phase = pi / 2
+    lib.add_equivalence(YGate(), y_to_ry)
+
 
 # HGate
 #              global phase: π/2
 #    ┌───┐        ┌─────────┐┌───────┐
 # q: ┤ H ├  ≡  q: ┤ Ry(π/2) ├┤ Rx(π) ├
 #    └───┘        └─────────┘└───────┘
-q = QuantumRegister(1, "q")
-h_to_rxry = QuantumCircuit(q)
-h_to_rxry.append(RYGate(theta=pi / 2), [q[0]])
-h_to_rxry.append(RXGate(theta=pi), [q[0]])
-h_to_rxry.global_phase = pi / 2
-_sel.add_equivalence(HGate(), h_to_rxry)
+@_sel.lazy_entry("h", 1)
+def _h_to_rxry(lib):
+    q = QuantumRegister(1, "q")
+    h_to_rxry = QuantumCircuit(q)
+    h_to_rxry.append(RYGate(theta=pi / 2), [q[0]])
+    h_to_rxry.append(RXGate(theta=pi), [q[0]])
+    h_to_rxry.global_phase = pi / 2
+    lib.add_equivalence(HGate(), h_to_rxry)
+
 
 # HGate
 #              global phase: π/2
 #    ┌───┐        ┌────────────┐┌────────┐
 # q: ┤ H ├  ≡  q: ┤ R(π/2,π/2) ├┤ R(π,0) ├
 #    └───┘        └────────────┘└────────┘
-q = QuantumRegister(1, "q")
-h_to_rr = QuantumCircuit(q)
-h_to_rr.append(RGate(theta=pi / 2, phi=pi / 2), [q[0]])
-h_to_rr.append(RGate(theta=pi, phi=0), [q[0]])
-h_to_rr.global_phase = pi / 2
-_sel.add_equivalence(HGate(), h_to_rr)
+@_sel.lazy_entry("h", 1)
+def _h_to_rr(lib):
+    q = QuantumRegister(1, "q")
+    h_to_rr = QuantumCircuit(q)
+    h_to_rr.append(RGate(theta=pi / 2, phi=pi / 2), [q[0]])
+    h_to_rr.append(RGate(theta=pi, phi=0), [q[0]])
+    h_to_rr.global_phase = pi / 2
+    lib.add_equivalence(HGate(), h_to_rr)
@@ -12,12 +12,13 @@
 
 """Phase Gate."""
 from cmath import exp
+from functools import lru_cache
 from typing import Optional, Union
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.quantumregister import QuantumRegister
-from qiskit.circuit.parameterexpression import ParameterValueType
+from qiskit.circuit.parameterexpression import ParameterExpression, ParameterValueType
 
 
 class PhaseGate(Gate):
@@ -285,24 +286,13 @@ class MCPhaseGate(ControlledGate):
         )
 
     def _define(self):
-        # pylint: disable=cyclic-import
-        from qiskit.circuit.quantumcircuit import QuantumCircuit
-
-        q = QuantumRegister(self.num_qubits, "q")
-        qc = QuantumCircuit(q, name=self.name)
-
-        if self.num_ctrl_qubits == 0:
-            qc.p(self.params[0], 0)
-        if self.num_ctrl_qubits == 1:
-            qc.cp(self.params[0], 0, 1)
+        if isinstance(self.params[0], ParameterExpression):
+            self.definition = _mcphase_definition(self.params[0], self.num_ctrl_qubits, self.name)
         else:
-            from .u3 import _gray_code_chain
-
-            scaled_lam = self.params[0] / (2 ** (self.num_ctrl_qubits - 1))
-            bottom_gate = CPhaseGate(scaled_lam)
-            for operation, qubits, clbits in _gray_code_chain(q, self.num_ctrl_qubits, bottom_gate):
-                qc._append(operation, qubits, clbits)
-        self.definition = qc
+            # definitions for a fixed angle are shared between gates, so each gate gets a copy
+            self.definition = _cached_mcphase_definition(
+                self.params[0], self.num_ctrl_qubits, self.name
+            ).copy()
 
     def control(
         self,
@@ -332,3 +322,27 @@ class MCPhaseGate(ControlledGate):
     def inverse(self):
         r"""Return inverted MCU1 gate (:math:`MCU1(\lambda){\dagger} = MCU1(-\lambda)`)"""
         return MCPhaseGate(-self.params[0], self.num_ctrl_qubits)
+
+
+def _mcphase_definition(lam, num_ctrl_qubits, name):
+    # pylint: disable=cyclic-import
+    from qiskit.circuit.quantumcircuit import QuantumCircuit
+
+    q = QuantumRegister(num_ctrl_qubits + 1, "q")
+    qc = QuantumCircuit(q, name=name)
+
+    if num_ctrl_qubits == 0:
+        qc.p(lam, 0)
+    if num_ctrl_qubits == 1:
+        qc.cp(lam, 0, 1)
+    else:
+        from .u3 import _gray_code_chain
+
+        scaled_lam = lam / (2 ** (num_ctrl_qubits - 1))
+        bottom_gate = CPhaseGate(scaled_lam)
+        for operation, qubits, clbits in _gray_code_chain(q, num_ctrl_qubits, bottom_gate):
+            qc._append(operation, qubits, clbits)
+    return qc
+
+
+_cached_mcphase_definition = lru_cache(maxsize=256)(_mcphase_definition)
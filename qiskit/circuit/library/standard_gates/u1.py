@@ -12,11 +12,12 @@
 
 """U1 Gate."""
 from cmath import exp
+from functools import lru_cache
 from typing import Optional, Union
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
 from qiskit.circuit.gate import Gate
-from qiskit.circuit.parameterexpression import ParameterValueType
+from qiskit.circuit.parameterexpression import ParameterExpression, ParameterValueType
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit._utils import _ctrl_state_to_int
 
@@ -316,25 +317,13 @@ class MCU1Gate(ControlledGate):
         )
 
     def _define(self):
-        # pylint: disable=cyclic-import
-        from qiskit.circuit.quantumcircuit import QuantumCircuit
-
-        q = QuantumRegister(self.num_qubits, "q")
-        qc = QuantumCircuit(q, name=self.name)
-
-        if self.num_ctrl_qubits == 0:
-            definition = U1Gate(self.params[0]).definition
-        if self.num_ctrl_qubits == 1:
-            definition = CU1Gate(self.params[0]).definition
+        if isinstance(self.params[0], ParameterExpression):
+            self.definition = _mcu1_definition(self.params[0], self.num_ctrl_qubits, self.name)
         else:
-            from .u3 import _gray_code_chain
-
-            scaled_lam = self.params[0] / (2 ** (self.num_ctrl_qubits - 1))
-            bottom_gate = CU1Gate(scaled_lam)
-            definition = _gray_code_chain(q, self.num_ctrl_qubits, bottom_gate)
-        for instr, qargs, cargs in definition:
-            qc._append(instr, qargs, cargs)
-        self.definition = qc
+            # definitions for a fixed angle are shared between gates, so each gate gets a copy
+            self.definition = _cached_mcu1_definition(
+                self.params[0], self.num_ctrl_qubits, self.name
+            ).copy()
 
     def control(
         self,
@@ -367,3 +356,28 @@ class MCU1Gate(ControlledGate):
     def inverse(self):
         r"""Return inverted MCU1 gate (:math:`MCU1(\lambda){\dagger} = MCU1(-\lambda)`)"""
         return MCU1Gate(-self.params[0], self.num_ctrl_qubits)
+
+
+def _mcu1_definition(lam, num_ctrl_qubits, name):
+    # pylint: disable=cyclic-import
+    from qiskit.circuit.quantumcircuit import QuantumCircuit
+
+    q = QuantumRegister(num_ctrl_qubits + 1, "q")
+    qc = QuantumCircuit(q, name=name)
+
+    if num_ctrl_qubits == 0:
+        definition = U1Gate(lam).definition
+    if num_ctrl_qubits == 1:
+        definition = CU1Gate(lam).definition
+    else:
+        from .u3 import _gray_code_chain
+
+        scaled_lam = lam / (2 ** (num_ctrl_qubits - 1))
+        bottom_gate = CU1Gate(scaled_lam)
+        definition = _gray_code_chain(q, num_ctrl_qubits, bottom_gate)
+    for instr, qargs, cargs in definition:
+        qc._append(instr, qargs, cargs)
+    return qc
+
+
+_cached_mcu1_definition = lru_cache(maxsize=256)(_mcu1_definition)
@@ -13,6 +13,7 @@
 """X, CX, CCX and multi-controlled X gates."""
 
 from typing import Optional, Union
+from functools import lru_cache
 from math import ceil
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
@@ -1081,23 +1082,11 @@ class MCXRecursive(MCXGate):
 
     def _define(self):
         """Define the MCX gate using recursion."""
-        # pylint: disable=cyclic-import
-        from qiskit.circuit.quantumcircuit import QuantumCircuit
-
-        q = QuantumRegister(self.num_qubits, name="q")
-        qc = QuantumCircuit(q, name=self.name)
-        if self.num_qubits == 4:
-            qc._append(C3XGate(), q[:], [])
-            self.definition = qc
-        elif self.num_qubits == 5:
-            qc._append(C4XGate(), q[:], [])
-            self.definition = qc
-        else:
-            for instr, qargs, cargs in self._recurse(q[:-1], q_ancilla=q[-1]):
-                qc._append(instr, qargs, cargs)
-            self.definition = qc
+        # definitions are shared between gates, so each gate gets a copy
+        self.definition = _mcx_recursive_definition(self.num_qubits, self.name).copy()
 
-    def _recurse(self, q, q_ancilla=None):
+    @staticmethod
+    def _recurse(q, q_ancilla=None):
         # recursion stop
         if len(q) == 4:
             return [(C3XGate(), q[:], [])]
@@ -1113,10 +1102,10 @@ class MCXRecursive(MCXGate):
         second_half = [*q[middle:num_ctrl_qubits], q_ancilla, q[num_ctrl_qubits]]
 
         rule = []
-        rule += self._recurse(first_half, q_ancilla=q[middle])
-        rule += self._recurse(second_half, q_ancilla=q[middle - 1])
-        rule += self._recurse(first_half, q_ancilla=q[middle])
-        rule += self._recurse(second_half, q_ancilla=q[middle - 1])
+        rule += MCXRecursive._recurse(first_half, q_ancilla=q[middle])
+        rule += MCXRecursive._recurse(second_half, q_ancilla=q[middle - 1])
+        rule += MCXRecursive._recurse(first_half, q_ancilla=q[middle])
+        rule += MCXRecursive._recurse(second_half, q_ancilla=q[middle - 1])
 
         return rule
 
@@ -1162,73 +1151,94 @@ class MCXVChain(MCXGate):
 
     def _define(self):
         """Define the MCX gate using a V-chain of CX gates."""
-        # pylint: disable=cyclic-import
-        from qiskit.circuit.quantumcircuit import QuantumCircuit
-
-        q = QuantumRegister(self.num_qubits, name="q")
-        qc = QuantumCircuit(q, name=self.name)
-        q_controls = q[: self.num_ctrl_qubits]
-        q_target = q[self.num_ctrl_qubits]
-        q_ancillas = q[self.num_ctrl_qubits + 1 :]
-
-        definition = []
-
-        if self._dirty_ancillas:
-            i = self.num_ctrl_qubits - 3
-            ancilla_pre_rule = [
-                (U2Gate(0, numpy.pi), [q_target], []),
-                (CXGate(), [q_target, q_ancillas[i]], []),
-                (U1Gate(-numpy.pi / 4), [q_ancillas[i]], []),
-                (CXGate(), [q_controls[-1], q_ancillas[i]], []),
-                (U1Gate(numpy.pi / 4), [q_ancillas[i]], []),
-                (CXGate(), [q_target, q_ancillas[i]], []),
-                (U1Gate(-numpy.pi / 4), [q_ancillas[i]], []),
-                (CXGate(), [q_controls[-1], q_ancillas[i]], []),
-                (U1Gate(numpy.pi / 4), [q_ancillas[i]], []),
-            ]
-            for inst in ancilla_pre_rule:
-                definition.append(inst)
-
-            for j in reversed(range(2, self.num_ctrl_qubits - 1)):
-                definition.append(
-                    (RCCXGate(), [q_controls[j], q_ancillas[i - 1], q_ancillas[i]], [])
-                )
-                i -= 1
-
-        definition.append((RCCXGate(), [q_controls[0], q_controls[1], q_ancillas[0]], []))
-        i = 0
-        for j in range(2, self.num_ctrl_qubits - 1):
-            definition.append((RCCXGate(), [q_controls[j], q_ancillas[i], q_ancillas[i + 1]], []))
-            i += 1
-
-        if self._dirty_ancillas:
-            ancilla_post_rule = [
-                (U1Gate(-numpy.pi / 4), [q_ancillas[i]], []),
-                (CXGate(), [q_controls[-1], q_ancillas[i]], []),
-                (U1Gate(numpy.pi / 4), [q_ancillas[i]], []),
-                (CXGate(), [q_target, q_ancillas[i]], []),
-                (U1Gate(-numpy.pi / 4), [q_ancillas[i]], []),
-                (CXGate(), [q_controls[-1], q_ancillas[i]], []),
-                (U1Gate(numpy.pi / 4), [q_ancillas[i]], []),
-                (CXGate(), [q_target, q_ancillas[i]], []),
-                (U2Gate(0, numpy.pi), [q_target], []),
-            ]
-            for inst in ancilla_post_rule:
-                definition.append(inst)
-        else:
-            definition.append((CCXGate(), [q_controls[-1], q_ancillas[i], q_target], []))
+        # definitions are shared between gates, so each gate gets a copy
+        self.definition = _mcx_vchain_definition(
+            self.num_qubits, self.num_ctrl_qubits, self._dirty_ancillas, self.name
+        ).copy()
+
+
+@lru_cache(maxsize=256)
+def _mcx_recursive_definition(num_qubits, name):
+    # pylint: disable=cyclic-import
+    from qiskit.circuit.quantumcircuit import QuantumCircuit
+
+    q = QuantumRegister(num_qubits, name="q")
+    qc = QuantumCircuit(q, name=name)
+    if num_qubits == 4:
+        qc._append(C3XGate(), q[:], [])
+    elif num_qubits == 5:
+        qc._append(C4XGate(), q[:], [])
+    else:
+        for instr, qargs, cargs in MCXRecursive._recurse(q[:-1], q_ancilla=q[-1]):
+            qc._append(instr, qargs, cargs)
+    return qc
+
+
+@lru_cache(maxsize=256)
+def _mcx_vchain_definition(num_qubits, num_ctrl_qubits, dirty_ancillas, name):
+    # pylint: disable=cyclic-import
+    from qiskit.circuit.quantumcircuit import QuantumCircuit
+
+    q = QuantumRegister(num_qubits, name="q")
+    qc = QuantumCircuit(q, name=name)
+    q_controls = q[:num_ctrl_qubits]
+    q_target = q[num_ctrl_qubits]
+    q_ancillas = q[num_ctrl_qubits + 1 :]
+
+    definition = []
+
+    if dirty_ancillas:
+        i = num_ctrl_qubits - 3
+        ancilla_pre_rule = [
+            (U2Gate(0, numpy.pi), [q_target], []),
+            (CXGate(), [q_target, q_ancillas[i]], []),
+            (U1Gate(-numpy.pi / 4), [q_ancillas[i]], []),
+            (CXGate(), [q_controls[-1], q_ancillas[i]], []),
+            (U1Gate(numpy.pi / 4), [q_ancillas[i]], []),
+            (CXGate(), [q_target, q_ancillas[i]], []),
+            (U1Gate(-numpy.pi / 4), [q_ancillas[i]], []),
+            (CXGate(), [q_controls[-1], q_ancillas[i]], []),
+            (U1Gate(numpy.pi / 4), [q_ancillas[i]], []),
+        ]
+        for inst in ancilla_pre_rule:
+            definition.append(inst)
 
-        for j in reversed(range(2, self.num_ctrl_qubits - 1)):
+        for j in reversed(range(2, num_ctrl_qubits - 1)):
             definition.append((RCCXGate(), [q_controls[j], q_ancillas[i - 1], q_ancillas[i]], []))
             i -= 1
-        definition.append((RCCXGate(), [q_controls[0], q_controls[1], q_ancillas[i]], []))
 
-        if self._dirty_ancillas:
-            for i, j in enumerate(list(range(2, self.num_ctrl_qubits - 1))):
-                definition.append(
-                    (RCCXGate(), [q_controls[j], q_ancillas[i], q_ancillas[i + 1]], [])
-                )
+    definition.append((RCCXGate(), [q_controls[0], q_controls[1], q_ancillas[0]], []))
+    i = 0
+    for j in range(2, num_ctrl_qubits - 1):
+        definition.append((RCCXGate(), [q_controls[j], q_ancillas[i], q_ancillas[i + 1]], []))
+        i += 1
+
+    if dirty_ancillas:
+        ancilla_post_rule = [
+            (U1Gate(-numpy.pi / 4), [q_ancillas[i]], []),
+            (CXGate(), [q_controls[-1], q_ancillas[i]], []),
+            (U1Gate(numpy.pi / 4), [q_ancillas[i]], []),
+            (CXGate(), [q_target, q_ancillas[i]], []),
+            (U1Gate(-numpy.pi / 4), [q_ancillas[i]], []),
+            (CXGate(), [q_controls[-1], q_ancillas[i]], []),
+            (U1Gate(numpy.pi / 4), [q_ancillas[i]], []),
+            (CXGate(), [q_target, q_ancillas[i]], []),
+            (U2Gate(0, numpy.pi), [q_target], []),
+        ]
+        for inst in ancilla_post_rule:
+            definition.append(inst)
+    else:
+        definition.append((CCXGate(), [q_controls[-1], q_ancillas[i], q_target], []))
+
+    for j in reversed(range(2, num_ctrl_qubits - 1)):
+        definition.append((RCCXGate(), [q_controls[j], q_ancillas[i - 1], q_ancillas[i]], []))
+        i -= 1
+    definition.append((RCCXGate(), [q_controls[0], q_controls[1], q_ancillas[i]], []))
+
+    if dirty_ancillas:
+        for i, j in enumerate(list(range(2, num_ctrl_qubits - 1))):
+            definition.append((RCCXGate(), [q_controls[j], q_ancillas[i], q_ancillas[i + 1]], []))
 
-        for instr, qargs, cargs in definition:
-            qc._append(instr, qargs, cargs)
-        self.definition = qc
+    for instr, qargs, cargs in definition:
+        qc._append(instr, qargs, cargs)
+    return qc
@@ -13,13 +13,18 @@
 # pylint: disable=import-error,invalid-sequence-index
 
 """Circuit transpile function"""
+from collections import OrderedDict
+from collections.abc import Set as AbstractSet
+import copy
 import io
-from itertools import cycle
+from itertools import cycle, repeat
 import logging
 import os
 import pickle
 import sys
+import threading
 from time import time
+import weakref
 from typing import List, Union, Dict, Callable, Any, Optional, Tuple, Iterable
 import warnings
 
@@ -41,6 +46,7 @@ from qiskit.transpiler.passes import ApplyLayout
 from qiskit.transpiler.passes.synthesis.high_level_synthesis import HLSConfig
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 from qiskit.transpiler.preset_passmanagers import (
+    common,
     level_0_pass_manager,
     level_1_pass_manager,
     level_2_pass_manager,
@@ -85,6 +91,7 @@ def transpile(
     init_method: str = None,
     optimization_method: str = None,
     ignore_backend_supplied_default_methods: bool = False,
+    skip_compatible: bool = False,
 ) -> Union[QuantumCircuit, List[QuantumCircuit]]:
     """Transpile one or more circuits, according to some desired transpilation targets.
 
@@ -282,6 +289,15 @@ def transpile(
             to support custom compilation target-specific passes/plugins which support
             backend-specific compilation techniques. If you'd prefer that these defaults were
             not used this option is used to disable those backend-specific defaults.
+        skip_compatible: If set to ``True``, the circuits that already conform to the backend,
+            i.e. whose instructions are all in the basis, whose two-qubit gates all act on
+            coupled qubits in a supported direction and whose delays respect the timing
+            constraints (as checked by :class:`~.CheckCompatibility`), are not run through the
+            preset pass manager. They are only laid out with the trivial layout and, if
+            ``scheduling_method`` is set, scheduled. This is much faster for circuits that were
+            already transpiled or built directly for the backend, but these circuits are then not
+            optimized, whatever the ``optimization_level``. This option has no effect if an
+            ``initial_layout`` is given.
 
     Returns:
         The transpiled circuit(s).
@@ -351,13 +367,12 @@ def transpile(
         init_method,
         optimization_method,
         ignore_backend_supplied_default_methods,
+        skip_compatible,
     )
     # Get transpile_args to configure the circuit transpilation job(s)
-    if coupling_map in unique_transpile_args:
-        cmap_conf = unique_transpile_args["coupling_map"]
-    else:
-        cmap_conf = [shared_args["coupling_map"]] * len(circuits)
-    _check_circuits_coupling_map(circuits, cmap_conf, backend)
+    _check_circuits_coupling_map(
+        circuits, unique_transpile_args.get("coupling_map", shared_args["coupling_map"]), backend
+    )
     if (
         len(circuits) > 1
         and os.getenv("QISKIT_IN_PARALLEL", "FALSE") == "FALSE"
@@ -372,12 +387,19 @@ def transpile(
             # Transpile circuits in parallel
             circuits = parallel.parallel_map(
                 _transpile_circuit,
-                list(zip(circuits, cycle([smb.name]), unique_transpile_args)),
+                list(
+                    zip(
+                        circuits,
+                        cycle([smb.name]),
+                        _unique_configs(unique_transpile_args, len(circuits)),
+                    )
+                ),
             )
     else:
         output_circuits = []
-        for circuit, unique_args in zip(circuits, unique_transpile_args):
-            transpile_config, pass_manager = _combine_args(shared_args, unique_args)
+        for circuit, (transpile_config, pass_manager) in zip(
+            circuits, _transpile_configs(shared_args, unique_transpile_args, len(circuits))
+        ):
             output_circuits.append(
                 _serial_transpile_circuit(
                     circuit,
@@ -401,23 +423,12 @@ def transpile(
 
 def _check_circuits_coupling_map(circuits, cmap_conf, backend):
     # Check circuit width against number of qubits in coupling_map(s)
-    coupling_maps_list = cmap_conf
-    for circuit, parsed_coupling_map in zip(circuits, coupling_maps_list):
-        # If coupling_map is not None or num_qubits == 1
+    if isinstance(cmap_conf, list):
+        max_qubits_list = [_coupling_map_max_qubits(cmap, backend) for cmap in cmap_conf]
+    else:
+        max_qubits_list = repeat(_coupling_map_max_qubits(cmap_conf, backend))
+    for circuit, max_qubits in zip(circuits, max_qubits_list):
         num_qubits = len(circuit.qubits)
-        max_qubits = None
-        if isinstance(parsed_coupling_map, CouplingMap):
-            max_qubits = parsed_coupling_map.size()
-
-        # If coupling_map is None, the limit might be in the backend (like in 1Q devices)
-        elif backend is not None:
-            backend_version = getattr(backend, "version", 0)
-            if backend_version <= 1:
-                if not backend.configuration().simulator:
-                    max_qubits = backend.configuration().n_qubits
-            else:
-                max_qubits = backend.num_qubits
-
         if max_qubits is not None and (num_qubits > max_qubits):
             raise TranspilerError(
                 f"Number of qubits ({num_qubits}) in {circuit.name} "
@@ -425,23 +436,41 @@ def _check_circuits_coupling_map(circuits, cmap_conf, backend):
             )
 
 
+def _coupling_map_max_qubits(parsed_coupling_map, backend):
+    # If coupling_map is not None or num_qubits == 1
+    if isinstance(parsed_coupling_map, CouplingMap):
+        return parsed_coupling_map.size()
+
+    # If coupling_map is None, the limit might be in the backend (like in 1Q devices)
+    if backend is not None:
+        backend_version = getattr(backend, "version", 0)
+        if backend_version <= 1:
+            if not backend.configuration().simulator:
+                return backend.configuration().n_qubits
+        else:
+            return backend.num_qubits
+    return None
+
+
 def _log_transpile_time(start_time, end_time):
     log_msg = "Total Transpile Time - %.5f (ms)" % ((end_time - start_time) * 1000)
     logger.info(log_msg)
 
 
+# The arguments that are passed to ``PassManager.run`` rather than used to build the pass manager.
+_RUN_ARGS = ("callback", "output_name")
+
+
 def _combine_args(shared_transpiler_args, unique_config):
+    config = {**shared_transpiler_args, **unique_config}
     # Pop optimization_level to exclude it from the kwargs when building a
     # PassManagerConfig
-    level = shared_transpiler_args.pop("optimization_level")
-    pass_manager_config = shared_transpiler_args
-    pass_manager_config.update(unique_config.pop("pass_manager_config"))
-    pass_manager_config = PassManagerConfig(**pass_manager_config)
-    # restore optimization_level in the input shared dict in case it's used again
-    # in the same process
-    shared_transpiler_args["optimization_level"] = level
-
-    transpile_config = unique_config
+    level = config.pop("optimization_level")
+    skip_compatible = config.pop("skip_compatible")
+    transpile_config = {
+        key: config.pop(key) for key in _RUN_ARGS + ("faulty_qubits_map", "backend_num_qubits")
+    }
+    pass_manager_config = PassManagerConfig(**config)
     transpile_config["pass_manager_config"] = pass_manager_config
 
     if transpile_config["faulty_qubits_map"]:
@@ -450,6 +479,69 @@ def _combine_args(shared_transpiler_args, unique_config):
         )
 
     # we choose an appropriate one based on desired optimization level
+    pass_manager = _preset_pass_manager(level, pass_manager_config, skip_compatible)
+    return transpile_config, pass_manager
+
+
+def _unique_configs(unique_transpiler_args, num_circuits):
+    """Return an iterable of the ``num_circuits`` dicts of the arguments that are specific to each
+    circuit, given a mapping of each such argument to the list of its values."""
+    if not unique_transpiler_args:
+        return repeat({}, num_circuits)
+    return _zip_dict(unique_transpiler_args)
+
+
+def _transpile_configs(shared_transpiler_args, unique_transpiler_args, num_circuits):
+    """Yield the transpile config and pass manager of each circuit.
+
+    The pass manager configuration is only resolved once if the circuits differ at most in the
+    arguments of ``PassManager.run``."""
+    if any(key not in _RUN_ARGS for key in unique_transpiler_args):
+        for unique_config in _zip_dict(unique_transpiler_args):
+            yield _combine_args(shared_transpiler_args, unique_config)
+        return
+    transpile_config, pass_manager = _combine_args(
+        shared_transpiler_args, dict.fromkeys(unique_transpiler_args)
+    )
+    for unique_config in _unique_configs(unique_transpiler_args, num_circuits):
+        yield {**transpile_config, **unique_config}, pass_manager
+
+
+# The preset pass managers built for the recent configurations, keyed on ``_pass_manager_key``,
+# with the configuration they were built from.  The cache is per thread, as the passes of a pass
+# manager must not run on two circuits at once.
+_PASS_MANAGERS = threading.local()
+_PASS_MANAGERS_SIZE = 32
+
+# The stage methods whose passes keep no state from one run to the next; the stages built by other
+# plugins may not, so a pass manager using them is never reused.
+_REUSABLE_STAGE_METHODS = {
+    "init_method": {None},
+    "layout_method": {None, "trivial", "dense", "noise_adaptive", "sabre"},
+    "routing_method": {None, "basic", "stochastic", "lookahead", "sabre", "none"},
+    "translation_method": {None, "translator", "synthesis", "unroller"},
+    "optimization_method": {None},
+    "scheduling_method": {None, "alap", "as_late_as_possible", "asap", "as_soon_as_possible"},
+}
+
+
+def _preset_pass_manager(level, pass_manager_config, skip_compatible=False):
+    """Return the preset pass manager of optimization ``level`` for ``pass_manager_config``,
+    reusing the one built by a previous call for the same configuration if possible.
+
+    If ``skip_compatible`` is set and no initial layout is given, the pass manager only runs the
+    preset passes on the circuits that do not already conform to the backend."""
+    skip_compatible = skip_compatible and pass_manager_config.initial_layout is None
+    key = _pass_manager_key(level, pass_manager_config)
+    if key is not None:
+        key += (skip_compatible,)
+    cache = getattr(_PASS_MANAGERS, "cache", None)
+    if cache is None:
+        cache = _PASS_MANAGERS.cache = OrderedDict()
+    if key is not None and key in cache:
+        cache.move_to_end(key)
+        return cache[key][1]
+
     if level == 0:
         pass_manager = level_0_pass_manager(pass_manager_config)
     elif level == 1:
@@ -460,7 +552,75 @@ def _combine_args(shared_transpiler_args, unique_config):
         pass_manager = level_3_pass_manager(pass_manager_config)
     else:
         raise TranspilerError("optimization_level can range from 0 to 3.")
-    return transpile_config, pass_manager
+    if skip_compatible:
+        pass_manager = common.generate_skip_compatible_passmanager(
+            pass_manager,
+            pass_manager_config.basis_gates,
+            pass_manager_config.coupling_map,
+            pass_manager_config.target,
+            pass_manager_config.timing_constraints,
+        )
+
+    if key is not None:
+        # The configuration is kept alive with the pass manager, so the ids in the key are not
+        # reused by other objects while it is cached.
+        cache[key] = (pass_manager_config, pass_manager)
+        if len(cache) > _PASS_MANAGERS_SIZE:
+            cache.popitem(last=False)
+    return pass_manager
+
+
+def _pass_manager_key(level, pass_manager_config):
+    """Return the key of the preset pass manager of optimization ``level`` for
+    ``pass_manager_config`` in the cache, or ``None`` if it must not be reused.
+
+    Immutable values, collections of names, coupling maps, instruction durations and layouts are
+    compared by value, and any other object (a target, backend properties, etc.) by identity."""
+    config = vars(pass_manager_config)
+    for name, methods in _REUSABLE_STAGE_METHODS.items():
+        if config[name] not in methods:
+            return None
+    key = [level]
+    for name, value in config.items():
+        if value is None or isinstance(value, (bool, int, float, str)):
+            key.append((name, type(value), value))
+        elif isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+            key.append((name, type(value), tuple(value)))
+        elif isinstance(value, AbstractSet) and all(isinstance(item, str) for item in value):
+            # The basis gates of a target are the keys of its gate map.
+            key.append((name, AbstractSet, frozenset(value)))
+        elif isinstance(value, CouplingMap):
+            key.append((name, CouplingMap, value.size(), tuple(value.graph.edge_list())))
+        elif isinstance(value, InstructionDurations):
+            key.append(
+                (
+                    name,
+                    InstructionDurations,
+                    value.dt,
+                    frozenset(value.duration_by_name.items()),
+                    frozenset(value.duration_by_name_qubits.items()),
+                    frozenset(value.duration_by_name_qubits_params.items()),
+                )
+            )
+        elif isinstance(value, TimingConstraints):
+            key.append((name, TimingConstraints, tuple(vars(value).items())))
+        elif isinstance(value, Layout):
+            key.append(
+                (
+                    name,
+                    Layout,
+                    frozenset(value.get_physical_bits().items()),
+                    frozenset(value.get_registers()),
+                )
+            )
+        else:
+            key.append((name, id(value)))
+    return tuple(key)
+
+
+def _clear_pass_manager_cache():
+    """Drop the preset pass managers cached by the calling thread."""
+    _PASS_MANAGERS.cache = OrderedDict()
 
 
 def _serial_transpile_circuit(
@@ -498,14 +658,7 @@ def _transpile_circuit(circuit_config_tuple: Tuple[QuantumCircuit, str, Dict]) -
         TranspilerError: if transpile_config is not valid or transpilation incurs error
     """
     circuit, name, unique_config = circuit_config_tuple
-    existing_shm = SharedMemory(name=name)
-    try:
-        with io.BytesIO(existing_shm.buf) as buf:
-            shared_transpiler_args = pickle.load(buf)
-    finally:
-        existing_shm.close()
-
-    transpile_config, pass_manager = _combine_args(shared_transpiler_args, unique_config)
+    transpile_config, pass_manager = _combine_args(_load_shared_args(name), unique_config)
     pass_manager_config = transpile_config["pass_manager_config"]
 
     result = pass_manager.run(
@@ -523,6 +676,26 @@ def _transpile_circuit(circuit_config_tuple: Tuple[QuantumCircuit, str, Dict]) -
     return result
 
 
+# The shared arguments last loaded by this process, keyed on the name of the shared memory they were
+# loaded from.  Every task of a parallel transpilation reads the same shared arguments, and reusing
+# the unpickled objects lets the tasks run by a worker share their pass managers too.
+_LOADED_SHARED_ARGS = {}
+
+
+def _load_shared_args(name):
+    """Return the shared transpiler arguments pickled in the shared memory ``name``."""
+    if name not in _LOADED_SHARED_ARGS:
+        existing_shm = SharedMemory(name=name)
+        try:
+            with io.BytesIO(existing_shm.buf) as buf:
+                shared_transpiler_args = pickle.load(buf)
+        finally:
+            existing_shm.close()
+        _LOADED_SHARED_ARGS.clear()
+        _LOADED_SHARED_ARGS[name] = shared_transpiler_args
+    return _LOADED_SHARED_ARGS[name]
+
+
 def _remap_circuit_faulty_backend(circuit, num_qubits, backend_prop, faulty_qubits_map):
     faulty_qubits = backend_prop.faulty_qubits() if backend_prop else []
     disconnected_qubits = {k for k, v in faulty_qubits_map.items() if v is None}.difference(
@@ -605,7 +778,8 @@ def _parse_transpile_args(
     init_method,
     optimization_method,
     ignore_backend_supplied_default_methods,
-) -> Tuple[List[Dict], Dict]:
+    skip_compatible,
+) -> Tuple[Dict[str, List], Dict]:
     """Resolve the various types of args allowed to the transpile() function through
     duck typing, overriding args, etc. Refer to the transpile() docstring for details on
     what types of inputs are allowed.
@@ -614,9 +788,13 @@ def _parse_transpile_args(
     them in case a transpile option is passed through multiple args (explicitly setting an
     arg has more priority than the arg set by backend).
 
+    Only the args that actually differ between the circuits are resolved per circuit, so that
+    the shared ones are only handled once however many circuits are transpiled.
+
     Returns:
-        Tuple[list[dict], dict]: a tuple contain a list of unique transpile parameter dicts and
-        the second element contains a dict of shared transpiler argument across all circuits.
+        Tuple[dict, dict]: a tuple whose first element maps the transpile parameters that are
+        unique to each circuit to the list of their values, and whose second element contains a
+        dict of shared transpiler argument across all circuits.
 
     Raises:
         TranspilerError: If instruction_durations are required but not supplied or found.
@@ -624,8 +802,7 @@ def _parse_transpile_args(
     if initial_layout is not None and layout_method is not None:
         warnings.warn("initial_layout provided; layout_method is ignored.", UserWarning)
     # Each arg could be single or a list. If list, it must be the same size as
-    # number of circuits. If single, duplicate to create a list of that size.
-    num_circuits = len(circuits)
+    # number of circuits. If single, it is shared by all the circuits.
     user_input_durations = instruction_durations
     user_input_timing_constraints = timing_constraints
     user_input_initial_layout = initial_layout
@@ -645,40 +822,46 @@ def _parse_transpile_args(
         if timing_constraints is None:
             timing_constraints = target.timing_constraints()
         if backend_properties is None:
-            backend_properties = target_to_backend_properties(target)
+            backend_properties = _target_backend_properties(target)
 
     basis_gates = _parse_basis_gates(basis_gates, backend)
     initial_layout = _parse_initial_layout(initial_layout, circuits)
     inst_map = _parse_inst_map(inst_map, backend)
-    faulty_qubits_map = _parse_faulty_qubits_map(backend, num_circuits)
+    faulty_qubits_map = _parse_faulty_qubits_map(backend)
     coupling_map = _parse_coupling_map(coupling_map, backend)
     backend_properties = _parse_backend_properties(backend_properties, backend)
-    backend_num_qubits = _parse_backend_num_qubits(backend, num_circuits)
+    backend_num_qubits = _parse_backend_num_qubits(backend)
     approximation_degree = _parse_approximation_degree(approximation_degree)
     output_name = _parse_output_name(output_name, circuits)
-    callback = _parse_callback(callback, num_circuits)
     durations = _parse_instruction_durations(backend, instruction_durations, dt, circuits)
-    timing_constraints = _parse_timing_constraints(backend, timing_constraints, num_circuits)
+    timing_constraints = _parse_timing_constraints(backend, timing_constraints)
     target = _parse_target(backend, target)
-    if scheduling_method and any(d is None for d in durations):
+    if scheduling_method and any(
+        d is None for d in (durations if isinstance(durations, list) else [durations])
+    ):
         raise TranspilerError(
             "Transpiling a circuit with a scheduling method"
             "requires a backend or instruction_durations."
         )
-    unique_dict = {
-        "callback": callback,
-        "output_name": output_name,
-        "faulty_qubits_map": faulty_qubits_map,
-        "backend_num_qubits": backend_num_qubits,
-    }
+    unique_dict = {}
     shared_dict = {
         "optimization_level": optimization_level,
+        "skip_compatible": skip_compatible,
         "basis_gates": basis_gates,
         "init_method": init_method,
         "optimization_method": optimization_method,
     }
+    for key, value in {
+        "callback": callback,
+        "output_name": output_name,
+        "faulty_qubits_map": faulty_qubits_map,
+        "backend_num_qubits": backend_num_qubits,
+    }.items():
+        if isinstance(value, list):
+            unique_dict[key] = value
+        else:
+            shared_dict[key] = value
 
-    list_transpile_args = []
     if not ignore_backend_supplied_default_methods:
         if scheduling_method is None and hasattr(backend, "get_scheduling_stage_plugin"):
             scheduling_method = backend.get_scheduling_stage_plugin()
@@ -743,52 +926,48 @@ def _parse_transpile_args(
         else:
             shared_dict[key] = value
 
-    for kwargs in _zip_dict(unique_dict):
-        transpile_args = {
-            "output_name": kwargs.pop("output_name"),
-            "callback": kwargs.pop("callback"),
-            "faulty_qubits_map": kwargs.pop("faulty_qubits_map"),
-            "backend_num_qubits": kwargs.pop("backend_num_qubits"),
-            "pass_manager_config": kwargs,
-        }
-        list_transpile_args.append(transpile_args)
-
-    return list_transpile_args, shared_dict
+    return unique_dict, shared_dict
 
 
 def _create_faulty_qubits_map(backend):
     """If the backend has faulty qubits, those should be excluded. A faulty_qubit_map is a map
     from working qubit in the backend to dummy qubits that are consecutive and connected."""
+    if backend is None or getattr(backend, "version", 0) > 1:
+        return None
+    faulty_qubits_map = _backend_v1_cached(
+        backend, "faulty_qubits_map", lambda: _build_faulty_qubits_map(backend)
+    )
+    return None if faulty_qubits_map is None else dict(faulty_qubits_map)
+
+
+def _build_faulty_qubits_map(backend):
+    """Build the faulty qubits map of a ``BackendV1``, see :func:`_create_faulty_qubits_map`."""
     faulty_qubits_map = None
-    if backend is not None:
-        backend_version = getattr(backend, "version", 0)
-        if backend_version > 1:
-            return None
-        if backend.properties():
-            faulty_qubits = backend.properties().faulty_qubits()
-            faulty_edges = [gates.qubits for gates in backend.properties().faulty_gates()]
-        else:
-            faulty_qubits = []
-            faulty_edges = []
-
-        if faulty_qubits or faulty_edges:
-            faulty_qubits_map = {}
-            configuration = backend.configuration()
-            full_coupling_map = configuration.coupling_map
-            functional_cm_list = [
-                edge
-                for edge in full_coupling_map
-                if (set(edge).isdisjoint(faulty_qubits) and edge not in faulty_edges)
-            ]
-
-            connected_working_qubits = CouplingMap(functional_cm_list).largest_connected_component()
-            dummy_qubit_counter = 0
-            for qubit in range(configuration.n_qubits):
-                if qubit in connected_working_qubits:
-                    faulty_qubits_map[qubit] = dummy_qubit_counter
-                    dummy_qubit_counter += 1
-                else:
-                    faulty_qubits_map[qubit] = None
+    if backend.properties():
+        faulty_qubits = backend.properties().faulty_qubits()
+        faulty_edges = [gates.qubits for gates in backend.properties().faulty_gates()]
+    else:
+        faulty_qubits = []
+        faulty_edges = []
+
+    if faulty_qubits or faulty_edges:
+        faulty_qubits_map = {}
+        configuration = backend.configuration()
+        full_coupling_map = configuration.coupling_map
+        functional_cm_list = [
+            edge
+            for edge in full_coupling_map
+            if (set(edge).isdisjoint(faulty_qubits) and edge not in faulty_edges)
+        ]
+
+        connected_working_qubits = CouplingMap(functional_cm_list).largest_connected_component()
+        dummy_qubit_counter = 0
+        for qubit in range(configuration.n_qubits):
+            if qubit in connected_working_qubits:
+                faulty_qubits_map[qubit] = dummy_qubit_counter
+                dummy_qubit_counter += 1
+            else:
+                faulty_qubits_map[qubit] = None
     return faulty_qubits_map
 
 
@@ -824,25 +1003,17 @@ def _parse_coupling_map(coupling_map, backend):
             if getattr(backend, "configuration", None):
                 configuration = backend.configuration()
                 if hasattr(configuration, "coupling_map") and configuration.coupling_map:
-                    faulty_map = _create_faulty_qubits_map(backend)
-                    if faulty_map:
-                        faulty_edges = [gate.qubits for gate in backend.properties().faulty_gates()]
-                        functional_gates = [
-                            edge for edge in configuration.coupling_map if edge not in faulty_edges
-                        ]
-                        coupling_map = CouplingMap()
-                        for qubit1, qubit2 in functional_gates:
-                            if faulty_map[qubit1] is not None and faulty_map[qubit2] is not None:
-                                coupling_map.add_edge(faulty_map[qubit1], faulty_map[qubit2])
-                        if configuration.n_qubits != coupling_map.size():
-                            warnings.warn(
-                                "The backend has currently some qubits/edges out of service."
-                                " This temporarily reduces the backend size from "
-                                f"{configuration.n_qubits} to {coupling_map.size()}",
-                                UserWarning,
-                            )
-                    else:
-                        coupling_map = CouplingMap(configuration.coupling_map)
+                    coupling_map = _build_coupling_map(backend)
+                    if (
+                        _create_faulty_qubits_map(backend)
+                        and configuration.n_qubits != coupling_map.size()
+                    ):
+                        warnings.warn(
+                            "The backend has currently some qubits/edges out of service."
+                            " This temporarily reduces the backend size from "
+                            f"{configuration.n_qubits} to {coupling_map.size()}",
+                            UserWarning,
+                        )
         else:
             coupling_map = backend.coupling_map
 
@@ -858,54 +1029,92 @@ def _parse_coupling_map(coupling_map, backend):
     return coupling_map
 
 
+def _build_coupling_map(backend):
+    configuration = backend.configuration()
+    faulty_map = _create_faulty_qubits_map(backend)
+    if not faulty_map:
+        return CouplingMap(configuration.coupling_map)
+    faulty_edges = [gate.qubits for gate in backend.properties().faulty_gates()]
+    functional_gates = [edge for edge in configuration.coupling_map if edge not in faulty_edges]
+    coupling_map = CouplingMap()
+    for qubit1, qubit2 in functional_gates:
+        if faulty_map[qubit1] is not None and faulty_map[qubit2] is not None:
+            coupling_map.add_edge(faulty_map[qubit1], faulty_map[qubit2])
+    return coupling_map
+
+
 def _parse_backend_properties(backend_properties, backend):
     # try getting backend_properties from user, else backend
     if backend_properties is None:
         backend_version = getattr(backend, "version", 0)
         if backend_version <= 1:
             if getattr(backend, "properties", None):
-                backend_properties = backend.properties()
-                if backend_properties and (
-                    backend_properties.faulty_qubits() or backend_properties.faulty_gates()
-                ):
-                    faulty_qubits = sorted(backend_properties.faulty_qubits(), reverse=True)
-                    faulty_edges = [gates.qubits for gates in backend_properties.faulty_gates()]
-                    # remove faulty qubits in backend_properties.qubits
-                    for faulty_qubit in faulty_qubits:
-                        del backend_properties.qubits[faulty_qubit]
-
-                    gates = []
-                    for gate in backend_properties.gates:
-                        # remove gates using faulty edges or with faulty qubits (and remap the
-                        # gates in terms of faulty_qubits_map)
-                        faulty_qubits_map = _create_faulty_qubits_map(backend)
-                        if (
-                            any(faulty_qubits_map[qubits] is not None for qubits in gate.qubits)
-                            or gate.qubits in faulty_edges
-                        ):
-                            continue
-                        gate_dict = gate.to_dict()
-                        replacement_gate = Gate.from_dict(gate_dict)
-                        gate_dict["qubits"] = [faulty_qubits_map[qubit] for qubit in gate.qubits]
-                        args = "_".join([str(qubit) for qubit in gate_dict["qubits"]])
-                        gate_dict["name"] = "{}{}".format(gate_dict["gate"], args)
-                        gates.append(replacement_gate)
-
-                    backend_properties.gates = gates
+                backend_properties = _build_backend_properties(backend)
         else:
-            backend_properties = target_to_backend_properties(backend.target)
+            backend_properties = _target_backend_properties(backend.target)
     return backend_properties
 
 
-def _parse_backend_num_qubits(backend, num_circuits):
+# The backend properties of the targets of BackendV2 backends, keyed on the compiled view of the
+# target, which the target replaces whenever it is modified.
+_TARGET_BACKEND_PROPERTIES = weakref.WeakKeyDictionary()
+
+
+def _target_backend_properties(target):
+    compiled = target.compile()
+    backend_properties = _TARGET_BACKEND_PROPERTIES.get(compiled)
+    if backend_properties is None:
+        backend_properties = target_to_backend_properties(target)
+        _TARGET_BACKEND_PROPERTIES[compiled] = backend_properties
+    return backend_properties
+
+
+def _build_backend_properties(backend):
+    """Return the properties of a ``BackendV1`` without its faulty qubits and gates.  If there are
+    any, a new properties object is built for each call, so the properties of the backend itself
+    are left untouched."""
+    backend_properties = backend.properties()
+    faulty_qubits_map = _create_faulty_qubits_map(backend)
+    if backend_properties and faulty_qubits_map:
+        faulty_qubits = set(backend_properties.faulty_qubits())
+        faulty_edges = [gates.qubits for gates in backend_properties.faulty_gates()]
+        backend_properties = copy.copy(backend_properties)
+        # remove faulty qubits in backend_properties.qubits
+        backend_properties.qubits = [
+            qubit_props
+            for qubit, qubit_props in enumerate(backend_properties.qubits)
+            if qubit not in faulty_qubits
+        ]
+
+        gates = []
+        for gate in backend_properties.gates:
+            # remove gates using faulty edges or with faulty qubits (and remap the
+            # gates in terms of faulty_qubits_map)
+            if (
+                any(faulty_qubits_map[qubits] is not None for qubits in gate.qubits)
+                or gate.qubits in faulty_edges
+            ):
+                continue
+            gate_dict = gate.to_dict()
+            replacement_gate = Gate.from_dict(gate_dict)
+            gate_dict["qubits"] = [faulty_qubits_map[qubit] for qubit in gate.qubits]
+            args = "_".join([str(qubit) for qubit in gate_dict["qubits"]])
+            gate_dict["name"] = "{}{}".format(gate_dict["gate"], args)
+            gates.append(replacement_gate)
+
+        backend_properties.gates = gates
+    return backend_properties
+
+
+def _parse_backend_num_qubits(backend):
     if backend is None:
-        return [None] * num_circuits
+        return None
     if not isinstance(backend, list):
         backend_version = getattr(backend, "version", 0)
         if backend_version <= 1:
-            return [backend.configuration().n_qubits] * num_circuits
+            return backend.configuration().n_qubits
         else:
-            return [backend.num_qubits] * num_circuits
+            return backend.num_qubits
     backend_num_qubits = []
     for a_backend in backend:
         backend_version = getattr(backend, "version", 0)
@@ -937,36 +1146,56 @@ def _parse_initial_layout(initial_layout, circuits):
     if isinstance(initial_layout, list) and any(
         isinstance(i, (list, dict)) for i in initial_layout
     ):
-        initial_layout = [
+        return [
             _layout_from_raw(lo, circ) if isinstance(lo, (list, dict)) else lo
             for lo, circ in zip(initial_layout, circuits)
         ]
-    else:
-        # even if one layout, but multiple circuits, the layout needs to be adapted for each
-        initial_layout = [_layout_from_raw(initial_layout, circ) for circ in circuits]
+    if initial_layout is None or isinstance(initial_layout, (Layout, dict)):
+        # the layout does not depend on the circuit, so it is shared by all of them
+        return _layout_from_raw(initial_layout, None)
 
-    return initial_layout
+    # even if one layout, but multiple circuits, the layout needs to be adapted for each, although
+    # only once for all the circuits with the same registers
+    layouts = {}
+    for circ in circuits:
+        qregs = tuple(circ.qregs)
+        if qregs not in layouts:
+            layouts[qregs] = _layout_from_raw(initial_layout, circ)
+    if len(layouts) == 1:
+        (layout,) = layouts.values()
+        if isinstance(layout, Layout):
+            return layout
+    return [layouts[tuple(circ.qregs)] for circ in circuits]
 
 
 def _parse_instruction_durations(backend, inst_durations, dt, circuits):
-    """Create a list of ``InstructionDuration``s. If ``inst_durations`` is provided,
+    """Create the ``InstructionDuration``s of the circuits. If ``inst_durations`` is provided,
     the backend will be ignored, otherwise, the durations will be populated from the
     backend. If any circuits have gate calibrations, those calibration durations would
     take precedence over backend durations, but be superceded by ``inst_duration``s.
+
+    A list with the durations of each circuit is only returned if some circuits have calibrations,
+    otherwise all the circuits share the same durations, which are returned directly.
     """
     if not inst_durations:
         backend_version = getattr(backend, "version", 0)
         if backend_version <= 1:
-            backend_durations = InstructionDurations()
-            try:
-                backend_durations = InstructionDurations.from_backend(backend)
-            except AttributeError:
-                pass
+            backend_durations = _backend_v1_durations(backend)
         else:
             backend_durations = backend.instruction_durations
 
     durations = []
+    uncalibrated_durations = None
     for circ in circuits:
+        if not circ.calibrations and uncalibrated_durations is not None:
+            # The durations of circuits without calibrations are all the same and are only read
+            # by the passes, so share them and the lookups they cache.
+            durations.append(uncalibrated_durations)
+            continue
+        if not circ.calibrations and not inst_durations:
+            uncalibrated_durations = _uncalibrated_durations(backend_durations, dt)
+            durations.append(uncalibrated_durations)
+            continue
         circ_durations = InstructionDurations()
         if not inst_durations:
             circ_durations.update(backend_durations, dt or backend_durations.dt)
@@ -981,10 +1210,105 @@ def _parse_instruction_durations(backend, inst_durations, dt, circuits):
         if inst_durations:
             circ_durations.update(inst_durations, dt or getattr(inst_durations, "dt", None))
 
+        if not circ.calibrations:
+            uncalibrated_durations = circ_durations
         durations.append(circ_durations)
+    if all(circ_durations is durations[0] for circ_durations in durations):
+        return durations[0]
     return durations
 
 
+# The durations of the circuits without calibrations, keyed on the backend durations they are
+# copied from and then on their dt, so that successive calls share them (and the pass managers
+# built for them).
+_UNCALIBRATED_DURATIONS = weakref.WeakKeyDictionary()
+
+
+def _uncalibrated_durations(backend_durations, dt):
+    dt = dt or backend_durations.dt
+    try:
+        copies = _UNCALIBRATED_DURATIONS.setdefault(backend_durations, {})
+    except TypeError:
+        copies = {}
+    if dt not in copies:
+        circ_durations = InstructionDurations()
+        circ_durations.update(backend_durations, dt)
+        copies[dt] = circ_durations
+    return copies[dt]
+
+
+# The objects derived from a BackendV1 by the ``_parse_*`` helpers, keyed on the backend and then on
+# the name of the object, with the source they were derived from (see ``_backend_v1_source``).
+_BACKEND_V1_CACHE = weakref.WeakKeyDictionary()
+
+
+def _backend_v1_source(backend):
+    """Return what the objects derived from a ``BackendV1`` depend on: its configuration and
+    properties objects, the date the properties were last updated and the ``dt`` of the
+    configuration."""
+    configuration = backend.configuration() if hasattr(backend, "configuration") else None
+    properties = backend.properties() if hasattr(backend, "properties") else None
+    return (
+        configuration,
+        properties,
+        getattr(properties, "last_update_date", None),
+        getattr(configuration, "dt", None),
+    )
+
+
+def _backend_v1_cached(backend, name, build):
+    """Return the object ``name`` of a ``BackendV1``, calling ``build()`` to derive it only if it
+    was not derived before from the same configuration and properties of the backend, updated at
+    the same date.  The cache of a backend can be dropped with :func:`.clear_backend_cache`.
+
+    The returned object is shared by all the calls, so it must not be modified or handed out to
+    the passes and the caller of :func:`.transpile`: copy it or build new objects from it instead.
+    """
+    source = _backend_v1_source(backend)
+    try:
+        cache = _BACKEND_V1_CACHE.setdefault(backend, {})
+    except TypeError:
+        # The backend cannot be weakly referenced or hashed.
+        return build()
+    cached = cache.get(name)
+    if (
+        cached is not None
+        and cached[0][0] is source[0]
+        and cached[0][1] is source[1]
+        and cached[0][2:] == source[2:]
+    ):
+        return cached[1]
+    value = build()
+    cache[name] = (source, value)
+    return value
+
+
+def _clear_backend_v1_cache(backend=None):
+    """Drop the objects derived from ``backend``, or from every backend if it is ``None``, so that
+    the next :func:`.transpile` call derives them again, see :func:`.clear_backend_cache`."""
+    if backend is None:
+        _BACKEND_V1_CACHE.clear()
+    else:
+        _BACKEND_V1_CACHE.pop(backend, None)
+
+
+def _backend_v1_durations(backend):
+    """Return the :class:`.InstructionDurations` of a ``BackendV1``, reusing those of a previous
+    call on the same backend as long as its source has not changed.  They are only read to fill the
+    durations of the circuits, see :func:`_parse_instruction_durations`."""
+
+    if backend is None:
+        return InstructionDurations()
+
+    def build():
+        try:
+            return InstructionDurations.from_backend(backend)
+        except AttributeError:
+            return InstructionDurations()
+
+    return _backend_v1_cached(backend, "instruction_durations", build)
+
+
 def _parse_approximation_degree(approximation_degree):
     if approximation_degree is None:
         return None
@@ -1004,17 +1328,11 @@ def _parse_target(backend, target):
     return target
 
 
-def _parse_callback(callback, num_circuits):
-    if not isinstance(callback, list):
-        callback = [callback] * num_circuits
-    return callback
-
-
-def _parse_faulty_qubits_map(backend, num_circuits):
+def _parse_faulty_qubits_map(backend):
     if backend is None:
-        return [None] * num_circuits
+        return None
     if not isinstance(backend, list):
-        return [_create_faulty_qubits_map(backend)] * num_circuits
+        return _create_faulty_qubits_map(backend)
     faulty_qubits_map = []
     for a_backend in backend:
         faulty_qubits_map.append(_create_faulty_qubits_map(a_backend))
@@ -1028,7 +1346,7 @@ def _parse_output_name(output_name, circuits):
         if isinstance(output_name, str):
             # single circuit
             if len(circuits) == 1:
-                return [output_name]
+                return output_name
             # multiple circuits
             else:
                 raise TranspilerError(
@@ -1054,12 +1372,13 @@ def _parse_output_name(output_name, circuits):
                 "list of strings: %s was used." % type(output_name)
             )
     else:
-        return [circuit.name for circuit in circuits]
+        # the circuits keep their names
+        return None
 
 
-def _parse_timing_constraints(backend, timing_constraints, num_circuits):
+def _parse_timing_constraints(backend, timing_constraints):
     if isinstance(timing_constraints, TimingConstraints):
-        return [timing_constraints] * num_circuits
+        return timing_constraints
     if backend is None and timing_constraints is None:
         timing_constraints = TimingConstraints()
     else:
@@ -1071,7 +1390,7 @@ def _parse_timing_constraints(backend, timing_constraints, num_circuits):
             timing_constraints = TimingConstraints(**timing_constraints)
         else:
             timing_constraints = backend.target.timing_constraints()
-    return [timing_constraints] * num_circuits
+    return timing_constraints
 
 
 def _zip_dict(mapping: Dict[Any, Iterable]) -> Iterable[Dict]:
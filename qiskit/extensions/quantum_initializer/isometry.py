@@ -20,7 +20,6 @@
 Generic isometries from m to n qubits.
 """
 
-import itertools
 import numpy as np
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.circuit.instruction import Instruction
@@ -230,18 +229,12 @@ class Isometry(Instruction):
         else:
             i_start = _a(k, s + 1) + 1
         id_list = [np.eye(2, 2) for _ in range(i_start)]
-        squs = [
-            _reverse_qubit_state(
-                [
-                    v[2 * i * 2**s + _b(k, s), k_prime],
-                    v[(2 * i + 1) * 2**s + _b(k, s), k_prime],
-                ],
-                _k_s(k, s),
-                self._epsilon,
-            )
-            for i in range(i_start, 2 ** (n - s - 1))
-        ]
-        return id_list + squs
+        # the pairs of amplitudes are found for all the single-qubit gates at once
+        indices = 2 * np.arange(i_start, 2 ** (n - s - 1)) * 2**s + _b(k, s)
+        squs = _reverse_qubit_states(
+            v[indices, k_prime], v[indices + 2**s, k_prime], _k_s(k, s), self._epsilon
+        )
+        return id_list + list(squs)
 
     # Append a UCGate up to diagonal to the circuit circ.
     def _append_ucg_up_to_diagonal(self, circ, q, single_qubit_gates, control_labels, target_label):
@@ -338,6 +331,23 @@ def _reverse_qubit_state(state, basis_state, epsilon):
     return m
 
 
+# Vectorized version of _reverse_qubit_state for the pairs of amplitudes [c0[i], c1[i]], returning
+# an array of shape (len(c0), 2, 2)
+def _reverse_qubit_states(c0, c1, basis_state, epsilon):
+    # same summation order as np.linalg.norm, so that the gates agree with _reverse_qubit_state
+    r = np.sqrt((c0.real**2 + c1.real**2) + (c0.imag**2 + c1.imag**2))
+    small = r < epsilon
+    r = np.where(small, 1, r)
+    gates = np.empty((len(c0), 2, 2), dtype=complex)
+    first_row, second_row = (0, 1) if basis_state == 0 else (1, 0)
+    gates[:, first_row, 0] = np.conj(c0) / r
+    gates[:, first_row, 1] = np.conj(c1) / r
+    gates[:, second_row, 0] = -c1 / r
+    gates[:, second_row, 1] = c0 / r
+    gates[small] = np.eye(2, 2)
+    return gates
+
+
 # Methods for applying gates to matrices (should be moved to Qiskit AER)
 
 # Input: matrix m with 2^n rows (and arbitrary many columns). Think of the columns as states
@@ -357,18 +367,22 @@ def _reverse_qubit_state(state, basis_state, epsilon):
 
 
 def _apply_ucg(m, k, single_qubit_gates):
-    # ToDo: Improve efficiency by parallelizing the gate application. A generalized version of
-    # ToDo: this method should be implemented by the state vector simulator in Qiskit AER.
+    # The gates are applied to all the pairs of rows and all the columns at once: the rows of m are
+    # grouped by the state of the k controls, the target and the remaining qubits.
     num_qubits = int(np.log2(m.shape[0]))
     num_col = m.shape[1]
     spacing = 2 ** (num_qubits - k - 1)
-    for j in range(2 ** (num_qubits - 1)):
-        i = (j // spacing) * spacing + j
-        gate_index = i // (2 ** (num_qubits - k))
-        for col in range(num_col):
-            m[np.array([i, i + spacing]), np.array([col, col])] = np.ndarray.flatten(
-                single_qubit_gates[gate_index].dot(np.array([[m[i, col]], [m[i + spacing, col]]]))
-            ).tolist()
+    gates = np.asarray(single_qubit_gates).reshape(2**k, 2, 2, 1, 1)
+    blocks = m.reshape(2**k, 2, spacing, num_col)
+    first, second = blocks[:, 0], blocks[:, 1]
+    # m may be a view which cannot be reshaped without copying, so write the result back into it
+    m[:] = np.stack(
+        [
+            gates[:, 0, 0] * first + gates[:, 0, 1] * second,
+            gates[:, 1, 0] * first + gates[:, 1, 1] * second,
+        ],
+        axis=1,
+    ).reshape(m.shape)
     return m
 
 
@@ -380,17 +394,9 @@ def _apply_ucg(m, k, single_qubit_gates):
 
 
 def _apply_diagonal_gate(m, action_qubit_labels, diag):
-    # ToDo: Improve efficiency by parallelizing the gate application. A generalized version of
-    # ToDo: this method should be implemented by the state vector simulator in Qiskit AER.
     num_qubits = int(np.log2(m.shape[0]))
-    num_cols = m.shape[1]
-    basis_states = list(itertools.product([0, 1], repeat=num_qubits))
-    for state in basis_states:
-        state_on_action_qubits = [state[i] for i in action_qubit_labels]
-        diag_index = _bin_to_int(state_on_action_qubits)
-        i = _bin_to_int(state)
-        for j in range(num_cols):
-            m[i, j] = diag[diag_index] * m[i, j]
+    diag_indices = _diag_indices(m.shape[0], action_qubit_labels, num_qubits)
+    m *= np.asarray(diag)[diag_indices].reshape(-1, 1)
     return m
 
 
@@ -405,15 +411,23 @@ def _apply_diagonal_gate(m, action_qubit_labels, diag):
 def _apply_diagonal_gate_to_diag(m_diagonal, action_qubit_labels, diag, num_qubits):
     if not m_diagonal:
         return m_diagonal
-    basis_states = list(itertools.product([0, 1], repeat=num_qubits))
-    for state in basis_states[: len(m_diagonal)]:
-        state_on_action_qubits = [state[i] for i in action_qubit_labels]
-        diag_index = _bin_to_int(state_on_action_qubits)
-        i = _bin_to_int(state)
-        m_diagonal[i] *= diag[diag_index]
+    diag_indices = _diag_indices(len(m_diagonal), action_qubit_labels, num_qubits)
+    m_diagonal[:] = (np.asarray(m_diagonal) * np.asarray(diag)[diag_indices]).tolist()
     return m_diagonal
 
 
+# Return, for each of the first num_states basis states, the index of the entry of a diagonal gate
+# acting on the qubits with labels action_qubit_labels (label 0 being the most significant qubit).
+
+
+def _diag_indices(num_states, action_qubit_labels, num_qubits):
+    states = np.arange(num_states)
+    diag_indices = np.zeros(num_states, dtype=int)
+    for label in action_qubit_labels:
+        diag_indices = (diag_indices << 1) | ((states >> (num_qubits - label - 1)) & 1)
+    return diag_indices
+
+
 # Apply a MC single-qubit gate (given by the 2*2 unitary input: gate) with controlling on
 # the qubits with label control_labels and acting on the qubit with label target_label
 # to a matrix m. The input matrix m and the gate have to be of dtype=complex. The qubit labels are
@@ -422,45 +436,22 @@ def _apply_diagonal_gate_to_diag(m_diagonal, action_qubit_labels, diag, num_qubi
 
 
 def _apply_multi_controlled_gate(m, control_labels, target_label, gate):
-    # ToDo: This method should be integrated into the state vector simulator in Qiskit AER.
     num_qubits = int(np.log2(m.shape[0]))
-    num_cols = m.shape[1]
     control_labels.sort()
-    free_qubits = num_qubits - len(control_labels) - 1
-    basis_states_free = list(itertools.product([0, 1], repeat=free_qubits))
-    for state_free in basis_states_free:
-        (e1, e2) = _construct_basis_states(state_free, control_labels, target_label)
-        for i in range(num_cols):
-            m[np.array([e1, e2]), np.array([i, i])] = np.ndarray.flatten(
-                gate.dot(np.array([[m[e1, i]], [m[e2, i]]]))
-            ).tolist()
+    # the rows of m on which the gate acts are those with all the controls in state 1, paired by
+    # the state of the target
+    states = np.arange(m.shape[0])
+    acted_on = (states >> (num_qubits - target_label - 1)) & 1 == 0
+    for label in control_labels:
+        acted_on &= (states >> (num_qubits - label - 1)) & 1 == 1
+    e1 = states[acted_on]
+    e2 = e1 + 2 ** (num_qubits - target_label - 1)
+    first, second = m[e1], m[e2]
+    m[e1] = gate[0, 0] * first + gate[0, 1] * second
+    m[e2] = gate[1, 0] * first + gate[1, 1] * second
     return m
 
 
-# Helper method for _apply_multi_controlled_gate. This constructs the basis states the MG gate
-# is acting on for a specific state state_free of the qubits we neither control nor act on.
-
-
-def _construct_basis_states(state_free, control_labels, target_label):
-    e1 = []
-    e2 = []
-    j = 0
-    for i in range(len(state_free) + len(control_labels) + 1):
-        if i in control_labels:
-            e1.append(1)
-            e2.append(1)
-        elif i == target_label:
-            e1.append(0)
-            e2.append(1)
-        else:
-            e1.append(state_free[j])
-            e2.append(state_free[j])
-            j += 1
-    out1 = _bin_to_int(e1)
-    out2 = _bin_to_int(e2)
-    return out1, out2
-
-
 # Some helper methods:
 
 
@@ -479,13 +470,6 @@ def _reverse_qubit_oder(qubits):
     return list(reversed(qubits))
 
 
-# Convert list of binary digits to integer
-
-
-def _bin_to_int(binary_digits_as_list):
-    return int("".join(str(x) for x in binary_digits_as_list), 2)
-
-
 def _ct(m):
     return np.transpose(np.conjugate(m))
 
@@ -503,8 +487,8 @@ def _get_binary_rep_as_list(n, num_digits):
 
 
 def _merge_UCGate_and_diag(single_qubit_gates, diag):
-    for (i, gate) in enumerate(single_qubit_gates):
-        single_qubit_gates[i] = np.array([[diag[2 * i], 0.0], [0.0, diag[2 * i + 1]]]).dot(gate)
+    merged = np.asarray(diag).reshape(-1, 2, 1) * np.asarray(single_qubit_gates)
+    single_qubit_gates[:] = list(merged)
     return single_qubit_gates
 
 
@@ -543,10 +527,7 @@ def _ucg_is_identity_up_to_global_phase(single_qubit_gates, epsilon):
         global_phase = 1.0 / (single_qubit_gates[0][0, 0])
     else:
         return False
-    for gate in single_qubit_gates:
-        if not np.allclose(global_phase * gate, np.eye(2, 2)):
-            return False
-    return True
+    return np.allclose(global_phase * np.asarray(single_qubit_gates), np.eye(2, 2))
 
 
 def _diag_is_identity_up_to_global_phase(diag, epsilon):
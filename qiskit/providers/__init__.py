@@ -96,6 +96,7 @@ Backend
    QubitProperties
    BackendV2Converter
    convert_to_target
+   clear_backend_cache
 
 Options
 -------
@@ -731,6 +732,7 @@ from qiskit.providers.backend import BackendV2
 from qiskit.providers.backend import QubitProperties
 from qiskit.providers.backend_compat import BackendV2Converter
 from qiskit.providers.backend_compat import convert_to_target
+from qiskit.providers.backend_compat import clear_backend_cache
 from qiskit.providers.options import Options
 from qiskit.providers.job import Job
 from qiskit.providers.job import JobV1
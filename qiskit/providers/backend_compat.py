@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import weakref
 from typing import List, Iterable, Any, Dict, Optional
 
 from qiskit.exceptions import QiskitError
@@ -29,6 +30,35 @@ from qiskit.providers.models.pulsedefaults import PulseDefaults
 from qiskit.providers.options import Options
 from qiskit.providers.exceptions import BackendPropertyError
 
+# The targets converted from a BackendV1 by BackendV2Converter, keyed on the backend, with the
+# configuration, properties and defaults objects, the date the properties were last updated and
+# the conversion options they were converted from.  They are never handed out, each converter gets
+# its own copy.
+_CONVERTED_TARGETS = weakref.WeakKeyDictionary()
+
+
+def clear_backend_cache(backend: Optional[BackendV1] = None):
+    """Drop the objects derived from a :class:`~.BackendV1` and reused between calls.
+
+    :func:`~.transpile` and :class:`~.BackendV2Converter` reuse what they derive from the
+    configuration and properties of a :class:`~.BackendV1`, such as its :class:`~.Target`, as long
+    as the backend returns the same configuration and properties objects and the
+    ``last_update_date`` of its properties is unchanged.  Call this function after modifying the
+    configuration or properties of a backend in place, so that they are derived again.
+
+    Args:
+        backend: The backend whose derived objects are dropped. If ``None``, those of every backend
+            are dropped.
+    """
+    # pylint: disable=cyclic-import
+    from qiskit.compiler import transpiler
+
+    transpiler._clear_backend_v1_cache(backend)
+    if backend is None:
+        _CONVERTED_TARGETS.clear()
+    else:
+        _CONVERTED_TARGETS.pop(backend, None)
+
 
 def convert_to_target(
     configuration: BackendConfiguration,
@@ -241,15 +271,43 @@ class BackendV2Converter(BackendV2):
                 self._defaults = self._backend.defaults()
             if self._properties is None and hasattr(self._backend, "properties"):
                 self._properties = self._backend.properties()
-            self._target = convert_to_target(
-                self._config,
-                self._properties,
-                self._defaults,
-                custom_name_mapping=self._name_mapping,
-                add_delay=self._add_delay,
-            )
+            self._target = self._converted_target()
         return self._target
 
+    def _converted_target(self):
+        """Convert the wrapped backend to a target, copying the one of another converter of the
+        same backend if it was converted from the same objects with the same options."""
+        source = (
+            self._config,
+            self._properties,
+            self._defaults,
+            getattr(self._properties, "last_update_date", None),
+            self._name_mapping,
+            self._add_delay,
+        )
+        try:
+            cached = _CONVERTED_TARGETS.get(self._backend)
+        except TypeError:
+            cached = None
+        if (
+            cached is not None
+            and all(old is new for old, new in zip(cached[0][:3], source[:3]))
+            and cached[0][3:] == source[3:]
+        ):
+            return cached[1]._copy()
+        target = convert_to_target(
+            self._config,
+            self._properties,
+            self._defaults,
+            custom_name_mapping=self._name_mapping,
+            add_delay=self._add_delay,
+        )
+        try:
+            _CONVERTED_TARGETS[self._backend] = (source, target)
+        except TypeError:
+            return target
+        return target._copy()
+
     @property
     def max_circuits(self):
         return self._config.max_experiments
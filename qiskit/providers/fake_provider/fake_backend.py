@@ -18,7 +18,6 @@ Base class for dummy backends.
 
 import warnings
 import collections
-import json
 import os
 import re
 
@@ -37,9 +36,14 @@ from .utils.json_decoder import (
     decode_backend_configuration,
     decode_backend_properties,
     decode_pulse_defaults,
+    load_snapshot,
 )
 from .utils.backend_converter import convert_to_target
 
+# A mapping of the snapshot files of a fake backend -> its converted target, shared by all the
+# instances of the backend in the process. Every instance gets its own copy of the target.
+_TARGET_CACHE = {}
+
 
 class _Credentials:
     def __init__(self, token="123456", url="https://"):
@@ -134,27 +138,22 @@ class FakeBackendV2(BackendV2):
     def _get_conf_dict_from_json(self):
         if not self.conf_filename:
             return None
-        conf_dict = self._load_json(self.conf_filename)
-        decode_backend_configuration(conf_dict)
+        conf_dict = self._load_json(self.conf_filename, decode_backend_configuration)
         conf_dict["backend_name"] = self.backend_name
         return conf_dict
 
     def _set_props_dict_from_json(self):
         if self.props_filename:
-            props_dict = self._load_json(self.props_filename)
-            decode_backend_properties(props_dict)
+            props_dict = self._load_json(self.props_filename, decode_backend_properties)
             self._props_dict = props_dict
 
     def _set_defs_dict_from_json(self):
         if self.defs_filename:
-            defs_dict = self._load_json(self.defs_filename)
-            decode_pulse_defaults(defs_dict)
+            defs_dict = self._load_json(self.defs_filename, decode_pulse_defaults)
             self._defs_dict = defs_dict
 
-    def _load_json(self, filename: str) -> dict:
-        with open(os.path.join(self.dirname, filename)) as f_json:
-            the_json = json.load(f_json)
-        return the_json
+    def _load_json(self, filename: str, decoder=None) -> dict:
+        return load_snapshot(os.path.join(self.dirname, filename), decoder)
 
     @property
     def target(self) -> Target:
@@ -163,16 +162,20 @@ class FakeBackendV2(BackendV2):
         :rtype: Target
         """
         if self._target is None:
-            self._get_conf_dict_from_json()
             if self._props_dict is None:
                 self._set_props_dict_from_json()
-            if self._defs_dict is None:
-                self._set_defs_dict_from_json()
-            self._target = convert_to_target(
-                conf_dict=self._conf_dict,
-                props_dict=self._props_dict,
-                defs_dict=self._defs_dict,
-            )
+            key = (self.dirname, self.conf_filename, self.props_filename, self.defs_filename)
+            target = _TARGET_CACHE.get(key)
+            if target is None:
+                if self._defs_dict is None:
+                    self._set_defs_dict_from_json()
+                target = convert_to_target(
+                    conf_dict=self._conf_dict,
+                    props_dict=self._props_dict,
+                    defs_dict=self._defs_dict,
+                )
+                _TARGET_CACHE[key] = target
+            self._target = target._copy()
 
         return self._target
 
@@ -35,9 +35,9 @@ class FakePulseBackend(FakeQasmBackend):
     def _set_defaults_from_json(self):
         if not self.props_filename:
             raise QiskitError("No properties file has been defined")
-        defs = self._load_json(self.defs_filename)
-        decode_pulse_defaults(defs)
-        self._defaults = PulseDefaults.from_dict(defs)
+        self._defaults = self._load_json(
+            self.defs_filename, decode_pulse_defaults, PulseDefaults.from_dict
+        )
 
     def _get_config_from_dict(self, conf):
         return PulseBackendConfiguration.from_dict(conf)
@@ -14,7 +14,6 @@
 Fake backend abstract class for mock backends.
 """
 
-import json
 import os
 
 from qiskit.exceptions import QiskitError
@@ -23,6 +22,7 @@ from qiskit.providers.models import BackendProperties, QasmBackendConfiguration
 from .utils.json_decoder import (
     decode_backend_configuration,
     decode_backend_properties,
+    load_snapshot,
 )
 from .fake_backend import FakeBackend
 
@@ -50,8 +50,7 @@ class FakeQasmBackend(FakeBackend):
     def _get_conf_from_json(self):
         if not self.conf_filename:
             raise QiskitError("No configuration file has been defined")
-        conf = self._load_json(self.conf_filename)
-        decode_backend_configuration(conf)
+        conf = self._load_json(self.conf_filename, decode_backend_configuration)
         configuration = self._get_config_from_dict(conf)
         configuration.backend_name = self.backend_name
         return configuration
@@ -59,14 +58,12 @@ class FakeQasmBackend(FakeBackend):
     def _set_props_from_json(self):
         if not self.props_filename:
             raise QiskitError("No properties file has been defined")
-        props = self._load_json(self.props_filename)
-        decode_backend_properties(props)
-        self._properties = BackendProperties.from_dict(props)
+        self._properties = self._load_json(
+            self.props_filename, decode_backend_properties, BackendProperties.from_dict
+        )
 
-    def _load_json(self, filename):
-        with open(os.path.join(self.dirname, filename)) as f_json:
-            the_json = json.load(f_json)
-        return the_json
+    def _load_json(self, filename, decoder=None, builder=None):
+        return load_snapshot(os.path.join(self.dirname, filename), decoder, builder)
 
     def _get_config_from_dict(self, conf):
         return QasmBackendConfiguration.from_dict(conf)
@@ -14,10 +14,55 @@
 Utils to decode fake backend configurations from json
 """
 
-from typing import Dict, Union, List
+import json
+import pickle
+from typing import Any, Callable, Dict, Optional, Union, List
 
 import dateutil.parser
 
+# A mapping of (path, decoder, builder) -> pickled decoded snapshot, or pickled object built
+# from it, shared by all the fake backends of the process.
+_SNAPSHOT_CACHE = {}
+
+
+def load_snapshot(
+    path: str,
+    decoder: Optional[Callable[[Dict], None]] = None,
+    builder: Optional[Callable[[Dict], Any]] = None,
+) -> Any:
+    """Load and decode a backend snapshot json file.
+
+    The json file is only parsed and decoded the first time it is loaded in the process.
+    The decoded snapshot is then kept as a compact pickle, so later loads of the same file,
+    for example by other instances of the same fake backend, only have to unpickle it.
+    Every call returns a new copy of the snapshot that the caller is free to modify.
+
+    Args:
+        path: The path of the json file.
+        decoder: A function decoding the loaded dictionary in place, such as
+            :func:`decode_backend_configuration`.
+        builder: A function building an object from the decoded dictionary, such as
+            :meth:`.PulseDefaults.from_dict`. If given, the built object is cached and a new
+            copy of it is returned instead of the decoded dictionary.
+
+    Returns:
+        The decoded snapshot, or the object built from it.
+    """
+    key = (path, decoder, builder)
+    try:
+        return pickle.loads(_SNAPSHOT_CACHE[key])
+    except KeyError:
+        pass
+    if builder is None:
+        with open(path) as f_json:
+            snapshot = json.load(f_json)
+        if decoder is not None:
+            decoder(snapshot)
+    else:
+        snapshot = builder(load_snapshot(path, decoder))
+    _SNAPSHOT_CACHE[key] = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    return snapshot
+
 
 def decode_pulse_defaults(defaults: Dict) -> None:
     """Decode pulse defaults data.
@@ -14,6 +14,7 @@
 
 """Helper class used to convert a pulse instruction into PulseQobjInstruction."""
 
+import functools
 import hashlib
 import re
 import warnings
@@ -522,7 +523,7 @@ class QobjToInstructionConverter:
             Parsed operand value. ParameterExpression object is returned if value is not number.
         """
         if isinstance(value_expr, str):
-            str_expr = parse_string_expr(value_expr, partial_binding=False)
+            str_expr = _parse_string_expr(value_expr)
             value_expr = str_expr(**{pname: Parameter(pname) for pname in str_expr.params})
         return value_expr
 
@@ -578,7 +579,8 @@ class QobjToInstructionConverter:
         schedule = Schedule()
 
         for acquire_channel, mem_slot, reg_slot in zip(acquire_channels, mem_slots, register_slots):
-            schedule |= (
+            schedule.insert(
+                t0,
                 instructions.Acquire(
                     duration,
                     acquire_channel,
@@ -586,8 +588,8 @@ class QobjToInstructionConverter:
                     reg_slot=reg_slot,
                     kernel=kernel,
                     discriminator=discriminator,
-                )
-                << t0
+                ),
+                inplace=True,
             )
 
         return schedule
@@ -740,3 +742,14 @@ class QobjToInstructionConverter:
         """
         t0 = instruction.t0
         return instructions.Snapshot(instruction.label, instruction.type) << t0
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_string_expr(source):
+    """Parse a string operand, reusing the parsed expression of identical operands.
+
+    Backend defaults repeat the same few phase expressions in many commands. Evaluating
+    a :class:`.PulseExpression` binds the parameters of a copy of its tree, so the same
+    parsed expression can be evaluated for every command.
+    """
+    return parse_string_expr(source, partial_binding=False)
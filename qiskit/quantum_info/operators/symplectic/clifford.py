@@ -25,6 +25,7 @@ from qiskit.quantum_info.operators.mixins import AdjointMixin, generate_apidocs
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.scalar_op import ScalarOp
 from qiskit.quantum_info.operators.symplectic.base_pauli import _count_y
+from qiskit.synthesis.linear.binary_matrix import PackedBinaryMatrix
 
 from .base_pauli import BasePauli
 from .clifford_circuits import _append_circuit, _append_operation
@@ -440,54 +441,36 @@ class Clifford(BaseOperator, AdjointMixin, Operation):
             table2 = self
 
         num_qubits = self.num_qubits
+        x1, z1, phase1 = table1.x, table1.z, table1.phase
 
-        array1 = table1.symplectic_matrix.astype(int)
-        phase1 = table1.phase.astype(int)
-
-        array2 = table2.symplectic_matrix.astype(int)
-        phase2 = table2.phase.astype(int)
+        # The GF(2) products run on bit-packed matrices
+        array1 = PackedBinaryMatrix(table1.symplectic_matrix)
+        array2 = PackedBinaryMatrix(table2.symplectic_matrix)
 
         # Update Pauli table
-        pauli = (array2.dot(array1) % 2).astype(bool)
+        pauli = array2.dot(array1).to_matrix()
+        x, z = pauli[:, :num_qubits], pauli[:, num_qubits:]
 
         # Add phases
-        phase = np.mod(array2.dot(phase1) + phase2, 2)
-
-        # Correcting for phase due to Pauli multiplication
-        ifacts = np.zeros(2 * num_qubits, dtype=int)
-
-        for k in range(2 * num_qubits):
-
-            row2 = array2[k]
-            x2 = table2.x[k]
-            z2 = table2.z[k]
-
-            # Adding a factor of i for each Y in the image of an operator under the
-            # first operation, since Y=iXZ
-
-            ifacts[k] += np.sum(x2 & z2)
-
-            # Adding factors of i due to qubit-wise Pauli multiplication
-
-            for j in range(num_qubits):
-                x = 0
-                z = 0
-                for i in range(2 * num_qubits):
-                    if row2[i]:
-                        x1 = array1[i, j]
-                        z1 = array1[i, j + num_qubits]
-                        if (x | z) & (x1 | z1):
-                            val = np.mod(np.abs(3 * z1 - x1) - np.abs(3 * z - x) - 1, 3)
-                            if val == 0:
-                                ifacts[k] += 1
-                            elif val == 1:
-                                ifacts[k] -= 1
-                        x = np.mod(x + x1, 2)
-                        z = np.mod(z + z1, 2)
+        phase = array2.dot(PackedBinaryMatrix(phase1[:, None])).to_matrix()[:, 0] ^ table2.phase
+
+        # Correcting for phase due to Pauli multiplication.  Row k of the result is the
+        # product of the rows i of table1 selected by row k of table2, in increasing order.
+        # Writing each row as i^(x.z) X^x Z^z (since Y = iXZ), the product picks up a factor
+        # of i for each Y of the rows and of the image of row k of table2, a factor of -1 for
+        # each pair a < b of rows with z_a.x_b odd, and a factor of i^(-x.z) for the Ys of
+        # the result.
+        ifacts = np.sum(table2.x & table2.z, axis=1, dtype=int)
+        ifacts += array2.to_matrix().astype(int).dot(np.sum(x1 & z1, axis=1, dtype=int))
+        signs = PackedBinaryMatrix(z1).dot(PackedBinaryMatrix(x1.T)).to_matrix()
+        signs = array2.dot(PackedBinaryMatrix(np.triu(signs, 1)))
+        signs = PackedBinaryMatrix.from_words(signs.words & array2.words, 2 * num_qubits)
+        ifacts += 2 * signs.row_weights()
+        ifacts -= np.sum(x & z, axis=1, dtype=int)
 
         p = np.mod(ifacts, 4) // 2
 
-        phase = np.mod(phase + p, 2)
+        phase = np.mod(phase + p, 2).astype(bool)
 
         return Clifford(self._stack_table_phase(pauli, phase), validate=False)
 
@@ -730,11 +713,11 @@ class Clifford(BaseOperator, AdjointMixin, Operation):
         if mat.shape != (2 * dim, 2 * dim):
             return False
 
-        one = np.eye(dim, dtype=int)
-        zero = np.zeros((dim, dim), dtype=int)
-        seye = np.block([[zero, one], [one, zero]])
-        arr = mat.astype(int)
-        return np.array_equal(np.mod(arr.T.dot(seye).dot(arr), 2), seye)
+        # seye * table swaps the two halves of the rows of table
+        arr = PackedBinaryMatrix(mat.T)
+        swapped = PackedBinaryMatrix(np.vstack((mat[dim:], mat[:dim])))
+        seye = np.roll(np.eye(2 * dim, dtype=bool), dim, axis=1)
+        return np.array_equal(arr.dot(swapped).to_matrix(), seye)
 
     @staticmethod
     def _conjugate_transpose(clifford, method):
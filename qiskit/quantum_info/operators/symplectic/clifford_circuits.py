@@ -13,6 +13,8 @@
 Circuit simulation for the Clifford class.
 """
 
+import numpy as np
+
 from qiskit.circuit.barrier import Barrier
 from qiskit.circuit.delay import Delay
 from qiskit.exceptions import QiskitError
@@ -21,6 +23,9 @@ from qiskit.exceptions import QiskitError
 def _append_circuit(clifford, circuit, qargs=None):
     """Update Clifford inplace by applying a Clifford circuit.
 
+    The gates are applied to a bit-packed copy of the tableau, which is written back to
+    ``clifford`` once the whole circuit has been applied.
+
     Args:
         clifford (Clifford): the Clifford to update.
         circuit (QuantumCircuit): the circuit to apply.
@@ -35,14 +40,9 @@ def _append_circuit(clifford, circuit, qargs=None):
     if qargs is None:
         qargs = list(range(clifford.num_qubits))
 
-    for instruction in circuit:
-        if instruction.clbits:
-            raise QiskitError(
-                f"Cannot apply Instruction with classical bits: {instruction.operation.name}"
-            )
-        # Get the integer position of the flat register
-        new_qubits = [qargs[circuit.find_bit(bit).index] for bit in instruction.qubits]
-        _append_operation(clifford, instruction.operation, new_qubits)
+    tableau = _PackedTableau(clifford)
+    _append_circuit_packed(tableau, circuit, qargs)
+    tableau.write(clifford)
     return clifford
 
 
@@ -66,6 +66,21 @@ def _append_operation(clifford, operation, qargs=None):
     if qargs is None:
         qargs = list(range(clifford.num_qubits))
 
+    name = _basis_gate_name(operation, qargs)
+    if name in _BASIS_1Q:
+        return _BASIS_1Q[name](clifford, qargs[0])
+    if name in _BASIS_2Q:
+        return _BASIS_2Q[name](clifford, qargs[0], qargs[1])
+    return _append_circuit(clifford, operation.definition, qargs)
+
+
+def _basis_gate_name(operation, qargs):
+    """Return the name of the Clifford basis gate ``operation`` is, or ``None`` if it must
+    be unrolled through its definition.
+
+    Raises:
+        QiskitError: if ``operation`` is not a valid Clifford operation on ``qargs``.
+    """
     gate = operation
 
     if isinstance(gate, str):
@@ -85,11 +100,11 @@ def _append_operation(clifford, operation, qargs=None):
     if name in _BASIS_1Q:
         if len(qargs) != 1:
             raise QiskitError("Invalid qubits for 1-qubit gate.")
-        return _BASIS_1Q[name](clifford, qargs[0])
+        return name
     if name in _BASIS_2Q:
         if len(qargs) != 2:
             raise QiskitError("Invalid qubits for 2-qubit gate.")
-        return _BASIS_2Q[name](clifford, qargs[0], qargs[1])
+        return name
 
     # If not a Clifford basis gate we try to unroll the gate and
     # raise an exception if unrolling reaches a non-Clifford gate.
@@ -97,8 +112,142 @@ def _append_operation(clifford, operation, qargs=None):
     # are a single qubit Clifford gate rather than raise an exception.
     if gate.definition is None:
         raise QiskitError(f"Cannot apply Instruction: {gate.name}")
+    return None
 
-    return _append_circuit(clifford, gate.definition, qargs)
+
+# ---------------------------------------------------------------------
+# Bit-packed tableau
+# ---------------------------------------------------------------------
+
+
+class _PackedTableau:
+    """A Clifford tableau stored column by column as Python integers.
+
+    Bit ``r`` of ``x[q]``, ``z[q]`` and ``phase`` holds row ``r`` of the corresponding
+    column of the boolean tableau, so that every basis gate is applied to all the rows
+    at once with a handful of word-parallel integer operations.
+    """
+
+    __slots__ = ("x", "z", "phase", "ones")
+
+    def __init__(self, clifford):
+        self.x = _pack_columns(clifford.x)
+        self.z = _pack_columns(clifford.z)
+        self.phase = _pack_columns(clifford.phase[:, None])[0]
+        self.ones = (1 << (2 * clifford.num_qubits)) - 1
+
+    def write(self, clifford):
+        """Write the tableau back into ``clifford`` in place."""
+        num_rows = 2 * clifford.num_qubits
+        clifford.x = _unpack_columns(self.x, num_rows)
+        clifford.z = _unpack_columns(self.z, num_rows)
+        clifford.phase = _unpack_columns([self.phase], num_rows)[:, 0]
+
+
+def _pack_columns(mat):
+    """Return the columns of a 2d boolean array as integers, with bit ``r`` holding row ``r``."""
+    packed = np.packbits(mat.T, axis=1, bitorder="little")
+    return [int.from_bytes(column.tobytes(), "little") for column in packed]
+
+
+def _unpack_columns(columns, num_rows):
+    """Inverse of :func:`_pack_columns`."""
+    num_bytes = (num_rows + 7) // 8
+    data = b"".join(column.to_bytes(num_bytes, "little") for column in columns)
+    packed = np.frombuffer(data, dtype=np.uint8).reshape(len(columns), num_bytes)
+    return np.unpackbits(packed, axis=1, count=num_rows, bitorder="little").astype(bool).T
+
+
+def _append_circuit_packed(tableau, circuit, qargs):
+    """Apply a Clifford circuit to a :class:`_PackedTableau` in place."""
+    indices = {bit: qargs[index] for index, bit in enumerate(circuit.qubits)}
+    for instruction in circuit:
+        if instruction.clbits:
+            raise QiskitError(
+                f"Cannot apply Instruction with classical bits: {instruction.operation.name}"
+            )
+        # Get the integer position of the flat register
+        new_qubits = [indices[bit] for bit in instruction.qubits]
+        _append_operation_packed(tableau, instruction.operation, new_qubits)
+
+
+def _append_operation_packed(tableau, operation, qargs):
+    """Apply a Clifford operation to a :class:`_PackedTableau` in place."""
+    if isinstance(operation, (Barrier, Delay)):
+        return
+    name = _basis_gate_name(operation, qargs)
+    if name is None:
+        _append_circuit_packed(tableau, operation.definition, qargs)
+    else:
+        _PACKED_BASIS[name](tableau, *qargs)
+
+
+# The functions below mirror the boolean ``_append_*`` helpers further down on a
+# :class:`_PackedTableau`, where ``tab.ones`` stands for an all-true column.
+
+
+def _packed_i(tab, qubit):
+    # pylint: disable=unused-argument
+    pass
+
+
+def _packed_x(tab, qubit):
+    tab.phase ^= tab.z[qubit]
+
+
+def _packed_y(tab, qubit):
+    tab.phase ^= tab.x[qubit] ^ tab.z[qubit]
+
+
+def _packed_z(tab, qubit):
+    tab.phase ^= tab.x[qubit]
+
+
+def _packed_h(tab, qubit):
+    x, z = tab.x[qubit], tab.z[qubit]
+    tab.phase ^= x & z
+    tab.x[qubit], tab.z[qubit] = z, x
+
+
+def _packed_s(tab, qubit):
+    x = tab.x[qubit]
+    tab.phase ^= x & tab.z[qubit]
+    tab.z[qubit] ^= x
+
+
+def _packed_sdg(tab, qubit):
+    x = tab.x[qubit]
+    tab.phase ^= x & ~tab.z[qubit] & tab.ones
+    tab.z[qubit] ^= x
+
+
+def _packed_v(tab, qubit):
+    x, z = tab.x[qubit], tab.z[qubit]
+    tab.x[qubit], tab.z[qubit] = x ^ z, x
+
+
+def _packed_w(tab, qubit):
+    x, z = tab.x[qubit], tab.z[qubit]
+    tab.x[qubit], tab.z[qubit] = z, z ^ x
+
+
+def _packed_cx(tab, control, target):
+    x0, z0, x1, z1 = tab.x[control], tab.z[control], tab.x[target], tab.z[target]
+    tab.phase ^= (x1 ^ z0 ^ tab.ones) & z1 & x0
+    tab.x[target] = x1 ^ x0
+    tab.z[control] = z0 ^ z1
+
+
+def _packed_cz(tab, control, target):
+    x0, z0, x1, z1 = tab.x[control], tab.z[control], tab.x[target], tab.z[target]
+    tab.phase ^= x0 & x1 & (z0 ^ z1)
+    tab.z[target] = z1 ^ x0
+    tab.z[control] = z0 ^ x1
+
+
+def _packed_swap(tab, qubit0, qubit1):
+    tab.x[qubit0], tab.x[qubit1] = tab.x[qubit1], tab.x[qubit0]
+    tab.z[qubit0], tab.z[qubit1] = tab.z[qubit1], tab.z[qubit0]
 
 
 # ---------------------------------------------------------------------
@@ -334,3 +483,20 @@ _BASIS_1Q = {
 _BASIS_2Q = {"cx": _append_cx, "cz": _append_cz, "swap": _append_swap}
 # Non-clifford gates
 _NON_CLIFFORD = {"t", "tdg", "ccx", "ccz"}
+_PACKED_BASIS = {
+    "i": _packed_i,
+    "id": _packed_i,
+    "iden": _packed_i,
+    "x": _packed_x,
+    "y": _packed_y,
+    "z": _packed_z,
+    "h": _packed_h,
+    "s": _packed_s,
+    "sdg": _packed_sdg,
+    "sinv": _packed_sdg,
+    "v": _packed_v,
+    "w": _packed_w,
+    "cx": _packed_cx,
+    "cz": _packed_cz,
+    "swap": _packed_swap,
+}
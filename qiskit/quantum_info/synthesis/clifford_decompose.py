@@ -14,6 +14,7 @@ Circuit synthesis for the Clifford class.
 """
 # pylint: disable=invalid-name
 
+from functools import lru_cache
 from itertools import product
 
 import numpy as np
@@ -21,6 +22,7 @@ import numpy as np
 from qiskit.circuit import QuantumCircuit
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.symplectic.clifford_circuits import (
+    _append_circuit,
     _append_cx,
     _append_h,
     _append_s,
@@ -30,7 +32,6 @@ from qiskit.quantum_info.operators.symplectic.clifford_circuits import (
     _append_x,
     _append_z,
 )
-from qiskit.quantum_info.operators.symplectic.pauli import Pauli
 
 
 def decompose_clifford(clifford, method=None):
@@ -64,6 +65,31 @@ def decompose_clifford(clifford, method=None):
     """
     num_qubits = clifford.num_qubits
 
+    # Small Cliffords recur all the time when synthesizing blocks of circuits, so their
+    # decompositions are cached by tableau
+    if num_qubits <= _MAX_CACHED_QUBITS:
+        return _decompose_small_clifford(method, num_qubits, clifford.tableau.tobytes()).copy()
+
+    return _decompose_clifford(clifford, method)
+
+
+_MAX_CACHED_QUBITS = 3
+
+
+@lru_cache(maxsize=4096)
+def _decompose_small_clifford(method, num_qubits, tableau):
+    """Cached :func:`decompose_clifford` for Cliffords of at most ``_MAX_CACHED_QUBITS`` qubits,
+    identified by the bytes of their boolean tableau."""
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info.operators.symplectic.clifford import Clifford
+
+    tableau = np.frombuffer(tableau, dtype=bool).reshape(2 * num_qubits, 2 * num_qubits + 1)
+    return _decompose_clifford(Clifford(tableau.copy(), validate=False), method)
+
+
+def _decompose_clifford(clifford, method):
+    num_qubits = clifford.num_qubits
+
     if method == "AG":
         return decompose_clifford_ag(clifford)
 
@@ -472,60 +498,44 @@ def decompose_clifford_greedy(clifford):
     num_qubits = clifford.num_qubits
     circ = QuantumCircuit(num_qubits, name=str(clifford))
     qubit_list = list(range(num_qubits))
-    clifford_cpy = clifford.copy()
 
-    # Reducing the original Clifford to identity
-    # via symplectic Gaussian elimination
+    # Reducing the original Clifford to identity via symplectic Gaussian elimination.
+    # Rather than the remaining Clifford C, we keep track of its adjoint, to which each
+    # decoupling circuit D is simply appended as D C^dagger is the adjoint of C D^dagger.
+    # The images of X_q and Z_q under the adjoint are then its destabilizer and stabilizer
+    # rows q.
+    clifford_adj = clifford.adjoint()
+
     while len(qubit_list) > 0:
-        # Calculate the adjoint of clifford_cpy without the phase
-        clifford_adj = clifford_cpy.copy()
-        tmp = clifford_adj.destab_x.copy()
-        clifford_adj.destab_x = clifford_adj.stab_z.T
-        clifford_adj.destab_z = clifford_adj.destab_z.T
-        clifford_adj.stab_x = clifford_adj.stab_x.T
-        clifford_adj.stab_z = tmp.T
-
-        list_greedy_cost = []
-        for qubit in qubit_list:
-            pauli_x = Pauli("I" * (num_qubits - qubit - 1) + "X" + "I" * qubit)
-            pauli_x = pauli_x.evolve(clifford_adj, frame="s")
-
-            pauli_z = Pauli("I" * (num_qubits - qubit - 1) + "Z" + "I" * qubit)
-            pauli_z = pauli_z.evolve(clifford_adj, frame="s")
-            list_pairs = []
-            pauli_count = 0
-
-            # Compute the CNOT cost in order to find the qubit with the minimal cost
-            for i in qubit_list:
-                typeq = _from_pair_paulis_to_type(pauli_x, pauli_z, i)
-                list_pairs.append(typeq)
-                pauli_count += 1
-            cost = _compute_greedy_cost(list_pairs)
-            list_greedy_cost.append([cost, qubit])
-
-        _, min_qubit = (sorted(list_greedy_cost))[0]
+        # Types of the pairs of Paulis (X_q, Z_q) on the qubits i, for every q and i in
+        # qubit_list, and the CNOT cost of eliminating each qubit q
+        pair_types = _pair_types(clifford_adj, qubit_list)
+        classes = _PAIR_CLASS[pair_types]
+        a_num, b_num, c_num, d_num = (np.count_nonzero(classes == c, axis=1) for c in range(4))
+        if np.any(a_num % 2 == 0):
+            raise QiskitError("Symplectic Gaussian elimination fails.")
+        cost = 3 * (a_num - 1) // 2 + (b_num + 1) * (b_num > 0) + c_num + d_num
+        cost += 3 * (classes[:, 0] != _CLASS_A)  # additional SWAP
 
         # Gaussian elimination step for the qubit with minimal CNOT cost
-        pauli_x = Pauli("I" * (num_qubits - min_qubit - 1) + "X" + "I" * min_qubit)
-        pauli_x = pauli_x.evolve(clifford_adj, frame="s")
-
-        pauli_z = Pauli("I" * (num_qubits - min_qubit - 1) + "Z" + "I" * min_qubit)
-        pauli_z = pauli_z.evolve(clifford_adj, frame="s")
+        min_index = int(np.argmin(cost))
+        min_qubit = qubit_list[min_index]
 
         # Compute the decoupling operator of cliff_ox and cliff_oz
-        decouple_circ, decouple_cliff = _calc_decoupling(
-            pauli_x, pauli_z, qubit_list, min_qubit, num_qubits, clifford_cpy
+        decouple_circ = _calc_decoupling(
+            dict(zip(qubit_list, pair_types[min_index].tolist())), min_qubit, num_qubits
         )
-        circ = circ.compose(decouple_circ)
+        circ.compose(decouple_circ, inplace=True)
 
         # Now the clifford acts trivially on min_qubit
-        clifford_cpy = decouple_cliff.adjoint().compose(clifford_cpy)
+        _append_circuit(clifford_adj, decouple_circ)
         qubit_list.remove(min_qubit)
 
-    # Add the phases (Pauli gates) to the Clifford circuit
+    # Add the phases (Pauli gates) to the Clifford circuit.  The remaining Clifford is a
+    # Pauli operator and so is its own adjoint.
     for qubit in range(num_qubits):
-        stab = clifford_cpy.stab_phase[qubit]
-        destab = clifford_cpy.destab_phase[qubit]
+        stab = clifford_adj.stab_phase[qubit]
+        destab = clifford_adj.destab_phase[qubit]
         if destab and stab:
             circ.y(qubit)
         elif not destab and stab:
@@ -578,105 +588,63 @@ D_class = [
 E_class = [[[False, False], [False, False]]]  # 'II'
 
 
-def _from_pair_paulis_to_type(pauli_x, pauli_z, qubit):
-    """Converts a pair of Paulis pauli_x and pauli_z into a type"""
-
-    type_x = [pauli_x.z[qubit], pauli_x.x[qubit]]
-    type_z = [pauli_z.z[qubit], pauli_z.x[qubit]]
-    return [type_x, type_z]
-
-
-def _compute_greedy_cost(list_pairs):
-    """Compute the CNOT cost of one step of the algorithm"""
-
-    A_num = 0
-    B_num = 0
-    C_num = 0
-    D_num = 0
-
-    for pair in list_pairs:
-        if pair in A_class:
-            A_num += 1
-        elif pair in B_class:
-            B_num += 1
-        elif pair in C_class:
-            C_num += 1
-        elif pair in D_class:
-            D_num += 1
-
-    if (A_num % 2) == 0:
-        raise QiskitError("Symplectic Gaussian elimination fails.")
-
-    # Calculate the CNOT cost
-    cost = 3 * (A_num - 1) / 2 + (B_num + 1) * (B_num > 0) + C_num + D_num
-    if list_pairs[0] not in A_class:  # additional SWAP
-        cost += 3
-
-    return cost
-
-
-def _calc_decoupling(pauli_x, pauli_z, qubit_list, min_qubit, num_qubits, cliff):
+def _pair_type(pair):
+    """Return the 4-bit code of a pair of single-qubit Paulis [[z_x, x_x], [z_z, x_z]]"""
+    return 8 * pair[0][0] + 4 * pair[0][1] + 2 * pair[1][0] + pair[1][1]
+
+
+# Equivalence class of every pair of Paulis, indexed by its code
+_CLASS_A, _CLASS_B, _CLASS_C, _CLASS_D, _CLASS_E = range(5)
+_PAIR_CLASS = np.empty(16, dtype=int)
+for _class, _pairs in enumerate([A_class, B_class, C_class, D_class, E_class]):
+    for _pair in _pairs:
+        _PAIR_CLASS[_pair_type(_pair)] = _class
+
+# Single-qubit gates reducing every pair of Paulis to a representative in the equivalence
+# class ['XZ', 'XX', 'XI', 'IZ', 'II']
+_PAIR_REDUCTION = {
+    _pair_type([[True, True], [False, False]]): ["s"],  # 'YI'
+    _pair_type([[True, True], [True, True]]): ["s"],  # 'YY'
+    _pair_type([[True, True], [True, False]]): ["s"],  # 'YZ'
+    _pair_type([[True, False], [False, False]]): ["h"],  # 'ZI'
+    _pair_type([[True, False], [True, False]]): ["h"],  # 'ZZ'
+    _pair_type([[True, False], [False, True]]): ["h"],  # 'ZX'
+    _pair_type([[False, False], [False, True]]): ["h"],  # 'IX'
+    _pair_type([[False, False], [True, True]]): ["s", "h"],  # 'IY'
+    _pair_type([[True, False], [True, True]]): ["s", "h"],  # 'ZY'
+    _pair_type([[True, True], [False, True]]): ["h", "s"],  # 'YX'
+    _pair_type([[False, True], [True, True]]): ["s", "h", "s"],  # 'XY'
+}
+
+
+def _pair_types(clifford, qubit_list):
+    """Return the codes of the pairs of Paulis given by the destabilizer and stabilizer rows
+    q of ``clifford`` on the qubits i, for all q and i in ``qubit_list``"""
+    rows = np.ix_(qubit_list, qubit_list)
+    destab_z = clifford.destab_z[rows].astype(int)
+    destab_x = clifford.destab_x[rows].astype(int)
+    stab_z = clifford.stab_z[rows].astype(int)
+    stab_x = clifford.stab_x[rows].astype(int)
+    return 8 * destab_z + 4 * destab_x + 2 * stab_z + stab_x
+
+
+def _calc_decoupling(pair_types, min_qubit, num_qubits):
     """Calculate a decoupling operator D:
     D^{-1} * Ox * D = x1
     D^{-1} * Oz * D = z1
-    and reduce the clifford such that it will act trivially on min_qubit
+    such that the clifford will act trivially on min_qubit, from the types of the pairs of
+    Paulis (Ox, Oz) on each remaining qubit.
     """
 
     circ = QuantumCircuit(num_qubits)
 
-    # decouple_cliff is initialized to an identity clifford
-    decouple_cliff = cliff.copy()
-    num_qubits = decouple_cliff.num_qubits
-    decouple_cliff.phase = np.zeros(2 * num_qubits)
-    decouple_cliff.symplectic_matrix = np.eye(2 * num_qubits)
-
     qubit0 = min_qubit  # The qubit for the symplectic Gaussian elimination
 
     # Reduce the pair of Paulis to a representative in the equivalence class
     # ['XZ', 'XX', 'XI', 'IZ', 'II'] by adding single-qubit gates
-    for qubit in qubit_list:
-
-        typeq = _from_pair_paulis_to_type(pauli_x, pauli_z, qubit)
-
-        if typeq in [
-            [[True, True], [False, False]],  # 'YI'
-            [[True, True], [True, True]],  # 'YY'
-            [[True, True], [True, False]],
-        ]:  # 'YZ':
-            circ.s(qubit)
-            _append_s(decouple_cliff, qubit)
-
-        elif typeq in [
-            [[True, False], [False, False]],  # 'ZI'
-            [[True, False], [True, False]],  # 'ZZ'
-            [[True, False], [False, True]],  # 'ZX'
-            [[False, False], [False, True]],
-        ]:  # 'IX'
-            circ.h(qubit)
-            _append_h(decouple_cliff, qubit)
-
-        elif typeq in [
-            [[False, False], [True, True]],  # 'IY'
-            [[True, False], [True, True]],
-        ]:  # 'ZY'
-            circ.s(qubit)
-            circ.h(qubit)
-            _append_s(decouple_cliff, qubit)
-            _append_h(decouple_cliff, qubit)
-
-        elif typeq == [[True, True], [False, True]]:  # 'YX'
-            circ.h(qubit)
-            circ.s(qubit)
-            _append_h(decouple_cliff, qubit)
-            _append_s(decouple_cliff, qubit)
-
-        elif typeq == [[False, True], [True, True]]:  # 'XY'
-            circ.s(qubit)
-            circ.h(qubit)
-            circ.s(qubit)
-            _append_s(decouple_cliff, qubit)
-            _append_h(decouple_cliff, qubit)
-            _append_s(decouple_cliff, qubit)
+    for qubit, typeq in pair_types.items():
+        for gate in _PAIR_REDUCTION.get(typeq, ()):
+            getattr(circ, gate)(qubit)
 
     # Reducing each pair of Paulis (except of qubit0) to 'II'
     # by adding two-qubit gates and single-qubit gates
@@ -685,15 +653,15 @@ def _calc_decoupling(pauli_x, pauli_z, qubit_list, min_qubit, num_qubits, cliff)
     C_qubits = []
     D_qubits = []
 
-    for qubit in qubit_list:
-        typeq = _from_pair_paulis_to_type(pauli_x, pauli_z, qubit)
-        if typeq in A_class:
+    for qubit, typeq in pair_types.items():
+        pair_class = _PAIR_CLASS[typeq]
+        if pair_class == _CLASS_A:
             A_qubits.append(qubit)
-        elif typeq in B_class:
+        elif pair_class == _CLASS_B:
             B_qubits.append(qubit)
-        elif typeq in C_class:
+        elif pair_class == _CLASS_C:
             C_qubits.append(qubit)
-        elif typeq in D_class:
+        elif pair_class == _CLASS_D:
             D_qubits.append(qubit)
 
     if len(A_qubits) % 2 != 1:
@@ -702,7 +670,6 @@ def _calc_decoupling(pauli_x, pauli_z, qubit_list, min_qubit, num_qubits, cliff)
     if qubit0 not in A_qubits:  # SWAP qubit0 and qubitA
         qubitA = A_qubits[0]
         circ.swap(qubit0, qubitA)
-        _append_swap(decouple_cliff, qubit0, qubitA)
         if qubit0 in B_qubits:
             B_qubits.remove(qubit0)
             B_qubits.append(qubitA)
@@ -725,28 +692,22 @@ def _calc_decoupling(pauli_x, pauli_z, qubit_list, min_qubit, num_qubits, cliff)
     # Reduce pairs in Class C to 'II'
     for qubit in C_qubits:
         circ.cx(qubit0, qubit)
-        _append_cx(decouple_cliff, qubit0, qubit)
 
     # Reduce pairs in Class D to 'II'
     for qubit in D_qubits:
         circ.cx(qubit, qubit0)
-        _append_cx(decouple_cliff, qubit, qubit0)
 
     # Reduce pairs in Class B to 'II'
     if len(B_qubits) > 1:
         for qubit in B_qubits[1:]:
             qubitB = B_qubits[0]
             circ.cx(qubitB, qubit)
-            _append_cx(decouple_cliff, qubitB, qubit)
 
     if len(B_qubits) > 0:
         qubitB = B_qubits[0]
         circ.cx(qubit0, qubitB)
         circ.h(qubitB)
         circ.cx(qubitB, qubit0)
-        _append_cx(decouple_cliff, qubit0, qubitB)
-        _append_h(decouple_cliff, qubitB)
-        _append_cx(decouple_cliff, qubitB, qubit0)
 
     # Reduce pairs in Class A (except of qubit0) to 'II'
     Alen = int((len(A_qubits) - 1) / 2)
@@ -756,8 +717,5 @@ def _calc_decoupling(pauli_x, pauli_z, qubit_list, min_qubit, num_qubits, cliff)
         circ.cx(A_qubits[2 * qubit + 1], A_qubits[2 * qubit])
         circ.cx(A_qubits[2 * qubit], qubit0)
         circ.cx(qubit0, A_qubits[2 * qubit + 1])
-        _append_cx(decouple_cliff, A_qubits[2 * qubit + 1], A_qubits[2 * qubit])
-        _append_cx(decouple_cliff, A_qubits[2 * qubit], qubit0)
-        _append_cx(decouple_cliff, qubit0, A_qubits[2 * qubit + 1])
 
-    return circ, decouple_cliff
+    return circ
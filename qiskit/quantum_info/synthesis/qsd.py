@@ -16,15 +16,14 @@ Method is described in arXiv:quant-ph/0406176.
 """
 import scipy
 import numpy as np
-from qiskit.circuit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import QuantumCircuit, CircuitInstruction
+from qiskit.circuit.library.standard_gates import CXGate, CZGate, RYGate, RZGate
 from qiskit.quantum_info.synthesis import two_qubit_decompose, one_qubit_decompose
 from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
 from qiskit.extensions.quantum_initializer.uc_pauli_rot import UCPauliRotGate, _EPS
 
 
-def qs_decomposition(
-    mat, opt_a1=True, opt_a2=True, decomposer_1q=None, decomposer_2q=None, *, _depth=0
-):
+def qs_decomposition(mat, opt_a1=True, opt_a2=True, decomposer_1q=None, decomposer_2q=None):
     """
     Decomposes unitary matrix into one and two qubit gates using Quantum Shannon Decomposition.
 
@@ -54,6 +53,11 @@ def qs_decomposition(
 
     This decomposition is described in arXiv:quant-ph/0406176.
 
+    The decomposition is computed level by level rather than recursively: all the blocks of the
+    same size are decomposed together, the multiplexers they give rise to are demultiplexed as a
+    batch, and the gates are then appended directly to a single flat output circuit, so no
+    intermediate circuits are built.
+
     Arguments:
        mat (ndarray): unitary matrix to decompose
        opt_a1 (bool): whether to try optimization A.1 from Shende. This should eliminate 1 cnot
@@ -66,11 +70,13 @@ def qs_decomposition(
           :class:`~qiskit.quantum_info.synthesis.one_qubit_decomposer.OneQubitEulerDecomser`
        decomposer_2q (None or Object): optional 2Q decomposer. If None, uses
           :class:`~qiskit.quantum_info.synthesis.two_qubit_decomposer.two_qubit_cnot_decompose
+          (after optimization A.2, if ``opt_a2`` is True). If given, it is used for every two
+          qubit block and optimization A.2 is not applied.
 
     Return:
        QuantumCircuit: Decomposed quantum circuit.
     """
-    #  _depth (int): Internal use parameter to track recursion depth.
+    mat = np.asarray(mat)
     dim = mat.shape[0]
     nqubits = int(np.log2(dim))
     if np.allclose(np.identity(dim), mat):
@@ -78,60 +84,91 @@ def qs_decomposition(
     if dim == 2:
         if decomposer_1q is None:
             decomposer_1q = one_qubit_decompose.OneQubitEulerDecomposer()
-        circ = decomposer_1q(mat)
-    elif dim == 4:
+        return decomposer_1q(mat)
+    if dim == 4:
         if decomposer_2q is None:
-            if opt_a2:
-                from qiskit.extensions.unitary import UnitaryGate  # pylint: disable=cyclic-import
-
-                def decomp_2q(mat):
-                    ugate = UnitaryGate(mat)
-                    qc = QuantumCircuit(2, name="qsd2q")
-                    qc.append(ugate, [0, 1])
-                    return qc
-
-                decomposer_2q = decomp_2q
-            else:
-                decomposer_2q = two_qubit_decompose.two_qubit_cnot_decompose
-        circ = decomposer_2q(mat)
-    else:
-        qr = QuantumRegister(nqubits)
-        circ = QuantumCircuit(qr)
-        dim_o2 = dim // 2
-        # perform cosine-sine decomposition
-        (u1, u2), vtheta, (v1h, v2h) = scipy.linalg.cossin(mat, separate=True, p=dim_o2, q=dim_o2)
-        # left circ
-        left_circ = _demultiplex(v1h, v2h, opt_a1=opt_a1, opt_a2=opt_a2, _depth=_depth)
-        circ.append(left_circ.to_instruction(), qr)
-        # middle circ
-        if opt_a1:
-            nangles = len(vtheta)
-            half_size = nangles // 2
-            # get UCG in terms of CZ
-            circ_cz = _get_ucry_cz(nqubits, (2 * vtheta).tolist())
-            circ.append(circ_cz.to_instruction(), range(nqubits))
-            # merge final cz with right-side generic multiplexer
-            u2[:, half_size:] = np.negative(u2[:, half_size:])
-        else:
-            circ.ucry((2 * vtheta).tolist(), qr[:-1], qr[-1])
-        # right circ
-        right_circ = _demultiplex(u1, u2, opt_a1=opt_a1, opt_a2=opt_a2, _depth=_depth)
-        circ.append(right_circ.to_instruction(), qr)
+            decomposer_2q = two_qubit_decompose.two_qubit_cnot_decompose
+        return decomposer_2q(mat)
+
+    # Decompose all the blocks of a level at once, down to the two-qubit blocks.  Each block of
+    # level ``k`` which is not the identity gives rise to four blocks of level ``k + 1``, which
+    # are stored in this order, so that the blocks of every level (and in particular the two
+    # qubit blocks) are ordered as they appear in the circuit.
+    blocks = mat.astype(complex)[np.newaxis]
+    levels = []
+    while blocks.shape[-1] > 4:
+        level, blocks = _decompose_level(blocks, opt_a1)
+        levels.append(level)
+    leaf_circuits = _decompose_leaves(blocks, opt_a2, decomposer_2q)
 
-    if opt_a2 and _depth == 0:
-        return _apply_a2(circ)
+    circ = QuantumCircuit(nqubits)
+    _build_circuit(circ, levels, leaf_circuits, opt_a1)
     return circ
 
 
-def _demultiplex(um0, um1, opt_a1=False, opt_a2=False, *, _depth=0):
-    """decomposes a generic multiplexer.
+def _decompose_level(blocks, opt_a1):
+    """Performs one step of the decomposition on all the (non-identity) blocks of a level.
+
+    Args:
+        blocks (ndarray): array of shape ``(num_blocks, dim, dim)`` holding the blocks.
+        opt_a1 (bool): whether optimization A.1 is used.
+
+    Returns:
+        tuple: a list with, for each block, either ``None`` if the block is the identity or the
+        tuple ``(first_child, ry_angles, left_rz_angles, right_rz_angles)`` of the index of its
+        first block in the next level and the angles of its multiplexed rotations; and
+        the array of shape ``(4 * num_non_identity_blocks, dim / 2, dim / 2)`` holding the
+        blocks of the next level.
+    """
+    num_blocks, dim = blocks.shape[:2]
+    dim_o2 = dim // 2
+    identity = np.identity(dim)
+    active = [index for index, block in enumerate(blocks) if not np.allclose(identity, block)]
+
+    # Multiplexers to demultiplex: the left one of block ``i`` is pair ``2 * i`` and the right
+    # one is pair ``2 * i + 1``.
+    um0 = np.empty((2 * len(active), dim_o2, dim_o2), dtype=complex)
+    um1 = np.empty_like(um0)
+    ry_angles = []
+    for position, index in enumerate(active):
+        # perform cosine-sine decomposition
+        (u1, u2), vtheta, (v1h, v2h) = scipy.linalg.cossin(
+            blocks[index], separate=True, p=dim_o2, q=dim_o2
+        )
+        if opt_a1:
+            # merge final cz of the multiplexed Ry with right-side generic multiplexer
+            u2[:, len(vtheta) // 2 :] = np.negative(u2[:, len(vtheta) // 2 :])
+        um0[2 * position], um1[2 * position] = v1h, v2h
+        um0[2 * position + 1], um1[2 * position + 1] = u1, u2
+        ry_angles.append(2 * vtheta)
+    del blocks
+
+    wmats, rz_angles, vmats = _demultiplex(um0, um1)
+    del um0, um1
+    next_blocks = np.empty((2 * wmats.shape[0], dim_o2, dim_o2), dtype=complex)
+    next_blocks[0::2] = wmats
+    next_blocks[1::2] = vmats
+
+    level = [None] * num_blocks
+    for position, index in enumerate(active):
+        level[index] = (
+            4 * position,
+            ry_angles[position],
+            rz_angles[2 * position],
+            rz_angles[2 * position + 1],
+        )
+    return level, next_blocks
+
+
+def _demultiplex(um0, um1):
+    """Decomposes a batch of generic multiplexers.
 
           ────□────
            ┌──┴──┐
          /─┤     ├─
            └─────┘
 
-    represented by the block diagonal matrix
+    represented by the block diagonal matrices
 
             ┏         ┓
             ┃ um0     ┃
@@ -148,108 +185,126 @@ def _demultiplex(um0, um1, opt_a1=False, opt_a2=False, *, _depth=0):
     where v and w are general unitaries determined from decomposition.
 
     Args:
-       um0 (ndarray): applied if MSB is 0
-       um1 (ndarray): applied if MSB is 1
-       opt_a1 (bool): whether to try optimization A.1 from Shende. This should elliminate 1 cnot
-          per call. If True CZ gates are left in the output. If desired these can be further decomposed
-       opt_a2 (bool): whether to try  optimization A.2 from Shende. This decomposes two qubit
-          unitaries into a diagonal gate and a two cx unitary and reduces overal cx count by
-          4^(n-2) - 1.
-       _depth (int): This is an internal variable to track the recursion depth.
+       um0 (ndarray): array of shape ``(num_multiplexers, dim, dim)`` of the blocks applied if
+          the MSB is 0
+       um1 (ndarray): array of the same shape of the blocks applied if the MSB is 1
 
     Returns:
-        QuantumCircuit: decomposed circuit
+        tuple: the arrays of the ``w`` unitaries, of the angles of the multiplexed Rz gates and
+        of the ``v`` unitaries.
     """
-    dim = um0.shape[0] + um1.shape[0]  # these should be same dimension
-    nqubits = int(np.log2(dim))
-    um0um1 = um0 @ um1.T.conjugate()
-    if is_hermitian_matrix(um0um1):
-        eigvals, vmat = scipy.linalg.eigh(um0um1)
-    else:
-        evals, vmat = scipy.linalg.schur(um0um1, output="complex")
-        eigvals = evals.diagonal()
+    um0um1 = um0 @ np.conj(np.swapaxes(um1, -1, -2))
+    vmats = np.empty_like(um0um1)
+    eigvals = np.empty(um0um1.shape[:-1], dtype=complex)
+    for index, prod in enumerate(um0um1):
+        if is_hermitian_matrix(prod):
+            eigvals[index], vmats[index] = scipy.linalg.eigh(prod)
+        else:
+            evals, vmats[index] = scipy.linalg.schur(prod, output="complex")
+            eigvals[index] = evals.diagonal()
+    del um0um1
     dvals = np.lib.scimath.sqrt(eigvals)
-    dmat = np.diag(dvals)
-    wmat = dmat @ vmat.T.conjugate() @ um1
-
-    circ = QuantumCircuit(nqubits)
-
-    # left gate
-    left_gate = qs_decomposition(
-        wmat, opt_a1=opt_a1, opt_a2=opt_a2, _depth=_depth + 1
-    ).to_instruction()
-    circ.append(left_gate, range(nqubits - 1))
-
-    # multiplexed Rz
-    angles = 2 * np.angle(np.conj(dvals))
-    circ.ucrz(angles.tolist(), list(range(nqubits - 1)), [nqubits - 1])
-
-    # right gate
-    right_gate = qs_decomposition(
-        vmat, opt_a1=opt_a1, opt_a2=opt_a2, _depth=_depth + 1
-    ).to_instruction()
-    circ.append(right_gate, range(nqubits - 1))
-
-    return circ
-
-
-def _get_ucry_cz(nqubits, angles):
-    """
-    Get uniformly controlled Ry gate in in CZ-Ry as in UCPauliRotGate.
-    """
-    nangles = len(angles)
-    qc = QuantumCircuit(nqubits)
-    q_controls = qc.qubits[:-1]
-    q_target = qc.qubits[-1]
-    if not q_controls:
-        if np.abs(angles[0]) > _EPS:
-            qc.ry(angles[0], q_target)
-    else:
-        angles = angles.copy()
-        UCPauliRotGate._dec_uc_rotations(angles, 0, len(angles), False)
-        for (i, angle) in enumerate(angles):
-            if np.abs(angle) > _EPS:
-                qc.ry(angle, q_target)
-            if not i == len(angles) - 1:
-                binary_rep = np.binary_repr(i + 1)
-                q_contr_index = len(binary_rep) - len(binary_rep.rstrip("0"))
-            else:
-                # Handle special case:
-                q_contr_index = len(q_controls) - 1
-            # leave off last CZ for merging with adjacent UCG
-            if i < nangles - 1:
-                qc.cz(q_controls[q_contr_index], q_target)
-    return qc
-
-
-def _apply_a2(circ):
-    from qiskit import transpile
-    from qiskit.quantum_info import Operator
-
-    # from qiskit.extensions.unitary import UnitaryGate
-    import qiskit.extensions.unitary
+    wmats = dvals[..., np.newaxis] * (np.conj(np.swapaxes(vmats, -1, -2)) @ um1)
+    rz_angles = 2 * np.angle(np.conj(dvals))
+    return wmats, rz_angles, vmats
+
+
+def _decompose_leaves(blocks, opt_a2, decomposer_2q):
+    """Synthesizes the two qubit blocks, in circuit order, returning a list with a circuit for
+    each block (``None`` for those which are the identity).
+
+    If ``opt_a2`` is True, each block but the last is only synthesized up to a diagonal, which is
+    merged into the next block (optimization A.2 from Shende).  This is allowed because the gates
+    between two consecutive blocks only use their qubits as controls."""
+    identity = np.identity(4)
+    active = [index for index, block in enumerate(blocks) if not np.allclose(identity, block)]
+    leaf_circuits = [None] * len(blocks)
+    if decomposer_2q is not None or not opt_a2:
+        if decomposer_2q is None:
+            decomposer_2q = two_qubit_decompose.two_qubit_cnot_decompose
+        for index in active:
+            leaf_circuits[index] = decomposer_2q(blocks[index])
+        return leaf_circuits
 
     decomposer = two_qubit_decompose.TwoQubitDecomposeUpToDiagonal()
-    ccirc = transpile(circ, basis_gates=["u", "cx", "qsd2q"], optimization_level=0)
-    ind2q = []
-    # collect 2q instrs
-    for i, instr_context in enumerate(ccirc.data):
-        instr, _, _ = instr_context
-        if instr.name == "qsd2q":
-            ind2q.append(i)
-    # rolling over diagonals
-    ind2 = None  # lint
-    for ind1, ind2 in zip(ind2q[0:-1:], ind2q[1::]):
-        # get neigboring 2q gates separated by controls
-        instr1, qargs, cargs = ccirc.data[ind1]
-        mat1 = Operator(instr1).data
-        instr2, _, _ = ccirc.data[ind2]
-        mat2 = Operator(instr2).data
+    for index, next_index in zip(active[:-1], active[1:]):
         # rollover
-        dmat, qc2cx = decomposer(mat1)
-        ccirc.data[ind1] = (qc2cx.to_gate(), qargs, cargs)
-        mat2 = mat2 @ dmat
-        ccirc.data[ind2] = (qiskit.extensions.unitary.UnitaryGate(mat2), qargs, cargs)
-    qc3 = two_qubit_decompose.two_qubit_cnot_decompose(mat2)
-    ccirc.data[ind2] = (qc3.to_gate(), qargs, cargs)
-    return ccirc
+        dmat, leaf_circuits[index] = decomposer(blocks[index])
+        blocks[next_index] = blocks[next_index] @ dmat
+    if active:
+        leaf_circuits[active[-1]] = two_qubit_decompose.two_qubit_cnot_decompose(blocks[active[-1]])
+    return leaf_circuits
+
+
+def _build_circuit(circ, levels, leaf_circuits, opt_a1):
+    """Appends the gates of the decomposition to ``circ``, visiting the blocks in circuit order
+    with an explicit stack."""
+    qubits = circ.qubits
+    num_levels = len(levels)
+    # Entries are either ``(level, index)`` for a block, or the arguments to ``_append_ucr``.
+    stack = [(0, 0)]
+    while stack:
+        entry = stack.pop()
+        if len(entry) != 2:
+            _append_ucr(circ, *entry)
+            continue
+        depth, index = entry
+        if depth == num_levels:
+            leaf_circuit = leaf_circuits[index]
+            if leaf_circuit is not None:
+                _append_circuit(circ, leaf_circuit, qubits[:2])
+            continue
+        if levels[depth][index] is None:
+            continue
+        child, ry_angles, left_rz_angles, right_rz_angles = levels[depth][index]
+        nqubits = num_levels - depth + 2
+        stack.extend(
+            [
+                (depth + 1, child + 3),
+                (RZGate, right_rz_angles, nqubits, False),
+                (depth + 1, child + 2),
+                (RYGate, ry_angles, nqubits, opt_a1),
+                (depth + 1, child + 1),
+                (RZGate, left_rz_angles, nqubits, False),
+                (depth + 1, child),
+            ]
+        )
+
+
+def _append_ucr(circ, gate_class, angles, nqubits, cz_variant):
+    """Appends a uniformly controlled rotation, targeting qubit ``nqubits - 1`` and controlled
+    by the qubits below it, decomposed as in :class:`.UCPauliRotGate`.
+
+    If ``cz_variant`` is True the CX gates are replaced by CZ gates and the last one is left off,
+    for it to be merged into the adjacent multiplexer (optimization A.1)."""
+    qubits = circ.qubits
+    q_target = qubits[nqubits - 1]
+    q_controls = qubits[: nqubits - 1]
+    entangler = CZGate if cz_variant else CXGate
+    angles = angles.tolist()
+    UCPauliRotGate._dec_uc_rotations(angles, 0, len(angles), False)
+    for i, angle in enumerate(angles):
+        if np.abs(angle) > _EPS:
+            circ._append(CircuitInstruction(gate_class(angle), (q_target,), ()))
+        if not i == len(angles) - 1:
+            # the control is the number of trailing zeros of i + 1
+            q_contr_index = ((i + 1) & -(i + 1)).bit_length() - 1
+        else:
+            # Handle special case:
+            if cz_variant:
+                # leave off last CZ for merging with adjacent UCG
+                continue
+            q_contr_index = len(q_controls) - 1
+        circ._append(CircuitInstruction(entangler(), (q_controls[q_contr_index], q_target), ()))
+
+
+def _append_circuit(circ, other, qubits):
+    """Appends the instructions of ``other`` to ``circ`` on ``qubits``, without copying them."""
+    bit_map = dict(zip(other.qubits, qubits))
+    for instruction in other.data:
+        circ._append(
+            CircuitInstruction(
+                instruction.operation, tuple(bit_map[qubit] for qubit in instruction.qubits), ()
+            )
+        )
+    circ.global_phase += other.global_phase
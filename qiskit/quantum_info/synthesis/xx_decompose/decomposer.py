@@ -16,6 +16,7 @@ Driver for a synthesis routine which emits optimal XX-based circuits.
 
 import heapq
 import math
+from functools import lru_cache
 from operator import itemgetter
 from typing import Callable, Optional
 
@@ -87,6 +88,7 @@ class XXDecomposer:
         self.gate = RZXGate(np.pi / 2)
         self.embodiments = embodiments if embodiments is not None else {}
         self.backup_optimizer = backup_optimizer
+        self._default_embodiments = {}
 
         self._check_embodiments()
 
@@ -132,33 +134,44 @@ class XXDecomposer:
               mapping the available strengths to their (infidelity) costs, with the strengths
               themselves normalized so that pi/2 represents CX = RZX(pi/2).
         """
-        best_point, best_cost, best_sequence = [0, 0, 0], 1.0, []
-        priority_queue = []
-        heapq.heappush(priority_queue, (0, []))
-        canonical_coordinate = np.array(canonical_coordinate)
+        return XXDecomposer._best_decompositions([canonical_coordinate], available_strengths)[0]
 
-        while True:
-            sequence_cost, sequence = heapq.heappop(priority_queue)
-
-            strength_polytope = XXPolytope.from_strengths(*[x / 2 for x in sequence])
-            candidate_point = strength_polytope.nearest(canonical_coordinate)
-            candidate_cost = sequence_cost + _average_infidelity(
-                canonical_coordinate, candidate_point
-            )
-
-            if candidate_cost < best_cost:
-                best_point, best_cost, best_sequence = candidate_point, candidate_cost, sequence
-
-            if strength_polytope.member(canonical_coordinate):
+    @staticmethod
+    def _best_decompositions(canonical_coordinates, available_strengths):
+        """
+        Runs `_best_decomposition` for each of `canonical_coordinates` at once, sharing the
+        sequences of strengths (and their polytopes) visited by the search between all of them.
+        """
+        targets = np.array(canonical_coordinates, dtype=float).reshape(-1, 3)
+        results = [{"point": [0, 0, 0], "cost": 1.0, "sequence": []} for _ in targets]
+        pending = list(range(len(targets)))
+
+        for sequence_cost, sequence, strength_polytope in _strength_sequences(
+            tuple(available_strengths.items())
+        ):
+            if not pending:
                 break
+            members = strength_polytope.member(targets[pending])
+            still_pending = []
+            for index, is_member in zip(pending, members):
+                canonical_coordinate = targets[index]
+                candidate_point = strength_polytope.nearest(canonical_coordinate)
+                candidate_cost = sequence_cost + _average_infidelity(
+                    canonical_coordinate, candidate_point
+                )
+
+                if candidate_cost < results[index]["cost"]:
+                    results[index] = {
+                        "point": candidate_point,
+                        "cost": candidate_cost,
+                        "sequence": list(sequence),
+                    }
 
-            for strength, extra_cost in available_strengths.items():
-                if len(sequence) == 0 or strength <= sequence[-1]:
-                    heapq.heappush(
-                        priority_queue, (sequence_cost + extra_cost, sequence + [strength])
-                    )
+                if not is_member:
+                    still_pending.append(index)
+            pending = still_pending
 
-        return {"point": best_point, "cost": best_cost, "sequence": best_sequence}
+        return results
 
     def num_basis_gates(self, unitary):
         """
@@ -169,14 +182,21 @@ class XXDecomposer:
         strengths = self._strength_to_infidelity(1.0)
 
         # get the associated _positive_ canonical coordinate
-        weyl_decomposition = TwoQubitWeylDecomposition(unitary)
-        target = [getattr(weyl_decomposition, x) for x in ("a", "b", "c")]
-        if target[-1] < -EPSILON:
-            target = [np.pi / 2 - target[0], target[1], -target[2]]
+        target = self._positive_canonical_coordinate(TwoQubitWeylDecomposition(unitary))
 
         best_sequence = self._best_decomposition(target, strengths)["sequence"]
         return len(best_sequence)
 
+    @staticmethod
+    def _positive_canonical_coordinate(weyl_decomposition):
+        """
+        Returns the positive canonical coordinate associated to a Weyl decomposition.
+        """
+        target = [getattr(weyl_decomposition, x) for x in ("a", "b", "c")]
+        if target[-1] < -EPSILON:
+            target = [np.pi / 2 - target[0], target[1], -target[2]]
+        return target
+
     @staticmethod
     def _strength_to_infidelity(basis_fidelity, approximate=False):
         """
@@ -220,31 +240,73 @@ class XXDecomposer:
         Returns:
             QuantumCircuit: Synthesized circuit.
         """
+        return self.decompose_many(
+            [unitary], basis_fidelity=basis_fidelity, approximate=approximate
+        )[0]
+
+    def decompose_many(self, unitaries, basis_fidelity=1.0, approximate=True):
+        """
+        Synthesizes each of a collection of two-qubit unitaries, as by calling the decomposer on
+        each of them in turn.  The search for the best sequence of basis gates is run for all the
+        unitaries together, so this is faster than separate calls for large collections.
+
+        Args:
+            unitaries (Iterable[Operator or ndarray]): 4x4 unitaries to synthesize.
+            basis_fidelity (dict or float): Fidelity of basis gates, as in :meth:`__call__`.
+            approximate (bool): Approximates if basis fidelities are less than 1.0 .
+        Returns:
+            list[QuantumCircuit]: Synthesized circuits, in the order of ``unitaries``.
+        """
         strength_to_infidelity = self._strength_to_infidelity(
             basis_fidelity, approximate=approximate
         )
-        from qiskit.extensions import UnitaryGate  # pylint: disable=cyclic-import
 
-        # get the associated _positive_ canonical coordinate
-        weyl_decomposition = TwoQubitWeylDecomposition(unitary)
-        target = [getattr(weyl_decomposition, x) for x in ("a", "b", "c")]
-        if target[-1] < -EPSILON:
-            target = [np.pi / 2 - target[0], target[1], -target[2]]
+        unitaries = list(unitaries)
+        weyl_decompositions = [TwoQubitWeylDecomposition(unitary) for unitary in unitaries]
+        targets = [self._positive_canonical_coordinate(weyl) for weyl in weyl_decompositions]
 
-        # scan for the best point
-        best_point, best_sequence = itemgetter("point", "sequence")(
-            self._best_decomposition(target, strength_to_infidelity)
-        )
-        # build the circuit building this canonical gate
-        embodiments = {
-            k: self.embodiments.get(k, self._default_embodiment(k))
-            for k, v in strength_to_infidelity.items()
-        }
-        circuit = canonical_xx_circuit(best_point, best_sequence, embodiments)
+        # scan for the best points
+        best_decompositions = self._best_decompositions(targets, strength_to_infidelity)
+
+        embodiments = {k: self._embodiment(k) for k in strength_to_infidelity}
+
+        return [
+            self._circuit_from_decomposition(
+                unitary, weyl_decomposition, best, embodiments, basis_fidelity
+            )
+            for unitary, weyl_decomposition, best in zip(
+                unitaries, weyl_decompositions, best_decompositions
+            )
+        ]
+
+    def _embodiment(self, strength):
+        """
+        Returns the circuit embodying XX(strength), building (and remembering) the default one if
+        the user did not provide it.
+        """
+        if strength in self.embodiments:
+            return self.embodiments[strength]
+        if strength not in self._default_embodiments:
+            self._default_embodiments[strength] = self._default_embodiment(strength)
+        return self._default_embodiments[strength]
+
+    def _circuit_from_decomposition(
+        self, unitary, weyl_decomposition, best_decomposition, embodiments, basis_fidelity
+    ):
+        """
+        Builds the circuit synthesizing `unitary` from its Weyl decomposition and the best sequence
+        of basis gates found for it.
+        """
+        from qiskit.extensions import UnitaryGate  # pylint: disable=cyclic-import
+
+        best_point, best_sequence = itemgetter("point", "sequence")(best_decomposition)
 
         if best_sequence == [np.pi / 2, np.pi / 2, np.pi / 2] and self.backup_optimizer is not None:
             return self.backup_optimizer(unitary, basis_fidelity=basis_fidelity)
 
+        # build the circuit building this canonical gate
+        circuit = canonical_xx_circuit(best_point, best_sequence, embodiments)
+
         # change to positive canonical coordinates
         if weyl_decomposition.c >= -EPSILON:
             # if they're the same...
@@ -280,3 +342,46 @@ class XXDecomposer:
         circ = self._decomposer1q(circ)
 
         return circ
+
+
+class _StrengthSequences:
+    """
+    The sequences of strengths visited, cheapest first, by the search in
+    `XXDecomposer._best_decompositions`, together with their costs and polytopes.
+
+    The order in which the search visits the sequences does not depend on the target, only on the
+    available strengths, so it is computed once per set of strengths and extended lazily as far as
+    the hardest target requires.
+    """
+
+    def __init__(self, available_strengths):
+        self._available_strengths = available_strengths
+        self._priority_queue = [(0, [])]
+        self._entries = []
+
+    def __iter__(self):
+        index = 0
+        while True:
+            if index == len(self._entries):
+                self._visit_next()
+            yield self._entries[index]
+            index += 1
+
+    def _visit_next(self):
+        sequence_cost, sequence = heapq.heappop(self._priority_queue)
+        strength_polytope = XXPolytope.from_strengths(*[x / 2 for x in sequence])
+        self._entries.append((sequence_cost, tuple(sequence), strength_polytope))
+
+        for strength, extra_cost in self._available_strengths:
+            if len(sequence) == 0 or strength <= sequence[-1]:
+                heapq.heappush(
+                    self._priority_queue, (sequence_cost + extra_cost, sequence + [strength])
+                )
+
+
+@lru_cache(maxsize=128)
+def _strength_sequences(available_strengths):
+    """
+    Returns the (shared) `_StrengthSequences` for the given tuple of (strength, cost) pairs.
+    """
+    return _StrengthSequences(available_strengths)
@@ -33,6 +33,8 @@ a-coordinates is then extracted from the monodromy polytope.
 NOTE: The constants in this file are auto-generated and are not meant to be edited by hand / read.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 from .polytopes import ConvexPolytopeData, PolytopeData, manual_get_vertex, polytope_has_element
@@ -74,9 +76,7 @@ def decomposition_hop(target_coordinate, strengths):
         else:
             raise ValueError("Couldn't find a coordinate to fix.")
 
-        raw_convex_polytope = next(
-            (cpp for cpp in xx_lift_polytope.convex_subpolytopes if cpp.name == cp.name), None
-        )
+        raw_convex_polytope = _xx_lift_subpolytopes_by_name().get(cp.name)
 
         coefficient_dict = {}
         for inequality in raw_convex_polytope.inequalities:
@@ -114,6 +114,17 @@ def decomposition_hop(target_coordinate, strengths):
     return [x * (np.pi / 2) for x in sorted([ah, al, af], reverse=True)]
 
 
+@lru_cache(maxsize=None)
+def _xx_lift_subpolytopes_by_name():
+    """
+    Indexes the convex subpolytopes of `xx_lift_polytope` by name, keeping the first of each name.
+    """
+    by_name = {}
+    for cpp in xx_lift_polytope.convex_subpolytopes:
+        by_name.setdefault(cpp.name, cpp)
+    return by_name
+
+
 xx_region_polytope = PolytopeData(
     convex_subpolytopes=[
         ConvexPolytopeData(
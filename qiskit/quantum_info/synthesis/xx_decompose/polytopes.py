@@ -17,6 +17,7 @@ which describes those two-qubit programs accessible to a given sequence of XX-ty
 
 from copy import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from itertools import combinations
 from typing import List
 
@@ -155,17 +156,7 @@ class XXPolytope:
         """
         Returns b with A*x + b ≥ 0 iff x belongs to the XXPolytope.
         """
-        return np.array(
-            [
-                0,
-                0,
-                0,
-                np.pi / 2,
-                self.total_strength,
-                self.total_strength - 2 * self.max_strength,
-                self.total_strength - self.max_strength - self.place_strength,
-            ]
-        )
+        return _polytope_offsets(self.total_strength, self.max_strength, self.place_strength)
 
     def member(self, point):
         """
@@ -215,23 +206,21 @@ class XXPolytope:
                 y0[0] = np.pi / 2 - y0[0]
             return y0
 
+        b1, b2, nearest3 = _polytope_tables(
+            self.total_strength, self.max_strength, self.place_strength
+        )
+
         # codimension 1
-        b1 = self._offsets.reshape(7, 1)
         A1y0 = np.einsum("ijk,k->ij", A1, y0)
-        nearest1 = np.einsum("ijk,ik->ij", A1inv, b1 + A1y0) - y0
+        nearest1 = -(np.einsum("ijk,ik->ij", A1inv, b1 + A1y0) - y0)
 
         # codimension 2
-        b2 = np.array([*combinations(self._offsets, 2)])
         A2y0 = np.einsum("ijk,k->ij", A2, y0)
-        nearest2 = np.einsum("ijk,ik->ij", A2inv, b2 + A2y0) - y0
-
-        # codimension 3
-        b3 = np.array([*combinations(self._offsets, 3)])
-        nearest3 = np.einsum("ijk,ik->ij", A3inv, b3)
+        nearest2 = -(np.einsum("ijk,ik->ij", A2inv, b2 + A2y0) - y0)
 
-        # pick the nearest
-        nearest = -np.concatenate([nearest1, nearest2, nearest3])
-        nearest = nearest[self.member(nearest)]
+        # pick the nearest; the codimension 3 candidates do not depend on the point
+        nearest = np.concatenate([nearest1, nearest2])
+        nearest = np.concatenate([nearest[self.member(nearest)], nearest3])
         smallest_index = np.argmin(np.linalg.norm(nearest - y0, axis=1))
 
         if reflected_p:
@@ -262,3 +251,43 @@ planes spanned by the planes/points/lines defined by the faces of any XX polytop
 
 See `XXPolytope.nearest`.
 """
+
+
+@lru_cache(maxsize=1024)
+def _polytope_offsets(total_strength, max_strength, place_strength):
+    """
+    Returns the offsets b of the XXPolytope with the given strengths (see `XXPolytope._offsets`).
+    """
+    offsets = np.array(
+        [
+            0,
+            0,
+            0,
+            np.pi / 2,
+            total_strength,
+            total_strength - 2 * max_strength,
+            total_strength - max_strength - place_strength,
+        ]
+    )
+    offsets.setflags(write=False)
+    return offsets
+
+
+@lru_cache(maxsize=1024)
+def _polytope_tables(total_strength, max_strength, place_strength):
+    """
+    Returns the data `XXPolytope.nearest` needs about the polytope with the given strengths,
+    independently of the point: the offsets b, arranged for the faces of codimension 1 and 2, and
+    those vertices of codimension 3 which belong to the polytope.  These only depend on the
+    sequence of strengths, so they are shared by all the targets decomposed with it.
+    """
+    offsets = _polytope_offsets(total_strength, max_strength, place_strength)
+    b1 = offsets.reshape(7, 1)
+    b2 = np.array([*combinations(offsets, 2)])
+    b3 = np.array([*combinations(offsets, 3)])
+    nearest3 = -np.einsum("ijk,ik->ij", A3inv, b3)
+    polytope = XXPolytope(total_strength, max_strength, place_strength)
+    nearest3 = nearest3[polytope.member(nearest3)]
+    for array in (b2, nearest3):
+        array.setflags(write=False)
+    return b1, b2, nearest3
@@ -29,6 +29,16 @@ Evolution Synthesis
    SuzukiTrotter
    MatrixExponential
 
+Linear Function Synthesis
+=========================
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   PackedBinaryMatrix
+   calc_inverse_matrix
+   check_invertible_binary_matrix
+
 """
 
 from .evolution import (
@@ -39,3 +49,4 @@ from .evolution import (
     MatrixExponential,
     QDrift,
 )
+from .linear import PackedBinaryMatrix, calc_inverse_matrix, check_invertible_binary_matrix
@@ -13,7 +13,6 @@
 """The Lie-Trotter product formula."""
 
 from typing import Callable, Optional, Union, Dict, Any
-import numpy as np
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.quantum_info.operators import SparsePauliOp, Pauli
 
@@ -55,6 +54,7 @@ class LieTrotter(ProductFormula):
         atomic_evolution: Optional[
             Callable[[Union[Pauli, SparsePauliOp], float], QuantumCircuit]
         ] = None,
+        wrap: bool = True,
     ) -> None:
         """
         Args:
@@ -66,8 +66,11 @@ class LieTrotter(ProductFormula):
             atomic_evolution: A function to construct the circuit for the evolution of single
                 Pauli string. Per default, a single Pauli evolution is decomopsed in a CX chain
                 and a single qubit Z rotation.
+            wrap: Whether to wrap the atomic evolutions into custom gate objects. If ``False``,
+                the gates of all the atomic evolutions are added directly to a single flat
+                circuit, which is much faster for operators with many terms.
         """
-        super().__init__(1, reps, insert_barriers, cx_structure, atomic_evolution)
+        super().__init__(1, reps, insert_barriers, cx_structure, atomic_evolution, wrap)
 
     def synthesize(self, evolution):
         # get operators and time to evolve
@@ -78,13 +81,10 @@ class LieTrotter(ProductFormula):
         evolution_circuit = QuantumCircuit(operators[0].num_qubits)
         first_barrier = False
 
-        if not isinstance(operators, list):
-            pauli_list = [(Pauli(op), np.real(coeff)) for op, coeff in operators.to_list()]
-        else:
-            pauli_list = [(op, 1) for op in operators]
+        pauli_list = self._atomic_operators(operators)
 
         # if we only evolve a single Pauli we don't need to additionally wrap it
-        wrap = not (len(pauli_list) == 1 and self.reps == 1)
+        wrap = self.wrap and not (len(pauli_list) == 1 and self.reps == 1)
 
         for _ in range(self.reps):
             for op, coeff in pauli_list:
@@ -95,9 +95,7 @@ class LieTrotter(ProductFormula):
                 else:
                     first_barrier = True
 
-                evolution_circuit.compose(
-                    self.atomic_evolution(op, coeff * time / self.reps), wrap=wrap, inplace=True
-                )
+                self._append_atomic_evolution(evolution_circuit, op, coeff * time / self.reps, wrap)
 
         return evolution_circuit
 
@@ -120,4 +118,5 @@ class LieTrotter(ProductFormula):
             "reps": self.reps,
             "insert_barriers": self.insert_barriers,
             "cx_structure": self._cx_structure,
+            "wrap": self.wrap,
         }
@@ -12,11 +12,26 @@
 
 """A product formula base for decomposing non-commuting operator exponentials."""
 
-from typing import Callable, Optional, Union, Any, Dict
+from typing import Callable, Optional, Union, Any, Dict, List, Tuple
 from functools import partial
 import numpy as np
+from qiskit.circuit.gate import Gate
 from qiskit.circuit.parameterexpression import ParameterExpression
-from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.quantumcircuit import QuantumCircuit, CircuitInstruction
+from qiskit.circuit.quantumregister import QuantumRegister
+from qiskit.circuit.library.standard_gates import (
+    CXGate,
+    HGate,
+    RXGate,
+    RXXGate,
+    RYGate,
+    RYYGate,
+    RZGate,
+    RZXGate,
+    RZZGate,
+    SdgGate,
+    SGate,
+)
 from qiskit.quantum_info import SparsePauliOp, Pauli
 
 from .evolution_synthesis import EvolutionSynthesis
@@ -37,6 +52,7 @@ class ProductFormula(EvolutionSynthesis):
         atomic_evolution: Optional[
             Callable[[Union[Pauli, SparsePauliOp], float], QuantumCircuit]
         ] = None,
+        wrap: bool = True,
     ) -> None:
         """
         Args:
@@ -49,11 +65,15 @@ class ProductFormula(EvolutionSynthesis):
             atomic_evolution: A function to construct the circuit for the evolution of single
                 Pauli string. Per default, a single Pauli evolution is decomopsed in a CX chain
                 and a single qubit Z rotation.
+            wrap: Whether to wrap the atomic evolutions into custom gate objects. If ``False``,
+                the gates of all the atomic evolutions are added directly to a single flat
+                circuit, which is much faster for operators with many terms.
         """
         super().__init__()
         self.order = order
         self.reps = reps
         self.insert_barriers = insert_barriers
+        self.wrap = wrap
 
         # user-provided atomic evolution, stored for serialization
         self._atomic_evolution = atomic_evolution
@@ -85,8 +105,160 @@ class ProductFormula(EvolutionSynthesis):
             "reps": self.reps,
             "insert_barriers": self.insert_barriers,
             "cx_structure": self._cx_structure,
+            "wrap": self.wrap,
         }
 
+    def _atomic_operators(self, operators) -> List[Tuple[Any, Any]]:
+        """Return the operators which are evolved atomically, together with their coefficients.
+
+        With a custom atomic evolution these are the :class:`.Pauli` terms of a
+        :class:`.SparsePauliOp`, or the :class:`.SparsePauliOp` of a list. Otherwise, the circuits
+        of the atomic evolutions are emitted directly by :meth:`_append_atomic_evolution`, and
+        the qubits and Paulis of all the terms are extracted at once from the bit arrays of the
+        operators.
+        """
+        if self._atomic_evolution is not None:
+            if not isinstance(operators, list):
+                return [(Pauli(op), np.real(coeff)) for op, coeff in operators.to_list()]
+            return [(op, 1) for op in operators]
+
+        if not isinstance(operators, list):
+            num_qubits = operators.num_qubits
+            return [
+                (_AtomicEvolution(num_qubits, [term]), coeff)
+                for term, coeff in zip(_pauli_terms(operators), np.real(operators.coeffs).tolist())
+            ]
+        return [(_AtomicEvolution.from_operator(op), 1) for op in operators]
+
+    def _append_atomic_evolution(self, circuit, operator, time, wrap) -> None:
+        """Append the evolution of an operator returned by :meth:`_atomic_operators` for the
+        given time to ``circuit``, either wrapped into a gate or directly."""
+        if not isinstance(operator, _AtomicEvolution):
+            circuit.compose(self.atomic_evolution(operator, time), wrap=wrap, inplace=True)
+        elif wrap:
+            definition = QuantumCircuit(
+                QuantumRegister(circuit.num_qubits, "q"), name=operator.name
+            )
+            operator.append_to(definition, time, self._cx_structure)
+            gate = Gate(operator.name, circuit.num_qubits, list(definition.parameters))
+            gate.definition = definition
+            circuit._append(CircuitInstruction(gate, tuple(circuit.qubits), ()))
+        else:
+            operator.append_to(circuit, time, self._cx_structure)
+
+
+class _AtomicEvolution:
+    """The evolution of a sum of commuting Pauli terms, stored as the qubits each term acts on and
+    its Pauli on each of these qubits, so that its circuit can be appended directly to another
+    circuit, without constructing the intermediate circuits of :func:`evolve_pauli`."""
+
+    __slots__ = ("num_qubits", "terms", "coeffs", "_name")
+
+    def __init__(self, num_qubits, terms, coeffs=None):
+        self.num_qubits = num_qubits
+        # list of (qubits, paulis) pairs, the qubits in increasing order and the paulis as
+        # the characters "X", "Y" and "Z"
+        self.terms = terms
+        # the coefficients of the terms, or None for a single Pauli with coefficient 1
+        self.coeffs = coeffs
+        self._name = None
+
+    @classmethod
+    def from_operator(cls, operator: SparsePauliOp) -> "_AtomicEvolution":
+        """Return the atomic evolution of all the terms of ``operator``."""
+        return cls(operator.num_qubits, _pauli_terms(operator), np.real(operator.coeffs).tolist())
+
+    @property
+    def name(self):
+        """The name of the evolution circuit, as set by :func:`evolve_pauli` and
+        :func:`_default_atomic_evolution`."""
+        if self._name is None:
+            labels = [_pauli_label(self.num_qubits, *term) for term in self.terms]
+            self._name = f"exp(it {labels[0] if self.coeffs is None else labels})"
+        return self._name
+
+    def append_to(self, circuit, time, cx_structure):
+        """Append the evolution for ``time`` to ``circuit``."""
+        if self.coeffs is None:
+            _append_pauli_evolution(circuit, *self.terms[0], time, cx_structure)
+        else:
+            for (qubits, paulis), coeff in zip(self.terms, self.coeffs):
+                _append_pauli_evolution(circuit, qubits, paulis, coeff * time, cx_structure)
+
+
+def _pauli_terms(operator: SparsePauliOp) -> List[Tuple[List[int], List[str]]]:
+    """Return the qubits every term of ``operator`` acts on and its Pauli on each of them,
+    computed for all the terms at once from the bit arrays of the operator."""
+    paulis = operator.paulis
+    support = paulis.z | paulis.x
+    kinds = np.array(["I", "X", "Z", "Y"])[paulis.x + 2 * paulis.z.astype(np.int8)]
+    rows, columns = np.nonzero(support)
+    qubits = columns.tolist()
+    kinds = kinds[rows, columns].tolist()
+    offsets = [0] + np.cumsum(np.count_nonzero(support, axis=1)).tolist()
+    return [(qubits[start:end], kinds[start:end]) for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def _pauli_label(num_qubits, qubits, paulis):
+    label = ["I"] * num_qubits
+    for qubit, pauli in zip(qubits, paulis):
+        label[num_qubits - 1 - qubit] = pauli
+    return "".join(label)
+
+
+def _append_pauli_evolution(circuit, qubits, paulis, time, cx_structure):
+    """Append the same gates as :func:`evolve_pauli` to ``circuit``, for the Pauli acting with
+    ``paulis[i]`` on the qubit with index ``qubits[i]``, the indices being in increasing order."""
+    num_non_identity = len(qubits)
+    if num_non_identity == 0:
+        circuit.global_phase -= time
+        return
+
+    bits = circuit.qubits
+    append = circuit._append
+    if num_non_identity == 1:
+        gate = {"X": RXGate, "Y": RYGate, "Z": RZGate}[paulis[0]](2 * time)
+        append(CircuitInstruction(gate, (bits[qubits[0]],), ()))
+        return
+
+    if num_non_identity == 2:
+        native = {
+            ("X", "X"): (RXXGate, 0, 1),
+            ("Y", "Y"): (RYYGate, 0, 1),
+            ("Z", "Z"): (RZZGate, 0, 1),
+            ("Z", "X"): (RZXGate, 0, 1),
+            ("X", "Z"): (RZXGate, 1, 0),
+        }.get(tuple(paulis))
+        if native is not None:
+            gate_class, first, second = native
+            append(
+                CircuitInstruction(
+                    gate_class(2 * time), (bits[qubits[first]], bits[qubits[second]]), ()
+                )
+            )
+            return
+
+    # basis transformation, CX chain, Z rotation on the lowest qubit and the inverses
+    if cx_structure == "chain":
+        cx_pairs = [(qubits[i], qubits[i - 1]) for i in range(num_non_identity - 1, 0, -1)]
+    else:
+        cx_pairs = [(qubit, qubits[0]) for qubit in qubits[1:]]
+    for qubit, pauli in zip(qubits, paulis):
+        if pauli == "Y":
+            append(CircuitInstruction(SdgGate(), (bits[qubit],), ()))
+        if pauli != "Z":
+            append(CircuitInstruction(HGate(), (bits[qubit],), ()))
+    for control, target in cx_pairs:
+        append(CircuitInstruction(CXGate(), (bits[control], bits[target]), ()))
+    append(CircuitInstruction(RZGate(2 * time), (bits[qubits[0]],), ()))
+    for control, target in reversed(cx_pairs):
+        append(CircuitInstruction(CXGate(), (bits[control], bits[target]), ()))
+    for qubit, pauli in zip(reversed(qubits), reversed(paulis)):
+        if pauli != "Z":
+            append(CircuitInstruction(HGate(), (bits[qubit],), ()))
+        if pauli == "Y":
+            append(CircuitInstruction(SGate(), (bits[qubit],), ()))
+
 
 def evolve_pauli(
     pauli: Pauli,
@@ -115,95 +287,10 @@ def evolve_pauli(
     Returns:
         A quantum circuit implementing the time evolution of the Pauli.
     """
-    num_non_identity = len([label for label in pauli.to_label() if label != "I"])
-
-    # first check, if the Pauli is only the identity, in which case the evolution only
-    # adds a global phase
-    if num_non_identity == 0:
-        definition = QuantumCircuit(pauli.num_qubits, global_phase=-time)
-    # if we evolve on a single qubit, if yes use the corresponding qubit rotation
-    elif num_non_identity == 1:
-        definition = _single_qubit_evolution(pauli, time)
-    # same for two qubits, use Qiskit's native rotations
-    elif num_non_identity == 2:
-        definition = _two_qubit_evolution(pauli, time, cx_structure)
-    # otherwise do basis transformation and CX chains
-    else:
-        definition = _multi_qubit_evolution(pauli, time, cx_structure)
-
-    definition.name = f"exp(it {pauli.to_label()})"
-
-    return definition
-
-
-def _single_qubit_evolution(pauli, time):
+    qubits, paulis = _pauli_terms(SparsePauliOp(pauli))[0]
     definition = QuantumCircuit(pauli.num_qubits)
-    # Note that all phases are removed from the pauli label and are only in the coefficients.
-    # That's because the operators we evolved have all been translated to a SparsePauliOp.
-    for i, pauli_i in enumerate(reversed(pauli.to_label())):
-        if pauli_i == "X":
-            definition.rx(2 * time, i)
-        elif pauli_i == "Y":
-            definition.ry(2 * time, i)
-        elif pauli_i == "Z":
-            definition.rz(2 * time, i)
-
-    return definition
-
-
-def _two_qubit_evolution(pauli, time, cx_structure):
-    # Get the Paulis and the qubits they act on.
-    # Note that all phases are removed from the pauli label and are only in the coefficients.
-    # That's because the operators we evolved have all been translated to a SparsePauliOp.
-    labels_as_array = np.array(list(reversed(pauli.to_label())))
-    qubits = np.where(labels_as_array != "I")[0]
-    labels = np.array([labels_as_array[idx] for idx in qubits])
-
-    definition = QuantumCircuit(pauli.num_qubits)
-
-    # go through all cases we have implemented in Qiskit
-    if all(labels == "X"):  # RXX
-        definition.rxx(2 * time, qubits[0], qubits[1])
-    elif all(labels == "Y"):  # RYY
-        definition.ryy(2 * time, qubits[0], qubits[1])
-    elif all(labels == "Z"):  # RZZ
-        definition.rzz(2 * time, qubits[0], qubits[1])
-    elif labels[0] == "Z" and labels[1] == "X":  # RZX
-        definition.rzx(2 * time, qubits[0], qubits[1])
-    elif labels[0] == "X" and labels[1] == "Z":  # RXZ
-        definition.rzx(2 * time, qubits[1], qubits[0])
-    else:  # all the others are not native in Qiskit, so use default the decomposition
-        definition = _multi_qubit_evolution(pauli, time, cx_structure)
-
-    return definition
-
-
-def _multi_qubit_evolution(pauli, time, cx_structure):
-    # get diagonalizing clifford
-    cliff = diagonalizing_clifford(pauli)
-
-    # get CX chain to reduce the evolution to the top qubit
-    if cx_structure == "chain":
-        chain = cnot_chain(pauli)
-    else:
-        chain = cnot_fountain(pauli)
-
-    # determine qubit to do the rotation on
-    target = None
-    # Note that all phases are removed from the pauli label and are only in the coefficients.
-    # That's because the operators we evolved have all been translated to a SparsePauliOp.
-    for i, pauli_i in enumerate(reversed(pauli.to_label())):
-        if pauli_i != "I":
-            target = i
-            break
-
-    # build the evolution as: diagonalization, reduction, 1q evolution, followed by inverses
-    definition = QuantumCircuit(pauli.num_qubits)
-    definition.compose(cliff, inplace=True)
-    definition.compose(chain, inplace=True)
-    definition.rz(2 * time, target)
-    definition.compose(chain.inverse(), inplace=True)
-    definition.compose(cliff.inverse(), inplace=True)
+    _append_pauli_evolution(definition, qubits, paulis, time, cx_structure)
+    definition.name = f"exp(it {pauli.to_label()})"
 
     return definition
 
@@ -319,10 +406,8 @@ def _default_atomic_evolution(operator, time, cx_structure):
         evolution_circuit = evolve_pauli(operator, time, cx_structure)
     else:
         # sum of Pauli operators: exponentiate each term (this assumes they commute)
-        pauli_list = [(Pauli(op), np.real(coeff)) for op, coeff in operator.to_list()]
-        name = f"exp(it {[pauli.to_label() for pauli, _ in pauli_list]})"
-        evolution_circuit = QuantumCircuit(operator.num_qubits, name=name)
-        for pauli, coeff in pauli_list:
-            evolution_circuit.compose(evolve_pauli(pauli, coeff * time, cx_structure), inplace=True)
+        evolution = _AtomicEvolution.from_operator(operator)
+        evolution_circuit = QuantumCircuit(operator.num_qubits, name=evolution.name)
+        evolution.append_to(evolution_circuit, time, cx_structure)
 
     return evolution_circuit
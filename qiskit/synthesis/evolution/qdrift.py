@@ -19,7 +19,6 @@ from qiskit.quantum_info.operators import SparsePauliOp, Pauli
 from qiskit.utils import algorithm_globals
 
 from .product_formula import ProductFormula
-from .lie_trotter import LieTrotter
 
 
 class QDrift(ProductFormula):
@@ -40,6 +39,7 @@ class QDrift(ProductFormula):
         atomic_evolution: Optional[
             Callable[[Union[Pauli, SparsePauliOp], float], QuantumCircuit]
         ] = None,
+        wrap: bool = True,
     ) -> None:
         r"""
         Args:
@@ -51,8 +51,11 @@ class QDrift(ProductFormula):
             atomic_evolution: A function to construct the circuit for the evolution of single
                 Pauli string. Per default, a single Pauli evolution is decomopsed in a CX chain
                 and a single qubit Z rotation.
+            wrap: Whether to wrap the atomic evolutions into custom gate objects. If ``False``,
+                the gates of all the atomic evolutions are added directly to a single flat
+                circuit, which is much faster for operators with many terms.
         """
-        super().__init__(1, reps, insert_barriers, cx_structure, atomic_evolution)
+        super().__init__(1, reps, insert_barriers, cx_structure, atomic_evolution, wrap)
         self.sampled_ops = None
 
     def synthesize(self, evolution):
@@ -60,12 +63,11 @@ class QDrift(ProductFormula):
         operators = evolution.operator
         time = evolution.time
 
+        pauli_list = self._atomic_operators(operators)
         if not isinstance(operators, list):
-            pauli_list = [(Pauli(op), coeff) for op, coeff in operators.to_list()]
-            coeffs = [np.real(coeff) for op, coeff in operators.to_list()]
+            coeffs = np.real(operators.coeffs)
         else:
-            pauli_list = [(op, 1) for op in operators]
-            coeffs = [1 for op in operators]
+            coeffs = np.ones(len(operators))
 
         # We artificially make the weights positive
         weights = np.abs(coeffs)
@@ -75,26 +77,24 @@ class QDrift(ProductFormula):
         # The protocol calls for the removal of the individual coefficients,
         # and multiplication by a constant evolution time.
         evolution_time = lambd * time / num_gates
-        self.sampled_ops = algorithm_globals.random.choice(
-            np.array(pauli_list, dtype=object),
-            size=(num_gates,),
-            p=weights / lambd,
+        # sample the indices of all the terms at once
+        sampled_indices = algorithm_globals.random.choice(
+            len(pauli_list), size=(num_gates,), p=weights / lambd
         )
-        # Update the coefficients of sampled_ops
-        self.sampled_ops = [(op, evolution_time) for op, coeff in self.sampled_ops]
-
-        # pylint: disable=cyclic-import
-        from qiskit.circuit.library.pauli_evolution import PauliEvolutionGate
-        from qiskit.opflow import PauliOp
+        if isinstance(operators, list):
+            sampled_ops = [operators[index] for index in sampled_indices]
+        else:
+            sampled_ops = list(operators.paulis[sampled_indices])
+        self.sampled_ops = [(op, evolution_time) for op in sampled_ops]
 
-        # Build the evolution circuit using the LieTrotter synthesis with the sampled operators
-        lie_trotter = LieTrotter(
-            insert_barriers=self.insert_barriers, atomic_evolution=self.atomic_evolution
-        )
-        evolution_circuit = PauliEvolutionGate(
-            sum(PauliOp(op) for op, coeff in self.sampled_ops),
-            time=evolution_time,
-            synthesis=lie_trotter,
-        ).definition
+        # Build the evolution circuit as the Lie-Trotter formula for the sampled operators
+        evolution_circuit = QuantumCircuit(operators[0].num_qubits)
+        wrap = self.wrap and num_gates > 1
+        for i, index in enumerate(sampled_indices):
+            if i > 0 and self.insert_barriers:
+                evolution_circuit.barrier()
+            self._append_atomic_evolution(
+                evolution_circuit, pauli_list[index][0], evolution_time, wrap
+            )
 
         return evolution_circuit
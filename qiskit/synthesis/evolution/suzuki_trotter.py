@@ -15,7 +15,6 @@
 from typing import Callable, Optional, Union
 
 import warnings
-import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.quantum_info.operators import SparsePauliOp, Pauli
@@ -60,6 +59,7 @@ class SuzukiTrotter(ProductFormula):
         atomic_evolution: Optional[
             Callable[[Union[Pauli, SparsePauliOp], float], QuantumCircuit]
         ] = None,
+        wrap: bool = True,
     ) -> None:
         """
         Args:
@@ -72,6 +72,9 @@ class SuzukiTrotter(ProductFormula):
             atomic_evolution: A function to construct the circuit for the evolution of single
                 Pauli string. Per default, a single Pauli evolution is decomopsed in a CX chain
                 and a single qubit Z rotation.
+            wrap: Whether to wrap the atomic evolutions into custom gate objects. If ``False``,
+                the gates of all the atomic evolutions are added directly to a single flat
+                circuit, which is much faster for operators with many terms.
         """
         if order % 2 == 1:
             warnings.warn(
@@ -85,17 +88,14 @@ class SuzukiTrotter(ProductFormula):
             # TODO replace deprecation warning by the following error and add unit test for odd
             # raise ValueError("Suzuki product formulae are symmetric and therefore only defined "
             #                  "for even orders.")
-        super().__init__(order, reps, insert_barriers, cx_structure, atomic_evolution)
+        super().__init__(order, reps, insert_barriers, cx_structure, atomic_evolution, wrap)
 
     def synthesize(self, evolution):
         # get operators and time to evolve
         operators = evolution.operator
         time = evolution.time
 
-        if not isinstance(operators, list):
-            pauli_list = [(Pauli(op), np.real(coeff)) for op, coeff in operators.to_list()]
-        else:
-            pauli_list = [(op, 1) for op in operators]
+        pauli_list = self._atomic_operators(operators)
 
         ops_to_evolve = self._recurse(self.order, time / self.reps, pauli_list)
 
@@ -111,7 +111,7 @@ class SuzukiTrotter(ProductFormula):
             else:
                 first_barrier = True
 
-            single_rep.compose(self.atomic_evolution(op, coeff), wrap=True, inplace=True)
+            self._append_atomic_evolution(single_rep, op, coeff, self.wrap)
 
         evolution_circuit = QuantumCircuit(operators[0].num_qubits)
         first_barrier = False
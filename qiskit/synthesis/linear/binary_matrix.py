@@ -0,0 +1,298 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Bit-packed binary matrices over GF(2)."""
+
+from typing import Union, List
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+
+# Number of set bits of every byte value, used to count the bits of packed rows.
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class PackedBinaryMatrix:
+    r"""A matrix over :math:`GF(2)` with its rows packed into 64-bit words.
+
+    Column ``j`` of a row is stored in bit ``j % 64`` of word ``j // 64``, and the unused
+    bits of the last word of every row are always zero. Adding (XOR-ing) one row into
+    another therefore only touches ``ceil(num_cols / 64)`` words, and the same operation
+    can be applied to many rows at once with a single NumPy call, which makes Gaussian
+    elimination, rank, inversion and multiplication much cheaper than on boolean arrays.
+
+    **Example:**
+
+    .. code-block:: python
+
+        import numpy as np
+        from qiskit.synthesis.linear import PackedBinaryMatrix
+
+        mat = PackedBinaryMatrix([[1, 0, 0], [1, 1, 0], [0, 0, 1]])
+        mat.xor_rows(1, 0)
+        assert mat == PackedBinaryMatrix.identity(3)
+        assert np.array_equal(mat.inverse().to_matrix(), np.eye(3, dtype=bool))
+    """
+
+    __slots__ = ("_words", "_num_cols")
+
+    def __init__(self, matrix: Union[List[List[int]], np.ndarray, "PackedBinaryMatrix"]):
+        """Create a new bit-packed binary matrix.
+
+        Args:
+            matrix: a two-dimensional array-like of 0s and 1s (any non-zero entry is
+                taken to be 1), or another :class:`PackedBinaryMatrix` to copy.
+
+        Raises:
+            QiskitError: if the input is not two-dimensional.
+        """
+        if isinstance(matrix, PackedBinaryMatrix):
+            self._words = matrix._words.copy()
+            self._num_cols = matrix._num_cols
+            return
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            raise QiskitError("A binary matrix must be two-dimensional.")
+        self._words = _pack(matrix.astype(bool, copy=False))
+        self._num_cols = matrix.shape[1]
+
+    @classmethod
+    def from_words(cls, words: np.ndarray, num_cols: int) -> "PackedBinaryMatrix":
+        """Create a matrix directly from its packed representation, without copying.
+
+        Args:
+            words: a ``(num_rows, ceil(num_cols / 64))`` array of ``uint64``.
+            num_cols: number of columns of the matrix.
+
+        Returns:
+            PackedBinaryMatrix: the matrix stored in ``words``.
+        """
+        out = cls.__new__(cls)
+        out._words = words
+        out._num_cols = num_cols
+        return out
+
+    @classmethod
+    def identity(cls, num_rows: int) -> "PackedBinaryMatrix":
+        """Return the ``num_rows x num_rows`` identity matrix."""
+        words = np.zeros((num_rows, _num_words(num_rows)), dtype=np.uint64)
+        rows = np.arange(num_rows)
+        words[rows, rows >> 6] = np.left_shift(np.uint64(1), (rows & 63).astype(np.uint64))
+        return cls.from_words(words, num_rows)
+
+    @classmethod
+    def from_row_integers(cls, rows: List[int], num_cols: int) -> "PackedBinaryMatrix":
+        """Create a matrix from rows given as integers, as returned by
+        :meth:`to_row_integers`."""
+        num_bytes = 8 * _num_words(num_cols)
+        data = b"".join(row.to_bytes(num_bytes, "little") for row in rows)
+        words = np.frombuffer(data, dtype="<u8").astype(np.uint64).reshape(len(rows), -1)
+        return cls.from_words(words, num_cols)
+
+    @property
+    def words(self) -> np.ndarray:
+        """The underlying ``(num_rows, num_words)`` array of ``uint64`` (not a copy)."""
+        return self._words
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows of the matrix."""
+        return self._words.shape[0]
+
+    @property
+    def num_cols(self) -> int:
+        """Number of columns of the matrix."""
+        return self._num_cols
+
+    @property
+    def shape(self):
+        """The ``(num_rows, num_cols)`` shape of the matrix."""
+        return (self.num_rows, self._num_cols)
+
+    def __repr__(self):
+        return f"PackedBinaryMatrix({self.to_matrix().astype(int).tolist()})"
+
+    def __eq__(self, other):
+        if not isinstance(other, PackedBinaryMatrix):
+            return False
+        return self.shape == other.shape and np.array_equal(self._words, other._words)
+
+    def __matmul__(self, other):
+        return self.dot(other)
+
+    def copy(self) -> "PackedBinaryMatrix":
+        """Return a copy of the matrix."""
+        return PackedBinaryMatrix.from_words(self._words.copy(), self._num_cols)
+
+    def to_matrix(self) -> np.ndarray:
+        """Return the matrix as a boolean NumPy array."""
+        return _unpack(self._words, self._num_cols)
+
+    def to_row_integers(self) -> List[int]:
+        """Return every row as a Python integer with bit ``j`` holding column ``j``.
+
+        Integers are cheaper than NumPy calls for algorithms that must visit the rows one
+        at a time, such as the Patel–Markov–Hayes synthesis.
+        """
+        data = self._words.astype("<u8", copy=False).tobytes()
+        row_bytes = 8 * self._words.shape[1]
+        return [
+            int.from_bytes(data[start : start + row_bytes], "little")
+            for start in range(0, len(data), row_bytes)
+        ]
+
+    def column(self, col: int) -> np.ndarray:
+        """Return the entries of column ``col`` as a boolean array."""
+        return _column(self._words, col)
+
+    def xor_rows(self, target, source):
+        """Add row ``source`` to row ``target`` in place.
+
+        Both arguments may also be arrays of indices of the same length, in which case all
+        pairs are applied at once; ``target`` must not then contain any row of ``source``.
+        """
+        self._words[target] ^= self._words[source]
+
+    def swap_rows(self, row1: int, row2: int):
+        """Swap rows ``row1`` and ``row2`` in place."""
+        self._words[[row1, row2]] = self._words[[row2, row1]]
+
+    def row_weights(self) -> np.ndarray:
+        """Return the number of ones in every row."""
+        return _popcount(self._words)
+
+    def transpose(self) -> "PackedBinaryMatrix":
+        """Return the transpose of the matrix."""
+        return PackedBinaryMatrix.from_words(_pack(self.to_matrix().T), self.num_rows)
+
+    def dot(self, other: "PackedBinaryMatrix") -> "PackedBinaryMatrix":
+        """Return the matrix product ``self @ other`` over :math:`GF(2)`.
+
+        Raises:
+            QiskitError: if the shapes of the matrices do not match.
+        """
+        if not isinstance(other, PackedBinaryMatrix):
+            other = PackedBinaryMatrix(other)
+        if self._num_cols != other.num_rows:
+            raise QiskitError(f"Cannot multiply matrices of shapes {self.shape} and {other.shape}.")
+        out = np.zeros((self.num_rows, other.words.shape[1]), dtype=np.uint64)
+        # Row i of the product is the sum of the rows k of ``other`` for which self[i, k] = 1.
+        for k in range(self._num_cols):
+            rows = _column(self._words, k)
+            if rows.any():
+                out[rows] ^= other.words[k]
+        return PackedBinaryMatrix.from_words(out, other.num_cols)
+
+    def rank(self) -> int:
+        """Return the rank of the matrix over :math:`GF(2)`."""
+        return _row_reduce(self._words.copy(), self._num_cols)
+
+    def is_invertible(self) -> bool:
+        """Return whether the matrix is square and invertible over :math:`GF(2)`."""
+        return self.num_rows == self._num_cols and self.rank() == self._num_cols
+
+    def inverse(self) -> "PackedBinaryMatrix":
+        """Return the inverse of the matrix over :math:`GF(2)`.
+
+        Raises:
+            QiskitError: if the matrix is not square or not invertible.
+        """
+        if self.num_rows != self._num_cols:
+            raise QiskitError("Only square matrices can be inverted.")
+        inverse = PackedBinaryMatrix.identity(self.num_rows).words
+        rank = _row_reduce(self._words.copy(), self._num_cols, inverse)
+        if rank != self._num_cols:
+            raise QiskitError("The matrix is not invertible.")
+        return PackedBinaryMatrix.from_words(inverse, self._num_cols)
+
+
+def calc_inverse_matrix(mat: np.ndarray) -> np.ndarray:
+    """Return the inverse of a binary matrix over :math:`GF(2)`.
+
+    Args:
+        mat: a square boolean (or 0/1) matrix.
+
+    Returns:
+        np.ndarray: the inverse of ``mat`` as a boolean matrix.
+
+    Raises:
+        QiskitError: if the matrix is not square or not invertible.
+    """
+    return PackedBinaryMatrix(mat).inverse().to_matrix()
+
+
+def check_invertible_binary_matrix(mat: np.ndarray) -> bool:
+    """Return whether a binary matrix is square and invertible over :math:`GF(2)`."""
+    mat = np.asarray(mat)
+    if mat.ndim != 2 or mat.shape[0] != mat.shape[1]:
+        return False
+    return PackedBinaryMatrix(mat).is_invertible()
+
+
+def _num_words(num_cols):
+    return (num_cols + 63) >> 6
+
+
+def _pack(matrix):
+    """Pack the rows of a 2d boolean array into little-endian 64-bit words."""
+    num_rows, num_cols = matrix.shape
+    packed = np.zeros((num_rows, 8 * _num_words(num_cols)), dtype=np.uint8)
+    if num_cols:
+        packed[:, : (num_cols + 7) >> 3] = np.packbits(matrix, axis=1, bitorder="little")
+    return packed.view("<u8").astype(np.uint64, copy=False)
+
+
+def _unpack(words, num_cols):
+    """Inverse of :func:`_pack`."""
+    as_bytes = words.astype("<u8", copy=False).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=num_cols, bitorder="little").astype(bool)
+
+
+def _column(words, col):
+    """Return column ``col`` of a packed matrix as a boolean array."""
+    return ((words[:, col >> 6] >> np.uint64(col & 63)) & np.uint64(1)).astype(bool)
+
+
+def _popcount(words):
+    """Return the number of set bits in every row of a 2d array of packed words."""
+    as_bytes = np.ascontiguousarray(words).astype("<u8", copy=False).view(np.uint8)
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+def _row_reduce(words, num_cols, companion=None):
+    """Bring ``words`` to reduced row echelon form in place and return its rank.
+
+    Every row operation is also applied to ``companion``, if given, which therefore ends up
+    holding the inverse of the original matrix when it starts as the identity and the
+    matrix is invertible.
+    """
+    rank = 0
+    num_rows = words.shape[0]
+    for col in range(num_cols):
+        if rank == num_rows:
+            break
+        candidates = np.flatnonzero(_column(words[rank:], col))
+        if not candidates.size:
+            continue
+        pivot = rank + candidates[0]
+        if pivot != rank:
+            words[[rank, pivot]] = words[[pivot, rank]]
+            if companion is not None:
+                companion[[rank, pivot]] = companion[[pivot, rank]]
+        rows = _column(words, col)
+        rows[rank] = False
+        if rows.any():
+            words[rows] ^= words[rank]
+            if companion is not None:
+                companion[rows] ^= companion[rank]
+        rank += 1
+    return rank
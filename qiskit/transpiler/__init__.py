@@ -675,6 +675,7 @@ Transpiler Target
 
    Target
    InstructionProperties
+   CompiledTarget
 
 Pass Manager Construction
 -------------------------
@@ -697,6 +698,7 @@ Layout and Topology
    :toctree: ../stubs/
 
    Layout
+   NLayout
    CouplingMap
 
 Scheduling
@@ -744,8 +746,9 @@ from .exceptions import TranspilerError, TranspilerAccessError
 from .fencedobjs import FencedDAGCircuit, FencedPropertySet
 from .basepasses import AnalysisPass, TransformationPass
 from .coupling import CouplingMap
-from .layout import Layout
+from .layout import Layout, NLayout
 from .instruction_durations import InstructionDurations
 from .target import Target
 from .target import InstructionProperties
+from .target import CompiledTarget
 from .target import QubitProperties
@@ -32,18 +32,68 @@ class InstructionDurations:
     Note that these fields are used as keys in dictionaries that are used to retrieve the
     instruction durations. Therefore, users must use the exact same parameter value to retrieve
     an instruction duration as the value with which it was added.
+
+    Durations looked up without parameters are remembered, already converted to the requested
+    unit, so that the scheduling passes querying the duration of every node of a circuit only
+    resolve and convert the duration of each instruction and qubits once. This cache is cleared
+    whenever :attr:`dt` or the stored durations are changed, including by writing to
+    :attr:`duration_by_name`, :attr:`duration_by_name_qubits` and
+    :attr:`duration_by_name_qubits_params` directly.
     """
 
     def __init__(
         self, instruction_durations: Optional["InstructionDurationsType"] = None, dt: float = None
     ):
-        self.duration_by_name = {}
-        self.duration_by_name_qubits = {}
-        self.duration_by_name_qubits_params = {}
-        self.dt = dt
+        # Converted durations keyed on (name, qubits, unit), filled in by ``get``.
+        self._lookup = {}
+        self._duration_by_name = _DurationMap(self._lookup)
+        self._duration_by_name_qubits = _DurationMap(self._lookup)
+        self._duration_by_name_qubits_params = _DurationMap(self._lookup)
+        self._dt = dt
         if instruction_durations:
             self.update(instruction_durations)
 
+    @property
+    def dt(self):
+        """Sampling duration in seconds of the target backend."""
+        return self._dt
+
+    @dt.setter
+    def dt(self, dt):
+        self._dt = dt
+        self._lookup.clear()
+
+    @property
+    def duration_by_name(self):
+        """The durations of instructions by name, as ``(duration, unit)``."""
+        return self._duration_by_name
+
+    @duration_by_name.setter
+    def duration_by_name(self, durations):
+        self._lookup.clear()
+        self._duration_by_name = _DurationMap(self._lookup, durations)
+
+    @property
+    def duration_by_name_qubits(self):
+        """The durations of instructions by name and qubits, as ``(duration, unit)``."""
+        return self._duration_by_name_qubits
+
+    @duration_by_name_qubits.setter
+    def duration_by_name_qubits(self, durations):
+        self._lookup.clear()
+        self._duration_by_name_qubits = _DurationMap(self._lookup, durations)
+
+    @property
+    def duration_by_name_qubits_params(self):
+        """The durations of instructions by name, qubits and parameters, as
+        ``(duration, unit)``."""
+        return self._duration_by_name_qubits_params
+
+    @duration_by_name_qubits_params.setter
+    def duration_by_name_qubits_params(self, durations):
+        self._lookup.clear()
+        self._duration_by_name_qubits_params = _DurationMap(self._lookup, durations)
+
     def __str__(self):
         """Return a string representation of all stored durations."""
         string = ""
@@ -223,6 +273,23 @@ class InstructionDurations:
         if name == "barrier":
             return 0
 
+        if parameters is None:
+            lookup_key = (name, tuple(qubits), to_unit)
+            duration = self._lookup.get(lookup_key)
+            if duration is None:
+                duration = self._lookup[lookup_key] = self._resolve(name, qubits, to_unit)
+            return duration
+        return self._resolve(name, qubits, to_unit, parameters)
+
+    def _resolve(
+        self,
+        name: str,
+        qubits: List[int],
+        to_unit: str,
+        parameters: Optional[Iterable[float]] = None,
+    ) -> float:
+        """Find the duration of the instruction in the stored durations and convert it to
+        ``to_unit``."""
         if parameters is not None:
             key = (name, tuple(qubits), tuple(parameters))
         else:
@@ -283,3 +350,47 @@ InstructionDurationsType = Union[
     InstructionDurations,
 ]
 """List of tuples representing (instruction name, qubits indices, parameters, duration)."""
+
+
+class _DurationMap(dict):
+    """A dictionary of durations that clears the cache of converted durations of the
+    :class:`.InstructionDurations` it belongs to whenever it is modified."""
+
+    def __init__(self, lookup, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lookup = lookup
+
+    def __reduce__(self):
+        return (_DurationMap, (self._lookup, dict(self)))
+
+    def __setitem__(self, key, value):
+        self._lookup.clear()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._lookup.clear()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._lookup.clear()
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        self._lookup.clear()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._lookup.clear()
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._lookup.clear()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._lookup.clear()
+        return super().popitem()
+
+    def clear(self):
+        self._lookup.clear()
+        super().clear()
@@ -24,6 +24,7 @@ from typing import Dict
 from qiskit.circuit.quantumregister import Qubit, QuantumRegister
 from qiskit.transpiler.exceptions import LayoutError
 from qiskit.converters import isinstanceint
+from qiskit._accelerate.stochastic_swap import NLayout  # pylint: disable=import-error
 
 
 class Layout:
@@ -230,6 +231,64 @@ class Layout:
         self[left] = self[right]
         self[right] = temp
 
+    def to_nlayout(self, qubits, num_physical_qubits=None):
+        """Convert this layout into an :class:`.NLayout`.
+
+        :class:`.NLayout` is the array-backed layout used by the routing passes implemented in
+        Rust, which maps the integer index of each virtual qubit to its physical qubit. Its swaps
+        and copies are much cheaper than those of a :class:`.Layout`, which makes it suited to
+        the inner loops of the passes that try many layouts.
+
+        Args:
+            qubits (list[Qubit]): The virtual qubits, in the order of their indices in the
+                returned layout, e.g. ``dag.qubits``. All the virtual qubits of this layout must
+                be in the list.
+            num_physical_qubits (int): The number of physical qubits of the returned layout.
+                Defaults to one more than the largest physical qubit of this layout.
+
+        Returns:
+            NLayout: The layout of the indices of ``qubits``.
+
+        Raises:
+            LayoutError: If a qubit of ``qubits`` is not mapped to a physical qubit by this layout,
+                if a virtual qubit of this layout is not in ``qubits``, or if a physical qubit of
+                this layout is not less than ``num_physical_qubits``.
+        """
+        if num_physical_qubits is None:
+            num_physical_qubits = max(self._p2v, default=-1) + 1
+        layout_mapping = {}
+        for index, virtual in enumerate(qubits):
+            physical = self._v2p.get(virtual)
+            if physical is None:
+                raise LayoutError(f"The qubit {virtual} is not mapped to a physical qubit.")
+            if physical >= num_physical_qubits:
+                raise LayoutError(
+                    f"The physical qubit {physical} of {virtual} is not less than the number of "
+                    f"physical qubits {num_physical_qubits}."
+                )
+            layout_mapping[index] = physical
+        if len(layout_mapping) != len(self._v2p):
+            raise LayoutError("The layout maps virtual qubits that are not in the list of qubits.")
+        return NLayout(layout_mapping, len(qubits), num_physical_qubits)
+
+    @classmethod
+    def from_nlayout(cls, nlayout, qubits):
+        """Create a layout from an :class:`.NLayout`, the inverse of :meth:`to_nlayout`.
+
+        Args:
+            nlayout (NLayout): The layout of the indices of the virtual qubits.
+            qubits (list[Qubit]): The virtual qubits, in the order of their indices in
+                ``nlayout``. Each of them must be mapped to a physical qubit in ``nlayout``.
+
+        Returns:
+            Layout: The layout of ``qubits``.
+        """
+        layout = cls()
+        for index, physical in nlayout.layout_mapping():
+            layout._v2p[qubits[index]] = physical
+            layout._p2v[physical] = qubits[index]
+        return layout
+
     def combine_into_edge_map(self, another_layout):
         """Combines self and another_layout into an "edge map".
 
@@ -170,6 +170,7 @@ Additional Passes
    FixedPoint
    ContainsInstruction
    GatesInBasis
+   CheckCompatibility
    ConvertConditionsToIfOps
 """
 
@@ -279,4 +280,5 @@ from .utils import Error
 from .utils import RemoveBarriers
 from .utils import ContainsInstruction
 from .utils import GatesInBasis
+from .utils import CheckCompatibility
 from .utils import ConvertConditionsToIfOps
@@ -13,14 +13,38 @@
 """Count the operations on the longest path in a DAGcircuit."""
 
 from qiskit.transpiler.basepasses import AnalysisPass
+from qiskit.transpiler.passes.analysis.dag_longest_path import DAGLongestPath
 
 
 class CountOpsLongestPath(AnalysisPass):
     """Count the operations on the longest path in a DAGcircuit.
 
     The result is saved in ``property_set['count_ops_longest_path']`` as an integer.
+    The longest path is taken from ``property_set['dag_longest_path']``, which is
+    computed by the required :class:`.DAGLongestPath` pass, so that running both
+    passes only looks for the longest path of the DAG once.
     """
 
+    def __init__(self):
+        super().__init__()
+        self.requires.append(DAGLongestPath())
+
     def run(self, dag):
         """Run the CountOpsLongestPath pass on `dag`."""
-        self.property_set["count_ops_longest_path"] = dag.count_ops_longest_path()
+        path = self.property_set["dag_longest_path"]
+        if path is None:
+            path = dag.longest_path()
+        self.property_set["count_ops_longest_path"] = _count_path_ops(path)
+
+
+def _count_path_ops(path):
+    """Count the occurrences of operation names on a longest path, as returned by
+    :meth:`.DAGCircuit.longest_path`."""
+    op_dict = {}
+    for node in path[1:-1]:  # remove qubits at beginning and end of path
+        name = node.op.name
+        if name not in op_dict:
+            op_dict[name] = 1
+        else:
+            op_dict[name] += 1
+    return op_dict
@@ -10,32 +10,45 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-"""Automatically require analysis passes for resource estimation."""
+"""Estimate the resources used by a DAG circuit in a single analysis pass."""
 
 from qiskit.transpiler.basepasses import AnalysisPass
-from qiskit.transpiler.passes.analysis.depth import Depth
-from qiskit.transpiler.passes.analysis.width import Width
-from qiskit.transpiler.passes.analysis.size import Size
-from qiskit.transpiler.passes.analysis.count_ops import CountOps
-from qiskit.transpiler.passes.analysis.num_tensor_factors import NumTensorFactors
-from qiskit.transpiler.passes.analysis.num_qubits import NumQubits
+from qiskit.transpiler.passes.analysis.count_ops_longest_path import _count_path_ops
 
 
 class ResourceEstimation(AnalysisPass):
-    """Automatically require analysis passes for resource estimation.
+    """Estimate the resources used by a DAG circuit.
 
-    An analysis pass for automatically running:
+    An analysis pass that computes at once the results of:
     * Depth()
     * Width()
     * Size()
     * CountOps()
     * NumTensorFactors()
+    * NumQubits()
+    * DAGLongestPath()
+    * CountOpsLongestPath()
+
+    and saves them in the property set under the same keys as those passes. The depth,
+    the longest path and the operations on it all come from a single longest-path search
+    of the DAG, and the size, width and operation counts are read off the DAG without
+    traversing it. As for any analysis pass, the results are invalidated by the pass
+    manager as soon as a transformation pass modifies the DAG.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.requires += [Depth(), Width(), Size(), CountOps(), NumTensorFactors(), NumQubits()]
+    def run(self, dag):
+        """Run the ResourceEstimation pass on `dag`.
 
-    def run(self, _):
-        """Run the ResourceEstimation pass on `dag`."""
-        pass
+        Raises:
+            DAGCircuitError: if control flow is present in the circuit.
+        """
+        # This raises if there is control flow, for which the depth is ambiguous.
+        self.property_set["size"] = dag.size()
+        path = dag.longest_path()
+        self.property_set["depth"] = max(len(path) - 2, 0)
+        self.property_set["width"] = dag.width()
+        self.property_set["count_ops"] = dag.count_ops(recurse=False)
+        self.property_set["num_tensor_factors"] = dag.num_tensor_factors()
+        self.property_set["num_qubits"] = dag.num_qubits()
+        self.property_set["dag_longest_path"] = path
+        self.property_set["count_ops_longest_path"] = _count_path_ops(path)
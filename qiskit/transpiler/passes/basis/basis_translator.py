@@ -29,6 +29,7 @@ from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.circuit.equivalence import Key
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.passes.utils import control_flow
 
 
 logger = logging.getLogger(__name__)
@@ -206,6 +207,17 @@ class BasisTranslator(TransformationPass):
 
         replace_start_time = time.time()
 
+        # Identical blocks on the same qubits, which are common in circuits with many branches, are
+        # only translated once.
+        translated_blocks = {}
+
+        def translate_block(block, block_wire_map):
+            dag_block = circuit_to_dag(block)
+            dag_updated = apply_translation(dag_block, block_wire_map)
+            if dag_updated:
+                return dag_updated, dag_to_circuit(dag_block)
+            return dag_updated, block
+
         def apply_translation(dag, wire_map):
             dag_updated = False
             for node in dag.op_nodes():
@@ -215,18 +227,25 @@ class BasisTranslator(TransformationPass):
                     if isinstance(node.op, ControlFlowOp):
                         flow_blocks = []
                         for block in node.op.blocks:
-                            dag_block = circuit_to_dag(block)
-                            dag_updated = apply_translation(
-                                dag_block,
-                                {
-                                    inner: wire_map[outer]
-                                    for inner, outer in zip(block.qubits, node.qargs)
-                                },
-                            )
-                            if dag_updated:
-                                flow_circ_block = dag_to_circuit(dag_block)
+                            block_wire_map = {
+                                inner: wire_map[outer]
+                                for inner, outer in zip(block.qubits, node.qargs)
+                            }
+                            key = control_flow.block_key(block)
+                            if key is None:
+                                dag_updated, flow_circ_block = translate_block(
+                                    block, block_wire_map
+                                )
                             else:
-                                flow_circ_block = block
+                                key = (key, tuple(block_wire_map.values()))
+                                if key in translated_blocks:
+                                    _, dag_updated, flow_circ_block = translated_blocks[key]
+                                    flow_circ_block = flow_circ_block.copy()
+                                else:
+                                    dag_updated, flow_circ_block = translate_block(
+                                        block, block_wire_map
+                                    )
+                                    translated_blocks[key] = (block, dag_updated, flow_circ_block)
                             flow_blocks.append(flow_circ_block)
                         node.op = node.op.replace_blocks(flow_blocks)
                     continue
@@ -387,12 +406,13 @@ class BasisSearchVisitor(retworkx.visit.DijkstraVisitor):  # pylint: disable=no-
         rule = self._predecessors.get(gate, None)
         if rule is not None:
             logger.debug(
-                "Gate %s generated using rule \n%s\n with total cost of %s.",
+                "Gate %s generated using rule %s with signature %s with total cost of %s.",
                 gate.name,
-                rule.circuit,
+                rule["position"],
+                rule["signature"],
                 score,
             )
-            self._basis_transforms.append((gate.name, gate.num_qubits, rule.params, rule.circuit))
+            self._basis_transforms.append((gate, rule["position"], rule["signature"]))
         # we can stop the search if we have found all gates in the original ciruit.
         if not self._source_gates_remain:
             # if we start from source gates and apply `basis_transforms` in reverse order, we'll end
@@ -420,7 +440,7 @@ class BasisSearchVisitor(retworkx.visit.DijkstraVisitor):  # pylint: disable=no-
         _, target, edata = edge
         if edata is not None:
             gate = self.graph[target]
-            self._predecessors[gate] = edata["rule"]
+            self._predecessors[gate] = edata
 
     def edge_cost(self, edge):
         """Returns the cost of an edge.
@@ -437,17 +457,16 @@ class BasisSearchVisitor(retworkx.visit.DijkstraVisitor):  # pylint: disable=no-
             return 1
 
         cost_tot = 0
-        rule = edge["rule"]
-        for instruction in rule.circuit:
-            key = Key(name=instruction.operation.name, num_qubits=len(instruction.qubits))
-            cost_tot += self._opt_cost_map[key]
+        for key, count in edge["signature"].items():
+            cost_tot += count * self._opt_cost_map[key]
 
         source = edge["source"]
         return cost_tot - self._opt_cost_map[source]
 
     @property
     def basis_transforms(self):
-        """Returns the gate basis transforms."""
+        """Returns the gate basis transforms, as ``(gate key, position, signature)`` tuples,
+        where ``position`` indexes the equivalences of the gate in the library."""
         return self._basis_transforms
 
 
@@ -489,21 +508,25 @@ def _basis_search(equiv_lib, source_basis, target_basis):
             nodes_to_indices[key] = graph.add_node(key)
         return nodes_to_indices[key]
 
+    # The graph is built from the signatures of the rules only (the gates each one uses), so
+    # that a lazily-built library only has to construct the circuits of the rules we choose.
     rcounter = 0  # running sum of the number of equivalence rules in the library.
     for key in equiv_lib._get_all_keys():
         target = lazy_setdefault(key)
         all_gates_in_lib.add(key)
-        for equiv in equiv_lib._get_equivalences(key):
-            sources = {
-                Key(name=instruction.operation.name, num_qubits=len(instruction.qubits))
-                for instruction in equiv.circuit
-            }
+        for position, signature in enumerate(equiv_lib._get_signatures(key)):
+            sources = set(signature)
             all_gates_in_lib |= sources
             edges = [
                 (
                     lazy_setdefault(source),
                     target,
-                    {"index": rcounter, "rule": equiv, "source": source},
+                    {
+                        "index": rcounter,
+                        "position": position,
+                        "signature": signature,
+                        "source": source,
+                    },
                 )
                 for source in sources
             ]
@@ -529,7 +552,17 @@ def _basis_search(equiv_lib, source_basis, target_basis):
     try:
         retworkx.digraph_dijkstra_search(graph, [dummy], vis.edge_cost, vis)
     except StopIfBasisRewritable:
-        rtn = vis.basis_transforms
+        # The search also reports rules for every other gate it reached on the way; only keep
+        # (and build) the ones which rewrite a gate that can appear in the source circuit.
+        # Rules are ordered such that any gate introduced by a rule is rewritten by a later one.
+        rtn = []
+        needed = set(source_basis)
+        for key, position, signature in vis.basis_transforms:
+            if key not in needed:
+                continue
+            needed.update(signature)
+            params, equiv = equiv_lib._get_equivalences(key)[position]
+            rtn.append((key.name, key.num_qubits, params, equiv))
 
         logger.debug("Transformation path:")
         for gate_name, gate_num_qubits, params, equiv in rtn:
@@ -53,12 +53,13 @@ class Unroll3qOrMore(TransformationPass):
         Raises:
             QiskitError: if a 3q+ gate is not decomposable
         """
+        block_cache = {}
         for node in dag.multi_qubit_ops():
             if dag.has_calibration_for(node):
                 continue
 
             if isinstance(node.op, ControlFlowOp):
-                node.op = control_flow.map_blocks(self.run, node.op)
+                node.op = control_flow.map_blocks(self.run, node.op, block_cache)
                 continue
 
             if self.target is not None:
@@ -56,9 +56,10 @@ class UnrollCustomDefinitions(TransformationPass):
         basic_insts = {"measure", "reset", "barrier", "snapshot", "delay"}
         device_insts = basic_insts | set(self._basis_gates)
 
+        block_cache = {}
         for node in dag.op_nodes():
             if isinstance(node.op, ControlFlowOp):
-                node.op = control_flow.map_blocks(self.run, node.op)
+                node.op = control_flow.map_blocks(self.run, node.op, block_cache)
                 continue
 
             if getattr(node.op, "_directive", False):
@@ -53,6 +53,7 @@ class Unroller(TransformationPass):
             return dag
         # Walk through the DAG and expand each non-basis node
         basic_insts = ["measure", "reset", "barrier", "snapshot", "delay"]
+        block_cache = {}
         for node in dag.op_nodes():
             if getattr(node.op, "_directive", False):
                 continue
@@ -70,7 +71,7 @@ class Unroller(TransformationPass):
                     continue
 
             if isinstance(node.op, ControlFlowOp):
-                node.op = control_flow.map_blocks(self.run, node.op)
+                node.op = control_flow.map_blocks(self.run, node.op, block_cache)
                 continue
 
             try:
@@ -140,22 +140,17 @@ def _build_error_matrix(num_qubits, target=None, coupling_map=None, backend_prop
     error_mat = np.zeros((num_qubits, num_qubits))
     use_error = False
     if target is not None and target.qargs is not None:
-        for qargs in target.qargs:
+        compiled = target.compile()
+        for column, qargs in enumerate(compiled.qargs):
             # Ignore gates over 2q DenseLayout only works with 2q
             if len(qargs) > 2:
                 continue
-            error = 0.0
-            ops = target.operation_names_for_qargs(qargs)
-            for op in ops:
-                props = target[op].get(qargs, None)
-                if props is not None and props.error is not None:
-                    # Use max error rate to represent operation error
-                    # on a qubit(s). If there is more than 1 operation available
-                    # we don't know what will be used on the qubits eventually
-                    # so we take the highest error operation as a proxy for
-                    # the possible worst case.
-                    error = max(error, props.error)
-            max_error = error
+            # Use max error rate to represent operation error
+            # on a qubit(s). If there is more than 1 operation available
+            # we don't know what will be used on the qubits eventually
+            # so we take the highest error operation as a proxy for
+            # the possible worst case. ``fmax`` skips the operations without an error.
+            max_error = np.fmax.reduce(compiled.errors[:, column], initial=0.0)
             # TODO: Factor in T1 and T2 to error matrix after #7736
             if len(qargs) == 1:
                 qubit = qargs[0]
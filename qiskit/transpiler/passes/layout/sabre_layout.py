@@ -99,27 +99,29 @@ class SabreLayout(AnalysisPass):
             raise TranspilerError("More virtual qubits exist than physical.")
 
         # Choose a random initial_layout.
-        if self.seed is None:
-            self.seed = np.random.randint(0, np.iinfo(np.int32).max)
-        rng = np.random.default_rng(self.seed)
+        seed = self.seed
+        if seed is None:
+            seed = np.random.randint(0, np.iinfo(np.int32).max)
+        rng = np.random.default_rng(seed)
 
         physical_qubits = rng.choice(self.coupling_map.size(), len(dag.qubits), replace=False)
         physical_qubits = rng.permutation(physical_qubits)
         initial_layout = Layout({q: dag.qubits[i] for i, q in enumerate(physical_qubits)})
 
         if self.routing_pass is None:
-            self.routing_pass = SabreSwap(
-                self.coupling_map, "decay", seed=self.seed, fake_run=True, trials=self.swap_trials
+            routing_pass = SabreSwap(
+                self.coupling_map, "decay", seed=seed, fake_run=True, trials=self.swap_trials
             )
         else:
-            self.routing_pass.fake_run = True
+            routing_pass = self.routing_pass
+            routing_pass.fake_run = True
 
         # Do forward-backward iterations.
         circ = dag_to_circuit(dag)
         rev_circ = circ.reverse_ops()
         for _ in range(self.max_iterations):
             for _ in ("forward", "backward"):
-                pm = self._layout_and_route_passmanager(initial_layout)
+                pm = self._layout_and_route_passmanager(initial_layout, routing_pass)
                 new_circ = pm.run(circ)
 
                 # Update initial layout and reverse the unmapped circuit.
@@ -138,9 +140,9 @@ class SabreLayout(AnalysisPass):
             initial_layout.add_register(qreg)
 
         self.property_set["layout"] = initial_layout
-        self.routing_pass.fake_run = False
+        routing_pass.fake_run = False
 
-    def _layout_and_route_passmanager(self, initial_layout):
+    def _layout_and_route_passmanager(self, initial_layout, routing_pass):
         """Return a passmanager for a full layout and routing.
 
         We use a factory to remove potential statefulness of passes.
@@ -150,7 +152,7 @@ class SabreLayout(AnalysisPass):
             FullAncillaAllocation(self.coupling_map),
             EnlargeWithAncilla(),
             ApplyLayout(),
-            self.routing_pass,
+            routing_pass,
         ]
         pm = PassManager(layout_and_route)
         return pm
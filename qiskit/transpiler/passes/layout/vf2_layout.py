@@ -123,10 +123,11 @@ class VF2Layout(AnalysisPass):
         # of trials based on the size of the graphs. For circuits with simple layouts
         # like an all 1q circuit we don't want to sit forever trying every possible
         # mapping in the search space if no other limits are set
-        if self.max_trials is None and self.call_limit is None and self.time_limit is None:
+        max_trials = self.max_trials
+        if max_trials is None and self.call_limit is None and self.time_limit is None:
             im_graph_edge_count = len(im_graph.edge_list())
             cm_graph_edge_count = len(self.coupling_map.graph.edge_list())
-            self.max_trials = max(im_graph_edge_count, cm_graph_edge_count) + 15
+            max_trials = max(im_graph_edge_count, cm_graph_edge_count) + 15
 
         logger.debug("Running VF2 to find mappings")
         mappings = vf2_mapping(
@@ -176,8 +177,8 @@ class VF2Layout(AnalysisPass):
                 )
                 chosen_layout = layout
                 chosen_layout_score = layout_score
-            if self.max_trials is not None and self.max_trials > 0 and trials >= self.max_trials:
-                logger.debug("Trial %s is >= configured max trials %s", trials, self.max_trials)
+            if max_trials is not None and max_trials > 0 and trials >= max_trials:
+                logger.debug("Trial %s is >= configured max trials %s", trials, max_trials)
                 break
             elapsed_time = time.time() - start_time
             if self.time_limit is not None and elapsed_time >= self.time_limit:
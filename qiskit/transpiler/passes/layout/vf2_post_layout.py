@@ -38,7 +38,7 @@ class VF2PostLayoutStopReason(Enum):
 def _target_match(node_a, node_b):
     # Node A is the set of operations in the target. Node B is the count dict
     # of oeprations on the node or edge in the circuit.
-    if isinstance(node_a, set):
+    if isinstance(node_a, (set, frozenset)):
         return node_a.issuperset(node_b.keys())
     # Node A is the count dict of operations on the node or edge in the circuit
     # Node B is the set of operations in the target on the same qubit(s).
@@ -142,17 +142,16 @@ class VF2PostLayout(AnalysisPass):
                 cm_graph = PyDiGraph(multigraph=False)
             else:
                 cm_graph = PyGraph(multigraph=False)
+            compiled = self.target.compile()
             cm_graph.add_nodes_from(
-                [self.target.operation_names_for_qargs((i,)) for i in range(self.target.num_qubits)]
+                [compiled.operation_names_for_qargs((i,)) for i in range(self.target.num_qubits)]
             )
             for qargs in self.target.qargs:
                 len_args = len(qargs)
                 # If qargs == 1 we already populated it and if qargs > 2 there are no instructions
                 # using those in the circuit because we'd have already returned by this point
                 if len_args == 2:
-                    cm_graph.add_edge(
-                        qargs[0], qargs[1], self.target.operation_names_for_qargs(qargs)
-                    )
+                    cm_graph.add_edge(qargs[0], qargs[1], compiled.operation_names_for_qargs(qargs))
             cm_nodes = list(cm_graph.node_indexes())
         else:
             cm_graph, cm_nodes = vf2_utils.shuffle_coupling_graph(
@@ -16,6 +16,7 @@ from collections import defaultdict
 import statistics
 import random
 
+import numpy as np
 from retworkx import PyDiGraph, PyGraph
 
 from qiskit.circuit import ControlFlowOp, ForLoopOp
@@ -101,16 +102,12 @@ def build_average_error_map(target, properties, coupling_map):
     if coupling_map is not None:
         num_qubits = coupling_map.size()
     if target is not None:
-        for qargs in target.qargs:
-            qarg_error = 0.0
-            count = 0
-            for op in target.operation_names_for_qargs(qargs):
-                inst_props = target[op].get(qargs, None)
-                if inst_props is not None and inst_props.error is not None:
-                    count += 1
-                    qarg_error += inst_props.error
-            if count > 0:
-                avg_map[qargs] = qarg_error / count
+        compiled = target.compile()
+        for column, qargs in enumerate(compiled.qargs):
+            errors = compiled.errors[:, column]
+            errors = errors[~np.isnan(errors)]
+            if errors.size > 0:
+                avg_map[qargs] = sum(errors.tolist()) / errors.size
     elif properties is not None:
         errors = defaultdict(list)
         for qubit in range(len(properties.qubits)):
@@ -36,7 +36,10 @@ class CollectMultiQBlocks(AnalysisPass):
     A Disjont Set Union data structure (DSU) is used to maintain blocks as
     gates are processed. This data structure points each qubit to a set at all
     times and the sets correspond to current blocks. These change over time
-    and the data structure allows these changes to be done quickly.
+    and the data structure allows these changes to be done quickly. Every qubit
+    points directly to the root of its set: since a set never holds more than
+    ``max_block_size`` qubits, re-pointing the qubits of the smaller set on a
+    union is cheap, and finding the open block of a qubit is a single lookup.
     """
 
     def __init__(self, max_block_size=2):
@@ -52,24 +55,20 @@ class CollectMultiQBlocks(AnalysisPass):
 
     def find_set(self, index):
         """DSU function for finding root of set of items
-        If my parent is myself, I am the root. Otherwise we recursively
-        find the root for my parent. After that, we assign my parent to be
-        my root, saving recursion in the future.
+        Every item points directly to the root of its set, so this is a
+        single lookup. Items that were not seen before start a set of their own.
         """
 
         if index not in self.parent:
             self.parent[index] = index
             self.bit_groups[index] = [index]
             self.gate_groups[index] = []
-        if self.parent[index] == index:
-            return index
-        self.parent[index] = self.find_set(self.parent[index])
         return self.parent[index]
 
     def union_set(self, set1, set2):
         """DSU function for unioning two sets together
-        Find the roots of each set. Then assign one to have the other
-        as its parent, thus liking the sets.
+        Find the roots of each set. Then point every item of one of them at the
+        root of the other, thus liking the sets.
         Merges smaller set into larger set in order to have better runtime
         """
 
@@ -79,11 +78,23 @@ class CollectMultiQBlocks(AnalysisPass):
             return
         if len(self.gate_groups[set1]) < len(self.gate_groups[set2]):
             set1, set2 = set2, set1
-        self.parent[set2] = set1
+        for bit in self.bit_groups[set2]:
+            self.parent[bit] = set1
         self.gate_groups[set1].extend(self.gate_groups[set2])
         self.bit_groups[set1].extend(self.bit_groups[set2])
-        self.gate_groups[set2].clear()
-        self.bit_groups[set2].clear()
+        self.gate_groups[set2] = []
+        self.bit_groups[set2] = []
+
+    def _close_set(self, root, block_list):
+        """Report the gates of the set rooted at ``root`` as a block and reset
+        all of its items to sets of their own."""
+        gates = self.gate_groups[root]
+        if gates:
+            block_list.append(gates)
+        for bit in self.bit_groups[root]:
+            self.parent[bit] = bit
+            self.bit_groups[bit] = [bit]
+            self.gate_groups[bit] = []
 
     def run(self, dag):
         """Run the CollectMultiQBlocks pass on `dag`.
@@ -104,6 +115,8 @@ class CollectMultiQBlocks(AnalysisPass):
         self.gate_groups = {}
 
         block_list = []
+        # whether each op node can be part of a block, filled in by the sort key below
+        processable = {}
 
         def collect_key(x):
             """special key function for topological ordering.
@@ -121,107 +134,82 @@ class CollectMultiQBlocks(AnalysisPass):
                 return "d"
             if isinstance(x.op, Gate):
                 if x.op.is_parameterized() or getattr(x.op, "condition", None) is not None:
+                    processable[x._node_id] = False
                     return "c"
+                processable[x._node_id] = True
                 return "b" + chr(ord("a") + len(x.qargs))
+            processable[x._node_id] = False
             return "d"
 
         op_nodes = dag.topological_op_nodes(key=collect_key)
         qubit_indices = {bit: index for index, bit in enumerate(dag.qubits)}
+        parent = self.parent
+        bit_groups = self.bit_groups
+        gate_groups = self.gate_groups
+        max_block_size = self.max_block_size
 
         for nd in op_nodes:
-            can_process = True
-            makes_too_big = False
-
-            # check if the node is a gate and if it is parameterized
-            if (
-                getattr(nd.op, "condition", None) is not None
-                or nd.op.is_parameterized()
-                or not isinstance(nd.op, Gate)
-            ):
-                can_process = False
-
             cur_qubits = {qubit_indices[bit] for bit in nd.qargs}
+            for bit in cur_qubits:
+                if bit not in parent:
+                    self.find_set(bit)
 
-            if can_process:
-                # if the gate is valid, check if grouping up the bits
-                # in the gate would fit within our desired max size
-                c_tops = set()
-                for bit in cur_qubits:
-                    c_tops.add(self.find_set(bit))
-                tot_size = 0
-                for group in c_tops:
-                    tot_size += len(self.bit_groups[group])
-                if tot_size > self.max_block_size:
-                    makes_too_big = True
-
-            if not can_process:
+            if not processable[nd._node_id]:
                 # resolve the case where we cannot process this node
                 for bit in cur_qubits:
                     # create a gate out of me
-                    bit = self.find_set(bit)
-                    if len(self.gate_groups[bit]) == 0:
-                        continue
-                    block_list.append(self.gate_groups[bit][:])
-                    cur_set = set(self.bit_groups[bit])
-                    for v in cur_set:
-                        # reset this bit
-                        self.parent[v] = v
-                        self.bit_groups[v] = [v]
-                        self.gate_groups[v] = []
-
-            if makes_too_big:
+                    self._close_set(parent[bit], block_list)
+                continue
+
+            # the gate is valid, check if grouping up the bits
+            # in the gate would fit within our desired max size
+            c_tops = {parent[bit] for bit in cur_qubits}
+            tot_size = 0
+            for group in c_tops:
+                tot_size += len(bit_groups[group])
+
+            if tot_size > max_block_size:
                 # adding in all of the new qubits would make the group too big
                 # we must block off sub portions of the groups until the new
                 # group would no longer be too big
                 savings = {}
-                tot_size = 0
                 for bit in cur_qubits:
-                    top = self.find_set(bit)
+                    top = parent[bit]
                     if top in savings:
                         savings[top] = savings[top] - 1
                     else:
-                        savings[top] = len(self.bit_groups[top]) - 1
-                        tot_size += len(self.bit_groups[top])
-                slist = []
-                for item, value in savings.items():
-                    slist.append((value, item))
-                slist.sort(reverse=True)
-                savings_need = tot_size - self.max_block_size
-                for item in slist:
+                        savings[top] = len(bit_groups[top]) - 1
+                slist = sorted(((value, item) for item, value in savings.items()), reverse=True)
+                savings_need = tot_size - max_block_size
+                for value, item in slist:
                     # remove groups until the size created would be acceptable
                     # start with blocking out the group that would decrease
                     # the new size the most. This heuristic for which blocks we
                     # create does not necessarily give the optimal blocking. Other
                     # heuristics may be worth considering
-                    if savings_need > 0:
-                        savings_need = savings_need - item[0]
-                        if len(self.gate_groups[item[1]]) >= 1:
-                            block_list.append(self.gate_groups[item[1]][:])
-                        cur_set = set(self.bit_groups[item[1]])
-                        for v in cur_set:
-                            self.parent[v] = v
-                            self.bit_groups[v] = [v]
-                            self.gate_groups[v] = []
-
-            if can_process:
-                # if the operation is a gate, either skip it if it is too large
-                # or group up all of the qubits involved in the gate
-                if len(cur_qubits) > self.max_block_size:
-                    # gates acting on more qubits than max_block_size cannot
-                    #   be a part of any block and thus we skip them here.
-                    # we have already finalized the blocks involving the gate's
-                    #   qubits in the above makes_too_big block
-                    continue  # unable to be part of a group
-                prev = -1
-                for bit in cur_qubits:
-                    if prev != -1:
-                        self.union_set(prev, bit)
-                    prev = bit
-                self.gate_groups[self.find_set(prev)].append(nd)
+                    if savings_need <= 0:
+                        break
+                    savings_need = savings_need - value
+                    self._close_set(item, block_list)
+
+            # if the operation is a gate, either skip it if it is too large
+            # or group up all of the qubits involved in the gate
+            if len(cur_qubits) > max_block_size:
+                # gates acting on more qubits than max_block_size cannot
+                #   be a part of any block and thus we skip them here.
+                # we have already finalized the blocks involving the gate's
+                #   qubits in the above makes_too_big block
+                continue  # unable to be part of a group
+            prev = -1
+            for bit in cur_qubits:
+                if prev != -1 and parent[prev] != parent[bit]:
+                    self.union_set(prev, bit)
+                prev = bit
+            gate_groups[parent[prev]].append(nd)
         # need to turn all groups that still exist into their own blocks
         for index in self.parent:
             if self.parent[index] == index and len(self.gate_groups[index]) != 0:
-                block_list.append(self.gate_groups[index][:])
+                block_list.append(self.gate_groups[index])
 
         self.property_set["block_list"] = block_list
 
@@ -144,7 +144,7 @@ class ConsolidateBlocks(TransformationPass):
 
     def _check_not_in_basis(self, gate_name, qargs, global_index_map):
         if self.target is not None:
-            return not self.target.instruction_supported(
+            return not self.target.compile().instruction_supported(
                 gate_name, tuple(global_index_map[qubit] for qubit in qargs)
             )
         else:
@@ -23,11 +23,18 @@ Exact and practical pattern matching for quantum circuit optimization.
 
 """
 
+import collections
 import itertools
 
+import numpy as np
+
 from qiskit.circuit.controlledgate import ControlledGate
 from qiskit.transpiler.passes.optimization.template_matching.forward_match import ForwardMatch
 from qiskit.transpiler.passes.optimization.template_matching.backward_match import BackwardMatch
+from qiskit.transpiler.passes.optimization.template_matching.template_substitution import (
+    _DEFAULT_COST_DICT,
+    _cost_may_be_reduced,
+)
 
 
 class TemplateMatching:
@@ -41,6 +48,9 @@ class TemplateMatching:
         template_dag_dep,
         heuristics_qubits_param=None,
         heuristics_backward_param=None,
+        heuristics_window_param=None,
+        search_budget=None,
+        cost_dict=None,
     ):
         """
         Create a TemplateMatching object with necessary arguments.
@@ -49,6 +59,11 @@ class TemplateMatching:
             template_dag_dep (QuantumCircuit): template.
             heuristics_backward_param (list[int]): [length, survivor]
             heuristics_qubits_param (list[int]): [length]
+            heuristics_window_param (list[int]): [length] only start a match from a circuit
+                gate if the gates within ``length`` nodes of it could make up a match that
+                reduces the quantum cost.
+            search_budget (int): maximum number of forward/backward match explorations.
+            cost_dict (dict): quantum cost of each gate name, used by the window heuristics.
         """
         self.circuit_dag_dep = circuit_dag_dep
         self.template_dag_dep = template_dag_dep
@@ -59,6 +74,13 @@ class TemplateMatching:
         self.heuristics_backward_param = (
             heuristics_backward_param if heuristics_backward_param is not None else []
         )
+        self.heuristics_window_param = (
+            heuristics_window_param if heuristics_window_param is not None else []
+        )
+        self.search_budget = search_budget
+        self.cost_dict = cost_dict if cost_dict is not None else _DEFAULT_COST_DICT
+        self.explorations = 0
+        self.budget_exhausted = False
 
     def _list_first_match_new(self, node_circuit, node_template, n_qubits_t, n_clbits_t):
         """
@@ -232,6 +254,45 @@ class TemplateMatching:
                     return list(qubit_set)
             return list(qubit_set)
 
+    def _out_of_budget(self):
+        """
+        Check whether the number of match explorations reached the search budget.
+        Returns:
+            bool: True if no more explorations are allowed.
+        """
+        if self.search_budget is not None and self.explorations >= self.search_budget:
+            self.budget_exhausted = True
+        return self.budget_exhausted
+
+    def _window_counts(self, circuit_indices):
+        """
+        Build per-window gate histograms of the circuit, as cumulative counts of the gates of
+        each template gate name, so the gates in any window can be counted in constant time.
+        Args:
+            circuit_indices (dict): indices of the circuit gates of each name.
+        Returns:
+            Callable[[int], bool]: function telling whether the window around the given circuit
+            node could hold a match that reduces the quantum cost.
+        """
+        length = self.heuristics_window_param[0]
+        size = self.circuit_dag_dep.size()
+        template_counts = collections.Counter(
+            node.op.name for node in self.template_dag_dep.get_nodes()
+        )
+        cumulative = {}
+        for name in template_counts:
+            counts = np.zeros(size + 1, dtype=int)
+            counts[np.asarray(circuit_indices.get(name, []), dtype=int) + 1] = 1
+            cumulative[name] = np.cumsum(counts)
+
+        def may_match(index):
+            low = max(0, index - length)
+            high = min(size, index + length + 1)
+            available = {name: counts[high] - counts[low] for name, counts in cumulative.items()}
+            return _cost_may_be_reduced(template_counts, available, self.cost_dict)
+
+        return may_match
+
     def run_template_matching(self):
         """
         Run the complete algorithm for finding all maximal matches for the given template and
@@ -239,7 +300,8 @@ class TemplateMatching:
         Then it explores all compatible qubit configurations of the circuit. For each
         qubit configurations, we apply first the Forward part of the algorithm  and then
         the Backward part of the algorithm. The longest matches for the given configuration
-        are stored. Finally the list of stored matches is sorted.
+        are stored. Finally the list of stored matches is sorted. The exploration stops early
+        once the search budget, if any, is exhausted.
         """
 
         # Get the number of qubits/clbits for both circuit and template.
@@ -249,9 +311,26 @@ class TemplateMatching:
         n_qubits_t = len(self.template_dag_dep.qubits)
         n_clbits_t = len(self.template_dag_dep.clbits)
 
+        # Only circuit gates with the same name as a template gate can start a match, so index
+        # the circuit gates by name instead of comparing every pair of gates.
+        circuit_indices = collections.defaultdict(list)
+        for circuit_index in range(0, self.circuit_dag_dep.size()):
+            circuit_indices[self.circuit_dag_dep.get_node(circuit_index).op.name].append(
+                circuit_index
+            )
+
+        window_counts = None
+        if self.heuristics_window_param:
+            window_counts = self._window_counts(circuit_indices)
+
         # Loop over the indices of both template and circuit.
         for template_index in range(0, self.template_dag_dep.size()):
-            for circuit_index in range(0, self.circuit_dag_dep.size()):
+            template_name = self.template_dag_dep.get_node(template_index).op.name
+            for circuit_index in circuit_indices.get(template_name, []):
+                if self._out_of_budget():
+                    break
+                if window_counts is not None and not window_counts(circuit_index):
+                    continue
                 # Operations match up to ParameterExpressions.
                 if self.circuit_dag_dep.get_node(circuit_index).op.soft_compare(
                     self.template_dag_dep.get_node(template_index).op
@@ -289,6 +368,8 @@ class TemplateMatching:
                         heuristics_qubits = []
 
                     for sub_q in self._sublist(list_circuit_q, qarg_c, n_qubits_t - len(qarg_t)):
+                        if self._out_of_budget():
+                            break
                         # If the heuristics qubits are a subset of the given qubits configuration,
                         # then this configuration is accepted.
                         if set(heuristics_qubits).issubset(set(sub_q) | set(qarg_c)):
@@ -306,6 +387,9 @@ class TemplateMatching:
                                             list_circuit_c, carg_c, n_clbits_t - len(carg_t)
                                         ):
                                             for perm_c in itertools.permutations(sub_c):
+                                                if self._out_of_budget():
+                                                    break
+                                                self.explorations += 1
                                                 perm_c = list(perm_c)
 
                                                 list_clbit_circuit = self._list_qubit_clbit_circuit(
@@ -339,7 +423,8 @@ class TemplateMatching:
 
                                                 # Add the matches to the list.
                                                 self._add_match(backward.match_final)
-                                    else:
+                                    elif not self._out_of_budget():
+                                        self.explorations += 1
                                         # Apply the forward match part of the algorithm.
                                         forward = ForwardMatch(
                                             self.circuit_dag_dep,
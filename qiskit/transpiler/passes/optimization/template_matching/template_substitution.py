@@ -24,6 +24,72 @@ from qiskit.dagcircuit.dagdependency import DAGDependency
 from qiskit.converters.dagdependency_to_dag import dagdependency_to_dag
 
 
+_DEFAULT_COST_DICT = {
+    "id": 0,
+    "x": 1,
+    "y": 1,
+    "z": 1,
+    "h": 1,
+    "t": 1,
+    "tdg": 1,
+    "s": 1,
+    "sdg": 1,
+    "u1": 1,
+    "u2": 2,
+    "u3": 2,
+    "rx": 1,
+    "ry": 1,
+    "rz": 1,
+    "r": 2,
+    "cx": 2,
+    "cy": 4,
+    "cz": 4,
+    "ch": 8,
+    "swap": 6,
+    "iswap": 8,
+    "rxx": 9,
+    "ryy": 9,
+    "rzz": 5,
+    "rzx": 7,
+    "ms": 9,
+    "cu3": 10,
+    "crx": 10,
+    "cry": 10,
+    "crz": 10,
+    "ccx": 21,
+    "rccx": 12,
+    "c3x": 96,
+    "rc3x": 24,
+    "c4x": 312,
+    "p": 1,
+}
+
+
+def _cost_may_be_reduced(template_counts, available_counts, cost_dict):
+    """
+    Check whether a match of a template could ever pass the quantum cost rule of
+    :class:`TemplateSubstitution`, given how many gates of each name are available to match.
+    The matched gates have to cost more than the unmatched ones, so the best case is the match
+    using every available gate.
+    Args:
+        template_counts (dict): number of gates of each name in the template.
+        available_counts (dict): number of gates of each name available in the circuit.
+        cost_dict (dict): quantum cost of each gate name.
+    Returns:
+        bool: False if no match can reduce the cost. Templates with gates missing from
+        ``cost_dict`` can't be judged, and give True.
+    """
+    total_cost = 0
+    best_matched_cost = 0
+    for name, count in template_counts.items():
+        cost = cost_dict.get(name)
+        if cost is None:
+            return True
+        total_cost += cost * count
+        best_matched_cost += cost * min(count, available_counts.get(name, 0))
+    return best_matched_cost > total_cost - best_matched_cost
+
+
 class SubstitutionConfig:
     """
     Class to store the configuration of a given match substitution, which circuit
@@ -86,45 +152,7 @@ class TemplateSubstitution:
         if user_cost_dict is not None:
             self.cost_dict = dict(user_cost_dict)
         else:
-            self.cost_dict = {
-                "id": 0,
-                "x": 1,
-                "y": 1,
-                "z": 1,
-                "h": 1,
-                "t": 1,
-                "tdg": 1,
-                "s": 1,
-                "sdg": 1,
-                "u1": 1,
-                "u2": 2,
-                "u3": 2,
-                "rx": 1,
-                "ry": 1,
-                "rz": 1,
-                "r": 2,
-                "cx": 2,
-                "cy": 4,
-                "cz": 4,
-                "ch": 8,
-                "swap": 6,
-                "iswap": 8,
-                "rxx": 9,
-                "ryy": 9,
-                "rzz": 5,
-                "rzx": 7,
-                "ms": 9,
-                "cu3": 10,
-                "crx": 10,
-                "cry": 10,
-                "crz": 10,
-                "ccx": 21,
-                "rccx": 12,
-                "c3x": 96,
-                "rc3x": 24,
-                "c4x": 312,
-                "p": 1,
-            }
+            self.cost_dict = dict(_DEFAULT_COST_DICT)
 
     def _pred_block(self, circuit_sublist, index):
         """
@@ -20,6 +20,9 @@ all compatible maximal matches that reduces the size of the circuit.
 Exact and practical pattern matching for quantum circuit optimization.
 `arXiv:1909.05270 <https://arxiv.org/abs/1909.05270>`_
 """
+import collections
+import logging
+
 import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
@@ -37,6 +40,12 @@ from qiskit.transpiler.passes.optimization.template_matching import (
     TemplateSubstitution,
     MaximalMatches,
 )
+from qiskit.transpiler.passes.optimization.template_matching.template_substitution import (
+    _DEFAULT_COST_DICT,
+    _cost_may_be_reduced,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class TemplateOptimization(TransformationPass):
@@ -50,6 +59,8 @@ class TemplateOptimization(TransformationPass):
         heuristics_qubits_param=None,
         heuristics_backward_param=None,
         user_cost_dict=None,
+        heuristics_window_param=None,
+        search_budget=None,
     ):
         """
         Args:
@@ -71,6 +82,19 @@ class TemplateOptimization(TransformationPass):
             user_cost_dict (Dict[str, int]): quantum cost dictionary passed to TemplateSubstitution
                 to configure its behavior. This will override any default values if None
                 is not given. The key is the name of the gate and the value its quantum cost.
+            heuristics_window_param (list[int]): [length] The heuristics for the window only
+                starts a match from a gate of the circuit if the gates within ``length`` nodes
+                of it in the dag dependency could form a match that reduces the quantum cost.
+                The gates of each window are counted from cumulative gate histograms of the
+                circuit. Matches spreading further than the window are lost, so the length
+                should be a few times the size of the templates.
+            search_budget (int): maximum number of forward/backward match explorations for
+                each template. Once it is exhausted, only the matches found so far are used.
+                By default the search is exhaustive.
+
+        Templates that can not reduce the quantum cost of the circuit are skipped before any
+        matching, by comparing the number of gates of each name in the template (its
+        signature, computed once per template) with the gate counts of the circuit.
         """
         super().__init__()
         # If no template is given; the template are set as x-x, cx-cx, ccx-ccx.
@@ -85,6 +109,11 @@ class TemplateOptimization(TransformationPass):
         )
 
         self.user_cost_dict = user_cost_dict
+        self.heuristics_window_param = (
+            heuristics_window_param if heuristics_window_param is not None else []
+        )
+        self.search_budget = search_budget
+        self._template_index = {}
 
     def run(self, dag):
         """
@@ -98,43 +127,32 @@ class TemplateOptimization(TransformationPass):
         """
         circuit_dag = dag
         circuit_dag_dep = dag_to_dagdependency(circuit_dag)
+        circuit_counts = _gate_counts(circuit_dag_dep)
+        cost_dict = self.user_cost_dict if self.user_cost_dict is not None else _DEFAULT_COST_DICT
 
-        for template in self.template_list:
-            if not isinstance(template, (QuantumCircuit, DAGDependency)):
-                raise TranspilerError("A template is a Quantumciruit or a DAGDependency.")
-
-            if len(template.qubits) > len(circuit_dag_dep.qubits):
+        for template_dag_dep, template_counts in self._get_template_index(
+            len(circuit_dag_dep.qubits)
+        ):
+            if not _cost_may_be_reduced(template_counts, circuit_counts, cost_dict):
                 continue
 
-            identity = np.identity(2 ** len(template.qubits), dtype=complex)
-            try:
-                if isinstance(template, DAGDependency):
-                    data = Operator(dagdependency_to_circuit(template)).data
-                else:
-                    data = Operator(template).data
-
-                comparison = np.allclose(data, identity)
-
-                if not comparison:
-                    raise TranspilerError(
-                        "A template is a Quantumciruit() that performs the identity."
-                    )
-            except TypeError:
-                pass
-
-            if isinstance(template, QuantumCircuit):
-                template_dag_dep = circuit_to_dagdependency(template)
-            else:
-                template_dag_dep = template
-
             template_m = TemplateMatching(
                 circuit_dag_dep,
                 template_dag_dep,
                 self.heuristics_qubits_param,
                 self.heuristics_backward_param,
+                self.heuristics_window_param,
+                self.search_budget,
+                cost_dict,
             )
 
             template_m.run_template_matching()
+            if template_m.budget_exhausted:
+                logger.debug(
+                    "Search budget of %s explorations exhausted for template %s.",
+                    self.search_budget,
+                    template_dag_dep.name,
+                )
 
             matches = template_m.match_list
 
@@ -152,7 +170,73 @@ class TemplateOptimization(TransformationPass):
                 substitution.run_dag_opt()
 
                 circuit_dag_dep = substitution.dag_dep_optimized
+                circuit_counts = _gate_counts(circuit_dag_dep)
             else:
                 continue
         circuit_dag = dagdependency_to_dag(circuit_dag_dep)
         return circuit_dag
+
+    def _get_template_index(self, num_qubits):
+        """
+        Check the templates that act on at most ``num_qubits`` qubits and index them by their
+        signature, the number of gates of each name in the template. Each template is only
+        checked and indexed once, for as long as it stays in the template list.
+        Args:
+            num_qubits (int): the number of qubits of the circuit to optimize.
+        Returns:
+            list[tuple[DAGDependency, dict]]: the templates and their signatures.
+        Raises:
+            TranspilerError: If the template has not the right form or
+             if the output circuit acts differently as the input circuit.
+        """
+        if len(self._template_index) > len(self.template_list):
+            # Drop the templates that were removed from the list.
+            template_ids = {id(template) for template in self.template_list}
+            self._template_index = {
+                template_id: entry
+                for template_id, entry in self._template_index.items()
+                if template_id in template_ids
+            }
+
+        template_index = []
+        for template in self.template_list:
+            if not isinstance(template, (QuantumCircuit, DAGDependency)):
+                raise TranspilerError("A template is a Quantumciruit or a DAGDependency.")
+
+            if len(template.qubits) > num_qubits:
+                continue
+
+            # The entries hold on to their template, so that its id is not reused.
+            entry = self._template_index.get(id(template))
+            if entry is None:
+                entry = (template, *_index_template(template))
+                self._template_index[id(template)] = entry
+            template_index.append(entry[1:])
+        return template_index
+
+
+def _index_template(template):
+    identity = np.identity(2 ** len(template.qubits), dtype=complex)
+    try:
+        if isinstance(template, DAGDependency):
+            data = Operator(dagdependency_to_circuit(template)).data
+        else:
+            data = Operator(template).data
+
+        comparison = np.allclose(data, identity)
+
+        if not comparison:
+            raise TranspilerError("A template is a Quantumciruit() that performs the identity.")
+    except TypeError:
+        pass
+
+    if isinstance(template, QuantumCircuit):
+        template_dag_dep = circuit_to_dagdependency(template)
+    else:
+        template_dag_dep = template
+
+    return template_dag_dep, _gate_counts(template_dag_dep)
+
+
+def _gate_counts(dag_dep):
+    return collections.Counter(node.op.name for node in dag_dep.get_nodes())
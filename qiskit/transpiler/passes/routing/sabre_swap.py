@@ -32,7 +32,6 @@ from qiskit._accelerate.sabre_swap import (
     NeighborTable,
     SabreDAG,
 )
-from qiskit._accelerate.stochastic_swap import NLayout  # pylint: disable=import-error
 
 logger = logging.getLogger(__name__)
 
@@ -152,11 +151,7 @@ class SabreSwap(TransformationPass):
 
         self.heuristic = heuristic
 
-        if seed is None:
-            ii32 = np.iinfo(np.int32)
-            self.seed = np.random.default_rng(None).integers(0, ii32.max, dtype=int)
-        else:
-            self.seed = seed
+        self.seed = seed
         if trials is None:
             self.trials = CPU_COUNT
         else:
@@ -195,6 +190,11 @@ class SabreSwap(TransformationPass):
 
         self.dist_matrix = self.coupling_map.distance_matrix
 
+        seed = self.seed
+        if seed is None:
+            ii32 = np.iinfo(np.int32)
+            seed = np.random.default_rng(None).integers(0, ii32.max, dtype=int)
+
         # Preserve input DAG's name, regs, wire_map, etc. but replace the graph.
         mapped_dag = None
         if not self.fake_run:
@@ -204,10 +204,7 @@ class SabreSwap(TransformationPass):
         current_layout = Layout.generate_trivial_layout(canonical_register)
         self._qubit_indices = {bit: idx for idx, bit in enumerate(canonical_register)}
         self._clbit_indices = {bit: idx for idx, bit in enumerate(dag.clbits)}
-        layout_mapping = {
-            self._qubit_indices[k]: v for k, v in current_layout.get_virtual_bits().items()
-        }
-        layout = NLayout(layout_mapping, len(dag.qubits), self.coupling_map.size())
+        layout = current_layout.to_nlayout(canonical_register, self.coupling_map.size())
         original_layout = layout.copy()
 
         dag_list = []
@@ -232,14 +229,12 @@ class SabreSwap(TransformationPass):
             self._neighbor_table,
             self.dist_matrix,
             heuristic,
-            self.seed,
+            seed,
             layout,
             self.trials,
         )
 
-        layout_mapping = layout.layout_mapping()
-        output_layout = Layout({dag.qubits[k]: v for (k, v) in layout_mapping})
-        self.property_set["final_layout"] = output_layout
+        self.property_set["final_layout"] = Layout.from_nlayout(layout, dag.qubits)
         if not self.fake_run:
             for node_id in gate_order:
                 node = dag._multi_graph[node_id]
@@ -26,6 +26,7 @@ from qiskit.circuit.library.standard_gates import SwapGate
 from qiskit.transpiler.layout import Layout
 from qiskit.circuit import IfElseOp, WhileLoopOp, ForLoopOp, ControlFlowOp, Instruction
 from qiskit._accelerate import stochastic_swap as stochastic_swap_rs
+from qiskit.transpiler.passes.utils import control_flow
 
 from .utils import get_swap_map_dag
 
@@ -71,8 +72,10 @@ class StochasticSwap(TransformationPass):
         self.fake_run = fake_run
         self.qregs = None
         self.initial_layout = initial_layout
+        self._trivial_initial_layout = False
         self._qubit_to_int = None
         self._int_to_qubit = None
+        self._routed_blocks = None
 
     def run(self, dag):
         """Run the StochasticSwap pass on `dag`.
@@ -97,12 +100,16 @@ class StochasticSwap(TransformationPass):
         self.rng = np.random.default_rng(self.seed)
 
         canonical_register = dag.qregs["q"]
-        if self.initial_layout is None:
+        if self.initial_layout is None or self._trivial_initial_layout:
+            # Without a given initial layout, start from the trivial layout of each DAG.
             self.initial_layout = Layout.generate_trivial_layout(canonical_register)
+            self._trivial_initial_layout = True
         # Qubit indices are used to assign an integer to each virtual qubit during the routing: it's
         # a mapping of {virtual: virtual}, for converting between Python and Rust forms.
         self._qubit_to_int = {bit: idx for idx, bit in enumerate(dag.qubits)}
         self._int_to_qubit = tuple(dag.qubits)
+        # Routed control-flow blocks, by the block, its wires and the layout it was routed from.
+        self._routed_blocks = {}
 
         self.qregs = dag.qregs
         logger.debug("StochasticSwap rng seeded with seed=%s", self.seed)
@@ -190,8 +197,7 @@ class StochasticSwap(TransformationPass):
             count=2 * len(gates),
         )
 
-        layout_mapping = {self._qubit_to_int[k]: v for k, v in layout.get_virtual_bits().items()}
-        int_layout = stochastic_swap_rs.NLayout(layout_mapping, num_qubits, coupling.size())
+        int_layout = layout.to_nlayout(self._int_to_qubit, coupling.size())
 
         trial_circuit = DAGCircuit()  # SWAP circuit for slice of swaps in this trial
         trial_circuit.add_qubits(layout.get_virtual_bits())
@@ -223,10 +229,7 @@ class StochasticSwap(TransformationPass):
 
         # Otherwise, we return our result for this layer
         logger.debug("layer_permutation: success!")
-        layout_mapping = best_layout.layout_mapping()
-
-        best_lay = Layout({best_circuit.qubits[k]: v for (k, v) in layout_mapping})
-        return True, best_circuit, best_depth, best_lay
+        return True, best_circuit, best_depth, Layout.from_nlayout(best_layout, best_circuit.qubits)
 
     def _layer_update(self, dag, layer, best_layout, best_depth, best_circuit):
         """Add swaps followed by the now mapped layer from the original circuit.
@@ -379,10 +382,29 @@ class StochasticSwap(TransformationPass):
         # these blocks down to remove any qubits that are idle.
         block_dags = []
         block_layouts = []
+        # Identical blocks on the same wires and from the same layout, which are common in circuits
+        # with many branches, are only routed once.
+        layout_key = frozenset(current_layout.get_virtual_bits().items())
         for block in node.op.blocks:
-            inner_pass = self._recursive_pass(current_layout)
-            block_dags.append(inner_pass.run(_dag_from_block(block, node, root_dag)))
-            block_layouts.append(inner_pass.property_set["final_layout"].copy())
+            key = control_flow.block_key(block)
+            if key is not None:
+                key = (key, tuple(node.qargs), tuple(node.cargs), layout_key)
+            if key is None or key not in self._routed_blocks:
+                inner_pass = self._recursive_pass(current_layout)
+                block_dag = inner_pass.run(_dag_from_block(block, node, root_dag))
+                block_layout = inner_pass.property_set["final_layout"]
+                if key is not None:
+                    routed_block = block_dag if self.fake_run else dag_to_circuit(block_dag)
+                    self._routed_blocks[key] = (block, routed_block, block_layout)
+            else:
+                # Draw the seed of the recursive pass anyway, so that the following blocks are
+                # routed as if there was no cache.
+                self._new_seed()
+                _, routed_block, block_layout = self._routed_blocks[key]
+                # The routed blocks are modified below, so each use needs its own DAG.
+                block_dag = routed_block if self.fake_run else circuit_to_dag(routed_block)
+            block_dags.append(block_dag)
+            block_layouts.append(block_layout.copy())
 
         # Determine what layout we need to go towards.  For some blocks (such as `for`), we must
         # guarantee that the final layout is the same as the initial or the loop won't work.  For an
@@ -160,12 +160,13 @@ class DynamicalDecoupling(TransformationPass):
             sequence_gphase = np.angle(noop[0][0])
 
         if self._qubits is None:
-            self._qubits = set(range(dag.num_qubits()))
+            qubits = set(range(dag.num_qubits()))
         else:
-            self._qubits = set(self._qubits)
+            qubits = set(self._qubits)
 
         if self._spacing:
-            if sum(self._spacing) != 1 or any(a < 0 for a in self._spacing):
+            spacing = self._spacing
+            if sum(spacing) != 1 or any(a < 0 for a in spacing):
                 raise TranspilerError(
                     "The spacings must be given in terms of fractions "
                     "of the slack period and sum to 1."
@@ -173,7 +174,7 @@ class DynamicalDecoupling(TransformationPass):
         else:  # default to balanced spacing
             mid = 1 / num_pulses
             end = mid / 2
-            self._spacing = [end] + [mid] * (num_pulses - 1) + [end]
+            spacing = [end] + [mid] * (num_pulses - 1) + [end]
 
         new_dag = dag.copy_empty_like()
 
@@ -194,7 +195,7 @@ class DynamicalDecoupling(TransformationPass):
 
             dag_qubit = nd.qargs[0]
             physical_qubit = qubit_index_map[dag_qubit]
-            if physical_qubit not in self._qubits:  # skip unwanted qubits
+            if physical_qubit not in qubits:  # skip unwanted qubits
                 new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs)
                 continue
 
@@ -234,7 +235,7 @@ class DynamicalDecoupling(TransformationPass):
                     continue
 
             # insert the actual DD sequence
-            taus = [int(slack * a) for a in self._spacing]
+            taus = [int(slack * a) for a in spacing]
             unused_slack = slack - sum(taus)  # unused, due to rounding to int multiples of dt
             middle_index = int((len(taus) - 1) / 2)  # arbitrary: redistribute to middle
             taus[middle_index] += unused_slack  # now we add up to original delay duration
@@ -12,11 +12,11 @@
 
 """Padding pass to fill empty timeslot."""
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from qiskit.circuit import Qubit, Clbit, Instruction
 from qiskit.circuit.delay import Delay
-from qiskit.dagcircuit import DAGCircuit, DAGNode
+from qiskit.dagcircuit import DAGCircuit, DAGNode, DAGOpNode
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 
@@ -49,9 +49,19 @@ class BasePadding(TransformationPass):
     which may result in violation of hardware alignment constraints.
     """
 
+    def __init__(self):
+        super().__init__()
+        # The indices of the nodes in between which the padding of each wire is inserted while
+        # the pass runs.
+        self._insertion_points = {}
+
     def run(self, dag: DAGCircuit):
         """Run the padding pass on ``dag``.
 
+        The padding is inserted into ``dag`` itself, in front of the node following each idle
+        interval, and the new nodes are added to ``node_start_time``, so the nodes which were
+        already scheduled keep their start times and the DAG is not rebuilt.
+
         Args:
             dag: DAG to be checked.
 
@@ -64,33 +74,18 @@ class BasePadding(TransformationPass):
         """
         self._pre_runhook(dag)
 
-        node_start_time = self.property_set["node_start_time"].copy()
-
-        new_dag = DAGCircuit()
-        for qreg in dag.qregs.values():
-            new_dag.add_qreg(qreg)
-        for creg in dag.cregs.values():
-            new_dag.add_creg(creg)
-
-        # Update start time dictionary for the new_dag.
-        # This information may be used for further scheduling tasks,
-        # but this is immediately invalidated becasue node id is updated in the new_dag.
-        self.property_set["node_start_time"].clear()
-
-        new_dag.name = dag.name
-        new_dag.metadata = dag.metadata
-        new_dag.unit = self.property_set["time_unit"]
-        new_dag.calibrations = dag.calibrations
-        new_dag.global_phase = dag.global_phase
+        node_start_time = self.property_set["node_start_time"]
+        dag.unit = self.property_set["time_unit"]
 
         idle_after = {bit: 0 for bit in dag.qubits}
+        self._insertion_points = {}
 
         # Compute fresh circuit duration from the node start time dictionary and op duration.
         # Note that pre-scheduled duration may change within the alignment passes, i.e.
         # if some instruction time t0 violating the hardware alignment constraint,
         # the alignment pass may delay t0 and accordingly the circuit duration changes.
         circuit_duration = 0
-        for node in dag.topological_op_nodes():
+        for node in list(dag.topological_op_nodes()):
             if node in node_start_time:
                 t0 = node_start_time[node]
                 t1 = t0 + node.op.duration
@@ -101,6 +96,7 @@ class BasePadding(TransformationPass):
                     # rather than instruction. Delay node is removed so that
                     # we can extract non-delay predecessors.
                     dag.remove_op_node(node)
+                    del node_start_time[node]
                     continue
 
                 for bit in node.qargs:
@@ -108,9 +104,10 @@ class BasePadding(TransformationPass):
                     # Fill idle time with some sequence
                     if t0 - idle_after[bit] > 0:
                         # Find previous node on the wire, i.e. always the latest node on the wire
-                        prev_node = next(new_dag.predecessors(new_dag.output_map[bit]))
+                        prev_node = _wire_predecessor(dag, node, bit)
+                        self._insertion_points[bit] = [prev_node._node_id, node._node_id]
                         self._pad(
-                            dag=new_dag,
+                            dag=dag,
                             qubit=bit,
                             t_start=idle_after[bit],
                             t_end=t0,
@@ -119,8 +116,6 @@ class BasePadding(TransformationPass):
                         )
 
                     idle_after[bit] = t1
-
-                self._apply_scheduled_op(new_dag, t0, node.op, node.qargs, node.cargs)
             else:
                 raise TranspilerError(
                     f"Operation {repr(node)} is likely added after the circuit is scheduled. "
@@ -128,12 +123,13 @@ class BasePadding(TransformationPass):
                 )
 
         # Add delays until the end of circuit.
-        for bit in new_dag.qubits:
+        for bit in dag.qubits:
             if circuit_duration - idle_after[bit] > 0:
-                node = new_dag.output_map[bit]
-                prev_node = next(new_dag.predecessors(node))
+                node = dag.output_map[bit]
+                prev_node = _wire_predecessor(dag, node, bit)
+                self._insertion_points[bit] = [prev_node._node_id, node._node_id]
                 self._pad(
-                    dag=new_dag,
+                    dag=dag,
                     qubit=bit,
                     t_start=idle_after[bit],
                     t_end=circuit_duration,
@@ -141,9 +137,10 @@ class BasePadding(TransformationPass):
                     prev_node=prev_node,
                 )
 
-        new_dag.duration = circuit_duration
+        self._insertion_points = {}
+        dag.duration = circuit_duration
 
-        return new_dag
+        return dag
 
     def _pre_runhook(self, dag: DAGCircuit):
         """Extra routine inserted before running the padding pass.
@@ -170,7 +167,10 @@ class BasePadding(TransformationPass):
     ):
         """Add new operation to DAG with scheduled information.
 
-        This is identical to apply_operation_back + updating the node_start_time propety.
+        This is identical to apply_operation_back + updating the node_start_time propety,
+        except that while the pass runs the operation is inserted in front of the node
+        following the interval being padded on each of its wires, rather than at the end
+        of the circuit.
 
         Args:
             dag: DAG circuit on which the sequence is applied.
@@ -184,7 +184,13 @@ class BasePadding(TransformationPass):
         if isinstance(clbits, Clbit):
             clbits = [clbits]
 
-        new_node = dag.apply_operation_back(oper, qargs=qubits, cargs=clbits)
+        qubits = tuple(qubits)
+        clbits = tuple(clbits) if clbits is not None else ()
+        points = self._insertion_points
+        if points and all(bit in points for bit in qubits + clbits):
+            new_node = _insert_between(dag, oper, qubits, clbits, points)
+        else:
+            new_node = dag.apply_operation_back(oper, qargs=qubits, cargs=clbits)
         self.property_set["node_start_time"][new_node] = t_start
 
     def _pad(
@@ -222,3 +228,37 @@ class BasePadding(TransformationPass):
             prev_node: Node ahead of the sequence.
         """
         raise NotImplementedError
+
+
+def _wire_predecessor(dag: DAGCircuit, node: DAGNode, wire: Union[Qubit, Clbit]) -> DAGNode:
+    """Return the node preceding ``node`` on ``wire``."""
+    return dag._multi_graph.find_predecessors_by_edge(node._node_id, lambda edge: edge == wire)[0]
+
+
+def _insert_between(
+    dag: DAGCircuit,
+    oper: Instruction,
+    qubits: Tuple[Qubit, ...],
+    clbits: Tuple[Clbit, ...],
+    insertion_points: Dict[Union[Qubit, Clbit], List[int]],
+) -> DAGOpNode:
+    """Insert a new operation on its wires in between the nodes given by ``insertion_points``,
+    which are then updated so that the next operation is inserted after this one."""
+    graph = dag._multi_graph
+    node_index = dag._add_op_node(oper, qubits, clbits)
+    for wire in qubits + clbits:
+        point = insertion_points[wire]
+        prev_index, next_index = point
+        # There may be parallel edges for other wires between the two nodes, so they are all
+        # removed and only the edge of this wire is rerouted through the new node.
+        wires = graph.get_all_edge_data(prev_index, next_index)
+        for _ in wires:
+            graph.remove_edge(prev_index, next_index)
+        for edge_wire in wires:
+            if edge_wire == wire:
+                graph.add_edge(prev_index, node_index, edge_wire)
+                graph.add_edge(node_index, next_index, edge_wire)
+            else:
+                graph.add_edge(prev_index, next_index, edge_wire)
+        point[0] = node_index
+    return graph[node_index]
@@ -12,7 +12,7 @@
 
 """Dynamical Decoupling insertion pass."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 from qiskit.circuit import Qubit, Gate
@@ -160,6 +160,11 @@ class PadDynamicalDecoupling(BasePadding):
 
         self._dd_sequence_lengths = dict()
         self._sequence_phase = 0
+        # Euler angles and phase of the inverse of a single gate DD sequence.
+        self._inverse_angles = None
+        self._sequence_checked = False
+        # Spaced DD sequences keyed on the qubit and the length of the idle period.
+        self._sequence_cache = {}
 
     def _pre_runhook(self, dag: DAGCircuit):
         super()._pre_runhook(dag)
@@ -182,20 +187,29 @@ class PadDynamicalDecoupling(BasePadding):
                     "of the slack period and sum to 1."
                 )
 
-        # Check if DD sequence is identity
-        if num_pulses != 1:
-            if num_pulses % 2 != 0:
-                raise TranspilerError("DD sequence must contain an even number of gates (or 1).")
-            noop = np.eye(2)
-            for gate in self._dd_sequence:
-                noop = noop.dot(gate.to_matrix())
-            if not matrix_equal(noop, IGate().to_matrix(), ignore_phase=True):
-                raise TranspilerError("The DD sequence does not make an identity operation.")
-            self._sequence_phase = np.angle(noop[0][0])
+        # Check if DD sequence is identity. The sequence is fixed for the pass instance,
+        # so this only needs to be done on the first run.
+        if not self._sequence_checked:
+            if num_pulses == 1:
+                u_inv = self._dd_sequence[0].inverse().to_matrix()
+                self._inverse_angles = OneQubitEulerDecomposer().angles_and_phase(u_inv)
+            else:
+                if num_pulses % 2 != 0:
+                    raise TranspilerError(
+                        "DD sequence must contain an even number of gates (or 1)."
+                    )
+                noop = np.eye(2)
+                for gate in self._dd_sequence:
+                    noop = noop.dot(gate.to_matrix())
+                if not matrix_equal(noop, IGate().to_matrix(), ignore_phase=True):
+                    raise TranspilerError("The DD sequence does not make an identity operation.")
+                self._sequence_phase = np.angle(noop[0][0])
+            self._sequence_checked = True
 
         # Precompute qubit-wise DD sequence length for performance
-        for qubit in dag.qubits:
-            physical_index = dag.qubits.index(qubit)
+        self._dd_sequence_lengths = {}
+        self._sequence_cache = {}
+        for physical_index, qubit in enumerate(dag.qubits):
             if self._qubits and physical_index not in self._qubits:
                 continue
 
@@ -264,7 +278,7 @@ class PadDynamicalDecoupling(BasePadding):
         # As you can see, constraints on t0 are all satified without explicit scheduling.
         time_interval = t_end - t_start
 
-        if self._qubits and dag.qubits.index(qubit) not in self._qubits:
+        if qubit not in self._dd_sequence_lengths:
             # Target physical qubit is not the target of this DD sequence.
             self._apply_scheduled_op(dag, t_start, Delay(time_interval, dag.unit), qubit)
             return
@@ -276,18 +290,21 @@ class PadDynamicalDecoupling(BasePadding):
             self._apply_scheduled_op(dag, t_start, Delay(time_interval, dag.unit), qubit)
             return
 
-        slack = time_interval - np.sum(self._dd_sequence_lengths[qubit])
+        key = (qubit, time_interval)
+        try:
+            sequence = self._sequence_cache[key]
+        except KeyError:
+            sequence = self._sequence_cache[key] = self._spaced_sequence(qubit, time_interval)
         sequence_gphase = self._sequence_phase
 
-        if slack <= 0:
+        if sequence is None:
             # Interval too short.
             self._apply_scheduled_op(dag, t_start, Delay(time_interval, dag.unit), qubit)
             return
 
         if len(self._dd_sequence) == 1:
             # Special case of using a single gate for DD
-            u_inv = self._dd_sequence[0].inverse().to_matrix()
-            theta, phi, lam, phase = OneQubitEulerDecomposer().angles_and_phase(u_inv)
+            theta, phi, lam, phase = self._inverse_angles
             if isinstance(next_node, DAGOpNode) and isinstance(next_node.op, (UGate, U3Gate)):
                 # Absorb the inverse into the successor (from left in circuit)
                 theta_r, phi_r, lam_r = next_node.op.params
@@ -307,6 +324,27 @@ class PadDynamicalDecoupling(BasePadding):
                 self._apply_scheduled_op(dag, t_start, Delay(time_interval, dag.unit), qubit)
                 return
 
+        # Construct DD sequence with delays
+        idle_after = t_start
+        for gate, duration in sequence:
+            if gate is None:
+                self._apply_scheduled_op(dag, idle_after, Delay(duration, dag.unit), qubit)
+            else:
+                self._apply_scheduled_op(dag, idle_after, gate, qubit)
+            idle_after += duration
+
+        dag.global_phase = self._mod_2pi(dag.global_phase + sequence_gphase)
+
+    def _spaced_sequence(self, qubit: Qubit, time_interval: int) -> Optional[List[Tuple]]:
+        """Return the DD sequence filling an idle period of ``time_interval`` on ``qubit``.
+
+        The sequence is a list of ``(gate, duration)`` pairs, where ``gate`` is ``None``
+        for the delays in between the DD gates, or ``None`` if the DD gates do not fit.
+        """
+        slack = time_interval - np.sum(self._dd_sequence_lengths[qubit])
+        if slack <= 0:
+            return None
+
         def _constrained_length(values):
             return self._alignment * np.floor(values / self._alignment)
 
@@ -333,22 +371,17 @@ class PadDynamicalDecoupling(BasePadding):
                 f"Option extra_slack_distribution = {self._extra_slack_distribution} is invalid."
             )
 
-        # (3) Construct DD sequence with delays
-        num_elements = max(len(self._dd_sequence), len(taus))
-        idle_after = t_start
-        for dd_ind in range(num_elements):
+        # (3) Interleave the DD gates with the delays
+        sequence = []
+        for dd_ind in range(max(len(self._dd_sequence), len(taus))):
             if dd_ind < len(taus):
                 tau = taus[dd_ind]
                 if tau > 0:
-                    self._apply_scheduled_op(dag, idle_after, Delay(tau, dag.unit), qubit)
-                    idle_after += tau
+                    sequence.append((None, tau))
             if dd_ind < len(self._dd_sequence):
                 gate = self._dd_sequence[dd_ind]
-                gate_length = self._dd_sequence_lengths[qubit][dd_ind]
-                self._apply_scheduled_op(dag, idle_after, gate, qubit)
-                idle_after += gate_length
-
-        dag.global_phase = self._mod_2pi(dag.global_phase + sequence_gphase)
+                sequence.append((gate, self._dd_sequence_lengths[qubit][dd_ind]))
+        return sequence
 
     @staticmethod
     def _mod_2pi(angle: float, atol: float = 0):
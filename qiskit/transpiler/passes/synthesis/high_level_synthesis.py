@@ -15,10 +15,12 @@
 
 
 from qiskit.converters import circuit_to_dag
+from qiskit.tools.parallel import parallel_map
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 from qiskit.transpiler.exceptions import TranspilerError
-from qiskit.quantum_info import decompose_clifford
+from qiskit.quantum_info import Clifford, decompose_clifford
+from qiskit.circuit.library import LinearFunction
 from qiskit.transpiler.synthesis import cnot_synth
 from .plugin import HighLevelSynthesisPluginManager, HighLevelSynthesisPlugin
 
@@ -89,7 +91,17 @@ class HighLevelSynthesis(TransformationPass):
     ``default`` methods for all other high-level objects, including ``op_a``-objects.
     """
 
-    def __init__(self, hls_config=None):
+    def __init__(self, hls_config=None, num_processes=1):
+        """HighLevelSynthesis initializer.
+
+        Args:
+            hls_config (HLSConfig): the high-level-synthesis config. If ``None``, the "default"
+                method is used for every higher-level object that has one.
+            num_processes (int): the number of processes used to synthesize the distinct
+                higher-level objects of a circuit concurrently. The default ``1`` synthesizes
+                them one after the other in the calling process, which is usually faster
+                unless the individual syntheses are expensive.
+        """
         super().__init__()
 
         if hls_config is not None:
@@ -98,9 +110,14 @@ class HighLevelSynthesis(TransformationPass):
             # When the config file is not provided, we will use the "default" method
             # to synthesize Operations (when available).
             self.hls_config = HLSConfig(True)
+        self.num_processes = num_processes
 
     def run(self, dag: DAGCircuit) -> DAGCircuit:
         """Run the HighLevelSynthesis pass on `dag`.
+
+        Identical higher-level objects with the same synthesis methods, such as equal
+        Cliffords or linear functions, are only synthesized once.
+
         Args:
             dag: input dag.
         Returns:
@@ -113,6 +130,10 @@ class HighLevelSynthesis(TransformationPass):
 
         hls_plugin_manager = HighLevelSynthesisPluginManager()
 
+        # the nodes to synthesize, with the index of their task, and the distinct tasks
+        nodes = []
+        tasks = []
+        task_indices = {}
         for node in dag.op_nodes():
 
             if node.name in self.hls_config.methods.keys():
@@ -130,30 +151,82 @@ class HighLevelSynthesis(TransformationPass):
             else:
                 methods = []
 
-            for method in methods:
-                plugin_name, plugin_args = method
+            if not methods:
+                continue
 
+            for plugin_name, _ in methods:
                 if plugin_name not in hls_plugin_manager.method_names(node.name):
                     raise TranspilerError(
                         "Specified method: %s not found in available plugins for %s"
                         % (plugin_name, node.name)
                     )
 
-                plugin_method = hls_plugin_manager.method(node.name, plugin_name)
+            key = _synthesis_key(node.op, methods)
+            if key is None or key not in task_indices:
+                if key is not None:
+                    task_indices[key] = len(tasks)
+                nodes.append((node, len(tasks)))
+                tasks.append((node.op, methods))
+            else:
+                nodes.append((node, task_indices[key]))
 
-                # ToDo: similarly to UnitarySynthesis, we should pass additional parameters
-                #       e.g. coupling_map to the synthesis algorithm.
-                decomposition = plugin_method.run(node.op, **plugin_args)
+        if self.num_processes > 1 and len(tasks) > 1:
+            decompositions = parallel_map(_synthesize, tasks, num_processes=self.num_processes)
+        else:
+            decompositions = [_synthesize(task, hls_plugin_manager) for task in tasks]
 
-                # The synthesis methods that are not suited for the given higher-level-object
-                # will return None, in which case the next method in the list will be used.
-                if decomposition is not None:
-                    dag.substitute_node_with_dag(node, circuit_to_dag(decomposition))
-                    break
+        for node, index in nodes:
+            decomposition = decompositions[index]
+            # The synthesis methods that are not suited for the given higher-level-object
+            # return None, in which case the node is kept.
+            if decomposition is not None:
+                dag.substitute_node_with_dag(node, circuit_to_dag(decomposition))
 
         return dag
 
 
+def _synthesize(task, hls_plugin_manager=None):
+    """Synthesize ``task = (operation, methods)`` with the first of the methods that does not
+    return ``None``."""
+    operation, methods = task
+    if hls_plugin_manager is None:
+        hls_plugin_manager = HighLevelSynthesisPluginManager()
+
+    for plugin_name, plugin_args in methods:
+        plugin_method = hls_plugin_manager.method(operation.name, plugin_name)
+
+        # ToDo: similarly to UnitarySynthesis, we should pass additional parameters
+        #       e.g. coupling_map to the synthesis algorithm.
+        decomposition = plugin_method.run(operation, **plugin_args)
+
+        # The synthesis methods that are not suited for the given higher-level-object
+        # will return None, in which case the next method in the list will be used.
+        if decomposition is not None:
+            return decomposition
+    return None
+
+
+def _synthesis_key(operation, methods):
+    """Return a hashable key identifying the synthesis of ``operation`` with ``methods``, or
+    ``None`` if the data of the operation cannot be compared cheaply."""
+    if isinstance(operation, Clifford):
+        data = operation.tableau
+    elif isinstance(operation, LinearFunction):
+        data = operation.linear
+    else:
+        return None
+    try:
+        methods_key = tuple(
+            (plugin_name, tuple(sorted(plugin_args.items())))
+            for plugin_name, plugin_args in methods
+        )
+        hash(methods_key)
+    except TypeError:
+        # unhashable or unorderable plugin arguments
+        return None
+    return (operation.name, data.shape, data.tobytes(), methods_key)
+
+
 class DefaultSynthesisClifford(HighLevelSynthesisPlugin):
     """The default clifford synthesis plugin."""
 
@@ -320,8 +320,9 @@ class UnitarySynthesis(TransformationPass):
                 dag, plugin_method, plugin_kwargs, default_method, default_kwargs
             )
 
+        block_cache = {}
         for node in dag.op_nodes(ControlFlowOp):
-            node.op = control_flow.map_blocks(_recurse, node.op)
+            node.op = control_flow.map_blocks(_recurse, node.op, block_cache)
 
         dag_bit_indices = (
             {bit: i for i, bit in enumerate(dag.qubits)}
@@ -441,15 +442,19 @@ class DefaultUnitarySynthesis(plugin.UnitarySynthesisPlugin):
     def __init__(self):
         super().__init__()
         self._decomposer_cache = {}
+        self._basis_decomposer_cache = {}
+        # The candidate decomposers only depend on the target (and ``pulse_optimize``), not on
+        # the qubits, so they are built once and shared by every pair of qubits.
+        self._target_decomposers = None
+
+    def _decomposers_2q_from_target(self, target, pulse_optimize):
+        if self._target_decomposers is not None:
+            cached_target, cached_pulse_optimize, decomposers_2q = self._target_decomposers
+            if cached_target is target and cached_pulse_optimize == pulse_optimize:
+                return decomposers_2q
+        # A different target invalidates the choices made for each pair of qubits too.
+        self._decomposer_cache = {}
 
-    def _find_decomposer_2q_from_target(self, target, qubits, pulse_optimize):
-        qubits_tuple = tuple(qubits)
-        reverse_tuple = (qubits[1], qubits[0])
-        if qubits_tuple in self._decomposer_cache:
-            return self._decomposer_cache[qubits_tuple]
-
-        matching = {}
-        reverse = {}
         kak_gates = _find_matching_kak_gates(target)
         euler_basis_gates = _find_matching_euler_bases(target)
         decomposers_2q = []
@@ -477,6 +482,18 @@ class DefaultUnitarySynthesis(plugin.UnitarySynthesisPlugin):
                     decomposer.gate_name = gate_name
                 decomposers_2q.append(decomposer)
 
+        self._target_decomposers = (target, pulse_optimize, decomposers_2q)
+        return decomposers_2q
+
+    def _find_decomposer_2q_from_target(self, target, qubits, pulse_optimize):
+        qubits_tuple = tuple(qubits)
+        reverse_tuple = (qubits[1], qubits[0])
+        decomposers_2q = self._decomposers_2q_from_target(target, pulse_optimize)
+        if qubits_tuple in self._decomposer_cache:
+            return self._decomposer_cache[qubits_tuple]
+
+        matching = {}
+        reverse = {}
         # Find lowest error matching or reverse decomposer and use that
         for index, decomposer in enumerate(decomposers_2q):
             gate_name = getattr(decomposer, "gate_name", decomposer.gate.name)
@@ -533,7 +550,9 @@ class DefaultUnitarySynthesis(plugin.UnitarySynthesisPlugin):
         wires = None
         if unitary.shape == (2, 2):
             if target is not None:
-                euler_basis = _choose_euler_basis(target.operation_names_for_qargs(tuple(qubits)))
+                euler_basis = _choose_euler_basis(
+                    target.compile().operation_names_for_qargs(tuple(qubits))
+                )
             else:
                 euler_basis = _choose_euler_basis(basis_gates)
             if euler_basis is not None:
@@ -550,9 +569,12 @@ class DefaultUnitarySynthesis(plugin.UnitarySynthesisPlugin):
                     target, qubits, pulse_optimize
                 )
             else:
-                decomposer2q = _basis_gates_to_decomposer_2q(
-                    basis_gates, pulse_optimize=pulse_optimize
-                )
+                cache_key = (frozenset(basis_gates or ()), pulse_optimize)
+                if cache_key not in self._basis_decomposer_cache:
+                    self._basis_decomposer_cache[cache_key] = _basis_gates_to_decomposer_2q(
+                        basis_gates, pulse_optimize=pulse_optimize
+                    )
+                decomposer2q = self._basis_decomposer_cache[cache_key]
             if not decomposer2q:
                 return None
             synth_dag, wires = self._synth_natural_direction(
@@ -26,6 +26,7 @@ from .error import Error
 from .remove_barriers import RemoveBarriers
 from .contains_instruction import ContainsInstruction
 from .gates_basis import GatesInBasis
+from .check_compatibility import CheckCompatibility
 from .convert_conditions_to_if_ops import ConvertConditionsToIfOps
 
 # Utility functions
@@ -0,0 +1,124 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Check if a DAG circuit already conforms to a backend."""
+
+from qiskit.circuit import ControlFlowOp, Delay
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler.basepasses import AnalysisPass
+
+
+class CheckCompatibility(AnalysisPass):
+    """Check if a DAG circuit already conforms to a backend, taking its i-th qubit as the i-th
+    physical qubit.
+
+    This pass combines the checks of :class:`.GatesInBasis`, :class:`.CheckMap`,
+    :class:`.CheckGateDirection` and :class:`.InstructionDurationCheck` in a single traversal of
+    the circuit, including the blocks of its control-flow operations. The circuit is compatible
+    if all its instructions are in the basis (or supported by the target on their qubits), all its
+    two-qubit gates act on coupled qubits in a supported direction, it has no gates on more qubits
+    unless the target supports them, and the durations of its delays and calibrations respect the
+    alignment constraints. The result is stored in the property ``is_compatible``.
+
+    The pass only sets ``is_compatible``, so that it can run before the passes it combines without
+    affecting the conditions that depend on their properties.
+    """
+
+    def __init__(self, basis_gates=None, coupling_map=None, target=None, timing_constraints=None):
+        """CheckCompatibility initializer.
+
+        Args:
+            basis_gates (list): The list of strings representing the set of basis gates.
+            coupling_map (CouplingMap): Directed graph representing a coupling map.
+            target (Target): The target representing the backend. If specified this will be
+                used instead of the ``basis_gates`` and ``coupling_map`` parameters.
+            timing_constraints (TimingConstraints): Hardware time alignment restrictions.
+        """
+        super().__init__()
+        self._basis_gates = None
+        if basis_gates is not None:
+            self._basis_gates = set(basis_gates).union(
+                {"measure", "reset", "barrier", "snapshot", "delay"}
+            )
+        self.coupling_map = coupling_map
+        self.target = target
+        self.timing_constraints = timing_constraints
+
+    def run(self, dag):
+        """Run the CheckCompatibility pass on `dag`.
+
+        Args:
+            dag (DAGCircuit): DAG to check.
+        """
+        num_qubits = None
+        if self.target is not None:
+            num_qubits = self.target.num_qubits
+        elif self.coupling_map is not None and len(self.coupling_map.graph):
+            num_qubits = self.coupling_map.size()
+        if num_qubits is not None and dag.num_qubits() > num_qubits:
+            self.property_set["is_compatible"] = False
+            return
+
+        edges = None
+        if self.target is None and self.coupling_map is not None and len(self.coupling_map.graph):
+            edges = set(self.coupling_map.get_edges())
+        alignments = None
+        if self.timing_constraints is not None:
+            alignments = {
+                self.timing_constraints.acquire_alignment,
+                self.timing_constraints.pulse_alignment,
+            } - {1}
+        target = None if self.target is None else self.target.compile()
+        self.property_set["is_compatible"] = self._visit(
+            dag, {bit: index for index, bit in enumerate(dag.qubits)}, target, edges, alignments
+        )
+
+    def _visit(self, dag, wire_map, target, edges, alignments):
+        if alignments and not all(
+            _is_aligned(schedule.duration, alignments)
+            for gate_cals in dag.calibrations.values()
+            for schedule in gate_cals.values()
+        ):
+            return False
+        for node in dag.op_nodes():
+            name = node.op.name
+            # Barrier is universal and supported by all backends
+            if name == "barrier":
+                continue
+            qargs = tuple(wire_map[bit] for bit in node.qargs)
+            if target is not None:
+                if not target.instruction_supported(name, qargs):
+                    return False
+            elif self._basis_gates is not None and name not in self._basis_gates:
+                return False
+            if isinstance(node.op, ControlFlowOp):
+                for block in node.op.blocks:
+                    inner_wire_map = {
+                        inner: wire_map[outer] for outer, inner in zip(node.qargs, block.qubits)
+                    }
+                    if not self._visit(
+                        circuit_to_dag(block), inner_wire_map, target, edges, alignments
+                    ):
+                        return False
+            elif getattr(node.op, "_directive", False):
+                continue
+            elif isinstance(node.op, Delay):
+                if alignments and not _is_aligned(node.op.duration, alignments):
+                    return False
+            elif edges is not None and len(qargs) > 1 and not dag.has_calibration_for(node):
+                if len(qargs) > 2 or qargs not in edges:
+                    return False
+        return True
+
+
+def _is_aligned(duration, alignments):
+    return all(duration % alignment == 0 for alignment in alignments)
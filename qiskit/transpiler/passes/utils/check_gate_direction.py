@@ -54,6 +54,7 @@ class CheckGateDirection(AnalysisPass):
         return True
 
     def _target_visit(self, dag, wire_map):
+        target = self.target.compile()
         # Don't include directives to avoid things like barrier, which are assumed always supported.
         for node in dag.op_nodes(include_directives=False):
             if isinstance(node.op, ControlFlowOp):
@@ -63,7 +64,7 @@ class CheckGateDirection(AnalysisPass):
                     }
                     if not self._target_visit(circuit_to_dag(block), inner_wire_map):
                         return False
-            elif len(node.qargs) == 2 and not self.target.instruction_supported(
+            elif len(node.qargs) == 2 and not target.instruction_supported(
                 node.op.name, (wire_map[node.qargs[0]], wire_map[node.qargs[1]])
             ):
                 return False
@@ -13,19 +13,115 @@
 """Internal utilities for working with control-flow operations."""
 
 import functools
-from typing import Callable
+from typing import Callable, Hashable, Optional
 
-from qiskit.circuit import ControlFlowOp
+from qiskit.circuit import (
+    Barrier,
+    ControlFlowOp,
+    ControlledGate,
+    Delay,
+    Measure,
+    QuantumCircuit,
+    Reset,
+)
 from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.dagcircuit import DAGCircuit
 
+_STANDARD_GATES_MODULE = "qiskit.circuit.library.standard_gates"
 
-def map_blocks(dag_mapping: Callable[[DAGCircuit], DAGCircuit], op: ControlFlowOp) -> ControlFlowOp:
+
+def map_blocks(
+    dag_mapping: Callable[[DAGCircuit], DAGCircuit], op: ControlFlowOp, cache: Optional[dict] = None
+) -> ControlFlowOp:
     """Use the ``dag_mapping`` function to replace the blocks of a :class:`.ControlFlowOp` with new
     ones.  Each block will be automatically converted to a :class:`.DAGCircuit` and then returned
-    to a :class:`.QuantumCircuit`."""
-    return op.replace_blocks(
-        [dag_to_circuit(dag_mapping(circuit_to_dag(block))) for block in op.blocks]
+    to a :class:`.QuantumCircuit`.
+
+    If ``cache`` is given, it is a dictionary shared between calls that stores the mapped blocks by
+    their :func:`block_key`, so that ``dag_mapping`` is only called once on each distinct block.
+    The following identical blocks are replaced by copies of the mapped block, so that the
+    operations never share a block.  This is only valid if the output of ``dag_mapping`` depends on
+    nothing but its input."""
+    if cache is None:
+        return op.replace_blocks(
+            [dag_to_circuit(dag_mapping(circuit_to_dag(block))) for block in op.blocks]
+        )
+    new_blocks = []
+    for block in op.blocks:
+        key = block_key(block)
+        if key is None:
+            new_blocks.append(dag_to_circuit(dag_mapping(circuit_to_dag(block))))
+            continue
+        if key in cache:
+            new_blocks.append(cache[key][1].copy())
+            continue
+        new_block = dag_to_circuit(dag_mapping(circuit_to_dag(block)))
+        # The block is stored with its mapping to keep the operations it holds alive, as the key
+        # may contain their ids.
+        cache[key] = (block, new_block)
+        new_blocks.append(new_block)
+    return op.replace_blocks(new_blocks)
+
+
+def block_key(block: QuantumCircuit) -> Optional[Hashable]:
+    """Get a hashable key of the structure of the control-flow block ``block``, such that blocks
+    with equal keys are equal up to their names.  Unlike :meth:`.QuantumCircuit.__eq__`, this does
+    not build the definitions of the operations or compare parameters approximately.
+
+    Operations from the standard library are compared by value, and other operations by identity,
+    as their definitions are not determined by their parameters.  Returns ``None`` if the block has
+    calibrations, metadata or unhashable parameters, in which case it should not be cached."""
+    if block.calibrations or block.metadata:
+        return None
+    key = (
+        tuple(block.qubits),
+        tuple(block.clbits),
+        tuple(block.qregs),
+        tuple(block.cregs),
+        block.global_phase,
+        block.duration,
+        block.unit,
+    )
+    instructions = []
+    for instruction in block.data:
+        operation_key = _operation_key(instruction.operation)
+        if operation_key is None:
+            return None
+        instructions.append((operation_key, instruction.qubits, instruction.clbits))
+    key += tuple(instructions)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _operation_key(operation):
+    params = []
+    for param in getattr(operation, "params", ()):
+        if isinstance(param, QuantumCircuit):
+            param = block_key(param)
+            if param is None:
+                return None
+        params.append((type(param), param))
+    if isinstance(operation, ControlFlowOp) or (
+        type(operation).__module__.startswith(_STANDARD_GATES_MODULE)
+        or type(operation) in (Barrier, Delay, Measure, Reset)
+    ):
+        identity = type(operation)
+    else:
+        identity = id(operation)
+    return (
+        identity,
+        operation.name,
+        operation.num_qubits,
+        operation.num_clbits,
+        tuple(params),
+        operation.ctrl_state if isinstance(operation, ControlledGate) else None,
+        getattr(operation, "label", None),
+        getattr(operation, "condition", None),
+        getattr(operation, "duration", None),
+        getattr(operation, "unit", None),
     )
 
 
@@ -48,11 +144,14 @@ def trivial_recurse(method):
 
     @functools.wraps(method)
     def out(self, dag):
+        # Identical blocks, which are common in circuits with many branches, are only run once.
+        cache = {}
+
         def bound_wrapped_method(dag):
-            return out(self, dag)
+            for node in dag.op_nodes(ControlFlowOp):
+                node.op = map_blocks(bound_wrapped_method, node.op, cache)
+            return method(self, dag)
 
-        for node in dag.op_nodes(ControlFlowOp):
-            node.op = map_blocks(bound_wrapped_method, node.op)
-        return method(self, dag)
+        return bound_wrapped_method(dag)
 
     return out
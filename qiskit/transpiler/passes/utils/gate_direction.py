@@ -140,6 +140,7 @@ class GateDirection(TransformationPass):
         return dag
 
     def _run_target(self, dag, wire_map):
+        target = self.target.compile()
         # Don't include directives to avoid things like barrier, which are assumed always supported.
         for node in dag.op_nodes(include_directives=False):
             if isinstance(node.op, ControlFlowOp):
@@ -161,9 +162,9 @@ class GateDirection(TransformationPass):
             qargs = (wire_map[node.qargs[0]], wire_map[node.qargs[1]])
             swapped = (qargs[1], qargs[0])
             if node.name in self._static_replacements:
-                if self.target.instruction_supported(node.name, qargs):
+                if target.instruction_supported(node.name, qargs):
                     continue
-                if self.target.instruction_supported(node.name, swapped):
+                if target.instruction_supported(node.name, swapped):
                     dag.substitute_node_with_dag(node, self._static_replacements[node.name])
                 else:
                     raise TranspilerError(
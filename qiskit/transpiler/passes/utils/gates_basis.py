@@ -43,13 +43,14 @@ class GatesInBasis(AnalysisPass):
             return
         gates_out_of_basis = False
         if self._target is not None:
+            target = self._target.compile()
 
             def _visit_target(dag, wire_map):
                 for gate in dag.op_nodes():
                     # Barrier is universal and supported by all backends
                     if gate.name == "barrier":
                         continue
-                    if not self._target.instruction_supported(
+                    if not target.instruction_supported(
                         gate.name, tuple(wire_map[bit] for bit in gate.qargs)
                     ):
                         return True
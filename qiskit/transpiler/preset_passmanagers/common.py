@@ -47,6 +47,8 @@ from qiskit.transpiler.passes import InstructionDurationCheck
 from qiskit.transpiler.passes import ConstrainedReschedule
 from qiskit.transpiler.passes import PulseGates
 from qiskit.transpiler.passes import ContainsInstruction
+from qiskit.transpiler.passes import CheckCompatibility
+from qiskit.transpiler.passes import TrivialLayout
 from qiskit.transpiler.passes import VF2PostLayout
 from qiskit.transpiler.passes.layout.vf2_layout import VF2LayoutStopReason
 from qiskit.transpiler.passes.layout.vf2_post_layout import VF2PostLayoutStopReason
@@ -153,6 +155,50 @@ def if_has_control_flow_else(if_present, if_absent):
     return out
 
 
+def _is_compatible(property_set):
+    return property_set["is_compatible"]
+
+
+def _not_compatible(property_set):
+    return not property_set["is_compatible"]
+
+
+def generate_skip_compatible_passmanager(
+    pass_manager, basis_gates=None, coupling_map=None, target=None, timing_constraints=None
+):
+    """Generate a pass manager that only runs ``pass_manager`` on the circuits that do not already
+    conform to the backend, as checked by :class:`.CheckCompatibility`.
+
+    The circuits that conform are laid out on the coupling map with the trivial layout and then
+    only go through the ``scheduling`` stage of ``pass_manager``, if it is a
+    :class:`.StagedPassManager` with one.
+
+    Args:
+        pass_manager (PassManager): The pass manager to run on the circuits that do not conform.
+        basis_gates (list): The list of basis gate names of the backend.
+        coupling_map (CouplingMap): The coupling map of the backend.
+        target (Target): The target of the backend. If specified this will be used instead of
+            the ``basis_gates`` and ``coupling_map`` to check the circuits.
+        timing_constraints (TimingConstraints): Hardware time alignment restrictions.
+
+    Returns:
+        PassManager: The pass manager skipping the circuits that already conform.
+    """
+    compatible = PassManager()
+    if coupling_map:
+        compatible.append(TrivialLayout(coupling_map))
+        compatible += generate_embed_passmanager(coupling_map)
+    scheduling = getattr(pass_manager, "scheduling", None)
+    if scheduling is not None:
+        compatible += scheduling
+    out = PassManager()
+    out.append(CheckCompatibility(basis_gates, coupling_map, target, timing_constraints))
+    if len(compatible):
+        out.append(compatible.to_flow_controller(), condition=_is_compatible)
+    out.append(pass_manager.to_flow_controller(), condition=_not_compatible)
+    return out
+
+
 def generate_unroll_3q(
     target,
     basis_gates=None,
@@ -79,11 +79,10 @@ class RunningPassManager:
         """
         # attaches the property set to the controller so it has access to it.
         if isinstance(passes, ConditionalController):
-            passes.condition = partial(passes.condition, self.fenced_property_set)
+            passes.condition = self._bind(passes.condition)
             self.working_list.append(passes)
         if isinstance(passes, DoWhileController):
-            if not isinstance(passes.do_while, partial):
-                passes.do_while = partial(passes.do_while, self.fenced_property_set)
+            passes.do_while = self._bind(passes.do_while)
             self.working_list.append(passes)
         else:
             flow_controller_conditions = self._normalize_flow_controller(flow_controller_conditions)
@@ -94,6 +93,25 @@ class RunningPassManager:
             )
             pass
 
+    def _bind(self, controller_callable):
+        """Bind a condition of a flow controller to the property set of this run.
+
+        The flow controllers nested in a pass manager are shared by all its runs, so their
+        conditions may still be bound to the property set of a previous run."""
+        if (
+            isinstance(controller_callable, partial)
+            and controller_callable.args
+            and isinstance(controller_callable.args[-1], FencedPropertySet)
+        ):
+            if controller_callable.args[-1] is self.fenced_property_set:
+                return controller_callable
+            controller_callable = partial(
+                controller_callable.func,
+                *controller_callable.args[:-1],
+                **controller_callable.keywords,
+            )
+        return partial(controller_callable, self.fenced_property_set)
+
     def _normalize_flow_controller(self, flow_controller):
         for name, param in flow_controller.items():
             if callable(param):
@@ -177,13 +195,11 @@ class RunningPassManager:
         # if provided a nested flow controller
         elif isinstance(pass_, FlowController):
 
-            if isinstance(pass_, ConditionalController) and not isinstance(
-                pass_.condition, partial
-            ):
-                pass_.condition = partial(pass_.condition, self.fenced_property_set)
+            if isinstance(pass_, ConditionalController):
+                pass_.condition = self._bind(pass_.condition)
 
-            elif isinstance(pass_, DoWhileController) and not isinstance(pass_.do_while, partial):
-                pass_.do_while = partial(pass_.do_while, self.fenced_property_set)
+            elif isinstance(pass_, DoWhileController):
+                pass_.do_while = self._bind(pass_.do_while)
 
             for _pass in pass_:
                 dag = self._do_pass(_pass, dag, pass_.options)
@@ -37,6 +37,7 @@ The individual classes are:
     CNOTUnitCircuit
     CNOTUnitObjective
     DefaultCNOTUnitObjective
+    FastCNOTUnitObjective
 
 
 Mathematical Detail
@@ -137,7 +138,7 @@ A basic usage of the AQC algorithm should consist of the following steps::
     approximate_circuit = CNOTUnitCircuit(num_qubits=num_qubits, cnots=cnots)
 
     # Create an objective that defines our optimization problem
-    approximating_objective = DefaultCNOTUnitObjective(num_qubits=num_qubits, cnots=cnots)
+    approximating_objective = FastCNOTUnitObjective(num_qubits=num_qubits, cnots=cnots)
 
     # Run optimization process to compile the unitary
     aqc.compile_unitary(
@@ -164,4 +165,4 @@ from .aqc import AQC
 from .aqc_plugin import AQCSynthesisPlugin
 from .cnot_structures import make_cnot_network
 from .cnot_unit_circuit import CNOTUnitCircuit
-from .cnot_unit_objective import CNOTUnitObjective, DefaultCNOTUnitObjective
+from .cnot_unit_objective import CNOTUnitObjective, DefaultCNOTUnitObjective, FastCNOTUnitObjective
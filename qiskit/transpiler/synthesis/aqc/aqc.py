@@ -16,6 +16,7 @@ import numpy as np
 
 from qiskit.algorithms.optimizers import L_BFGS_B, Optimizer
 from qiskit.quantum_info import Operator
+from qiskit.tools.parallel import parallel_map
 from .approximate import ApproximateCircuit, ApproximatingObjective
 
 
@@ -35,16 +36,20 @@ class AQC:
 
     * Approximate objective is tightly coupled with the approximate circuit implementation and
       provides two methods for computing objective function and gradient with respect to approximate
-      circuit parameters. This objective is passed to the optimizer. Currently, there's only one
-      implementation based on 4-rotations CNOT unit blocks: :class:`.DefaultCNOTUnitObjective`. This
-      is a naive implementation of the objective function and gradient and may suffer from performance
-      issues.
+      circuit parameters. This objective is passed to the optimizer. There are two implementations
+      based on 4-rotations CNOT unit blocks: :class:`.DefaultCNOTUnitObjective`, which is a naive
+      implementation of the objective function and gradient and may suffer from performance issues,
+      and :class:`.FastCNOTUnitObjective`, which computes the same values much faster.
+
+    The optimization may be restarted from several random initial points, in which case the
+    optimizations are run in parallel and the best result is kept.
     """
 
     def __init__(
         self,
         optimizer: Optional[Optimizer] = None,
         seed: Optional[int] = None,
+        num_restarts: int = 1,
     ):
         """
         Args:
@@ -52,10 +57,20 @@ class AQC:
                 the best approximate circuit. By default :obj:`.L_BFGS_B` is used with max iterations
                 is set to 1000.
             seed: a seed value to be user by a random number generator.
+            num_restarts: a number of optimizations to run, each one from a different initial
+                point. The first one starts from the initial point passed to
+                :meth:`compile_unitary`, if any, and the other ones from random points. The
+                optimizations are run in parallel and the best result is kept.
+
+        Raises:
+            ValueError: if ``num_restarts`` is not positive.
         """
         super().__init__()
+        if num_restarts < 1:
+            raise ValueError(f"The number of restarts must be positive, got {num_restarts}.")
         self._optimizer = optimizer
         self._seed = seed
+        self._num_restarts = num_restarts
 
     def compile_unitary(
         self,
@@ -91,15 +106,18 @@ class AQC:
 
         optimizer = self._optimizer or L_BFGS_B(maxiter=1000)
 
-        if initial_point is None:
+        initial_points = [] if initial_point is None else [initial_point]
+        if len(initial_points) < self._num_restarts:
             np.random.seed(self._seed)
-            initial_point = np.random.uniform(0, 2 * np.pi, approximating_objective.num_thetas)
+            while len(initial_points) < self._num_restarts:
+                initial_points.append(
+                    np.random.uniform(0, 2 * np.pi, approximating_objective.num_thetas)
+                )
 
-        opt_result = optimizer.minimize(
-            fun=approximating_objective.objective,
-            x0=initial_point,
-            jac=approximating_objective.gradient,
+        opt_results = parallel_map(
+            _minimize, initial_points, task_args=(optimizer, approximating_objective)
         )
+        opt_result = min(opt_results, key=lambda result: result.fun)
 
         approximate_circuit.build(opt_result.x)
 
@@ -108,3 +126,11 @@ class AQC:
         if global_phase_required:
             alpha = np.angle(np.trace(np.dot(approx_matrix.conj().T, target_matrix)))
             approximate_circuit.global_phase = alpha
+
+
+def _minimize(initial_point, optimizer, approximating_objective):
+    return optimizer.minimize(
+        fun=approximating_objective.objective,
+        x0=initial_point,
+        jac=approximating_objective.gradient,
+    )
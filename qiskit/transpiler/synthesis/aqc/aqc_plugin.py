@@ -49,6 +49,10 @@ class AQCSynthesisPlugin(UnitarySynthesisPlugin):
     seed (int)
         A random seed.
 
+    num_restarts (int)
+        A number of optimizations to run in parallel from different initial points, the best
+        result is kept. Default value is ``1``.
+
     initial_point (:class:`~numpy.ndarray`)
         Initial values of angles/parameters to start the optimization process from.
     """
@@ -108,7 +112,7 @@ class AQCSynthesisPlugin(UnitarySynthesisPlugin):
         from qiskit.transpiler.synthesis.aqc.aqc import AQC
         from qiskit.transpiler.synthesis.aqc.cnot_structures import make_cnot_network
         from qiskit.transpiler.synthesis.aqc.cnot_unit_circuit import CNOTUnitCircuit
-        from qiskit.transpiler.synthesis.aqc.cnot_unit_objective import DefaultCNOTUnitObjective
+        from qiskit.transpiler.synthesis.aqc.cnot_unit_objective import FastCNOTUnitObjective
 
         num_qubits = int(round(np.log2(unitary.shape[0])))
 
@@ -127,10 +131,11 @@ class AQCSynthesisPlugin(UnitarySynthesisPlugin):
 
         optimizer = config.get("optimizer", L_BFGS_B(maxiter=1000))
         seed = config.get("seed")
-        aqc = AQC(optimizer, seed)
+        num_restarts = config.get("num_restarts", 1)
+        aqc = AQC(optimizer, seed, num_restarts)
 
         approximate_circuit = CNOTUnitCircuit(num_qubits=num_qubits, cnots=cnots)
-        approximating_objective = DefaultCNOTUnitObjective(num_qubits=num_qubits, cnots=cnots)
+        approximating_objective = FastCNOTUnitObjective(num_qubits=num_qubits, cnots=cnots)
 
         initial_point = config.get("initial_point")
         aqc.compile_unitary(
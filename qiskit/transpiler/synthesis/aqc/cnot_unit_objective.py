@@ -295,3 +295,235 @@ class DefaultCNOTUnitObjective(CNOTUnitObjective):
             )
 
         return der
+
+
+class FastCNOTUnitObjective(CNOTUnitObjective):
+    """
+    An implementation of the objective function and gradient based on CNOT units, which is much
+    faster than :class:`.DefaultCNOTUnitObjective`.
+
+    Instead of building a full ``(2^n, 2^n)`` matrix for every CNOT unit and rotation, and
+    multiplying these matrices together, the gates are applied directly to the rows or columns
+    of the matrices they act on, which costs :math:`O(4^n)` per gate rather than
+    :math:`O(8^n)`. The gradient with respect to all the parameters is computed in a single
+    backward sweep over the CNOT units, starting from the circuit matrix cached by the last
+    objective evaluation. All the matrices of this sweep are kept in workspaces that are
+    allocated once, when the objective is created, and reused by every evaluation.
+
+    The objective and gradient values are the same as those of
+    :class:`.DefaultCNOTUnitObjective`.
+    """
+
+    def __init__(self, num_qubits: int, cnots: np.ndarray) -> None:
+        """
+        Args:
+            num_qubits: number of qubits.
+            cnots: a CNOT structure to be used in the optimization procedure.
+        """
+        super().__init__(num_qubits, cnots)
+        dim = 2**num_qubits
+        # the CNOT of a unit maps the row (or column) with index ``i`` to ``cnot_perms[k, i]``
+        indices = np.arange(dim)
+        self._cnot_perms = np.empty((self._num_cnots, dim), dtype=np.intp)
+        for cnot_index in range(self._num_cnots):
+            control_mask = 1 << (num_qubits - 1 - int(cnots[0, cnot_index]))
+            target_mask = 1 << (num_qubits - 1 - int(cnots[1, cnot_index]))
+            self._cnot_perms[cnot_index] = np.where(
+                indices & control_mask, indices ^ target_mask, indices
+            )
+        # einsum subscripts for the partial traces onto one qubit and onto pairs of qubits
+        self._trace_subscripts = {}
+        # workspaces
+        self._workspace = np.empty((2, dim, dim), dtype=complex)
+        self._circuit_matrix = np.empty((dim, dim), dtype=complex)
+        self._last_thetas = None
+        self._target_norm = 0.0
+
+    @property
+    def target_matrix(self) -> np.ndarray:
+        return self._target_matrix
+
+    @target_matrix.setter
+    def target_matrix(self, target_matrix: np.ndarray) -> None:
+        self._target_matrix = np.asarray(target_matrix, dtype=complex)
+        self._target_norm = la.norm(self._target_matrix, "fro") ** 2
+        self._last_thetas = None
+
+    def objective(self, param_values: np.ndarray) -> float:
+        n = self._num_qubits
+        dim = 2**n
+        unit_q1, unit_q2, rotations = self._gate_matrices(param_values)
+
+        # the matrix of the initial rotations is the Kronecker product of every qubit's rotations
+        rotation_matrix = rotations[0]
+        for rotation in rotations[1:]:
+            rotation_matrix = np.kron(rotation_matrix, rotation)
+
+        # then the CNOT units are applied to it one after the other
+        circuit_matrix, spare = self._circuit_matrix, self._workspace[0]
+        circuit_matrix[:] = rotation_matrix
+        for cnot_index in range(self._num_cnots):
+            np.take(circuit_matrix, self._cnot_perms[cnot_index], axis=0, out=spare)
+            self._apply_left(unit_q1[cnot_index], int(self._cnots[0, cnot_index]), spare)
+            self._apply_left(unit_q2[cnot_index], int(self._cnots[1, cnot_index]), spare)
+            circuit_matrix, spare = spare, circuit_matrix
+        if circuit_matrix is not self._circuit_matrix:
+            self._circuit_matrix[:] = circuit_matrix
+
+        # 0.5 * ||V - U||^2 = 0.5 * (||V||^2 + ||U||^2) - Re<V, U>, where V is unitary
+        overlap = np.vdot(self._circuit_matrix, self._target_matrix).real
+        error = 0.5 * (dim + self._target_norm) - overlap
+
+        self._last_thetas = np.array(param_values, dtype=float)
+        return error
+
+    def gradient(self, param_values: np.ndarray) -> np.ndarray:
+        # the circuit matrix is re-used if the thetas are those of the last objective computation
+        if self._last_thetas is None or not np.array_equal(param_values, self._last_thetas):
+            self.objective(param_values)
+
+        n = self._num_qubits
+        num_cnots = self._num_cnots
+        cnots = self._cnots
+        unit_q1, unit_q2, rotations = self._gate_matrices(param_values)
+        der_q1, der_q2, der_rotations = self._gate_derivatives(param_values)
+        der = np.empty(4 * num_cnots + 3 * n)
+
+        # The partial derivative of the objective with respect to a parameter of the CNOT unit
+        # U_k is -Re<L_k dU_k R_k, U> = -Re<dU_k, G_k>, where L_k and R_k are the products of
+        # the gates on the left and on the right of U_k, and G_k = L_k^H U R_k^H. These matrices
+        # satisfy G_{k-1} = U_k^H G_k U_{k-1}, and G_{L-1} = U V^H U_{L-1}. The workspace holds
+        # G_k U_k^H at the start of every iteration.
+        workspace, spare = self._workspace
+        np.dot(self._target_matrix, self._circuit_matrix.conj().T, out=workspace)
+        for cnot_index in range(num_cnots - 1, -1, -1):
+            q1 = int(cnots[0, cnot_index])
+            q2 = int(cnots[1, cnot_index])
+            perm = self._cnot_perms[cnot_index]
+            # with U_k = F2 F1 CX, <dU_k, G_k> = <dF2 dF1, G_k CX>, which only depends on the
+            # partial trace of G_k CX onto the qubits q1 and q2
+            self._apply_right(unit_q2[cnot_index], q2, workspace)
+            self._apply_right(unit_q1[cnot_index], q1, workspace)
+            reduced = self._partial_trace(workspace, (q1, q2))
+            theta_index = 4 * cnot_index
+            der[theta_index : theta_index + 2] = -np.einsum(
+                "kab,cd,acbd->k", der_q1[cnot_index].conj(), unit_q2[cnot_index].conj(), reduced
+            ).real
+            der[theta_index + 2 : theta_index + 4] = -np.einsum(
+                "ab,kcd,acbd->k", unit_q1[cnot_index].conj(), der_q2[cnot_index].conj(), reduced
+            ).real
+            # G_{k-1} U_{k-1}^H = U_k^H G_k = CX F1^H F2^H G_k
+            np.take(workspace, perm, axis=1, out=spare)
+            self._apply_left(unit_q2[cnot_index].conj().T, q2, spare)
+            self._apply_left(unit_q1[cnot_index].conj().T, q1, spare)
+            np.take(spare, perm, axis=0, out=workspace)
+
+        # now the workspace holds W^H U R^H, where W is the product of the CNOT units and R the
+        # initial rotations, and the partial derivatives of R are -Re tr(R dR^H W^H U R^H)
+        for qubit in range(n):
+            reduced = self._partial_trace(workspace, (qubit,))
+            theta_index = 4 * num_cnots + 3 * qubit
+            der[theta_index : theta_index + 3] = -np.einsum(
+                "ab,kcb,ca->k", rotations[qubit], der_rotations[qubit].conj(), reduced
+            ).real
+
+        return der
+
+    def _gate_matrices(self, thetas):
+        """Returns the single-qubit matrices on the control and target qubits of every CNOT unit
+        and the initial rotation matrices of every qubit."""
+        num_cnots = self._num_cnots
+        unit_thetas = np.asarray(thetas[: 4 * num_cnots]).reshape(num_cnots, 4)
+        rotation_thetas = np.asarray(thetas[4 * num_cnots :]).reshape(self._num_qubits, 3)
+        unit_q1 = _rz(unit_thetas[:, 1]) @ _ry(unit_thetas[:, 0])
+        unit_q2 = _rx(unit_thetas[:, 3]) @ _ry(unit_thetas[:, 2])
+        rotations = (
+            _rz(rotation_thetas[:, 0]) @ _ry(rotation_thetas[:, 1]) @ _rz(rotation_thetas[:, 2])
+        )
+        return unit_q1, unit_q2, rotations
+
+    def _gate_derivatives(self, thetas):
+        """Returns the derivatives of the matrices of :meth:`_gate_matrices` with respect to each
+        of their angles, stacked along the second axis."""
+        num_cnots = self._num_cnots
+        unit_thetas = np.asarray(thetas[: 4 * num_cnots]).reshape(num_cnots, 4)
+        rotation_thetas = np.asarray(thetas[4 * num_cnots :]).reshape(self._num_qubits, 3)
+        ry1, rz1 = _ry(unit_thetas[:, 0]), _rz(unit_thetas[:, 1])
+        ry2, rx2 = _ry(unit_thetas[:, 2]), _rx(unit_thetas[:, 3])
+        der_q1 = np.stack([rz1 @ _PAULI_Y @ ry1, _PAULI_Z @ rz1 @ ry1], axis=1)
+        der_q2 = np.stack([rx2 @ _PAULI_Y @ ry2, _PAULI_X @ rx2 @ ry2], axis=1)
+        rz0, ry0 = _rz(rotation_thetas[:, 0]), _ry(rotation_thetas[:, 1])
+        rz2 = _rz(rotation_thetas[:, 2])
+        der_rotations = np.stack(
+            [
+                _PAULI_Z @ rz0 @ ry0 @ rz2,
+                rz0 @ _PAULI_Y @ ry0 @ rz2,
+                rz0 @ ry0 @ _PAULI_Z @ rz2,
+            ],
+            axis=1,
+        )
+        return der_q1, der_q2, der_rotations
+
+    def _apply_left(self, unitary, qubit, matrix):
+        """Multiplies ``matrix`` in place on the left by ``unitary`` placed on ``qubit``."""
+        _apply_2x2(unitary, matrix.reshape(2**qubit, 2, -1))
+
+    def _apply_right(self, unitary, qubit, matrix):
+        """Multiplies ``matrix`` in place on the right by ``unitary`` placed on ``qubit``."""
+        _apply_2x2(unitary.T, matrix.reshape(-1, 2, 2 ** (self._num_qubits - 1 - qubit)))
+
+    def _partial_trace(self, matrix, qubits):
+        """Returns the partial trace of ``matrix`` onto ``qubits``, as an array with one row and
+        one column index for each of the qubits, in the given order."""
+        subscripts = self._trace_subscripts.get(qubits)
+        if subscripts is None:
+            n = self._num_qubits
+            # the row and column indices of the traced out qubits are the same
+            rows = [chr(ord("a") + q) for q in range(n)]
+            columns = list(rows)
+            for i, qubit in enumerate(qubits):
+                columns[qubit] = chr(ord("A") + i)
+            output = "".join(rows[q] for q in qubits) + "".join(columns[q] for q in qubits)
+            subscripts = "".join(rows) + "".join(columns) + "->" + output
+            self._trace_subscripts[qubits] = subscripts
+        return np.einsum(subscripts, matrix.reshape((2,) * (2 * self._num_qubits)))
+
+
+# derivatives of the rotations exp(-i theta P / 2) are -i P / 2 times the rotations
+_PAULI_X = np.array([[0, -0.5j], [-0.5j, 0]])
+_PAULI_Y = np.array([[0, -0.5], [0.5, 0]], dtype=complex)
+_PAULI_Z = np.array([[-0.5j, 0], [0, 0.5j]])
+
+
+def _apply_2x2(unitary, blocks):
+    """Multiplies in place every ``(2, k)`` block of the ``(m, 2, k)`` array ``blocks`` by
+    ``unitary`` on the left."""
+    first, second = blocks[:, 0], blocks[:, 1]
+    new_first = unitary[0, 0] * first
+    new_first += unitary[0, 1] * second
+    second *= unitary[1, 1]
+    second += unitary[1, 0] * first
+    first[:] = new_first
+
+
+def _rx(thetas):
+    """Returns the RX rotation matrices for an array of angles."""
+    cos, sin = np.cos(thetas / 2), -1j * np.sin(thetas / 2)
+    return np.stack([np.stack([cos, sin], axis=-1), np.stack([sin, cos], axis=-1)], axis=-2)
+
+
+def _ry(thetas):
+    """Returns the RY rotation matrices for an array of angles."""
+    cos, sin = np.cos(thetas / 2), np.sin(thetas / 2)
+    return np.stack(
+        [np.stack([cos, -sin], axis=-1), np.stack([sin, cos], axis=-1)], axis=-2
+    ).astype(complex)
+
+
+def _rz(thetas):
+    """Returns the RZ rotation matrices for an array of angles."""
+    phase = np.exp(-0.5j * thetas)
+    zero = np.zeros_like(phase)
+    return np.stack(
+        [np.stack([phase, zero], axis=-1), np.stack([zero, phase.conj()], axis=-1)], axis=-2
+    )
@@ -18,8 +18,10 @@ for optimal synthesis of linear (CNOT-only) reversible circuits.
 
 import copy
 import numpy as np
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import QuantumCircuit, CircuitInstruction
+from qiskit.circuit.library.standard_gates import CXGate
 from qiskit.exceptions import QiskitError
+from qiskit.synthesis.linear import PackedBinaryMatrix
 
 
 def graysynth(cnots, angles, section_size=2):
@@ -192,7 +194,7 @@ def cnot_synth(state, section_size=2):
     Quantum Information & Computation 8.3 (2008): 282-294.
 
     Args:
-        state (list[list] or ndarray): n x n matrix, describing the state
+        state (list[list] or ndarray or PackedBinaryMatrix): n x n matrix, describing the state
             of the input circuit
         section_size (int): the size of each section, used in _lwr_cnot_synth(), in the
             Patel–Markov–Hayes algorithm. section_size must be a factor of num_qubits.
@@ -204,24 +206,25 @@ def cnot_synth(state, section_size=2):
     Raises:
         QiskitError: when variable "state" isn't of type numpy.matrix
     """
-    if not isinstance(state, (list, np.ndarray)):
+    if not isinstance(state, (list, np.ndarray, PackedBinaryMatrix)):
         raise QiskitError(
             "state should be of type list or numpy.ndarray, "
             "but was of the type {}".format(type(state))
         )
-    state = np.array(state)
+    state = PackedBinaryMatrix(state)
     # Synthesize lower triangular part
     [state, circuit_l] = _lwr_cnot_synth(state, section_size)
-    state = np.transpose(state)
+    state = state.transpose()
     # Synthesize upper triangular part
     [state, circuit_u] = _lwr_cnot_synth(state, section_size)
     circuit_l.reverse()
     for i in circuit_u:
         i.reverse()
     # Convert the list into a circuit of C-NOT gates
-    circ = QuantumCircuit(state.shape[0])
+    circ = QuantumCircuit(state.num_rows)
+    qubits = circ.qubits
     for i in circuit_u + circuit_l:
-        circ.cx(i[0], i[1])
+        circ._append(CircuitInstruction(CXGate(), (qubits[i[0]], qubits[i[1]]), ()))
     return circ
 
 
@@ -249,51 +252,56 @@ def _lwr_cnot_synth(state, section_size):
     overlap back to it. The intuition is to avoid a high-weight pivot row
     increasing the weight of lower rows.
 
+    Each row of the matrix is handled as a single integer with bit ``j`` holding column
+    ``j``, so that row additions and overlap counts take a handful of word operations
+    whatever the number of qubits.
+
     Args:
-        state (ndarray): n x n matrix, describing a linear quantum circuit
+        state (PackedBinaryMatrix): n x n matrix, describing a linear quantum circuit
         section_size (int): the section size the matrix columns are divided into
 
     Returns:
-        numpy.matrix: n by n matrix, describing the state of the output circuit
+        PackedBinaryMatrix: n by n matrix, describing the state of the output circuit
         list: a k by 2 list of C-NOT operations that need to be applied
     """
     circuit = []
-    num_qubits = state.shape[0]
+    num_qubits = state.num_rows
+    rows = state.to_row_integers()
     cutoff = 1
 
     # Iterate over column sections
     for sec in range(1, int(np.floor(num_qubits / section_size) + 1)):
         # Remove duplicate sub-rows in section sec
+        section_mask = ((1 << section_size) - 1) << ((sec - 1) * section_size)
         patt = {}
         for row in range((sec - 1) * section_size, num_qubits):
-            sub_row_patt = copy.deepcopy(state[row, (sec - 1) * section_size : sec * section_size])
-            if np.sum(sub_row_patt) == 0:
+            sub_row_patt = rows[row] & section_mask
+            if sub_row_patt == 0:
                 continue
-            if str(sub_row_patt) not in patt:
-                patt[str(sub_row_patt)] = row
+            if sub_row_patt not in patt:
+                patt[sub_row_patt] = row
             else:
-                state[row, :] ^= state[patt[str(sub_row_patt)], :]
-                circuit.append([patt[str(sub_row_patt)], row])
+                rows[row] ^= rows[patt[sub_row_patt]]
+                circuit.append([patt[sub_row_patt], row])
         # Use gaussian elimination for remaining entries in column section
         for col in range((sec - 1) * section_size, sec * section_size):
+            col_bit = 1 << col
             # Check if 1 on diagonal
-            diag_one = 1
-            if state[col, col] == 0:
-                diag_one = 0
+            diag_one = rows[col] & col_bit
             # Remove ones in rows below column col
             for row in range(col + 1, num_qubits):
-                if state[row, col] == 1:
-                    if diag_one == 0:
-                        state[col, :] ^= state[row, :]
+                if rows[row] & col_bit:
+                    if not diag_one:
+                        rows[col] ^= rows[row]
                         circuit.append([row, col])
                         diag_one = 1
-                    state[row, :] ^= state[col, :]
+                    rows[row] ^= rows[col]
                     circuit.append([col, row])
                 # Back reduce the pivot row using the current row
-                if sum(state[col, :] & state[row, :]) > cutoff:
-                    state[col, :] ^= state[row, :]
+                if bin(rows[col] & rows[row]).count("1") > cutoff:
+                    rows[col] ^= rows[row]
                     circuit.append([row, col])
-    return [state, circuit]
+    return [PackedBinaryMatrix.from_row_integers(rows, state.num_cols), circuit]
 
 
 def _remove_duplicates(lists):
@@ -19,11 +19,13 @@ from a backend
 
 from collections.abc import Mapping
 from collections import defaultdict
+import copy
 import datetime
 import io
 import logging
 import inspect
 
+import numpy as np
 import retworkx as rx
 
 from qiskit.circuit.parameter import Parameter
@@ -182,6 +184,7 @@ class Target(Mapping):
         "_non_global_strict_basis",
         "qubit_properties",
         "_global_operations",
+        "_compiled",
     )
 
     def __init__(
@@ -254,6 +257,7 @@ class Target(Mapping):
         self.aquire_alignment = aquire_alignment
         self._non_global_basis = None
         self._non_global_strict_basis = None
+        self._compiled = None
         if qubit_properties is not None:
             if not self.num_qubits:
                 self.num_qubits = len(qubit_properties)
@@ -351,11 +355,11 @@ class Target(Mapping):
             raise AttributeError("Instruction %s is already in the target" % instruction_name)
         self._gate_name_map[instruction_name] = instruction
         if is_class:
-            qargs_val = {None: None}
+            qargs_val = _QargsPropertiesMap(self, {None: None})
         else:
             if None in properties:
                 self._global_operations[instruction.num_qubits].add(instruction_name)
-            qargs_val = {}
+            qargs_val = _QargsPropertiesMap(self)
             for qarg in properties:
                 if qarg is not None and len(qarg) != instruction.num_qubits:
                     raise TranspilerError(
@@ -372,6 +376,7 @@ class Target(Mapping):
         self._instruction_schedule_map = None
         self._non_global_basis = None
         self._non_global_strict_basis = None
+        self._compiled = None
 
     def update_instruction_properties(self, instruction, qargs, properties):
         """Update the property object for an instruction qarg pair already in the Target
@@ -387,9 +392,58 @@ class Target(Mapping):
             raise KeyError(f"Provided instruction: '{instruction}' not in this Target")
         if qargs not in self._gate_map[instruction]:
             raise KeyError(f"Provided qarg: '{qargs}' not in this Target for {instruction}")
+        # This also clears the views of the properties, see _QargsPropertiesMap.
         self._gate_map[instruction][qargs] = properties
+
+    def _properties_changed(self):
+        """Clear the views of the instruction properties, after they were changed."""
         self._instruction_durations = None
         self._instruction_schedule_map = None
+        self._compiled = None
+
+    def _copy(self):
+        """Return a copy of this target whose instructions, properties and qubit properties can be
+        modified without affecting this target.  The calibrations of the instructions are shared."""
+        out = type(self).__new__(type(self))
+        for attribute in (
+            "num_qubits",
+            "description",
+            "dt",
+            "granularity",
+            "min_length",
+            "pulse_alignment",
+            "aquire_alignment",
+        ):
+            setattr(out, attribute, getattr(self, attribute))
+        out.qubit_properties = (
+            None
+            if self.qubit_properties is None
+            else [copy.copy(properties) for properties in self.qubit_properties]
+        )
+        out._gate_name_map = {
+            name: operation if inspect.isclass(operation) else operation.copy()
+            for name, operation in self._gate_name_map.items()
+        }
+        out._gate_map = {
+            name: _QargsPropertiesMap(
+                out,
+                {qargs: copy.copy(properties) for qargs, properties in qargs_properties.items()},
+            )
+            for name, qargs_properties in self._gate_map.items()
+        }
+        out._global_operations = defaultdict(
+            set, {size: set(names) for size, names in self._global_operations.items()}
+        )
+        out._qarg_gate_map = defaultdict(
+            set, {qargs: set(names) for qargs, names in self._qarg_gate_map.items()}
+        )
+        out._coupling_graph = None
+        out._instruction_durations = None
+        out._instruction_schedule_map = None
+        out._non_global_basis = None
+        out._non_global_strict_basis = None
+        out._compiled = None
+        return out
 
     def update_from_instruction_schedule_map(self, inst_map, inst_name_map=None, error_dict=None):
         """Update the target from an instruction schedule map.
@@ -521,6 +575,24 @@ class Target(Mapping):
         self._instruction_schedule_map = out_inst_schedule_map
         return out_inst_schedule_map
 
+    def compile(self):
+        """Get a :class:`~.CompiledTarget` index of the instructions in the target.
+
+        The compiled target is built on the first call and reused until the target is
+        modified, with :meth:`add_instruction`, :meth:`update_instruction_properties` or by
+        setting the properties of an instruction directly with
+        ``target[instruction][qargs] = properties``. Changing the attributes of an existing
+        :class:`~.InstructionProperties` object in place is not detected.
+        Passes that query the target for every node of a circuit should get it once and
+        use its methods instead of the equivalent methods of the target.
+
+        Returns:
+            CompiledTarget: The compiled view of the target.
+        """
+        if self._compiled is None or self._compiled.num_qubits != self.num_qubits:
+            self._compiled = CompiledTarget(self)
+        return self._compiled
+
     def operation_from_name(self, instruction):
         """Get the operation class object for a given name
 
@@ -550,17 +622,7 @@ class Target(Mapping):
         Raises:
             KeyError: If qargs is not in target
         """
-        if qargs is not None and any(x not in range(0, self.num_qubits) for x in qargs):
-            raise KeyError(f"{qargs} not in target.")
-        res = [self._gate_name_map[x] for x in self._qarg_gate_map[qargs]]
-        if qargs is not None:
-            res += self._global_operations.get(len(qargs), list())
-        for op in self._gate_name_map.values():
-            if inspect.isclass(op):
-                res.append(op)
-        if not res:
-            raise KeyError(f"{qargs} not in target.")
-        return list(res)
+        return self.compile().operations_for_qargs(qargs)
 
     def operation_names_for_qargs(self, qargs):
         """Get the operation names for a specified qargs tuple
@@ -577,17 +639,7 @@ class Target(Mapping):
         Raises:
             KeyError: If qargs is not in target
         """
-        if qargs is not None and any(x not in range(0, self.num_qubits) for x in qargs):
-            raise KeyError(f"{qargs} not in target.")
-        res = self._qarg_gate_map.get(qargs, set())
-        if qargs is not None:
-            res.update(self._global_operations.get(len(qargs), set()))
-        for name, op in self._gate_name_map.items():
-            if inspect.isclass(op):
-                res.add(name)
-        if not res:
-            raise KeyError(f"{qargs} not in target.")
-        return res
+        return set(self.compile().operation_names_for_qargs(qargs))
 
     def instruction_supported(
         self, operation_name=None, qargs=None, operation_class=None, parameters=None
@@ -993,6 +1045,261 @@ class Target(Mapping):
         return output.getvalue()
 
 
+class _QargsPropertiesMap(dict):
+    """The mapping of qargs to :class:`~.InstructionProperties` of an instruction in a
+    :class:`~.Target`, which clears the views of the properties of the target, like its
+    :class:`~.CompiledTarget`, whenever it is modified."""
+
+    def __init__(self, target, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._target = target
+
+    def __reduce__(self):
+        return (_QargsPropertiesMap, (self._target, dict(self)))
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._target._properties_changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._target._properties_changed()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._target._properties_changed()
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._target._properties_changed()
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._target._properties_changed()
+        return result
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._target._properties_changed()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._target._properties_changed()
+        return result
+
+    def clear(self):
+        super().clear()
+        self._target._properties_changed()
+
+
+class CompiledTarget:
+    """An immutable index of the instructions supported by a :class:`~.Target`.
+
+    :class:`~.Target` stores its instructions in nested dictionaries keyed on the
+    operation name and then on the qargs, which is convenient to build and edit but
+    means that answering "is this operation supported on these qubits" requires walking
+    those dictionaries. A compiled target is built once from a snapshot of a
+    :class:`~.Target` (see :meth:`.Target.compile`) and answers these queries with a
+    single dictionary lookup:
+
+    * every operation name is interned as an integer id, its index in
+      :attr:`operation_names`;
+    * the operations supported on every qargs are stored as a bitset with bit ``i``
+      set for the operation with id ``i``;
+    * the error rates and durations of the instructions are stored in dense
+      ``(num_operations, num_qargs)`` arrays, with ``nan`` for the instructions
+      without the property, where the columns follow the order of :attr:`qargs`.
+
+    A compiled target is not updated when its :class:`~.Target` is modified, but
+    :meth:`.Target.compile` returns a new one after the target has been modified.
+    """
+
+    __slots__ = (
+        "num_qubits",
+        "operation_names",
+        "qargs",
+        "errors",
+        "durations",
+        "_operations",
+        "_operation_ids",
+        "_operation_bits",
+        "_qargs_ids",
+        "_qargs_masks",
+        "_global_masks",
+        "_class_mask",
+        "_names_for_qargs",
+        "__weakref__",
+    )
+
+    def __init__(self, target):
+        """Compile a target.
+
+        Args:
+            target (Target): The target to compile.
+        """
+        self.num_qubits = target.num_qubits
+        self.operation_names = tuple(target.operation_names)
+        self._operations = tuple(target.operation_from_name(name) for name in self.operation_names)
+        self._operation_ids = {name: index for index, name in enumerate(self.operation_names)}
+        self._operation_bits = {name: 1 << index for name, index in self._operation_ids.items()}
+        # A mapping of qargs -> bitset of the operations with these qargs in the target
+        self._qargs_masks = {}
+        # A mapping of number of qubits -> bitset of the operations supported on any qargs
+        self._global_masks = defaultdict(int)
+        # A bitset of the variable width operations defined by class
+        self._class_mask = 0
+        for index, (name, operation) in enumerate(zip(self.operation_names, self._operations)):
+            if inspect.isclass(operation):
+                self._class_mask |= 1 << index
+                continue
+            for qargs in target[name]:
+                if qargs is None:
+                    self._global_masks[operation.num_qubits] |= 1 << index
+                else:
+                    self._qargs_masks[qargs] = self._qargs_masks.get(qargs, 0) | 1 << index
+        self._global_masks = dict(self._global_masks)
+        self.qargs = tuple(self._qargs_masks)
+        self._qargs_ids = {qargs: index for index, qargs in enumerate(self.qargs)}
+        self.errors = np.full((len(self.operation_names), len(self.qargs)), np.nan)
+        self.durations = np.full((len(self.operation_names), len(self.qargs)), np.nan)
+        for index, name in enumerate(self.operation_names):
+            if self._class_mask >> index & 1:
+                continue
+            for qargs, properties in target[name].items():
+                if qargs is None or properties is None:
+                    continue
+                column = self._qargs_ids[qargs]
+                error = getattr(properties, "error", None)
+                if error is not None:
+                    self.errors[index, column] = error
+                duration = getattr(properties, "duration", None)
+                if duration is not None:
+                    self.durations[index, column] = duration
+        self.errors.flags.writeable = False
+        self.durations.flags.writeable = False
+        # Memoized bitsets and names of the operations supported on each looked up qargs
+        self._names_for_qargs = {}
+
+    def operation_id(self, operation_name):
+        """Get the integer id of an operation, its index in :attr:`operation_names`.
+
+        Raises:
+            KeyError: If the operation is not in the target.
+        """
+        return self._operation_ids[operation_name]
+
+    def qargs_id(self, qargs):
+        """Get the index of the column of ``qargs`` in :attr:`errors` and :attr:`durations`.
+
+        Raises:
+            KeyError: If no operation is defined on exactly these qargs in the target.
+        """
+        return self._qargs_ids[qargs]
+
+    def instruction_supported(self, operation_name, qargs=None):
+        """Return whether the target supports an operation on the given qargs.
+
+        This gives the same result as :meth:`.Target.instruction_supported` called
+        without ``operation_class`` and ``parameters``.
+
+        Args:
+            operation_name (str): The name of the operation.
+            qargs (tuple): The tuple of qubit indices of the instruction. If ``None``,
+                return whether the operation is supported on any qubits.
+
+        Returns:
+            bool: Whether the instruction is supported.
+        """
+        bit = self._operation_bits.get(operation_name)
+        if bit is None:
+            return False
+        if qargs is None:
+            return True
+        try:
+            mask = self._qargs_masks.get(qargs, 0)
+        except TypeError:
+            # A list was passed in by mistake
+            qargs = tuple(qargs)
+            mask = self._qargs_masks.get(qargs, 0)
+        if mask & bit:
+            return True
+        if self._global_masks.get(len(qargs), 0) & bit:
+            return all(x < self.num_qubits for x in qargs)
+        if self._class_mask & bit:
+            return all(x <= self.num_qubits for x in qargs) and len(set(qargs)) == len(qargs)
+        return False
+
+    def operation_names_for_qargs(self, qargs):
+        """Get the names of the operations supported on the specified qargs.
+
+        Args:
+            qargs (tuple): A qargs tuple of the qubits to get the operations that apply
+                to it. If set to ``None`` this will return the names of the globally
+                defined operations in the target.
+
+        Returns:
+            frozenset: The names of the operations that apply to ``qargs``.
+
+        Raises:
+            KeyError: If qargs is not in target
+        """
+        return self._lookup_qargs(qargs)[1]
+
+    def operations_for_qargs(self, qargs):
+        """Get the operations supported on the specified qargs.
+
+        Args:
+            qargs (tuple): A qargs tuple of the qubits to get the operations that apply
+                to it. If set to ``None`` this will return the globally defined
+                operations in the target.
+
+        Returns:
+            list: The :class:`~qiskit.circuit.Instruction` instances (or classes, for
+            variable width operations defined globally) that apply to ``qargs``.
+
+        Raises:
+            KeyError: If qargs is not in target
+        """
+        mask = self._lookup_qargs(qargs)[0]
+        return [self._operations[index] for index in _bit_indices(mask)]
+
+    def _lookup_qargs(self, qargs):
+        """Return the bitset and the names of the operations supported on ``qargs``."""
+        try:
+            return self._names_for_qargs[qargs]
+        except KeyError:
+            pass
+        if qargs is None:
+            mask = self._class_mask
+            for global_mask in self._global_masks.values():
+                mask |= global_mask
+        else:
+            if any(x not in range(0, self.num_qubits) for x in qargs):
+                raise KeyError(f"{qargs} not in target.")
+            mask = (
+                self._qargs_masks.get(qargs, 0)
+                | self._global_masks.get(len(qargs), 0)
+                | self._class_mask
+            )
+        if not mask:
+            raise KeyError(f"{qargs} not in target.")
+        names = frozenset(self.operation_names[index] for index in _bit_indices(mask))
+        self._names_for_qargs[qargs] = (mask, names)
+        return mask, names
+
+
+def _bit_indices(mask):
+    """Yield the indices of the set bits of ``mask`` in increasing order."""
+    index = 0
+    while mask:
+        if mask & 1:
+            yield index
+        mask >>= 1
+        index += 1
+
+
 def target_to_backend_properties(target: Target):
     """Convert a :class:`~.Target` object into a legacy :class:`~.BackendProperties`"""
 
@@ -0,0 +1,57 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-function-docstring,attribute-defined-outside-init
+
+"""Benchmarks of Clifford synthesis and of the passes built on it."""
+
+from qiskit import QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.quantum_info import random_clifford
+from qiskit.quantum_info.synthesis.clifford_decompose import decompose_clifford_greedy
+from qiskit.transpiler.passes import HighLevelSynthesis, OptimizeCliffords
+
+
+class CliffordSynthesisBenchmarks:
+    """Time the greedy synthesis of random Cliffords and its use through the passes."""
+
+    params = [20, 50, 100, 200]
+    param_names = ["num_qubits"]
+    timeout = 600
+
+    def setup(self, num_qubits):
+        self.clifford = random_clifford(num_qubits, seed=42)
+        circuit = QuantumCircuit(num_qubits)
+        for seed in range(3):
+            circuit.append(random_clifford(num_qubits, seed=seed), circuit.qubits)
+        self.dag = circuit_to_dag(circuit)
+
+    def time_decompose_clifford_greedy(self, _):
+        decompose_clifford_greedy(self.clifford)
+
+    def time_optimize_and_synthesize_cliffords(self, _):
+        HighLevelSynthesis().run(OptimizeCliffords().run(self.dag))
+
+
+class SmallCliffordSynthesisBenchmarks:
+    """Time the synthesis of many 2-qubit Clifford blocks, which hits the cache of small
+    Clifford decompositions."""
+
+    def setup(self):
+        circuit = QuantumCircuit(20)
+        for layer in range(200):
+            for qubit in range(layer % 2, 19, 2):
+                circuit.append(random_clifford(2, seed=qubit % 7), [qubit, qubit + 1])
+        self.dag = circuit_to_dag(circuit)
+
+    def time_high_level_synthesis(self):
+        HighLevelSynthesis().run(self.dag)
@@ -0,0 +1,48 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-function-docstring,attribute-defined-outside-init
+
+"""Benchmarks of the block collection passes on large circuits."""
+
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler.passes import Collect2qBlocks, CollectMultiQBlocks
+
+
+class CollectBlocksBenchmarks:
+    """Time to collect blocks of random circuits of 1, 2 and 3 qubit gates."""
+
+    params = [10000, 100000]
+    param_names = ["num_gates"]
+    timeout = 600
+
+    def setup(self, num_gates):
+        rng = np.random.default_rng(42)
+        circuit = QuantumCircuit(20)
+        for num_qubits in rng.integers(1, 4, size=num_gates):
+            qubits = [int(q) for q in rng.choice(20, size=num_qubits, replace=False)]
+            if num_qubits == 1:
+                circuit.h(qubits[0])
+            elif num_qubits == 2:
+                circuit.cx(*qubits)
+            else:
+                circuit.ccx(*qubits)
+        self.dag = circuit_to_dag(circuit)
+
+    def time_collect_2q_blocks(self, _):
+        Collect2qBlocks().run(self.dag)
+
+    def time_collect_multiq_blocks(self, _):
+        CollectMultiQBlocks(max_block_size=3).run(self.dag)
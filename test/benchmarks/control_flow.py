@@ -0,0 +1,53 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-function-docstring,attribute-defined-outside-init
+
+"""Benchmarks of transpiling dynamic circuits with many repeated control-flow branches."""
+
+from qiskit import transpile
+from qiskit.circuit import QuantumCircuit
+from qiskit.transpiler import CouplingMap
+
+
+class RepeatedBranchesBenchmarks:
+    """Time to transpile a circuit with many identical if-else branches."""
+
+    params = [[10, 100, 500], [0, 1]]
+    param_names = ["num_branches", "optimization_level"]
+    timeout = 600
+
+    def setup(self, num_branches, _):
+        circuit = QuantumCircuit(5, 5)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        for _ in range(num_branches):
+            with circuit.if_test((circuit.clbits[0], True)) as else_:
+                circuit.h(1)
+                circuit.cx(1, 2)
+                circuit.cx(0, 3)
+            with else_:
+                circuit.x(1)
+                circuit.cx(1, 4)
+        circuit.measure(range(5), range(5))
+        self.circuit = circuit
+        self.basis_gates = ["rz", "sx", "x", "cx", "if_else"]
+        self.coupling_map = CouplingMap.from_line(5)
+
+    def time_transpile(self, _, optimization_level):
+        transpile(
+            self.circuit,
+            basis_gates=self.basis_gates,
+            coupling_map=self.coupling_map,
+            optimization_level=optimization_level,
+            seed_transpiler=42,
+        )
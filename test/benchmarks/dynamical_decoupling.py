@@ -0,0 +1,73 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-function-docstring,attribute-defined-outside-init
+
+"""Benchmarks of dynamical decoupling insertion on a dense 127 qubit circuit."""
+
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.circuit.library import XGate, YGate
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import InstructionDurations
+from qiskit.transpiler.passes import (
+    ALAPScheduleAnalysis,
+    PadDelay,
+    PadDynamicalDecoupling,
+    TimeUnitConversion,
+)
+
+
+class DynamicalDecouplingBenchmarks:
+    """Time to pad a scheduled dense circuit on 127 qubits."""
+
+    params = [10000, 100000]
+    param_names = ["num_gates"]
+    timeout = 600
+    # The padding passes modify the scheduled DAG, so it is rebuilt for every sample.
+    number = 1
+
+    def setup(self, num_gates):
+        num_qubits = 127
+        rng = np.random.default_rng(42)
+        circuit = QuantumCircuit(num_qubits)
+        for _ in range(num_gates):
+            if rng.random() < 0.6:
+                circuit.x(int(rng.integers(num_qubits)))
+            else:
+                qubit = int(rng.integers(num_qubits - 1))
+                circuit.cx(qubit, qubit + 1)
+        self.durations = InstructionDurations(
+            [("x", None, 160), ("y", None, 160), ("cx", None, 800)]
+        )
+        self.dag = circuit_to_dag(circuit)
+        conversion = TimeUnitConversion(self.durations)
+        conversion.run(self.dag)
+        scheduler = ALAPScheduleAnalysis(self.durations)
+        scheduler.property_set = conversion.property_set
+        scheduler.run(self.dag)
+        self.property_set = scheduler.property_set
+
+    def _run(self, padding):
+        padding.property_set = self.property_set
+        padding.run(self.dag)
+
+    def time_pad_delay(self, _):
+        self._run(PadDelay())
+
+    def time_pad_xy4(self, _):
+        self._run(
+            PadDynamicalDecoupling(
+                self.durations, [XGate(), YGate(), XGate(), YGate()], pulse_alignment=16
+            )
+        )
@@ -0,0 +1,45 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-function-docstring,attribute-defined-outside-init
+
+"""Benchmarks of the product formula synthesis of Pauli evolutions."""
+
+import numpy as np
+
+from qiskit.circuit.library import PauliEvolutionGate
+from qiskit.quantum_info import SparsePauliOp, random_pauli_list
+from qiskit.synthesis import LieTrotter, SuzukiTrotter, QDrift
+
+
+class PauliEvolutionSynthesisBenchmarks:
+    """Time to synthesize the evolution of random operators with many terms."""
+
+    params = ([1000, 10000], [True, False])
+    param_names = ["num_terms", "wrap"]
+    timeout = 600
+
+    def setup(self, num_terms, _):
+        rng = np.random.default_rng(42)
+        self.operator = SparsePauliOp(
+            random_pauli_list(20, num_terms, seed=42, phase=False),
+            rng.uniform(-1, 1, size=num_terms).astype(complex),
+        )
+
+    def time_lie_trotter(self, _, wrap):
+        PauliEvolutionGate(self.operator, 0.1, synthesis=LieTrotter(reps=2, wrap=wrap)).definition
+
+    def time_suzuki_trotter(self, _, wrap):
+        PauliEvolutionGate(self.operator, 0.1, synthesis=SuzukiTrotter(wrap=wrap)).definition
+
+    def time_qdrift(self, _, wrap):
+        PauliEvolutionGate(self.operator, 0.1, synthesis=QDrift(wrap=wrap)).definition
@@ -0,0 +1,36 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-function-docstring,attribute-defined-outside-init
+
+"""Benchmarks of the Quantum Shannon Decomposition of random unitaries."""
+
+from scipy.stats import unitary_group
+
+from qiskit.quantum_info.synthesis.qsd import qs_decomposition
+
+
+class QuantumShannonDecompositionBenchmarks:
+    """Time and peak memory of the synthesis of random unitaries."""
+
+    params = ([4, 6, 8, 10], [False, True])
+    param_names = ["num_qubits", "optimizations"]
+    timeout = 3600
+
+    def setup(self, num_qubits, _):
+        self.unitary = unitary_group.rvs(2**num_qubits, random_state=42)
+
+    def time_qs_decomposition(self, _, optimizations):
+        qs_decomposition(self.unitary, opt_a1=optimizations, opt_a2=optimizations)
+
+    def peakmem_qs_decomposition(self, _, optimizations):
+        qs_decomposition(self.unitary, opt_a1=optimizations, opt_a2=optimizations)
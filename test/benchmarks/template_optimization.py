@@ -0,0 +1,77 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-function-docstring,attribute-defined-outside-init
+
+"""Benchmarks of the TemplateOptimization pass on large NCT circuits."""
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.library.templates import nct
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler.passes import TemplateOptimization
+
+
+def random_nct_circuit(num_qubits, num_gates, seed):
+    """Random circuit of X, CX and CCX gates."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for num_controls, qubits in zip(
+        rng.integers(0, 3, size=num_gates),
+        (rng.choice(num_qubits, 3, replace=False) for _ in range(num_gates)),
+    ):
+        qubits = [int(qubit) for qubit in qubits[: num_controls + 1]]
+        if num_controls == 0:
+            circuit.x(*qubits)
+        elif num_controls == 1:
+            circuit.cx(*qubits)
+        else:
+            circuit.ccx(*qubits)
+    return circuit
+
+
+class TemplateOptimizationBenchmarks:
+    """Time the pass with the small NCT templates, bounding the search with the window
+    heuristics and a search budget so that 10^3-10^4 gate circuits stay tractable.  At these
+    sizes, building the ``DAGDependency`` of the circuit is a large part of the total."""
+
+    params = [1000, 10000]
+    param_names = ["num_gates"]
+    timeout = 3600
+
+    def setup(self, num_gates):
+        circuit = random_nct_circuit(10, num_gates, seed=42)
+        self.dag = circuit_to_dag(circuit)
+        self.templates = [
+            nct.template_nct_2a_1(),
+            nct.template_nct_2a_2(),
+            nct.template_nct_2a_3(),
+            nct.template_nct_4a_3(),
+            nct.template_nct_5a_3(),
+        ]
+
+    def time_template_optimization(self, _):
+        TemplateOptimization(
+            self.templates,
+            heuristics_qubits_param=[1],
+            heuristics_backward_param=[3, 1],
+            heuristics_window_param=[10],
+            search_budget=500,
+        ).run(self.dag)
+
+    def time_template_optimization_pruning_only(self, _):
+        # Templates with gates missing from the circuit are skipped without matching.
+        TemplateOptimization(
+            [nct.template_nct_9c_1(), nct.template_nct_9d_1()],
+            search_budget=500,
+        ).run(self.dag)
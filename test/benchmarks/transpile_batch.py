@@ -0,0 +1,70 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-function-docstring,attribute-defined-outside-init
+
+"""Benchmarks of transpiling large batches of trivial circuits, which are dominated by the
+per-circuit overhead of :func:`.transpile` rather than by the passes."""
+
+import os
+
+from qiskit import transpile
+from qiskit.circuit import QuantumCircuit
+from qiskit.providers.fake_provider import FakeWashington
+from qiskit.transpiler import CouplingMap
+
+
+class TranspileBatchBenchmarks:
+    """Time to transpile 10000 trivial circuits in a single call."""
+
+    params = [[0, 1], ["none", "basis", "backend"]]
+    param_names = ["optimization_level", "target"]
+    timeout = 600
+
+    def setup(self, optimization_level, target):
+        # Run serially, so that the per-circuit overhead is not hidden by the parallel workers.
+        self.in_parallel = os.environ.get("QISKIT_IN_PARALLEL")
+        os.environ["QISKIT_IN_PARALLEL"] = "TRUE"
+        self.circuits = []
+        for i in range(10000):
+            circuit = QuantumCircuit(2, name=f"circuit_{i}")
+            circuit.h(0)
+            circuit.cx(0, 1)
+            circuit.measure_all()
+            self.circuits.append(circuit)
+        if target == "none":
+            self.kwargs = {}
+        elif target == "basis":
+            self.kwargs = {
+                "basis_gates": ["rz", "sx", "x", "cx"],
+                "coupling_map": CouplingMap.from_line(5),
+            }
+        else:
+            self.kwargs = {"backend": FakeWashington()}
+        self.kwargs["optimization_level"] = optimization_level
+        self.kwargs["seed_transpiler"] = 42
+
+    def teardown(self, *_):
+        if self.in_parallel is None:
+            os.environ.pop("QISKIT_IN_PARALLEL", None)
+        else:
+            os.environ["QISKIT_IN_PARALLEL"] = self.in_parallel
+
+    def time_transpile(self, *_):
+        transpile(self.circuits, **self.kwargs)
+
+    def time_transpile_named(self, *_):
+        transpile(
+            self.circuits,
+            output_name=[f"transpiled_{i}" for i in range(len(self.circuits))],
+            **self.kwargs,
+        )
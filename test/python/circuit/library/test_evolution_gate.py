@@ -19,10 +19,11 @@ from ddt import ddt, data, unpack
 from qiskit.circuit import QuantumCircuit, Parameter
 from qiskit.circuit.library import PauliEvolutionGate
 from qiskit.synthesis import LieTrotter, SuzukiTrotter, MatrixExponential, QDrift
+from qiskit.synthesis.evolution.product_formula import evolve_pauli
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 from qiskit.opflow import I, X, Y, Z, PauliSumOp
-from qiskit.quantum_info import Operator, SparsePauliOp, Pauli, Statevector
+from qiskit.quantum_info import Operator, SparsePauliOp, Pauli, Statevector, random_pauli_list
 from qiskit.utils import algorithm_globals
 
 
@@ -308,3 +309,58 @@ class TestEvolutionGate(QiskitTestCase):
                 evo = PauliEvolutionGate(op)
                 self.assertEqual(evo.name, "PauliEvolution")
                 self.assertEqual(evo.label, f"exp(-it {label})")
+
+    @data(
+        (LieTrotter, {"reps": 2}),
+        (LieTrotter, {"cx_structure": "fountain"}),
+        (SuzukiTrotter, {"order": 4, "insert_barriers": True}),
+        (QDrift, {"reps": 3}),
+    )
+    @unpack
+    def test_unwrapped_synthesis(self, synth_cls, options):
+        """Test not wrapping the atomic evolutions gives a flat, equivalent circuit."""
+        op = SparsePauliOp(["XYZI", "IIZZ", "YIIX", "ZXYZ"], [0.2, -0.5, 1.1, 0.3])
+        time = 0.3
+        wrapped = PauliEvolutionGate(op, time, synthesis=synth_cls(**options)).definition
+
+        algorithm_globals.random_seed = 2
+        flat = PauliEvolutionGate(op, time, synthesis=synth_cls(**options, wrap=False)).definition
+
+        basis = {"cx", "h", "s", "sdg", "rx", "ry", "rz", "rxx", "ryy", "rzz", "rzx", "barrier"}
+        self.assertTrue(set(flat.count_ops()).issubset(basis))
+        self.assertEqual(flat, wrapped.decompose())
+
+    @data(LieTrotter, SuzukiTrotter)
+    def test_unwrapped_settings(self, synth_cls):
+        """Test the wrap option is stored in the settings."""
+        synthesis = synth_cls(wrap=False)
+        self.assertFalse(synthesis.settings["wrap"])
+        self.assertFalse(synth_cls(**synthesis.settings).wrap)
+
+    def test_many_terms(self):
+        """Test the unwrapped synthesis of an operator with many terms and a parameterized time."""
+        num_qubits, num_terms = 5, 100
+        rng = np.random.default_rng(42)
+        op = SparsePauliOp(
+            random_pauli_list(num_qubits, num_terms, seed=42, phase=False),
+            rng.uniform(-1, 1, size=num_terms).astype(complex),
+        )
+        time = Parameter("t")
+        flat = PauliEvolutionGate(op, time, synthesis=LieTrotter(wrap=False)).definition
+        wrapped = PauliEvolutionGate(op, time, synthesis=LieTrotter()).definition
+
+        self.assertEqual(flat.num_parameters, 1)
+        self.assertEqual(wrapped.size(), num_terms)
+        self.assertEqual(flat, wrapped.decompose())
+
+    def test_qdrift_sampled_ops(self):
+        """Test QDrift samples its terms in a single draw and evolves them in order."""
+        op = SparsePauliOp(["X", "Y", "Z"], [0.1, -0.6, 0.3])
+        qdrift = QDrift(reps=4, wrap=False)
+        circuit = PauliEvolutionGate(op, 0.5, synthesis=qdrift).definition
+
+        self.assertEqual(len(qdrift.sampled_ops), circuit.size())
+        expected = QuantumCircuit(1)
+        for pauli, time in qdrift.sampled_ops:
+            expected.compose(evolve_pauli(pauli, time), inplace=True)
+        self.assertEqual(circuit, expected)
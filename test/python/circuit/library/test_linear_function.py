@@ -175,6 +175,33 @@ class TestLinearFunctions(QiskitTestCase):
             Operator(linear_function_from_matrix.definition) == Operator(linear_circuit)
         )
 
+    def test_large_linear_function(self):
+        """Test validating, synthesizing and converting back a linear function on many
+        qubits, where floating-point determinants are not usable."""
+        rng = np.random.default_rng(2468)
+        linear_circuit = random_linear_circuit(120, 1000, seed=rng)
+        linear_function = LinearFunction(linear_circuit)
+        validated = LinearFunction(linear_function.linear, validate_input=True)
+        synthesized = LinearFunction(linear_function.definition, validate_input=True)
+        self.assertTrue(np.all(synthesized.linear == linear_function.linear))
+        self.assertEqual(synthesized, validated)
+
+        singular = linear_function.linear.copy()
+        singular[0] = singular[1]
+        with self.assertRaises(CircuitError):
+            LinearFunction(singular, validate_input=True)
+
+    def test_equality(self):
+        """Test that linear functions are compared by their matrices."""
+        linear_circuit = QuantumCircuit(3)
+        linear_circuit.cx(0, 1)
+        linear_circuit.swap(1, 2)
+        linear_function = LinearFunction(linear_circuit)
+        self.assertEqual(linear_function, LinearFunction(linear_function.linear))
+        self.assertNotEqual(linear_function, LinearFunction(np.eye(3)))
+        self.assertNotEqual(linear_function, LinearFunction(np.eye(4)))
+        self.assertNotEqual(linear_function, SwapGate())
+
     def test_bad_matrix_non_rectangular(self):
         """Tests that an error is raised if the matrix is not rectangular."""
         mat = [[1, 1, 0, 0], [1, 0, 0], [0, 1, 0, 0], [1, 1, 1, 1]]
@@ -23,7 +23,7 @@ from qiskit import QuantumCircuit, QuantumRegister
 from qiskit.quantum_info import Statevector, Operator
 from qiskit.test import QiskitTestCase
 from qiskit.exceptions import QiskitError
-from qiskit.circuit.library import StatePreparation
+from qiskit.circuit.library import StatePreparation, RYGate, RZGate
 
 
 @ddt
@@ -114,6 +114,39 @@ class TestStatePreparation(QiskitTestCase):
         qc.append(StatePreparation("01").repeat(2), [0, 1])
         self.assertEqual(qc.decompose().count_ops()["state_preparation"], 2)
 
+    def test_large_state(self):
+        """Test a larger random state is prepared correctly"""
+        rng = np.random.default_rng(1234)
+        desired_vector = rng.standard_normal(2**10) + 1j * rng.standard_normal(2**10)
+        desired_vector /= np.linalg.norm(desired_vector)
+        qc = QuantumCircuit(10)
+        qc.prepare_state(desired_vector)
+        self.assertEqual(Statevector(qc), Statevector(desired_vector))
+
+    def test_multiplexors_are_flat(self):
+        """Test the multiplexors in the definition are defined without nested multiplexors"""
+        rng = np.random.default_rng(5678)
+        desired_vector = rng.standard_normal(2**4) + 1j * rng.standard_normal(2**4)
+        desired_vector /= np.linalg.norm(desired_vector)
+        disentangler = StatePreparation(desired_vector).definition.data[0].operation.definition
+        for instruction in disentangler.data:
+            self.assertTrue(instruction.operation.name.startswith("multiplex"))
+            ops = instruction.operation.definition.count_ops()
+            self.assertLessEqual(set(ops), {"rz", "ry", "cx"})
+            self.assertLessEqual(ops.get("cx", 0), 2 ** (instruction.operation.num_qubits - 1))
+
+    @data("rz", "ry")
+    def test_multiplexor_inverse_and_reverse(self, rotation):
+        """Test the inverse and the reversal of a multiplexor do not change its action"""
+        rng = np.random.default_rng(42)
+        angles = rng.uniform(-np.pi, np.pi, 8)
+        stateprep = StatePreparation("0000")
+        gate_class = RZGate if rotation == "rz" else RYGate
+        multiplexor = stateprep._multiplex(gate_class, angles)
+        expected = Operator(multiplexor.definition)
+        self.assertEqual(Operator(multiplexor.inverse()), expected.adjoint())
+        self.assertEqual(Operator(multiplexor.reverse_ops()), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
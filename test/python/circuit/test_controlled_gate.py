@@ -61,6 +61,7 @@ from qiskit.circuit.library import (
     CSXGate,
     MSGate,
     Barrier,
+    IGate,
     RCCXGate,
     RC3XGate,
     MCU1Gate,
@@ -1220,6 +1221,80 @@ class TestControlledGate(QiskitTestCase):
         target = _compute_control_matrix(base_mat, num_ctrl_qubits)
         self.assertEqual(Operator(ctrl_qc), Operator(target))
 
+    @data(0, 1, 3)
+    def test_lazy_standard_gate_definition(self, ctrl_state):
+        """Test the definition of a controlled standard gate is built on first use and
+        every gate gets its own copy of it."""
+        cgate1 = HGate().control(2, ctrl_state=ctrl_state)
+        cgate2 = HGate().control(2, ctrl_state=ctrl_state)
+        self.assertIsNone(cgate1._definition)
+
+        target = _compute_control_matrix(Operator(HGate()).data, 2, ctrl_state=ctrl_state)
+        self.assertEqual(Operator(cgate1), Operator(target))
+        self.assertEqual(cgate1, cgate2)
+        self.assertIsNot(cgate1._definition, cgate2._definition)
+
+        cgate1._definition.data.clear()
+        self.assertEqual(Operator(cgate2), Operator(target))
+        self.assertEqual(Operator(HGate().control(2, ctrl_state=ctrl_state)), Operator(target))
+
+    def test_standard_gate_custom_definition(self):
+        """Test the custom definition of a standard gate is used by its controlled version, while
+        a gate whose default definition was already built still gets a lazy one."""
+        gate = HGate()
+        custom = QuantumCircuit(1)
+        custom.x(0)
+        gate.definition = custom
+        target = _compute_control_matrix(Operator(XGate()).data, 2)
+        self.assertEqual(Operator(gate.control(2)), Operator(target))
+
+        gate = HGate()
+        self.assertIsNotNone(gate.definition)
+        self.assertIsNone(gate.control(2)._definition)
+
+    def test_lazy_definition_parameter_types(self):
+        """Test equal parameters of different types each get their own controlled definition."""
+        for value in (True, 1, 1.0):
+            with self.subTest(value=value):
+                gate = RZGate(value).control(1)
+                expected = _compute_control_matrix(Operator(RZGate(float(value))).data, 1)
+                self.assertEqual(Operator(gate), Operator(expected))
+                self.assertIs(type(gate.base_gate.params[0]), type(value))
+
+    def test_lazy_definition_without_control_source(self):
+        """Test a controlled gate pickled before lazy definitions, which has no
+        ``_control_source`` of its own, still builds its definition."""
+        state = dict(vars(CXGate()))
+        state.pop("_control_source", None)
+        gate = CXGate.__new__(CXGate)
+        gate.__dict__.update(state)
+        self.assertEqual(gate.definition, CXGate().definition)
+
+    def test_lazy_definition_bound_parameters(self):
+        """Test the definition of a controlled parameterized standard gate, which is only built
+        on first use, uses the bound parameters."""
+        theta = Parameter("θ")
+        circuit = QuantumCircuit(3)
+        circuit.append(CRYGate(theta).control(1), [0, 1, 2])
+        bound = circuit.assign_parameters({theta: 0.4})
+
+        expected = QuantumCircuit(3)
+        expected.append(CRYGate(0.4).control(1), [0, 1, 2])
+        self.assertEqual(Operator(bound), Operator(expected))
+
+    def test_non_controllable_standard_gate_raises(self):
+        """Test an error is still raised when controlling a standard gate without definition."""
+        with self.assertRaises(QiskitError):
+            IGate().control(2)
+
+    @data(MCXRecursive, MCXVChain)
+    def test_mcx_definitions_are_copied(self, gate_class):
+        """Test the cached definitions of the MCX gates are copied for every gate."""
+        gate1, gate2 = gate_class(6), gate_class(6)
+        self.assertEqual(gate1.definition, gate2.definition)
+        self.assertIsNot(gate1.definition, gate2.definition)
+        self.assertIsNot(gate1.definition.data[0].operation, gate2.definition.data[0].operation)
+
 
 @ddt
 class TestOpenControlledToMatrix(QiskitTestCase):
@@ -13,6 +13,8 @@
 
 """Test Qiskit's EquivalenceLibrary class."""
 
+import os
+import tempfile
 import unittest
 import numpy as np
 
@@ -23,6 +25,11 @@ from qiskit.circuit.library import U2Gate
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.converters import circuit_to_instruction, circuit_to_gate
 from qiskit.circuit import EquivalenceLibrary
+from qiskit.circuit.equivalence import Key, LazyEquivalenceLibrary
+from qiskit.circuit.library.standard_gates.equivalence_library import (
+    StandardEquivalenceLibrary,
+)
+from qiskit.transpiler.passes import BasisTranslator
 from qiskit.utils import optionals
 
 from ..visualization.visualization import QiskitVisualizationTestCase, path_to_diagram_reference
@@ -466,6 +473,101 @@ class TestSessionEquivalenceLibrary(QiskitTestCase):
         self.assertEqual(decomps[0], qc2)
 
 
+class TestLazyEquivalenceLibrary(QiskitTestCase):
+    """Test cases for LazyEquivalenceLibrary."""
+
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+        self.eq_lib = self._register_entries(LazyEquivalenceLibrary())
+
+    def _register_entries(self, eq_lib):
+        @eq_lib.lazy_entry("1q0p", 1)
+        def _zero_param(lib):
+            self.calls.append("1q0p")
+            equiv = QuantumCircuit(1)
+            equiv.h(0)
+            lib.add_equivalence(OneQubitZeroParamGate(), equiv)
+
+        @eq_lib.lazy_entry("1q1p", 1)
+        def _one_param(lib):
+            self.calls.append("1q1p")
+            theta = Parameter("theta")
+            equiv = QuantumCircuit(1)
+            equiv.rz(theta, 0)
+            lib.add_equivalence(OneQubitOneParamGate(theta), equiv)
+
+        return eq_lib
+
+    def test_entries_built_on_first_query(self):
+        """Loaders only run when their gate is first queried, and only once."""
+        self.assertTrue(self.eq_lib.has_entry(OneQubitZeroParamGate()))
+        self.assertEqual(self.calls, [])
+
+        entry = self.eq_lib.get_entry(OneQubitZeroParamGate())
+        expected = QuantumCircuit(1)
+        expected.h(0)
+        self.assertEqual(entry, [expected])
+        self.assertEqual(self.calls, ["1q0p"])
+
+        self.eq_lib.get_entry(OneQubitZeroParamGate())
+        self.assertEqual(self.calls, ["1q0p"])
+
+    def test_add_equivalence_keeps_order(self):
+        """Adding to an entry that is not built yet appends after the registered equivalences."""
+        theta = Parameter("theta")
+        equiv = QuantumCircuit(1)
+        equiv.p(theta, 0)
+        self.eq_lib.add_equivalence(OneQubitOneParamGate(theta), equiv)
+
+        entry = self.eq_lib.get_entry(OneQubitOneParamGate(1.0))
+        self.assertEqual(len(entry), 2)
+        self.assertEqual(entry[0].data[0].operation.name, "rz")
+        self.assertEqual(entry[1].data[0].operation.name, "p")
+
+    def test_set_entry_drops_loader(self):
+        """Setting an entry replaces its equivalences without building them."""
+        equiv = QuantumCircuit(1)
+        equiv.x(0)
+        self.eq_lib.set_entry(OneQubitZeroParamGate(), [equiv])
+
+        self.assertEqual(self.eq_lib.get_entry(OneQubitZeroParamGate()), [equiv])
+        self.assertEqual(self.calls, [])
+
+    def test_basis_search_with_signatures(self):
+        """A basis search only builds the entries it uses when signatures are available."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "signatures.json")
+            self.eq_lib.dump_signatures(path)
+            self.calls.clear()
+            eq_lib = self._register_entries(LazyEquivalenceLibrary(signatures_path=path))
+
+            circuit = QuantumCircuit(1)
+            circuit.append(OneQubitZeroParamGate(), [0])
+            out = BasisTranslator(eq_lib, ["h", "rz"])(circuit)
+
+        expected = QuantumCircuit(1)
+        expected.h(0)
+        self.assertEqual(out, expected)
+        self.assertEqual(self.calls, ["1q0p"])
+
+    def test_standard_signatures_up_to_date(self):
+        """The signatures snapshot of the standard library matches its equivalences.
+
+        If this fails, run ``tools/update_equivalence_signatures.py``."""
+        snapshot = StandardEquivalenceLibrary._load_signatures()
+        self.assertEqual(set(snapshot), StandardEquivalenceLibrary._get_all_keys())
+        for key, signatures in snapshot.items():
+            with self.subTest(key=key):
+                equivalences = StandardEquivalenceLibrary._get_equivalences(key)
+                self.assertEqual(
+                    signatures,
+                    EquivalenceLibrary._get_signatures(StandardEquivalenceLibrary, key),
+                )
+                self.assertEqual(len(signatures), len(equivalences))
+                self.assertIsInstance(key, Key)
+
+
 class TestEquivalenceLibraryVisualization(QiskitVisualizationTestCase):
     """Test cases for EquivalenceLibrary visualization."""
 
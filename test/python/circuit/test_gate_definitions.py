@@ -280,6 +280,7 @@ class TestGateEquivalenceEqual(QiskitTestCase):
             "ClassicalFunction",
             "ClassicalElement",
             "StatePreparation",
+            "_Multiplexor",
             "LinearFunction",
             "Commuting2qBlock",
         }
@@ -12,6 +12,7 @@
 
 """Tests basic functionality of the transpile function"""
 
+import datetime
 import io
 import os
 import sys
@@ -29,7 +30,7 @@ from qiskit.exceptions import QiskitError
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, pulse, qpy, qasm3
 from qiskit.circuit import Parameter, Gate, Qubit, Clbit
-from qiskit.compiler import transpile
+from qiskit.compiler import transpile, transpiler
 from qiskit.dagcircuit import DAGOutNode
 from qiskit.converters import circuit_to_dag
 from qiskit.circuit.library import (
@@ -46,6 +47,7 @@ from qiskit.circuit.library import (
 from qiskit.circuit import IfElseOp, WhileLoopOp, ForLoopOp, ControlFlowOp
 from qiskit.circuit.measure import Measure
 from qiskit.test import QiskitTestCase
+from qiskit.providers import clear_backend_cache
 from qiskit.providers.fake_provider import (
     FakeMelbourne,
     FakeRueschlikon,
@@ -54,13 +56,15 @@ from qiskit.providers.fake_provider import (
 )
 from qiskit.transpiler import Layout, CouplingMap
 from qiskit.transpiler import PassManager
-from qiskit.transpiler.target import Target
+from qiskit.transpiler.target import Target, InstructionProperties
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements, GateDirection
 from qiskit.quantum_info import Operator, random_unitary
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 from qiskit.transpiler.preset_passmanagers import level_0_pass_manager
 
+from ..providers.faulty_backends import FakeOurenseFaultyQ1
+
 
 class CustomCX(Gate):
     """Custom CX gate representation."""
@@ -1269,6 +1273,213 @@ class TestTranspile(QiskitTestCase):
         out = transpile(qc, dt=1e-9)
         self.assertEqual(out.data[0].operation.unit, "dt")
 
+    def test_scheduling_durations_follow_backend_dt(self):
+        """Test that durations reused between calls on the same backend follow changes to its
+        dt."""
+        qc = QuantumCircuit(1)
+        qc.u(0.1, 0.2, 0.3, 0)
+
+        backend = FakeBoeblingen()
+        backend.configuration().dt = 1e-9
+        first = transpile(qc, backend, initial_layout=[0], scheduling_method="asap")
+        backend.configuration().dt = 0.5e-9
+        second = transpile(qc, backend, initial_layout=[0], scheduling_method="asap")
+        u3_length = backend.properties().gate_length("u3", 0)
+        self.assertEqual(first.duration, round(u3_length / 1e-9))
+        self.assertEqual(second.duration, round(u3_length / 0.5e-9))
+
+    def test_backend_v1_derived_objects_reused(self):
+        """Test that transpile derives the faulty qubits map of a BackendV1 once, until the
+        properties of the backend are updated or its cache is cleared."""
+        qc = QuantumCircuit(2)
+        qc.cx(0, 1)
+        backend = FakeBoeblingen()
+
+        with patch.object(
+            transpiler, "_build_faulty_qubits_map", wraps=transpiler._build_faulty_qubits_map
+        ) as build:
+            transpile(qc, backend, seed_transpiler=42)
+            transpile(qc, backend, seed_transpiler=42)
+            self.assertEqual(build.call_count, 1)
+
+            backend.properties().last_update_date += datetime.timedelta(hours=1)
+            transpile(qc, backend, seed_transpiler=42)
+            self.assertEqual(build.call_count, 2)
+
+            clear_backend_cache(backend)
+            transpile(qc, backend, seed_transpiler=42)
+            self.assertEqual(build.call_count, 3)
+
+    def test_backend_v1_derived_objects_not_shared(self):
+        """Test that modifying the objects derived from a BackendV1 for a transpile call does not
+        affect the next calls on the same backend."""
+        backend = FakeBoeblingen()
+        coupling_map = transpiler._parse_coupling_map(None, backend)
+        self.assertNotIn((0, 2), coupling_map.get_edges())
+        coupling_map.add_edge(0, 2)
+        self.assertNotIn((0, 2), transpiler._parse_coupling_map(None, backend).get_edges())
+
+        backend = FakeOurenseFaultyQ1()
+        properties = backend.properties()
+        backend.properties = lambda: properties
+        faulty_qubits_map = transpiler._create_faulty_qubits_map(backend)
+        self.assertEqual(faulty_qubits_map[3], 0)
+        faulty_qubits_map[3] = None
+        self.assertEqual(transpiler._create_faulty_qubits_map(backend)[3], 0)
+
+        pruned = transpiler._parse_backend_properties(None, backend)
+        self.assertEqual(len(pruned.qubits), 4)
+        self.assertIsNot(transpiler._parse_backend_properties(None, backend), pruned)
+        self.assertEqual(len(properties.qubits), 5)
+
+    @data(0, 1, 2, 3)
+    def test_preset_pass_manager_reused(self, optimization_level):
+        """Test that transpile builds one preset pass manager per configuration and that reusing it
+        gives the same circuits as new pass managers."""
+        circuits = [QuantumCircuit(3) for _ in range(3)]
+        circuits[0].h(0)
+        circuits[0].cx(0, 2)
+        circuits[1].ccx(0, 1, 2)
+        circuits[2].cx(2, 0)
+        circuits[2].cx(1, 0)
+        for circuit in circuits:
+            circuit.measure_all()
+        backend = FakeBoeblingen()
+        transpiler._clear_pass_manager_cache()
+
+        expected = []
+        for circuit in circuits:
+            expected.append(
+                transpile(
+                    circuit, backend, optimization_level=optimization_level, seed_transpiler=7
+                )
+            )
+            transpiler._clear_pass_manager_cache()
+
+        level_pass_manager = f"level_{optimization_level}_pass_manager"
+        with patch.object(
+            transpiler, level_pass_manager, wraps=getattr(transpiler, level_pass_manager)
+        ) as build:
+            with patch.dict("os.environ", {"QISKIT_IN_PARALLEL": "TRUE"}):
+                first = transpile(
+                    circuits, backend, optimization_level=optimization_level, seed_transpiler=7
+                )
+            second = transpile(
+                circuits[0], backend, optimization_level=optimization_level, seed_transpiler=7
+            )
+            other = transpile(
+                circuits[0], backend, optimization_level=optimization_level, seed_transpiler=8
+            )
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected[0])
+        self.assertIsInstance(other, QuantumCircuit)
+
+    @data(0, 1, 2, 3)
+    def test_preset_pass_manager_reused_without_backend(self, optimization_level):
+        """Test that the preset pass manager is reused by calls with a target or with basis gates
+        and a coupling map, but no backend."""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 2)
+        circuit.measure_all()
+        target = FakeMumbaiV2().target
+        transpiler._clear_pass_manager_cache()
+
+        level_pass_manager = f"level_{optimization_level}_pass_manager"
+        with patch.object(
+            transpiler, level_pass_manager, wraps=getattr(transpiler, level_pass_manager)
+        ) as build:
+            for _ in range(3):
+                transpile(
+                    circuit, target=target, optimization_level=optimization_level, seed_transpiler=7
+                )
+            self.assertEqual(build.call_count, 1)
+            for _ in range(3):
+                transpile(
+                    circuit,
+                    basis_gates=["rz", "sx", "cx"],
+                    coupling_map=[[0, 1], [1, 2]],
+                    optimization_level=optimization_level,
+                    seed_transpiler=7,
+                )
+            self.assertEqual(build.call_count, 2)
+            target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=0.5))
+            transpile(
+                circuit, target=target, optimization_level=optimization_level, seed_transpiler=7
+            )
+            self.assertEqual(build.call_count, 3)
+
+    def test_shared_args_resolved_once(self):
+        """Test that the pass manager configuration of a batch of circuits that only differ in
+        their names is resolved once, and that the circuits get the right names."""
+        circuits = []
+        for i in range(5):
+            circuit = QuantumCircuit(2, name=f"circuit_{i}")
+            circuit.h(0)
+            circuit.cx(i % 2, (i + 1) % 2)
+            circuit.measure_all()
+            circuits.append(circuit)
+        output_name = [f"out_{i}" for i in range(5)]
+        kwargs = {
+            "basis_gates": ["rz", "sx", "cx"],
+            "coupling_map": CouplingMap([[0, 1], [1, 2]]),
+            "initial_layout": [2, 1],
+            "seed_transpiler": 42,
+        }
+
+        expected = [transpile(circuit, **kwargs) for circuit in circuits]
+        with patch.object(transpiler, "PassManagerConfig", wraps=PassManagerConfig) as config:
+            with patch.dict("os.environ", {"QISKIT_IN_PARALLEL": "TRUE"}):
+                named = transpile(circuits, output_name=output_name, **kwargs)
+                unnamed = transpile(circuits, **kwargs)
+        self.assertEqual(config.call_count, 2)
+        self.assertEqual([circuit.name for circuit in named], output_name)
+        self.assertEqual(unnamed, expected)
+        self.assertEqual(
+            [circuit.name for circuit in unnamed], [circuit.name for circuit in circuits]
+        )
+
+    @data(0, 1, 2, 3)
+    def test_skip_compatible(self, optimization_level):
+        """Test that the circuits that already conform to the backend are only laid out when
+        skip_compatible is set, and that the others are transpiled as usual."""
+        backend = FakeMumbaiV2()
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.cx(0, 2)
+        circuit.measure_all()
+        compatible = transpile(circuit, backend, optimization_level=1, seed_transpiler=42)
+        expected = transpile(
+            circuit, backend, optimization_level=optimization_level, seed_transpiler=42
+        )
+
+        with patch.dict("os.environ", {"QISKIT_IN_PARALLEL": "TRUE"}):
+            result = transpile(
+                [compatible, circuit],
+                backend,
+                optimization_level=optimization_level,
+                seed_transpiler=42,
+                skip_compatible=True,
+            )
+        self.assertEqual(result, [compatible, expected])
+        self.assertEqual(
+            result[0]._layout.initial_layout, Layout.generate_trivial_layout(*compatible.qregs)
+        )
+
+        scheduled = transpile(
+            compatible,
+            backend,
+            optimization_level=optimization_level,
+            scheduling_method="alap",
+            skip_compatible=True,
+        )
+        scheduled_ops = dict(scheduled.count_ops())
+        del scheduled_ops["delay"]
+        self.assertEqual(scheduled_ops, dict(compatible.count_ops()))
+        self.assertIsNotNone(scheduled.duration)
+
     def test_scheduling_backend_v2(self):
         """Test that scheduling method works with Backendv2."""
         qc = QuantumCircuit(2)
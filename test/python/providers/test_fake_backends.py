@@ -14,11 +14,13 @@
 # pylint: disable=missing-module-docstring
 
 import operator
+from unittest.mock import patch
 
 from test import combine
 from ddt import ddt, data
 
 from qiskit.circuit import QuantumCircuit
+from qiskit.circuit.library import XGate
 from qiskit.compiler import assemble
 from qiskit.compiler import transpile
 from qiskit.exceptions import QiskitError
@@ -31,8 +33,10 @@ from qiskit.providers.fake_provider import (
     FakeYorktown,
     FakeMumbai,
 )
-from qiskit.providers.backend_compat import BackendV2Converter
+from qiskit.providers import backend_compat
+from qiskit.providers.backend_compat import BackendV2Converter, clear_backend_cache
 from qiskit.providers.backend import BackendV2
+from qiskit.transpiler import InstructionProperties
 from qiskit.utils import optionals
 
 FAKE_PROVIDER_FOR_BACKEND_V2 = FakeProviderForBackendV2()
@@ -160,6 +164,27 @@ class TestFakeBackends(QiskitTestCase):
         else:
             self.skipTest("Backend %s does not have defaults" % backend)
 
+    def test_instances_do_not_share_snapshot(self):
+        backend = FakeMumbai()
+        backend.configuration().coupling_map.append([0, 26])
+        backend.properties().qubits[0][0].value = 1.0
+        backend.defaults().qubit_freq_est[0] = 1.0
+        backend.defaults().instruction_schedule_map.remove("x", 0)
+        other = FakeMumbai()
+        self.assertNotIn([0, 26], other.configuration().coupling_map)
+        self.assertNotEqual(other.properties().qubits[0][0].value, 1.0)
+        self.assertNotEqual(other.defaults().qubit_freq_est[0], 1.0)
+        self.assertTrue(other.defaults().instruction_schedule_map.has("x", 0))
+
+    def test_instances_v2_do_not_share_snapshot(self):
+        backend = FakeMumbaiV2()
+        backend.target.update_instruction_properties("cx", (0, 1), None)
+        backend.target.add_instruction(XGate(), name="x_copy")
+        other = FakeMumbaiV2()
+        self.assertIsNotNone(other.target["cx"][(0, 1)])
+        self.assertNotIn("x_copy", other.target)
+        self.assertEqual(other.target.num_qubits, backend.target.num_qubits)
+
     def test_delay_circuit(self):
         backend = FakeMumbaiV2()
         qc = QuantumCircuit(2)
@@ -182,6 +207,28 @@ class TestFakeBackends(QiskitTestCase):
         max_count = max(counts.items(), key=operator.itemgetter(1))[0]
         self.assertEqual(max_count, "11")
 
+    def test_converters_reuse_conversion(self):
+        backend = FakeMumbai()
+        with patch.object(
+            backend_compat, "convert_to_target", wraps=backend_compat.convert_to_target
+        ) as convert:
+            first = BackendV2Converter(backend).target
+            second = BackendV2Converter(backend).target
+            self.assertEqual(convert.call_count, 1)
+            self.assertIsNotNone(BackendV2Converter(backend, add_delay=True).target)
+            self.assertIsNotNone(BackendV2Converter(FakeMumbai()).target)
+            self.assertEqual(convert.call_count, 3)
+            clear_backend_cache(backend)
+            self.assertIsNotNone(BackendV2Converter(backend).target)
+            self.assertEqual(convert.call_count, 4)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.instructions, second.instructions)
+        first.update_instruction_properties("cx", (0, 1), InstructionProperties(error=0.5))
+        self.assertEqual(first["cx"][(0, 1)].error, 0.5)
+        self.assertNotEqual(second["cx"][(0, 1)].error, 0.5)
+        self.assertNotEqual(BackendV2Converter(backend).target["cx"][(0, 1)].error, 0.5)
+
     def test_converter_delay_circuit(self):
         backend = FakeMumbai()
         backend_v2 = BackendV2Converter(backend, add_delay=True)
@@ -37,6 +37,7 @@ from qiskit.quantum_info import random_clifford
 from qiskit.quantum_info.operators import Clifford, Operator
 from qiskit.quantum_info.operators.symplectic.clifford_circuits import _append_operation
 from qiskit.quantum_info.synthesis.clifford_decompose import (
+    decompose_clifford,
     decompose_clifford_ag,
     decompose_clifford_bm,
     decompose_clifford_greedy,
@@ -505,6 +506,24 @@ class TestCliffordSynthesis(QiskitTestCase):
             value = Clifford(decompose_clifford_greedy(target))
             self.assertEqual(value, target)
 
+    def test_decompose_small_clifford_cached(self):
+        """Test that decompositions of small Cliffords are cached and returned as copies"""
+        cliff = random_clifford(2, seed=10)
+        circ1 = decompose_clifford(cliff)
+        circ2 = decompose_clifford(Clifford(cliff.tableau.copy()))
+        self.assertIsNot(circ1, circ2)
+        self.assertEqual(circ1, circ2)
+        circ1.h(0)
+        self.assertEqual(Clifford(decompose_clifford(cliff)), cliff)
+        self.assertEqual(Clifford(decompose_clifford(cliff, method="AG")), cliff)
+
+    @combine(num_qubits=[30, 70])
+    def test_decompose_greedy_many_qubits(self, num_qubits):
+        """Test greedy synthesis for {num_qubits}-qubit Cliffords"""
+        target = random_clifford(num_qubits, seed=num_qubits)
+        value = Clifford(decompose_clifford_greedy(target))
+        self.assertEqual(value, target)
+
 
 @ddt
 class TestCliffordDecomposition(QiskitTestCase):
@@ -680,6 +699,27 @@ class TestCliffordOperators(QiskitTestCase):
             target = Clifford(circ1.compose(circ2))
             self.assertEqual(target, value)
 
+    @combine(num_qubits=[33, 70])
+    def test_compose_method_many_qubits(self, num_qubits):
+        """Test compose method on tableaus spanning several 64-bit words"""
+        samples = 3
+        num_gates = 5 * num_qubits
+        seed = 650
+        gates = "all"
+        for i in range(samples):
+            circ1 = random_clifford_circuit(num_qubits, num_gates, gates=gates, seed=seed + i)
+            circ2 = random_clifford_circuit(
+                num_qubits, num_gates, gates=gates, seed=seed + samples + i
+            )
+            cliff1 = Clifford(circ1)
+            cliff2 = Clifford(circ2)
+            self.assertTrue(cliff1.is_unitary())
+            value = cliff1.compose(cliff2)
+            target = Clifford(circ1.compose(circ2))
+            self.assertEqual(target, value)
+            self.assertEqual(cliff1.compose(circ2), value)
+            self.assertEqual(cliff1.adjoint().compose(cliff1), Clifford(QuantumCircuit(num_qubits)))
+
     @combine(num_qubits=[1, 2, 3])
     def test_dot_method(self, num_qubits):
         """Test dot method"""
@@ -1473,6 +1473,39 @@ class TestQuantumShannonDecomposer(QiskitTestCase):
             ccirc.count_ops().get("cx"), (23 / 48) * 4**nqubits - (3 / 2) * 2**nqubits + 4 / 3
         )
 
+    @data(1, 2)
+    def test_small_default_options(self, nqubits):
+        """Test decomposition of 1 and 2 qubit unitaries with the default optimizations."""
+        dim = 2**nqubits
+        umat = scipy.stats.unitary_group.rvs(dim, random_state=1224)
+        circ = self.qsd(umat)
+        self.assertTrue(Operator(umat) == Operator(circ))
+        if nqubits == 2:
+            ccirc = transpile(circ, basis_gates=["u", "cx"], optimization_level=0)
+            self.assertLessEqual(ccirc.count_ops().get("cx", 0), 3)
+
+    @data(False, True)
+    def test_flat_output(self, optimize):
+        """Test the output circuit only contains one and two qubit operations."""
+        nqubits = 6
+        dim = 2**nqubits
+        umat = scipy.stats.unitary_group.rvs(dim, random_state=42)
+        circ = self.qsd(umat, opt_a1=optimize, opt_a2=optimize)
+        self.assertTrue(all(len(instruction.qubits) <= 2 for instruction in circ.data))
+        self.assertTrue(Operator(umat) == Operator(circ))
+        ccirc = transpile(circ, basis_gates=["u", "cx"], optimization_level=0)
+        if optimize:
+            expected_cx = (23 / 48) * 4**nqubits - (3 / 2) * 2**nqubits + 4 / 3
+            self.assertEqual(ccirc.count_ops().get("cx"), expected_cx)
+        else:
+            self.assertLessEqual(ccirc.count_ops().get("cx"), self._qsd_l2_cx_count(nqubits))
+
+    def test_block_identity(self):
+        """Test decomposition of a unitary acting trivially on some blocks."""
+        umat = np.kron(np.identity(4), scipy.stats.unitary_group.rvs(4, random_state=7))
+        circ = self.qsd(umat)
+        self.assertTrue(Operator(umat) == Operator(circ))
+
 
 class TestTwoQubitDecomposeUpToDiagonal(QiskitTestCase):
     """test TwoQubitDecomposeUpToDiagonal class"""
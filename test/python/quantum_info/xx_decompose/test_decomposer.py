@@ -67,6 +67,36 @@ class TestMonodromyQISKit(unittest.TestCase):
 
             self.assertEqual(circuit1, circuit2)
 
+    def test_decompose_many(self):
+        """Test that batched compilation agrees with compiling each unitary separately."""
+        unitaries = []
+        for _ in range(20):
+            unitary = unitary_group.rvs(4, random_state=self._random_state)
+            unitaries.append(unitary / np.linalg.det(unitary) ** (1 / 4))
+
+        for basis_fidelity in [1.0, 0.99]:
+            circuits = self.decomposer.decompose_many(unitaries, basis_fidelity=basis_fidelity)
+            self.assertEqual(len(circuits), len(unitaries))
+            for unitary, circuit in zip(unitaries, circuits):
+                self.assertEqual(circuit, self.decomposer(unitary, basis_fidelity=basis_fidelity))
+
+    def test_best_decompositions_batch(self):
+        """Test that the batched search finds the same decompositions as separate searches."""
+        strength_table = self.decomposer._strength_to_infidelity(0.99, approximate=True)
+        targets = []
+        for _ in range(50):
+            unitary = unitary_group.rvs(4, random_state=self._random_state)
+            targets.append(
+                self.decomposer._positive_canonical_coordinate(TwoQubitWeylDecomposition(unitary))
+            )
+
+        batched = self.decomposer._best_decompositions(targets, strength_table)
+        for target, result in zip(targets, batched):
+            expected = self.decomposer._best_decomposition(target, strength_table)
+            self.assertEqual(result["sequence"], expected["sequence"])
+            self.assertEqual(result["cost"], expected["cost"])
+            np.testing.assert_array_equal(result["point"], expected["point"])
+
     @ddt.data(np.pi / 3, np.pi / 5, np.pi / 2)
     def test_default_embodiment(self, angle):
         """Test that _default_embodiment actually does yield XX gates."""
@@ -0,0 +1,108 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the bit-packed binary matrices used in linear function synthesis."""
+
+import unittest
+import numpy as np
+from ddt import ddt, data
+
+from qiskit.exceptions import QiskitError
+from qiskit.synthesis.linear import (
+    PackedBinaryMatrix,
+    calc_inverse_matrix,
+    check_invertible_binary_matrix,
+)
+from qiskit.test import QiskitTestCase
+
+
+def _reference_rank(mat):
+    """Rank over GF(2) by plain Gaussian elimination on a boolean array."""
+    mat = np.array(mat, dtype=bool)
+    rank = 0
+    for col in range(mat.shape[1]):
+        pivots = np.flatnonzero(mat[rank:, col])
+        if not pivots.size:
+            continue
+        pivot = rank + pivots[0]
+        mat[[rank, pivot]] = mat[[pivot, rank]]
+        for row in range(mat.shape[0]):
+            if row != rank and mat[row, col]:
+                mat[row] ^= mat[rank]
+        rank += 1
+        if rank == mat.shape[0]:
+            break
+    return rank
+
+
+@ddt
+class TestPackedBinaryMatrix(QiskitTestCase):
+    """Tests for PackedBinaryMatrix."""
+
+    @data((1, 1), (3, 5), (7, 64), (10, 65), (130, 70))
+    def test_roundtrip(self, shape):
+        """Test packing and unpacking, including matrices wider than one word."""
+        rng = np.random.default_rng(1234)
+        mat = rng.integers(2, size=shape).astype(bool)
+        packed = PackedBinaryMatrix(mat)
+        self.assertEqual(packed.shape, shape)
+        self.assertTrue(np.array_equal(packed.to_matrix(), mat))
+        self.assertTrue(np.array_equal(packed.transpose().to_matrix(), mat.T))
+        self.assertTrue(np.array_equal(packed.row_weights(), mat.sum(axis=1)))
+        self.assertTrue(np.array_equal(packed.column(shape[1] - 1), mat[:, -1]))
+        self.assertEqual(
+            PackedBinaryMatrix.from_row_integers(packed.to_row_integers(), shape[1]), packed
+        )
+
+    def test_row_operations(self):
+        """Test adding and swapping rows."""
+        mat = PackedBinaryMatrix([[1, 0, 1], [0, 1, 1], [0, 0, 1]])
+        mat.xor_rows(0, 2)
+        mat.xor_rows([1], [2])
+        mat.swap_rows(0, 2)
+        self.assertEqual(mat, PackedBinaryMatrix([[0, 0, 1], [0, 1, 0], [1, 0, 0]]))
+
+    @data(2, 5, 64, 100)
+    def test_dot(self, num_qubits):
+        """Test matrix multiplication over GF(2) against integer multiplication."""
+        rng = np.random.default_rng(num_qubits)
+        mat1 = rng.integers(2, size=(num_qubits, num_qubits))
+        mat2 = rng.integers(2, size=(num_qubits, num_qubits + 3))
+        product = PackedBinaryMatrix(mat1) @ PackedBinaryMatrix(mat2)
+        self.assertTrue(np.array_equal(product.to_matrix(), (mat1 @ mat2) % 2))
+
+    @data(3, 8, 65, 150)
+    def test_rank_and_inverse(self, num_qubits):
+        """Test the rank and inverse of random matrices."""
+        rng = np.random.default_rng(5678)
+        for _ in range(5):
+            mat = rng.integers(2, size=(num_qubits, num_qubits))
+            packed = PackedBinaryMatrix(mat)
+            rank = _reference_rank(mat)
+            self.assertEqual(packed.rank(), rank)
+            self.assertEqual(check_invertible_binary_matrix(mat), rank == num_qubits)
+            if rank == num_qubits:
+                inverse = calc_inverse_matrix(mat)
+                self.assertTrue(np.array_equal((mat @ inverse) % 2, np.eye(num_qubits, dtype=int)))
+            else:
+                with self.assertRaises(QiskitError):
+                    packed.inverse()
+
+    def test_non_square_is_not_invertible(self):
+        """Test that non-square matrices are reported as non invertible."""
+        self.assertFalse(check_invertible_binary_matrix([[1, 0, 0], [0, 1, 0]]))
+        with self.assertRaises(QiskitError):
+            PackedBinaryMatrix([[1, 0, 0], [0, 1, 0]]).inverse()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,7 +24,10 @@ from qiskit.test import QiskitTestCase
 from qiskit.transpiler.synthesis.aqc.aqc import AQC
 from qiskit.transpiler.synthesis.aqc.cnot_structures import make_cnot_network
 from qiskit.transpiler.synthesis.aqc.cnot_unit_circuit import CNOTUnitCircuit
-from qiskit.transpiler.synthesis.aqc.cnot_unit_objective import DefaultCNOTUnitObjective
+from qiskit.transpiler.synthesis.aqc.cnot_unit_objective import (
+    DefaultCNOTUnitObjective,
+    FastCNOTUnitObjective,
+)
 
 
 class TestAqc(QiskitTestCase):
@@ -60,6 +63,34 @@ class TestAqc(QiskitTestCase):
         error = 0.5 * (np.linalg.norm(approx_matrix - ORIGINAL_CIRCUIT, "fro") ** 2)
         self.assertTrue(error < 1e-3)
 
+    def test_aqc_fast_objective_restarts(self):
+        """Tests AQC with the fast objective and several random restarts."""
+        num_qubits = int(round(np.log2(np.array(ORIGINAL_CIRCUIT).shape[0])))
+        cnots = make_cnot_network(
+            num_qubits=num_qubits, network_layout="spin", connectivity_type="full", depth=0
+        )
+
+        aqc = AQC(optimizer=L_BFGS_B(maxiter=200), seed=12345, num_restarts=3)
+
+        target_matrix = np.array(ORIGINAL_CIRCUIT)
+        approximate_circuit = CNOTUnitCircuit(num_qubits, cnots)
+        approximating_objective = FastCNOTUnitObjective(num_qubits, cnots)
+
+        aqc.compile_unitary(
+            target_matrix=target_matrix,
+            approximate_circuit=approximate_circuit,
+            approximating_objective=approximating_objective,
+        )
+
+        approx_matrix = Operator(approximate_circuit).data
+        error = 0.5 * (np.linalg.norm(approx_matrix - ORIGINAL_CIRCUIT, "fro") ** 2)
+        self.assertTrue(error < 1e-3)
+
+    def test_invalid_num_restarts(self):
+        """Tests a non-positive number of restarts is rejected."""
+        with self.assertRaises(ValueError):
+            AQC(num_restarts=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,7 +20,11 @@ import numpy as np
 
 from qiskit.test import QiskitTestCase
 from qiskit.transpiler.synthesis.aqc.cnot_structures import make_cnot_network
-from qiskit.transpiler.synthesis.aqc.cnot_unit_objective import DefaultCNOTUnitObjective
+from qiskit.quantum_info import random_unitary
+from qiskit.transpiler.synthesis.aqc.cnot_unit_objective import (
+    DefaultCNOTUnitObjective,
+    FastCNOTUnitObjective,
+)
 
 
 class TestGradientAgainstFiniteDiff(QiskitTestCase):
@@ -105,5 +109,42 @@ class TestGradientAgainstFiniteDiff(QiskitTestCase):
         self.assertTrue(np.all(orders < 3))
 
 
+class TestFastGradient(QiskitTestCase):
+    """Compares the fast objective and gradient with the default ones."""
+
+    def test_fast_vs_default(self):
+        """Tests the fast objective and gradient are the same as the default ones."""
+        for num_qubits, network_layout, connectivity_type in [
+            (3, "spin", "full"),
+            (4, "sequ", "line"),
+            (4, "cart", "star"),
+            (5, "cyclic_spin", "full"),
+        ]:
+            with self.subTest(num_qubits=num_qubits, network_layout=network_layout):
+                cnots = make_cnot_network(
+                    num_qubits=num_qubits,
+                    network_layout=network_layout,
+                    connectivity_type=connectivity_type,
+                    depth=0,
+                )
+                target_matrix = random_unitary(2**num_qubits, seed=num_qubits).data
+                default_objective = DefaultCNOTUnitObjective(num_qubits, cnots)
+                default_objective.target_matrix = target_matrix
+                fast_objective = FastCNOTUnitObjective(num_qubits, cnots)
+                fast_objective.target_matrix = target_matrix
+
+                rng = np.random.default_rng(num_qubits)
+                for _ in range(3):
+                    thetas = rng.uniform(0, 2 * np.pi, default_objective.num_thetas)
+                    self.assertAlmostEqual(
+                        fast_objective.objective(thetas), default_objective.objective(thetas)
+                    )
+                    np.testing.assert_allclose(
+                        fast_objective.gradient(thetas),
+                        default_objective.gradient(thetas),
+                        atol=1e-10,
+                    )
+
+
 if __name__ == "__main__":
     unittest.main()
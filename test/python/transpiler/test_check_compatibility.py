@@ -0,0 +1,137 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the CheckCompatibility pass."""
+
+import unittest
+
+from ddt import ddt, data
+
+from qiskit import pulse
+from qiskit.circuit import QuantumCircuit
+from qiskit.providers.fake_provider import FakeMumbaiV2
+from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.passes import CheckCompatibility
+from qiskit.transpiler.timing_constraints import TimingConstraints
+from qiskit.test import QiskitTestCase
+
+
+@ddt
+class TestCheckCompatibility(QiskitTestCase):
+    """Tests for the CheckCompatibility pass."""
+
+    def setUp(self):
+        super().setUp()
+        self.basis_gates = ["rz", "sx", "cx"]
+        self.coupling_map = CouplingMap([[0, 1], [1, 2]])
+
+    def check(self, circuit, **kwargs):
+        """Run the pass on ``circuit`` and return the property it sets."""
+        kwargs.setdefault("basis_gates", self.basis_gates)
+        kwargs.setdefault("coupling_map", self.coupling_map)
+        property_set = {}
+        CheckCompatibility(**kwargs)(circuit, property_set=property_set)
+        return property_set["is_compatible"]
+
+    def test_compatible(self):
+        """Test a circuit in the basis, on coupled qubits in the right direction."""
+        circuit = QuantumCircuit(3)
+        circuit.sx(0)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        circuit.barrier()
+        circuit.delay(100, 2)
+        circuit.measure_all()
+        self.assertTrue(self.check(circuit))
+
+    def test_not_in_basis(self):
+        """Test a circuit with a gate out of the basis."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        self.assertFalse(self.check(circuit))
+
+    @data([0, 2], [1, 0])
+    def test_not_mapped(self, qubits):
+        """Test a circuit with a two-qubit gate on uncoupled qubits or in the wrong direction."""
+        circuit = QuantumCircuit(3)
+        circuit.cx(*qubits)
+        self.assertFalse(self.check(circuit))
+
+    def test_calibrated_gate_not_mapped(self):
+        """Test that the connectivity of gates with a calibration is not checked, as in
+        CheckMap."""
+        circuit = QuantumCircuit(3)
+        circuit.cx(0, 2)
+        circuit.add_calibration("cx", [0, 2], pulse.Schedule())
+        self.assertTrue(self.check(circuit))
+
+    def test_three_qubit_gate(self):
+        """Test that gates on more than two qubits are not compatible with a coupling map."""
+        circuit = QuantumCircuit(3)
+        circuit.ccx(0, 1, 2)
+        self.assertFalse(self.check(circuit, basis_gates=self.basis_gates + ["ccx"]))
+        self.assertTrue(
+            self.check(circuit, basis_gates=self.basis_gates + ["ccx"], coupling_map=None)
+        )
+
+    def test_too_many_qubits(self):
+        """Test a circuit wider than the coupling map."""
+        self.assertFalse(self.check(QuantumCircuit(4)))
+
+    def test_control_flow(self):
+        """Test that the blocks of control-flow operations are checked on the qubits they are
+        applied to."""
+        basis_gates = self.basis_gates + ["if_else"]
+        body = QuantumCircuit(2, 1)
+        body.cx(0, 1)
+
+        circuit = QuantumCircuit(3, 1)
+        circuit.measure(0, 0)
+        circuit.if_test((circuit.clbits[0], True), body, [1, 2], [0])
+        self.assertTrue(self.check(circuit, basis_gates=basis_gates))
+
+        circuit = QuantumCircuit(3, 1)
+        circuit.measure(0, 0)
+        circuit.if_test((circuit.clbits[0], True), body, [2, 1], [0])
+        self.assertFalse(self.check(circuit, basis_gates=basis_gates))
+
+    def test_timing_constraints(self):
+        """Test that delays must respect the alignment constraints."""
+        circuit = QuantumCircuit(1)
+        circuit.delay(100, 0)
+        self.assertTrue(self.check(circuit, timing_constraints=TimingConstraints()))
+        self.assertFalse(
+            self.check(circuit, timing_constraints=TimingConstraints(pulse_alignment=16))
+        )
+        circuit = QuantumCircuit(1)
+        circuit.delay(160, 0)
+        self.assertTrue(
+            self.check(circuit, timing_constraints=TimingConstraints(pulse_alignment=16))
+        )
+
+    def test_target(self):
+        """Test that the target is used instead of the basis gates and coupling map."""
+        target = FakeMumbaiV2().target
+        circuit = QuantumCircuit(3)
+        circuit.sx(0)
+        circuit.cx(0, 1)
+        circuit.cx(2, 1)
+        circuit.measure_all()
+        self.assertTrue(self.check(circuit, basis_gates=None, coupling_map=None, target=target))
+        circuit = QuantumCircuit(3)
+        circuit.cx(0, 2)
+        self.assertFalse(self.check(circuit, basis_gates=None, coupling_map=None, target=target))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,7 @@ from math import pi
 from ddt import ddt, data, unpack
 
 from qiskit.circuit import Gate, QuantumCircuit
+from qiskit.circuit.random import random_circuit
 from qiskit.circuit import QuantumRegister, ClassicalRegister
 from qiskit.converters import circuit_to_dag
 from qiskit.transpiler import PassManager
@@ -185,6 +186,61 @@ class TestCollect2qBlocks(QiskitTestCase):
         pass_manager.run(qc)
         self.assertEqual(len(pass_manager.property_set["block_list"]), 3)
 
+    @data(1, 2, 3, 4, 5)
+    def test_blocks_of_random_circuit(self, seed):
+        """Test the blocks found on a random circuit with measurements, conditions and 3q gates
+        are disjoint, each act on at most 2 qubits, cover every unconditioned 2q gate, list their
+        nodes in topological order and can each be replaced by a single gate."""
+        circuit = random_circuit(6, 30, max_operands=3, measure=True, conditional=True, seed=seed)
+        dag = circuit_to_dag(circuit)
+        blocks = dag.collect_2q_runs()
+
+        seen = set()
+        for block in blocks:
+            block_ids = [node._node_id for node in block]
+            self.assertTrue(seen.isdisjoint(block_ids))
+            seen.update(block_ids)
+
+            qubits = {qubit for node in block for qubit in node.qargs}
+            self.assertLessEqual(len(qubits), 2)
+            for node in block:
+                self.assertIsInstance(node.op, Gate)
+                self.assertIsNone(node.op.condition)
+
+            for i, node in enumerate(block):
+                ancestors = dag.ancestors(node)
+                self.assertFalse(any(later in ancestors for later in block[i + 1 :]))
+
+        for node in dag.op_nodes():
+            if len(node.qargs) == 2 and isinstance(node.op, Gate) and node.op.condition is None:
+                self.assertIn(node._node_id, seen)
+
+        for block in blocks:
+            qubits = sorted({qubit for node in block for qubit in node.qargs}, key=dag.qubits.index)
+            wire_pos_map = {qubit: i for i, qubit in enumerate(qubits)}
+            dag.replace_block_with_op(block, Gate("block", len(qubits), []), wire_pos_map)
+
+    def test_pending_1q_gates_join_next_block(self):
+        """Test that 1q gates only join the block of a later 2q gate on the same wire if
+        nothing interrupts the wire in between."""
+        qc = QuantumCircuit(3, 1)
+        qc.h(0)
+        qc.x(1)
+        qc.measure(1, 0)
+        qc.z(1)
+        qc.cx(0, 1)
+        qc.h(2)
+        qc.cx(1, 2)
+        qc.s(0)
+
+        pass_ = Collect2qBlocks()
+        pass_.run(circuit_to_dag(qc))
+
+        self.assertEqual(
+            [[n.name for n in block] for block in pass_.property_set["block_list"]],
+            [["h", "z", "cx", "s"], ["h", "cx"]],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -285,6 +285,28 @@ class TestCollect2qBlocks(QiskitTestCase):
 
         pass_manager.run(qc)
 
+    def test_blocks_are_independent_between_runs(self):
+        """Test that running the pass again does not modify the blocks of a previous run."""
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(1, 2)
+        qc.ccx(0, 1, 2)
+        qc.cx(0, 2)
+        dag = circuit_to_dag(qc)
+
+        pass_ = CollectMultiQBlocks(max_block_size=2)
+        pass_.run(dag)
+        first = [[n.name for n in block] for block in pass_.property_set["block_list"]]
+        first_blocks = pass_.property_set["block_list"]
+        pass_.run(dag)
+
+        self.assertEqual(first, [["h", "cx"], ["cx"], ["cx"]])
+        self.assertEqual([[n.name for n in block] for block in first_blocks], first)
+        self.assertEqual(
+            [[n.name for n in block] for block in pass_.property_set["block_list"]], first
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,160 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the internal utilities for control-flow operations of the transpiler passes."""
+
+import unittest
+
+import numpy as np
+
+from qiskit.circuit import Clbit, Gate, IfElseOp, QuantumCircuit, Qubit
+from qiskit.circuit.library import CXGate
+from qiskit.extensions import UnitaryGate
+from qiskit.transpiler.passes.utils.control_flow import block_key, map_blocks
+from qiskit.test import QiskitTestCase
+
+
+class TestBlockKey(QiskitTestCase):
+    """Tests for the block_key function."""
+
+    def setUp(self):
+        super().setUp()
+        self.qubits = [Qubit(), Qubit()]
+        self.clbit = Clbit()
+
+    def block(self):
+        """Get an empty block on the same bits."""
+        return QuantumCircuit(self.qubits, [self.clbit])
+
+    def test_equal_blocks(self):
+        """Test that blocks built separately with the same instructions have equal keys."""
+        blocks = []
+        for _ in range(2):
+            block = self.block()
+            block.h(0)
+            block.rz(0.5, 1)
+            block.cx(0, 1).c_if(self.clbit, True)
+            block.measure(1, 0)
+            blocks.append(block)
+        self.assertNotEqual(blocks[0].name, blocks[1].name)
+        self.assertEqual(block_key(blocks[0]), block_key(blocks[1]))
+
+    def test_different_blocks(self):
+        """Test that blocks that differ in any way that matters have different keys."""
+        base = self.block()
+        base.rz(0.5, 0)
+        base.cx(0, 1)
+        keys = {block_key(base)}
+
+        for change in (
+            lambda block: block.rz(0.25, 0),
+            lambda block: block.rz(0.5, 1),
+            lambda block: block.rx(0.5, 0),
+            lambda block: block.rz(0.5, 0).c_if(self.clbit, True),
+            lambda block: block.append(CXGate(label="cx"), [0, 1]),
+            lambda block: block.append(CXGate(ctrl_state=0), [0, 1]),
+        ):
+            block = self.block()
+            block.rz(0.5, 0)
+            block.cx(0, 1)
+            change(block)
+            keys.add(block_key(block))
+        other_bits = QuantumCircuit(2, 1)
+        other_bits.rz(0.5, 0)
+        other_bits.cx(0, 1)
+        keys.add(block_key(other_bits))
+        self.assertEqual(len(keys), 8)
+
+    def test_custom_gates_by_identity(self):
+        """Test that gates outside of the standard library are only equal to themselves, as
+        their definitions may differ."""
+        gate = Gate("custom", 1, [])
+        first, second, third = self.block(), self.block(), self.block()
+        first.append(gate, [0])
+        second.append(gate, [0])
+        third.append(Gate("custom", 1, []), [0])
+        self.assertEqual(block_key(first), block_key(second))
+        self.assertNotEqual(block_key(first), block_key(third))
+
+    def test_nested_blocks(self):
+        """Test that the blocks of nested control-flow operations are compared by value."""
+        keys = []
+        for _ in range(2):
+            body = self.block()
+            body.x(0)
+            block = self.block()
+            block.if_test((self.clbit, True), body, self.qubits, [self.clbit])
+            keys.append(block_key(block))
+        self.assertEqual(keys[0], keys[1])
+
+    def test_not_cacheable(self):
+        """Test that blocks with unhashable parameters or with calibrations have no key."""
+        block = self.block()
+        block.append(UnitaryGate(np.eye(2)), [0])
+        self.assertIsNone(block_key(block))
+        block = self.block()
+        block.x(0)
+        block.add_calibration("x", [0], None)
+        self.assertIsNone(block_key(block))
+
+
+class TestMapBlocks(QiskitTestCase):
+    """Tests for the map_blocks function."""
+
+    def test_cache(self):
+        """Test that identical blocks are only mapped once with a cache."""
+        qubit, clbit = Qubit(), Clbit()
+        ops = []
+        for _ in range(3):
+            body = QuantumCircuit([qubit, clbit])
+            body.x(0)
+            ops.append(IfElseOp((clbit, True), body))
+
+        mapped = []
+
+        def mapping(dag):
+            mapped.append(dag)
+            return dag
+
+        cache = {}
+        new_ops = [map_blocks(mapping, op, cache) for op in ops]
+        self.assertEqual(len(mapped), 1)
+        self.assertEqual(new_ops[0], ops[0])
+        self.assertEqual(new_ops[1], ops[1])
+        self.assertEqual(new_ops[2], ops[2])
+
+        mapped.clear()
+        for op in ops:
+            map_blocks(mapping, op)
+        self.assertEqual(len(mapped), 3)
+
+    def test_cached_blocks_not_shared(self):
+        """Test that the operations mapped from the cache do not share their blocks, so modifying
+        one does not modify the others."""
+        qubit, clbit = Qubit(), Clbit()
+        ops = []
+        for _ in range(3):
+            body = QuantumCircuit([qubit, clbit])
+            body.x(0)
+            ops.append(IfElseOp((clbit, True), body))
+
+        cache = {}
+        new_ops = [map_blocks(lambda dag: dag, op, cache) for op in ops]
+        new_ops[1].blocks[0].h(0)
+        self.assertEqual(len(new_ops[0].blocks[0]), 1)
+        self.assertEqual(len(new_ops[2].blocks[0]), 1)
+        new_ops[0].blocks[0].data[0].operation.label = "modified"
+        self.assertIsNone(new_ops[2].blocks[0].data[0].operation.label)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,6 +16,7 @@ import unittest
 
 from qiskit import QuantumCircuit, QuantumRegister
 from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PassManager
 from qiskit.transpiler.passes import CountOpsLongestPath
 from qiskit.test import QiskitTestCase
 
@@ -61,6 +62,23 @@ class TestCountOpsLongestPathPass(QiskitTestCase):
         count_ops = pass_.property_set["count_ops_longest_path"]
         self.assertDictEqual(count_ops, {"cx": 3, "x": 2, "y": 2, "h": 2})
 
+    def test_reuses_longest_path(self):
+        """Test that the longest path found by the required DAGLongestPath pass is used."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.x(1)
+
+        passmanager = PassManager()
+        passmanager.append(CountOpsLongestPath())
+        passmanager.run(circuit)
+
+        path = passmanager.property_set["dag_longest_path"]
+        self.assertEqual([node.name for node in path[1:-1]], ["h", "cx", "x"])
+        self.assertDictEqual(
+            passmanager.property_set["count_ops_longest_path"], {"h": 1, "cx": 1, "x": 1}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
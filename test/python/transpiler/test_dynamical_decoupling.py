@@ -615,6 +615,21 @@ class TestPadDynamicalDecoupling(QiskitTestCase):
         with self.assertRaises(TranspilerError):
             pm.run(self.ghz4)
 
+    def test_dd_pass_reused(self):
+        """Test that a DD pass instance can be reused on different circuits."""
+        dd_sequence = [XGate(), YGate(), XGate(), YGate()]
+        dd_pass = PadDynamicalDecoupling(self.durations, dd_sequence, pulse_alignment=10)
+
+        for circuit in (self.ghz4, self.midmeas, self.ghz4):
+            reused = PassManager([ALAPScheduleAnalysis(self.durations), dd_pass]).run(circuit)
+            fresh = PassManager(
+                [
+                    ALAPScheduleAnalysis(self.durations),
+                    PadDynamicalDecoupling(self.durations, dd_sequence, pulse_alignment=10),
+                ]
+            ).run(circuit)
+            self.assertEqual(reused, fresh)
+
     @data(0.5, 1.5)
     def test_dd_with_calibrations_with_parameters(self, param_value):
         """Check that calibrations in a circuit with parameters work fine."""
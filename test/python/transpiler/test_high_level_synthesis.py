@@ -18,10 +18,13 @@ Tests the interface for HighLevelSynthesis transpiler pass.
 import unittest.mock
 
 from qiskit.circuit import QuantumCircuit, Operation
+from qiskit.circuit.library import LinearFunction
+from qiskit.quantum_info import Operator, random_clifford
 from qiskit.test import QiskitTestCase
 from qiskit.transpiler import PassManager
 from qiskit.transpiler.passes.synthesis.plugin import HighLevelSynthesisPlugin
 from qiskit.transpiler.passes.synthesis.high_level_synthesis import HighLevelSynthesis, HLSConfig
+from qiskit.transpiler.synthesis import cnot_synth
 
 
 # In what follows, we create two simple operations OpA and OpB, that potentially mimic
@@ -290,5 +293,38 @@ class TestHighLeverSynthesis(QiskitTestCase):
             self.assertIn("op_b", ops.keys())
 
 
+class TestHighLevelSynthesisReuse(QiskitTestCase):
+    """Tests for the reuse and the parallel execution of syntheses."""
+
+    def test_equal_objects_synthesized_once(self):
+        """Check that equal linear functions are only synthesized once."""
+        qc = QuantumCircuit(4)
+        for qubits in [[0, 1, 2], [1, 2, 3], [0, 1, 2]]:
+            qc.append(LinearFunction([[1, 1, 0], [0, 1, 0], [0, 1, 1]]), qubits)
+        qc.append(LinearFunction([[0, 1, 0], [1, 0, 0], [1, 1, 1]]), [3, 2, 1])
+
+        with unittest.mock.patch(
+            "qiskit.transpiler.passes.synthesis.high_level_synthesis.cnot_synth",
+            wraps=cnot_synth,
+        ) as mock_cnot_synth:
+            tqc = PassManager([HighLevelSynthesis()]).run(qc)
+
+        self.assertEqual(mock_cnot_synth.call_count, 2)
+        self.assertNotIn("linear_function", tqc.count_ops())
+        self.assertEqual(Operator(tqc), Operator(qc))
+
+    def test_parallel_synthesis(self):
+        """Check that synthesizing in several processes gives the same circuit."""
+        qc = QuantumCircuit(5)
+        for seed, qubits in enumerate([[0, 1, 2], [1, 2, 3], [4, 2, 0], [3, 4, 1]]):
+            qc.append(random_clifford(3, seed=seed), qubits)
+        qc.append(random_clifford(3, seed=0), [2, 3, 4])
+
+        serial = PassManager([HighLevelSynthesis()]).run(qc)
+        parallel = PassManager([HighLevelSynthesis(num_processes=2)]).run(qc)
+        self.assertEqual(parallel, serial)
+        self.assertEqual(Operator(parallel), Operator(qc))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -14,6 +14,9 @@
 
 """Test InstructionDurations class."""
 
+import copy
+import pickle
+
 from qiskit.circuit import Delay, Parameter
 from qiskit.providers.fake_provider import FakeParis, FakeTokyo
 from qiskit.transpiler.exceptions import TranspilerError
@@ -60,6 +63,53 @@ class TestInstructionDurationsClass(QiskitTestCase):
         self.assertEqual(durations.get("rzx", [0, 1], parameters=[0.5]), 150)
         self.assertEqual(durations.get("rzx", [0, 1], parameters=[1.0]), 300)
 
+    def test_update_after_get(self):
+        durations = InstructionDurations([("cx", (0, 1), 100), ("x", None, 20)])
+        self.assertEqual(durations.get("cx", [0, 1]), 100)
+        self.assertEqual(durations.get("x", [0]), 20)
+
+        durations.update([("cx", (0, 1), 200), ("x", [0], 40)])
+        self.assertEqual(durations.get("cx", [0, 1]), 200)
+        self.assertEqual(durations.get("x", [0]), 40)
+        self.assertEqual(durations.get("x", [1]), 20)
+
+    def test_set_dt_after_get(self):
+        durations = InstructionDurations([("x", [0], 100e-9, "s")], dt=1e-9)
+        self.assertEqual(durations.get("x", [0]), 100)
+
+        durations.dt = 2e-9
+        self.assertEqual(durations.get("x", [0]), 50)
+        durations.update(None, dt=1e-9)
+        self.assertEqual(durations.get("x", [0]), 100)
+        self.assertEqual(durations.get("x", [0], "s"), 100e-9)
+
+    def test_write_durations_after_get(self):
+        durations = InstructionDurations([("cx", (0, 1), 100), ("x", None, 20)])
+        self.assertEqual(durations.get("cx", [0, 1]), 100)
+        self.assertEqual(durations.get("x", [0]), 20)
+
+        durations.duration_by_name_qubits[("cx", (0, 1))] = 200, "dt"
+        durations.duration_by_name["x"] = 30, "dt"
+        self.assertEqual(durations.get("cx", [0, 1]), 200)
+        self.assertEqual(durations.get("x", [0]), 30)
+
+        durations.duration_by_name_qubits.update({("x", (0,)): (40, "dt")})
+        self.assertEqual(durations.get("x", [0]), 40)
+        del durations.duration_by_name_qubits[("x", (0,))]
+        self.assertEqual(durations.get("x", [0]), 30)
+
+        durations.duration_by_name = {"x": (50, "dt")}
+        self.assertEqual(durations.get("x", [0]), 50)
+
+    def test_copies_keep_separate_caches(self):
+        durations = InstructionDurations([("x", [0], 100)])
+        self.assertEqual(durations.get("x", [0]), 100)
+        for other in (copy.deepcopy(durations), pickle.loads(pickle.dumps(durations))):
+            self.assertEqual(other.get("x", [0]), 100)
+            other.duration_by_name_qubits[("x", (0,))] = 200, "dt"
+            self.assertEqual(other.get("x", [0]), 200)
+            self.assertEqual(durations.get("x", [0]), 100)
+
     def _find_gate_with_length(self, backend):
         """Find a gate that has gate length."""
         props = backend.properties()
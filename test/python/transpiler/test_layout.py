@@ -186,6 +186,50 @@ class LayoutTest(QiskitTestCase):
         with self.assertRaises(LayoutError):
             layout.swap(0, self.qr[0])
 
+    def test_layout_swap_virtual(self):
+        """swap() method on virtual qubits"""
+        layout = Layout({self.qr[0]: 2, self.qr[1]: 0, self.qr[2]: 1})
+        layout.swap(self.qr[0], self.qr[2])
+        self.assertDictEqual(
+            layout.get_virtual_bits(), {self.qr[0]: 1, self.qr[1]: 0, self.qr[2]: 2}
+        )
+        self.assertDictEqual(
+            layout.get_physical_bits(), {0: self.qr[1], 1: self.qr[0], 2: self.qr[2]}
+        )
+
+    def test_layout_swap_idle_physical(self):
+        """swap() method on a physical qubit with no virtual qubit"""
+        layout = Layout({self.qr[0]: 0, None: 1})
+        layout.swap(0, 1)
+        self.assertDictEqual(layout.get_virtual_bits(), {self.qr[0]: 1})
+        self.assertEqual(layout[0], None)
+        self.assertEqual(layout[1], self.qr[0])
+
+    def test_layout_to_from_nlayout(self):
+        """to_nlayout() and from_nlayout() methods"""
+        qubits = list(self.qr)
+        layout = Layout({self.qr[0]: 4, self.qr[1]: 0, self.qr[2]: 2})
+        nlayout = layout.to_nlayout(qubits)
+        self.assertEqual(nlayout.logical_to_physical(0), 4)
+        self.assertEqual(nlayout.physical_to_logical(2), 2)
+        nlayout.swap_physical(0, 2)
+        self.assertDictEqual(
+            Layout.from_nlayout(nlayout, qubits).get_virtual_bits(),
+            {self.qr[0]: 4, self.qr[1]: 2, self.qr[2]: 0},
+        )
+        # The layout itself is not modified by the swap.
+        self.assertEqual(layout[self.qr[1]], 0)
+
+    def test_layout_to_nlayout_partial(self):
+        """to_nlayout() raises for layouts that do not map exactly the given qubits"""
+        qubits = list(self.qr)
+        with self.assertRaises(LayoutError):
+            Layout({self.qr[0]: 2, self.qr[1]: 0}).to_nlayout(qubits)
+        with self.assertRaises(LayoutError):
+            Layout({self.qr[0]: 2, self.qr[1]: 0}).to_nlayout(qubits[:1])
+        with self.assertRaises(LayoutError):
+            Layout({self.qr[0]: 4, self.qr[1]: 0, self.qr[2]: 2}).to_nlayout(qubits, 3)
+
     def test_layout_combine(self):
         """combine_into_edge_map() method"""
         layout = Layout()
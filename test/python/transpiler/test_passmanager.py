@@ -179,3 +179,30 @@ class TestPassManager(QiskitTestCase):
             "third 4",
         ]
         self.assertEqual(calls, expected)
+
+    def test_nested_flow_controller_reused(self):
+        """Test that the conditions of nested flow controllers read the property set of the
+        current run when a pass manager is run several times."""
+
+        class SetProperty(TransformationPass):
+            def run(self, dag):
+                self.property_set["run_inner"] = dag.name == "run"
+                return dag
+
+        class DummyPass(TransformationPass):
+            def run(self, dag):
+                return dag
+
+        inner = PassManager()
+        inner.append(DummyPass(), condition=lambda property_set: property_set["run_inner"])
+        outer = PassManager(SetProperty())
+        outer.append(inner.to_flow_controller())
+
+        for name in ("skip", "run", "skip", "run"):
+            calls = []
+            outer.run(
+                QuantumCircuit(name=name),
+                callback=lambda pass_, **_: calls.append(type(pass_).__name__),
+            )
+            expected = ["SetProperty", "DummyPass"] if name == "run" else ["SetProperty"]
+            self.assertEqual(calls, expected)
@@ -15,6 +15,8 @@
 import unittest
 
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuitError
 from qiskit.transpiler import PassManager
 from qiskit.transpiler.passes import ResourceEstimation
 from qiskit.test import QiskitTestCase
@@ -57,6 +59,48 @@ class TestResourceEstimationPass(QiskitTestCase):
         self.assertEqual(passmanager.property_set["width"], 2)
         self.assertDictEqual(passmanager.property_set["count_ops"], {"cx": 6, "h": 2})
 
+    def test_all_metrics(self):
+        """Test that all the metrics of the DAG are computed."""
+        circuit = QuantumCircuit(4, 1)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.x(1)
+        circuit.cx(1, 0)
+        circuit.h(2)
+        circuit.measure(1, 0)
+        dag = circuit_to_dag(circuit)
+
+        passmanager = PassManager()
+        passmanager.append(ResourceEstimation())
+        passmanager.run(circuit)
+        property_set = passmanager.property_set
+
+        self.assertEqual(property_set["size"], 6)
+        self.assertEqual(property_set["depth"], 5)
+        self.assertEqual(property_set["width"], 5)
+        self.assertEqual(property_set["num_qubits"], 4)
+        self.assertEqual(property_set["num_tensor_factors"], 3)
+        self.assertDictEqual(property_set["count_ops"], {"h": 2, "cx": 2, "x": 1, "measure": 1})
+        self.assertEqual(
+            [node.name for node in property_set["dag_longest_path"][1:-1]],
+            [node.name for node in dag.longest_path()[1:-1]],
+        )
+        self.assertDictEqual(
+            property_set["count_ops_longest_path"], {"h": 1, "cx": 2, "x": 1, "measure": 1}
+        )
+
+    def test_control_flow(self):
+        """Test that control flow raises, as its depth and size are ambiguous."""
+        body = QuantumCircuit(1)
+        body.x(0)
+        circuit = QuantumCircuit(1, 1)
+        circuit.for_loop(range(2), None, body, [0], [])
+
+        passmanager = PassManager()
+        passmanager.append(ResourceEstimation())
+        with self.assertRaises(DAGCircuitError):
+            passmanager.run(circuit)
+
 
 if __name__ == "__main__":
     unittest.main()
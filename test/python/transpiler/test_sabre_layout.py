@@ -208,6 +208,29 @@ barrier q18585[5],q18585[2],q18585[8],q18585[3],q18585[6];
         self.assertEqual(layout[qc.qubits[12]], 20)
         self.assertEqual(layout[qc.qubits[13]], 8)
 
+    def test_reused_pass(self):
+        """Test that running a pass on several circuits gives the same layouts as new passes."""
+        circuits = []
+        for num_qubits in (5, 3):
+            qr = QuantumRegister(num_qubits, "q")
+            circuit = QuantumCircuit(qr)
+            for i in range(num_qubits - 1):
+                circuit.cx(qr[i], qr[i + 1])
+            circuit.cx(qr[0], qr[-1])
+            circuits.append(circuit)
+
+        reused = SabreLayout(CouplingMap(self.cmap20), seed=0)
+        for circuit in circuits:
+            dag = circuit_to_dag(circuit)
+            reused.run(dag)
+            pass_ = SabreLayout(CouplingMap(self.cmap20), seed=0)
+            pass_.run(dag)
+            self.assertEqual(reused.property_set["layout"], pass_.property_set["layout"])
+
+        unseeded = SabreLayout(CouplingMap(self.cmap20))
+        unseeded.run(circuit_to_dag(circuits[0]))
+        self.assertIsNone(unseeded.seed)
+
 
 if __name__ == "__main__":
     unittest.main()
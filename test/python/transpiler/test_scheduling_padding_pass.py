@@ -16,6 +16,8 @@ import unittest
 
 from ddt import ddt, data, unpack
 from qiskit import QuantumCircuit
+from qiskit.circuit import Delay
+from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.pulse import Schedule, Play, Constant, DriveChannel
 from qiskit.test import QiskitTestCase
 from qiskit.transpiler.instruction_durations import InstructionDurations
@@ -819,6 +821,56 @@ class TestSchedulingAndPaddingPass(QiskitTestCase):
 
         self.assertEqual(scheduled, qc)
 
+    def test_padding_in_place(self):
+        """Test that the padding is inserted into the scheduled DAG, whose nodes keep their
+        start times, with the start times of the new delays added next to them."""
+        qc = QuantumCircuit(3)
+        qc.x(0)
+        qc.cx(0, 1)
+        qc.cx(0, 1)
+        qc.delay(100, 2)
+        qc.x(2)
+        qc.cx(1, 2)
+
+        durations = InstructionDurations([("x", None, 160), ("cx", None, 800)])
+        dag = circuit_to_dag(qc)
+        schedule_pass = ALAPScheduleAnalysis(durations)
+        dag = schedule_pass.requires[0].run(dag)
+        schedule_pass.property_set = schedule_pass.requires[0].property_set
+        schedule_pass.run(dag)
+        start_times = {
+            node: t0
+            for node, t0 in schedule_pass.property_set["node_start_time"].items()
+            if node.op.name != "delay"
+        }
+
+        pad_pass = PadDelay()
+        pad_pass.property_set = schedule_pass.property_set
+        padded = pad_pass.run(dag)
+
+        self.assertIs(padded, dag)
+        self.assertEqual(padded.duration, 2560)
+        node_start_time = pad_pass.property_set["node_start_time"]
+        self.assertEqual(set(node_start_time), set(padded.op_nodes()))
+        for node, t0 in start_times.items():
+            self.assertEqual(node_start_time[node], t0)
+        delays = sorted(
+            (padded.qubits.index(node.qargs[0]), node_start_time[node], node.op.duration)
+            for node in padded.op_nodes(Delay)
+        )
+        self.assertEqual(delays, [(0, 1760, 800), (1, 0, 160), (2, 0, 1600)])
+
+        expected = QuantumCircuit(3)
+        expected.x(0)
+        expected.delay(160, 1)
+        expected.cx(0, 1)
+        expected.cx(0, 1)
+        expected.delay(800, 0)
+        expected.delay(1600, 2)
+        expected.x(2)
+        expected.cx(1, 2)
+        self.assertEqual(dag_to_circuit(padded), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
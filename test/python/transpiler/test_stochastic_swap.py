@@ -620,6 +620,31 @@ class TestStochasticSwapControlFlow(QiskitTestCase):
         expected.measure(qreg, creg[new_order])
         self.assertEqual(dag_to_circuit(cdag), expected)
 
+    def test_repeated_if_blocks(self):
+        """test that identical if blocks routed from the same layout are routed once"""
+        num_qubits = 5
+        qreg = QuantumRegister(num_qubits, "q")
+        creg = ClassicalRegister(num_qubits)
+        coupling = CouplingMap.from_line(num_qubits)
+        qc = QuantumCircuit(qreg, creg)
+        qc.measure(0, 0)
+        for _ in range(10):
+            true_body = QuantumCircuit(qreg, creg[[0]])
+            true_body.cx(0, 2)
+            qc.if_test((creg[0], 1), true_body, qreg, creg[[0]])
+        qc.cx(0, 4)
+
+        dag = circuit_to_dag(qc)
+        cdag = StochasticSwap(coupling, seed=58).run(dag)
+        check_map_pass = CheckMap(coupling)
+        check_map_pass.run(cdag)
+        self.assertTrue(check_map_pass.property_set["is_swap_mapped"])
+
+        if_ops = [node.op for node in cdag.op_nodes(ControlFlowOp)]
+        self.assertEqual(len(if_ops), 10)
+        for op in if_ops[1:]:
+            self.assertEqual(op, if_ops[0])
+
     def test_pre_if_else_route_post_x(self):
         """test swap with if else controlflow construct; pre-cx and post x"""
         num_qubits = 5
@@ -12,7 +12,11 @@
 
 # pylint: disable=missing-docstring
 
+import copy
 import math
+import pickle
+
+import numpy as np
 
 from qiskit.circuit.library import (
     RZGate,
@@ -1625,6 +1629,142 @@ class TestGlobalVariableWidthOperations(QiskitTestCase):
         )
 
 
+class TestCompiledTarget(QiskitTestCase):
+    """Test the compiled view of a target."""
+
+    def setUp(self):
+        super().setUp()
+        self.target = Target(num_qubits=3)
+        self.target.add_instruction(
+            XGate(),
+            {
+                (0,): InstructionProperties(duration=1e-8, error=1e-4),
+                (1,): InstructionProperties(duration=2e-8),
+                (2,): None,
+            },
+        )
+        self.target.add_instruction(
+            CXGate(),
+            {
+                (0, 1): InstructionProperties(duration=3e-7, error=1e-2),
+                (1, 2): InstructionProperties(error=2e-2),
+            },
+        )
+        self.target.add_instruction(Measure())
+        self.target.add_instruction(IfElseOp, name="if_else")
+
+    def test_compile_is_cached(self):
+        compiled = self.target.compile()
+        self.assertIs(compiled, self.target.compile())
+
+    def test_invalidated_by_add_instruction(self):
+        compiled = self.target.compile()
+        self.assertFalse(compiled.instruction_supported("sx", (0,)))
+        self.target.add_instruction(SXGate(), {(0,): None})
+        self.assertIsNot(compiled, self.target.compile())
+        self.assertTrue(self.target.compile().instruction_supported("sx", (0,)))
+        self.assertTrue(self.target.instruction_supported("sx", (0,)))
+
+    def test_invalidated_by_update_instruction_properties(self):
+        compiled = self.target.compile()
+        column = compiled.qargs_id((1,))
+        self.assertTrue(np.isnan(compiled.errors[compiled.operation_id("x"), column]))
+        self.target.update_instruction_properties(
+            "x", (1,), InstructionProperties(duration=2e-8, error=5e-4)
+        )
+        compiled = self.target.compile()
+        self.assertEqual(compiled.errors[compiled.operation_id("x"), column], 5e-4)
+
+    def test_invalidated_by_mapping_write(self):
+        compiled = self.target.compile()
+        column = compiled.qargs_id((1,))
+        self.target["x"][(1,)] = InstructionProperties(duration=2e-8, error=5e-4)
+        compiled = self.target.compile()
+        self.assertEqual(compiled.errors[compiled.operation_id("x"), column], 5e-4)
+
+        self.assertFalse(compiled.instruction_supported("cx", (1, 0)))
+        self.target["cx"][(1, 0)] = None
+        self.assertTrue(self.target.compile().instruction_supported("cx", (1, 0)))
+        del self.target["cx"][(1, 0)]
+        self.assertFalse(self.target.compile().instruction_supported("cx", (1, 0)))
+
+    def test_invalidated_in_copies(self):
+        self.target.compile()
+        for target in (copy.deepcopy(self.target), pickle.loads(pickle.dumps(self.target))):
+            compiled = target.compile()
+            target["x"][(1,)] = InstructionProperties(error=5e-4)
+            self.assertIsNot(compiled, target.compile())
+            # The original target is not modified.
+            self.assertIsNone(self.target["x"][(1,)].error)
+
+    def test_operation_ids(self):
+        compiled = self.target.compile()
+        self.assertEqual(compiled.operation_names, ("x", "cx", "measure", "if_else"))
+        for index, name in enumerate(compiled.operation_names):
+            self.assertEqual(compiled.operation_id(name), index)
+        with self.assertRaises(KeyError):
+            compiled.operation_id("h")
+
+    def test_instruction_supported(self):
+        compiled = self.target.compile()
+        self.assertTrue(compiled.instruction_supported("x", (2,)))
+        self.assertTrue(compiled.instruction_supported("cx", (0, 1)))
+        self.assertFalse(compiled.instruction_supported("cx", (1, 0)))
+        self.assertTrue(compiled.instruction_supported("measure", (1,)))
+        self.assertFalse(compiled.instruction_supported("measure", (3,)))
+        self.assertFalse(compiled.instruction_supported("measure", (0, 1)))
+        self.assertTrue(compiled.instruction_supported("if_else", (0, 1, 2)))
+        self.assertFalse(compiled.instruction_supported("if_else", (0, 0)))
+        self.assertFalse(compiled.instruction_supported("h", (0,)))
+        self.assertTrue(compiled.instruction_supported("cx"))
+
+    def test_operation_names_for_qargs(self):
+        compiled = self.target.compile()
+        self.assertEqual(
+            compiled.operation_names_for_qargs((0,)), frozenset({"x", "measure", "if_else"})
+        )
+        self.assertEqual(compiled.operation_names_for_qargs((1, 2)), frozenset({"cx", "if_else"}))
+        self.assertEqual(
+            compiled.operation_names_for_qargs(None), frozenset({"measure", "if_else"})
+        )
+        with self.assertRaises(KeyError):
+            compiled.operation_names_for_qargs((0, 3))
+
+    def test_operation_names_for_qargs_does_not_modify_target(self):
+        names = self.target.operation_names_for_qargs((0,))
+        names.add("h")
+        self.assertEqual(self.target.operation_names_for_qargs((0,)), {"x", "measure", "if_else"})
+
+    def test_operations_for_qargs(self):
+        compiled = self.target.compile()
+        self.assertEqual(compiled.operations_for_qargs((1,)), [XGate(), Measure(), IfElseOp])
+
+    def test_error_and_duration_arrays(self):
+        compiled = self.target.compile()
+        self.assertEqual(compiled.qargs, ((0,), (1,), (2,), (0, 1), (1, 2)))
+        nan = np.nan
+        np.testing.assert_array_equal(
+            compiled.errors,
+            [
+                [1e-4, nan, nan, nan, nan],
+                [nan, nan, nan, 1e-2, 2e-2],
+                [nan, nan, nan, nan, nan],
+                [nan, nan, nan, nan, nan],
+            ],
+        )
+        np.testing.assert_array_equal(
+            compiled.durations,
+            [
+                [1e-8, 2e-8, nan, nan, nan],
+                [nan, nan, nan, 3e-7, nan],
+                [nan, nan, nan, nan, nan],
+                [nan, nan, nan, nan, nan],
+            ],
+        )
+        with self.assertRaises(ValueError):
+            compiled.errors[0, 0] = 0.0
+
+
 class TestInstructionProperties(QiskitTestCase):
     def test_empty_repr(self):
         properties = InstructionProperties()
@@ -14,6 +14,8 @@
 """Test the TemplateOptimization pass."""
 
 import unittest
+from unittest import mock
+
 import numpy as np
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit import Parameter
@@ -23,6 +25,7 @@ from qiskit.converters.circuit_to_dag import circuit_to_dag
 from qiskit.converters.circuit_to_dagdependency import circuit_to_dagdependency
 from qiskit.transpiler import PassManager
 from qiskit.transpiler.passes import TemplateOptimization
+from qiskit.transpiler.passes.optimization.template_matching import TemplateMatching
 from qiskit.transpiler.passes.calibration.rzx_templates import rzx_templates
 from qiskit.test import QiskitTestCase
 from qiskit.transpiler.exceptions import TranspilerError
@@ -645,6 +648,119 @@ class TestTemplateMatching(QiskitTestCase):
 
         self.assertEqual(circuit_out, expected)
 
+    def test_skip_template_that_cannot_reduce_cost(self):
+        """A template is not matched at all if the circuit lacks the gates it needs to reduce
+        the cost."""
+        circuit_in = QuantumCircuit(2)
+        circuit_in.cx(0, 1)
+        circuit_in.h(0)
+
+        # Matching both cx would reduce the cost, but the circuit only has one of them.
+        template = QuantumCircuit(2)
+        template.cx(0, 1)
+        template.cx(0, 1)
+
+        with mock.patch.object(
+            TemplateMatching, "run_template_matching", autospec=True
+        ) as run_template_matching:
+            circuit_out = PassManager(TemplateOptimization([template])).run(circuit_in)
+        run_template_matching.assert_not_called()
+        self.assertEqual(circuit_out, circuit_in)
+
+    def test_search_budget(self):
+        """The number of explored matches is bounded by the search budget."""
+        circuit_in = QuantumCircuit(6)
+        for qubit in range(5):
+            circuit_in.cx(qubit, qubit + 1)
+            circuit_in.cx(qubit, qubit + 1)
+
+        template = QuantumCircuit(2)
+        template.cx(0, 1)
+        template.cx(0, 1)
+
+        matching = TemplateMatching(
+            circuit_to_dagdependency(circuit_in),
+            circuit_to_dagdependency(template),
+            search_budget=3,
+        )
+        matching.run_template_matching()
+        self.assertTrue(matching.budget_exhausted)
+        self.assertEqual(matching.explorations, 3)
+
+        # A budget only delays optimization, the circuit is still correct.
+        pass_ = TemplateOptimization([template], search_budget=3)
+        circuit_out = PassManager(pass_).run(circuit_in)
+        self.assertLess(circuit_out.size(), circuit_in.size())
+        self.assertEqual(Operator(circuit_in), Operator(circuit_out))
+
+    def test_window_heuristics(self):
+        """Matches within the window are found, and start nodes whose window can't hold a
+        useful match are not explored."""
+        circuit_in = QuantumCircuit(3)
+        circuit_in.cx(0, 1)
+        circuit_in.cx(0, 1)
+        for _ in range(10):
+            circuit_in.h(2)
+        circuit_in.cx(1, 2)
+
+        template = QuantumCircuit(2)
+        template.cx(0, 1)
+        template.cx(0, 1)
+
+        matching = TemplateMatching(
+            circuit_to_dagdependency(circuit_in),
+            circuit_to_dagdependency(template),
+            heuristics_window_param=[2],
+        )
+        matching.run_template_matching()
+        # The last cx (node 12) is too far from the others to start a match.
+        matched_nodes = {node for match in matching.match_list for _, node in match.match}
+        self.assertEqual(matched_nodes, {0, 1})
+        self.assertIn([[0, 0], [1, 1]], [match.match for match in matching.match_list])
+
+        pass_ = TemplateOptimization([template], heuristics_window_param=[2])
+        circuit_out = PassManager(pass_).run(circuit_in)
+        expected = QuantumCircuit(3)
+        for _ in range(10):
+            expected.h(2)
+        expected.cx(1, 2)
+        self.assertEqual(circuit_out, expected)
+
+    def test_skip_wider_template_before_checks(self):
+        """A template wider than the circuit is skipped before checking it is the identity."""
+        template = QuantumCircuit(3)
+        template.ccx(0, 1, 2)
+
+        circuit_in = QuantumCircuit(2)
+        circuit_in.cx(0, 1)
+        circuit_in.cx(0, 1)
+        pass_ = TemplateOptimization([template_nct_2a_2(), template])
+        self.assertEqual(PassManager(pass_).run(circuit_in), QuantumCircuit(2))
+
+        with self.assertRaises(TranspilerError):
+            PassManager(pass_).run(QuantumCircuit(3))
+
+    def test_template_list_modified_in_place(self):
+        """Templates added to or replaced in the template list after a run are used."""
+        circuit_in = QuantumCircuit(2)
+        circuit_in.h(0)
+        circuit_in.h(0)
+
+        pass_ = TemplateOptimization([template_nct_2a_2()])
+        self.assertEqual(PassManager(pass_).run(circuit_in), circuit_in)
+
+        template = QuantumCircuit(1)
+        template.h(0)
+        template.h(0)
+        pass_.template_list.append(template)
+        self.assertEqual(PassManager(pass_).run(circuit_in), QuantumCircuit(2))
+
+        not_identity = QuantumCircuit(1)
+        not_identity.h(0)
+        pass_.template_list[1] = not_identity
+        with self.assertRaises(TranspilerError):
+            PassManager(pass_).run(circuit_in)
+
 
 if __name__ == "__main__":
     unittest.main()
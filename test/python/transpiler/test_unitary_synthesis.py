@@ -786,6 +786,33 @@ class TestUnitarySynthesis(QiskitTestCase):
         result_qc = dag_to_circuit(result_dag)
         self.assertEqual(result_qc, QuantumCircuit(1))
 
+    def test_decomposers_shared_between_qubit_pairs(self):
+        """Test that the 2q decomposers built for a target are reused for every pair of qubits."""
+        from qiskit.transpiler.passes.synthesis.unitary_synthesis import DefaultUnitarySynthesis
+
+        target = FakeMumbaiFractionalCX().target
+        plugin = DefaultUnitarySynthesis()
+        decomposer_01, _ = plugin._find_decomposer_2q_from_target(target, [0, 1], None)
+        decomposers = plugin._decomposers_2q_from_target(target, None)
+        decomposer_12, _ = plugin._find_decomposer_2q_from_target(target, [1, 2], None)
+        self.assertIs(plugin._decomposers_2q_from_target(target, None), decomposers)
+        self.assertIn(decomposer_01, decomposers)
+        self.assertIn(decomposer_12, decomposers)
+
+        other_target = FakeMumbaiFractionalCX().target
+        self.assertIsNot(plugin._decomposers_2q_from_target(other_target, None), decomposers)
+        self.assertEqual(plugin._decomposer_cache, {})
+
+    def test_two_qubit_synthesis_many_pairs_with_target(self):
+        """Test synthesis of 2q unitaries on several pairs of qubits sharing decomposers."""
+        backend = FakeMumbaiFractionalCX()
+        qc = QuantumCircuit(4)
+        for seed, qubits in enumerate([[0, 1], [1, 2], [2, 3], [1, 0], [0, 1]]):
+            qc.unitary(random_unitary(4, seed=seed), qubits)
+        unitary_synth_pass = UnitarySynthesis(target=backend.target)
+        result_qc = dag_to_circuit(unitary_synth_pass.run(circuit_to_dag(qc)))
+        self.assertEqual(Operator(qc), Operator(result_qc))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -457,6 +457,22 @@ class TestVF2LayoutOther(LayoutTestCase):
             pass_1.property_set["VF2Layout_stop_reason"], VF2LayoutStopReason.MORE_THAN_2Q
         )
 
+    def test_reused_pass_limits(self):
+        """The trial limit derived from a circuit is not kept for the next runs"""
+        cmap5 = FakeTenerife().configuration().coupling_map
+
+        qr = QuantumRegister(3, "qr")
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[1], qr[0])
+        circuit.cx(qr[0], qr[2])
+
+        pass_ = VF2Layout(CouplingMap(cmap5), seed=42)
+        pass_.run(circuit_to_dag(circuit))
+        self.assertIsNone(pass_.max_trials)
+        self.assertEqual(
+            pass_.property_set["VF2Layout_stop_reason"], VF2LayoutStopReason.SOLUTION_FOUND
+        )
+
 
 class TestMultipleTrials(QiskitTestCase):
     """Test the passes behavior with >1 trial."""
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Utility script to regenerate the signatures snapshot of the standard equivalence library"""
+
+import argparse
+
+from qiskit.circuit.library.standard_gates import equivalence_library
+
+
+def _main():
+    parser = argparse.ArgumentParser(
+        description="Regenerate the standard equivalence library signatures snapshot"
+    )
+    parser.add_argument("--output", "-o", type=str, default=equivalence_library._SIGNATURES_PATH)
+    args = parser.parse_args()
+    equivalence_library.StandardEquivalenceLibrary.dump_signatures(args.output)
+
+
+if __name__ == "__main__":
+    _main()